@@ -2,6 +2,16 @@
 
 from .browser import Browser
 from .tab import Tab
+from .pool import TabPool
+from .reconnect import ReconnectPolicy
+from .intercept import Interceptor, InterceptRule
+from .cache import ResponseCache
+from .metrics import Metrics, MemorySink, PrometheusTextSink
+from .protocol_log import ProtocolLog, read_log
+from .cluster import BrowserCluster
+from .launcher import ChromeLauncher
+from .client import new_connector, default_session, close_default_session
+from .connection import BrowserConnection, TabSession
 from .exceptions import *
 
 __version__ = '0.0.2'
@@ -1,79 +1,292 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import time
 import asyncio
+import logging
 import aiohttp
 
+from urllib.parse import urlparse
+
 from .tab import Tab
+from .pool import TabPool
+from .codec import get_codec
+from .client import default_session
+from .connection import BrowserConnection, TabSession
+from .exceptions import *
 
 
 __all__ = ["Browser"]
 
 
-class Browser:
-    _all_tabs = {}
+logger = logging.getLogger(__name__)
+
 
-    def __init__(self, url="http://127.0.0.1:9222", loop=None):
+class Browser:
+    def __init__(self, url="http://127.0.0.1:9222", loop=None, multiplex=False, codec=None, reconnect=None,
+                 session=None, connector=None, cache=None, hooks=None,
+                 protocol_log=None, strict_protocol=False):
         self.dev_url = url
         self.loop = loop or asyncio.get_event_loop()
+        self.codec = get_codec(codec)
+        self.reconnect = reconnect
+        self.multiplex = multiplex
+        # a ResponseCache shared by the interceptors of every tab
+        self.cache = cache
+        # instrumentation of the HTTP calls and of every tab, see Metrics
+        self.hooks = hooks
+        # a ProtocolLog shared by every tab
+        self.protocol_log = protocol_log
+        # see Tab.strict_protocol
+        self.strict_protocol = strict_protocol
+        self._connection = None
+        self._connect_lock = asyncio.Lock()
+
+        # targetId -> targetInfo, kept up to date by the Target events once watch() is called
+        self.targets = {}
+        self._tabs = {}
+        self._watching = None
+        self._watch_lock = asyncio.Lock()
+        self._destroyed = None
+
+        # an injected session is left open by close(), a session of our own on `connector` is not
+        self._session = session
+        self._connector = connector
+        self._own_session = False
 
-        if self.dev_url not in self._all_tabs:
-            self._tabs = self._all_tabs[self.dev_url] = {}
-        else:
-            self._tabs = self._all_tabs[self.dev_url]
+    @property
+    def session(self):
+        if self._session is None:
+            if self._connector is not None:
+                self._session = aiohttp.ClientSession(connector=self._connector, connector_owner=False, loop=self.loop)
+                self._own_session = True
+            else:
+                return default_session(self.loop)
 
-        self.session = aiohttp.ClientSession(loop=self.loop)
+        return self._session
+
+    async def _get(self, endpoint, url, timeout=None, json=False):
+        hooks = self.hooks
+        if hooks is not None:
+            start = time.perf_counter()
+            error = True
+
+        try:
+            async with self.session.get(url, timeout=timeout) as rp:
+                result = await rp.json(loads=self.codec.loads) if json else await rp.text()
+            error = False
+            return result
+        finally:
+            if hooks is not None:
+                hooks.on_http(self, endpoint, time.perf_counter() - start, error)
 
     async def new_tab(self, url=None, timeout=None):
         url = url or ''
-        async with self.session.get("{}/json/new?{}".format(self.dev_url, url), timeout=timeout) as rp:
-            tab_json = await rp.json()
-            tab = Tab(**tab_json)
-            self._tabs[tab.id] = tab
-            return tab
+        tab_json = await self._get("new", "{}/json/new?{}".format(self.dev_url, url), timeout=timeout, json=True)
+        tab = await self._new_tab_object(tab_json)
+        self._tabs[tab.id] = tab
+        self.targets.setdefault(tab.id, {"targetId": tab.id, "type": tab_json.get("type", "page"),
+                                         "title": tab_json.get("title", ""), "url": tab_json.get("url", "")})
+        return tab
+
+    async def _new_tab_object(self, tab_json):
+        if self.multiplex:
+            return TabSession(await self.connect(), codec=self.codec, reconnect=self.reconnect, cache=self.cache,
+                              hooks=self.hooks, protocol_log=self.protocol_log,
+                              strict_protocol=self.strict_protocol, **tab_json)
+
+        return Tab(codec=self.codec, reconnect=self.reconnect, cache=self.cache, hooks=self.hooks,
+                   protocol_log=self.protocol_log, strict_protocol=self.strict_protocol, **tab_json)
+
+    async def connect(self, timeout=None):
+        """
+        the browser level connection used by multiplexed tabs, created on first use
+        """
+        async with self._connect_lock:
+            if self._connection is None or self._connection.status == Tab.status_stopped:
+                version = await self.version(timeout=timeout)
+                self._connection = BrowserConnection(
+                    id="browser", type="browser", codec=self.codec, reconnect=self.reconnect, hooks=self.hooks,
+                    protocol_log=self.protocol_log, on_reconnect=self._rewatch,
+                    webSocketDebuggerUrl=version['webSocketDebuggerUrl'])
+
+            await self._connection.start()
+            return self._connection
+
+    async def disconnect(self):
+        self._watching = None
+        if self._connection is None or self._connection.status != Tab.status_started:
+            return False
+
+        return await self._connection.stop()
+
+    def tab_pool(self, **kwargs):
+        """
+        a TabPool creating its tabs with this browser, see TabPool for the arguments
+        """
+        return TabPool(self, **kwargs)
+
+    async def watch(self, timeout=None):
+        """
+        follow the targets with Target.setDiscoverTargets on the browser connection,
+        called by list_tab() when multiplexed, again after the connection is gone and after it reconnects
+        """
+        async with self._watch_lock:
+            connection = await self.connect(timeout)
+            if self._watching is connection:
+                return False
+
+            # from here on the events fill the registry, the snapshot below fills the rest
+            self.targets = {}
+            self._destroyed = set()
+            connection.set_listener("Target.targetCreated", self._target_created)
+            connection.set_listener("Target.targetInfoChanged", self._target_info_changed)
+            connection.set_listener("Target.targetDestroyed", self._target_destroyed)
+
+            await connection.call_method("Target.setDiscoverTargets", discover=True, _timeout=timeout)
+            result = await connection.call_method("Target.getTargets", _timeout=timeout)
+
+            # events handled meanwhile are newer than this snapshot
+            targets = dict((info['targetId'], info) for info in result['targetInfos'])
+            targets.update(self.targets)
+            for tab_id in self._destroyed:
+                targets.pop(tab_id, None)
+
+            self.targets = targets
+            self._destroyed = None
+            for tab_id in list(self._tabs):
+                if tab_id not in self.targets:
+                    del self._tabs[tab_id]
+
+            self._watching = connection
+            return True
+
+    async def _rewatch(self):
+        """the new websocket of a reconnected connection discovers nothing until told to"""
+        if self._watching is None:
+            return
+
+        self._watching = None
+        try:
+            await self.watch()
+        except AioChromeException:
+            logger.warning("%s watch after reconnect failed" % self, exc_info=True)
+
+    async def _target_created(self, targetInfo, **kwargs):
+        self.targets[targetInfo['targetId']] = targetInfo
+
+    async def _target_info_changed(self, targetInfo, **kwargs):
+        tab_id = targetInfo['targetId']
+        if tab_id not in self.targets:
+            return
+
+        self.targets[tab_id] = targetInfo
+        tab = self._tabs.get(tab_id)
+        if tab:
+            tab._kwargs.update(title=targetInfo.get('title'), url=targetInfo.get('url'))
+
+    async def _target_destroyed(self, targetId, **kwargs):
+        if self._destroyed is not None:
+            self._destroyed.add(targetId)
+
+        self.targets.pop(targetId, None)
+        self._tabs.pop(targetId, None)
+
+    def _target_json(self, info):
+        """the /json entry of a target"""
+        url = urlparse(self.dev_url)
+        return {
+            "id": info['targetId'],
+            "type": info['type'],
+            "title": info.get('title', ''),
+            "url": info.get('url', ''),
+            "webSocketDebuggerUrl": "%s://%s/devtools/page/%s" % (
+                "wss" if url.scheme == "https" else "ws", url.netloc, info['targetId']),
+        }
 
     async def list_tab(self, timeout=None):
-        async with self.session.get("{}/json".format(self.dev_url), timeout=timeout) as rp:
-            tabs_map = {}
-            for tab_json in await rp.json():
-                if tab_json['type'] != 'page':  # pragma: no cover
-                    continue
+        """
+        the page targets. multiplexed or watched, from the registry kept by watch(): no HTTP
+        round trip once the browser connection is up. otherwise from /json, as chrome lists them
+        """
+        if not self.multiplex and self._watching is None:
+            return await self._list_json(timeout)
+
+        if self._watching is None or self._watching.status != Tab.status_started:
+            await self.watch(timeout)
+
+        tabs = []
+        for tab_id, info in list(self.targets.items()):
+            if info['type'] != 'page':
+                continue
+
+            tab = self._tabs.get(tab_id)
+            if tab is None or tab.status == Tab.status_stopped:
+                tab = self._tabs[tab_id] = await self._new_tab_object(self._target_json(info))
+
+            tabs.append(tab)
 
-                if tab_json['id'] in self._tabs and self._tabs[tab_json['id']].status != Tab.status_stopped:
-                    tabs_map[tab_json['id']] = self._tabs[tab_json['id']]
-                else:
-                    tabs_map[tab_json['id']] = Tab(**tab_json)
+        return tabs
 
-            self._tabs = tabs_map
-            return list(self._tabs.values())
+    async def _list_json(self, timeout=None):
+        tabs = {}
+        for tab_json in await self._get("list", "%s/json" % self.dev_url, timeout=timeout, json=True):
+            if tab_json['type'] != 'page':  # pragma: no cover
+                continue
+
+            tab = self._tabs.get(tab_json['id'])
+            if tab is None or tab.status == Tab.status_stopped:
+                tab = await self._new_tab_object(tab_json)
+
+            tabs[tab.id] = tab
+
+        self._tabs = tabs
+        return list(tabs.values())
 
     async def activate_tab(self, tab_id, timeout=None):
         if isinstance(tab_id, Tab):
             tab_id = tab_id.id
 
-        async with self.session.get("%s/json/activate/%s" % (self.dev_url, tab_id), timeout=timeout) as rp:
-            return await rp.text()
+        return await self._get("activate", "%s/json/activate/%s" % (self.dev_url, tab_id), timeout=timeout)
 
     async def close_tab(self, tab_id, timeout=None):
         if isinstance(tab_id, Tab):
             tab_id = tab_id.id
 
+        self.targets.pop(tab_id, None)
         tab = self._tabs.pop(tab_id, None)
-        if tab and tab.status == Tab.status_started:  # pragma: no cover
-            tab.stop()
+        if tab and tab.status == Tab.status_started:
+            await tab.stop()
 
-        async with self.session.get("%s/json/close/%s" % (self.dev_url, tab_id), timeout=timeout) as rp:
-            return await rp.text()
+        return await self._get("close", "%s/json/close/%s" % (self.dev_url, tab_id), timeout=timeout)
 
     async def version(self, timeout=None):
-        async with self.session.get("%s/json/version" % self.dev_url, json=True, timeout=timeout) as rp:
-            return await rp.json()
+        return await self._get("version", "%s/json/version" % self.dev_url, timeout=timeout, json=True)
+
+    async def close(self):
+        """
+        stop the tabs and the connection of this browser, the tabs themselves are left open
+        """
+        for tab in list(self._tabs.values()):
+            if tab.status == Tab.status_started:
+                await tab.stop()
+
+        await self.disconnect()
+
+        if self._own_session:
+            await self._session.close()
+            self._session = None
+            self._own_session = False
+
+        return True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     def __str__(self):
         return '<Browser %s>' % self.dev_url
 
     __repr__ = __str__
-
-    def __del__(self):
-        if not self.session.closed:
-            self.session.close()
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import threading
+import collections
+import concurrent.futures
+
+from email.utils import parsedate_to_datetime
+
+
+__all__ = ["ResponseCache"]
+
+
+# bodies are stored decoded, fulfilling them with these would break the page
+encoding_headers = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def _atomic_write(filename, data):
+    # readers and other writers see the old file or the new one, never a part of it
+    tmp = "%s.%s.tmp" % (filename, uuid.uuid4().hex)
+    with open(tmp, "wb") as fd:
+        fd.write(data)
+    os.replace(tmp, filename)
+
+
+def freshness(headers, default_ttl=None, now=None):
+    """
+    seconds a response may be served from the cache, from its Cache-Control / Expires
+    headers (a list of {"name", "value"}). 0 for a response not to store, None for no limit.
+    """
+    now = time.time() if now is None else now
+    values = collections.defaultdict(list)
+    for header in headers:
+        values[header['name'].lower()].append(header['value'])
+
+    if 'set-cookie' in values or '*' in [v.strip() for v in ",".join(values['vary']).split(",")]:
+        return 0
+
+    directives = {}
+    for value in values['cache-control'] + values['pragma']:
+        for directive in value.split(","):
+            name, _, arg = directive.strip().partition("=")
+            directives[name.lower()] = arg.strip('"')
+
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0
+
+    if 'max-age' in directives:
+        try:
+            return max(0, int(directives['max-age']))
+        except ValueError:
+            return 0
+
+    if values['expires']:
+        try:
+            return max(0, parsedate_to_datetime(values['expires'][0]).timestamp() - now)
+        except (TypeError, ValueError):
+            return 0  # an invalid Expires means already expired
+
+    return default_ttl
+
+
+class ResponseCache:
+    """
+    an on-disk cache of responses, fulfilled by the Interceptor with Fetch.fulfillRequest.
+
+    bodies are content-addressed (`bodies/<sha256>`, the same asset under many urls is
+    stored once), an entry per url (`entries/<sha1 of the url>.json`) holds the status,
+    the headers, the digest and the expiry from the cache headers. the index of the
+    entries is in memory; an entry another process wrote is picked up on a miss.
+
+    files are written to a temporary name and renamed, so tabs, browsers and processes
+    may share one directory. the least recently used entries go once the bodies exceed
+    `max_size` bytes. `default_ttl` is the lifetime of a response without cache headers,
+    None keeps it until evicted.
+
+    get() and put() read and write files, coroutines use lookup() and store(): the same
+    calls made in a thread of the cache, one at a time, so the event loop never waits
+    for the disk. the index and the counters are shared with that thread under a lock.
+    """
+
+    def __init__(self, path, max_size=100 * 1024 * 1024, default_ttl=None):
+        self.path = path
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        self.size = 0
+        # url key -> entry, least recently used first
+        self.index = collections.OrderedDict()
+        # digest -> [size, number of entries]
+        self.bodies = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+        self._executor = None
+        self._lock = threading.RLock()
+
+        for name in ("entries", "bodies"):
+            os.makedirs(os.path.join(path, name), exist_ok=True)
+
+        entries = []
+        for name in os.listdir(os.path.join(path, "entries")):
+            if name.endswith(".json"):
+                entry = self._load(name[:-5])
+                if entry is not None:
+                    entries.append(entry)
+
+        for entry in sorted(entries, key=lambda entry: entry['used']):
+            self._add(entry)
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _entry_file(self, key):
+        return os.path.join(self.path, "entries", key + ".json")
+
+    def _body_file(self, digest):
+        return os.path.join(self.path, "bodies", digest)
+
+    def _load(self, key):
+        try:
+            with open(self._entry_file(key), "rb") as fd:
+                entry = json.loads(fd.read().decode('utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.exists(self._body_file(entry['digest'])):
+            return None
+
+        return entry
+
+    def _add(self, entry):
+        key = self.key(entry['url'])
+        self._remove(key, delete=False)
+        self.index[key] = entry
+
+        body = self.bodies.get(entry['digest'])
+        if body is None:
+            body = self.bodies[entry['digest']] = [entry['size'], 0]
+            self.size += entry['size']
+        body[1] += 1
+
+    def _remove(self, key, delete=True):
+        entry = self.index.pop(key, None)
+        if entry is None:
+            return False
+
+        if delete:
+            self._unlink(self._entry_file(key))
+
+        body = self.bodies[entry['digest']]
+        body[1] -= 1
+        if body[1] == 0:
+            del self.bodies[entry['digest']]
+            self.size -= body[0]
+            if delete:
+                self._unlink(self._body_file(entry['digest']))
+
+        return True
+
+    @staticmethod
+    def _unlink(filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass  # removed by another writer
+
+    def get(self, url):
+        """{"url", "status", "headers", "body"} of a fresh response of url, or None"""
+        with self._lock:
+            return self._get(url)
+
+    def _get(self, url):
+        key = self.key(url)
+        entry = self.index.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None and entry['url'] == url:
+                self._add(entry)
+
+        if entry is None or entry['url'] != url:
+            self.misses += 1
+            return None
+
+        if entry['expires'] is not None and entry['expires'] <= time.time():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        try:
+            with open(self._body_file(entry['digest']), "rb") as fd:
+                body = fd.read()
+        except OSError:
+            # evicted by another process, which may have stored a newer entry
+            self._remove(key, delete=False)
+            self.misses += 1
+            return None
+
+        self.index.move_to_end(key)
+        entry['used'] = time.time()
+        self.hits += 1
+        self.bytes_saved += len(body)
+        return {"url": url, "status": entry['status'], "headers": entry['headers'], "body": body}
+
+    def put(self, url, status, headers, body):
+        """
+        store a response unless its headers forbid it, return whether it was stored.
+        body is the decoded body, the headers about its encoding on the wire are dropped.
+        """
+        with self._lock:
+            return self._put(url, status, headers, body)
+
+    def _put(self, url, status, headers, body):
+        ttl = freshness(headers, self.default_ttl)
+        if ttl == 0 or len(body) > self.max_size:
+            return False
+
+        digest = hashlib.sha256(body).hexdigest()
+        if not os.path.exists(self._body_file(digest)):
+            _atomic_write(self._body_file(digest), body)
+
+        now = time.time()
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": [h for h in headers if h['name'].lower() not in encoding_headers],
+            "digest": digest,
+            "size": len(body),
+            "stored": now,
+            "used": now,
+            "expires": None if ttl is None else now + ttl,
+        }
+
+        key = self.key(url)
+        old = self.index.get(key)
+        _atomic_write(self._entry_file(key), json.dumps(entry).encode('utf-8'))
+        if old is not None and old['digest'] != digest and self.bodies[old['digest']][1] == 1:
+            self._unlink(self._body_file(old['digest']))
+
+        self._add(entry)
+        self.stores += 1
+
+        while self.size > self.max_size:
+            self._remove(next(iter(self.index)))
+            self.evictions += 1
+
+        return True
+
+    def _run(self, func, *args):
+        if self._executor is None:
+            # one thread, so the index is never changed by two calls at once
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        return asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+
+    async def lookup(self, url):
+        """get() off the event loop"""
+        return await self._run(self.get, url)
+
+    async def store(self, url, status, headers, body):
+        """put() off the event loop"""
+        return await self._run(self.put, url, status, headers, body)
+
+    def close(self):
+        """stop the thread of lookup() and store(), a later call starts another one"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def clear(self):
+        with self._lock:
+            for key in list(self.index):
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            return self._stats()
+
+    def _stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.index),
+            "bodies": len(self.bodies),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def __len__(self):
+        return len(self.index)
+
+    def __str__(self):
+        return "<ResponseCache %s %s entries>" % (self.path, len(self.index))
+
+    __repr__ = __str__
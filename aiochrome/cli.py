@@ -38,7 +38,10 @@ class JSONTabEncoder(json.JSONEncoder):
 def coro(f):
     def wrapper(*args, **kwargs):
         loop = asyncio.get_event_loop()
-        return loop.run_until_complete(f(*args, **kwargs))
+        try:
+            return loop.run_until_complete(f(*args, **kwargs))
+        finally:
+            loop.run_until_complete(aiochrome.close_default_session(loop))
 
     return update_wrapper(wrapper, f)
 
@@ -56,8 +59,8 @@ async def list(host, port, secure):
     """list all the available targets/tabs"""
     url = "%s://%s:%s" % ("https" if secure else "http", host, port)
     try:
-        browser = aiochrome.Browser(url)
-        click.echo(json.dumps(await browser.list_tab(), cls=JSONTabEncoder, indent=4))
+        async with aiochrome.Browser(url) as browser:
+            click.echo(json.dumps(await browser.list_tab(), cls=JSONTabEncoder, indent=4))
     except Exception as e:
         click.echo(e)
 
@@ -71,8 +74,8 @@ async def new(host, port, secure, url="about:blank"):
     _url = "%s://%s:%s" % ("https" if secure else "http", host, port)
 
     try:
-        browser = aiochrome.Browser(_url)
-        click.echo(json.dumps(await browser.new_tab(url), cls=JSONTabEncoder, indent=4))
+        async with aiochrome.Browser(_url) as browser:
+            click.echo(json.dumps(await browser.new_tab(url), cls=JSONTabEncoder, indent=4))
     except Exception as e:
         click.echo(e)
 
@@ -86,8 +89,8 @@ async def activate(host, port, secure, id):
     url = "%s://%s:%s" % ("https" if secure else "http", host, port)
 
     try:
-        browser = aiochrome.Browser(url)
-        click.echo(await browser.activate_tab(id))
+        async with aiochrome.Browser(url) as browser:
+            click.echo(await browser.activate_tab(id))
     except Exception as e:
         click.echo(e)
 
@@ -101,8 +104,8 @@ async def close(host, port, secure, id):
     url = "%s://%s:%s" % ("https" if secure else "http", host, port)
 
     try:
-        browser = aiochrome.Browser(url)
-        click.echo(await browser.close_tab(id))
+        async with aiochrome.Browser(url) as browser:
+            click.echo(await browser.close_tab(id))
     except Exception as e:
         click.echo(e)
 
@@ -115,8 +118,8 @@ async def version(host, port, secure):
     url = "%s://%s:%s" % ("https" if secure else "http", host, port)
 
     try:
-        browser = aiochrome.Browser(url)
-        click.echo(json.dumps(await browser.version(), indent=4))
+        async with aiochrome.Browser(url) as browser:
+            click.echo(json.dumps(await browser.version(), indent=4))
     except Exception as e:
         click.echo(e)
 
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+import asyncio
+import aiohttp
+
+
+__all__ = ["new_connector", "default_session", "close_default_session"]
+
+
+# connections kept open to one remote debugging endpoint, and in total
+LIMIT = 100
+LIMIT_PER_HOST = 10
+KEEPALIVE_TIMEOUT = 30
+
+# one session per event loop, a session can't be used from another loop
+_sessions = weakref.WeakKeyDictionary()
+
+
+def new_connector(limit=LIMIT, limit_per_host=LIMIT_PER_HOST, keepalive_timeout=KEEPALIVE_TIMEOUT, loop=None):
+    """a keep-alive connector for the /json endpoints"""
+    return aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host,
+                                keepalive_timeout=keepalive_timeout, loop=loop)
+
+
+def default_session(loop=None):
+    """
+    the process-wide session used by every Browser created without a session or connector
+    """
+    loop = loop or asyncio.get_event_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = _sessions[loop] = aiohttp.ClientSession(connector=new_connector(loop=loop), loop=loop)
+
+    return session
+
+
+async def close_default_session(loop=None):
+    session = _sessions.pop(loop or asyncio.get_event_loop(), None)
+    if session is None or session.closed:
+        return False
+
+    await session.close()
+    return True
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import logging
+import aiohttp
+
+from .browser import Browser
+from .pool import _AcquireContext
+from .exceptions import *
+
+
+__all__ = ["BrowserCluster", "ClusterNode"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterNode:
+    """one remote debugging endpoint of a BrowserCluster, with its own TabPool"""
+
+    def __init__(self, browser, max_concurrency, **pool_kwargs):
+        self.browser = browser
+        self.max_concurrency = max_concurrency
+        self.pool = browser.tab_pool(max_size=max_concurrency, **pool_kwargs)
+
+        self.active = 0
+        self.jobs = 0
+        self.open_tabs = 0
+        self.failures = 0
+        self.healthy = True
+        self.draining = False
+        self.last_check = None
+
+    @property
+    def url(self):
+        return self.browser.dev_url
+
+    @property
+    def available(self):
+        return self.healthy and not self.draining and self.active < self.max_concurrency
+
+    def load(self):
+        return self.active / float(self.max_concurrency)
+
+    def stats(self):
+        return {
+            "healthy": self.healthy,
+            "draining": self.draining,
+            "active": self.active,
+            "jobs": self.jobs,
+            "open_tabs": self.open_tabs,
+            "failures": self.failures,
+            "pool": self.pool.stats(),
+        }
+
+    def __str__(self):
+        return "<ClusterNode %s %s/%s>" % (self.url, self.active, self.max_concurrency)
+
+    __repr__ = __str__
+
+
+class BrowserCluster:
+    """
+    schedule jobs onto tabs of several remote debugging endpoints.
+
+    strategy `least_loaded` picks the node with the lowest active/max_concurrency,
+    `open_tabs` the node with the fewest open tabs. every `health_interval` seconds
+    each node is checked with /json/version, after `max_failures` failed checks in
+    a row a node is drained (no new jobs) and removed once its jobs are done.
+    """
+
+    strategy_least_loaded = 'least_loaded'
+    strategy_open_tabs = 'open_tabs'
+
+    def __init__(self, urls, max_concurrency=10, strategy=strategy_least_loaded,
+                 health_interval=5, health_timeout=2, max_failures=3, browser_kwargs=None, **pool_kwargs):
+        if strategy not in (self.strategy_least_loaded, self.strategy_open_tabs):
+            raise RuntimeException("unknown cluster strategy: %s" % strategy)
+
+        self.max_concurrency = max_concurrency
+        self.strategy = strategy
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.max_failures = max_failures
+
+        self._browser_kwargs = browser_kwargs or {}
+        self._pool_kwargs = pool_kwargs
+        self._tab_nodes = {}
+        self._changed = asyncio.Condition()
+        self._health_task = None
+
+        self.nodes = []
+        for url in urls:
+            self.add_node(url)
+
+    def add_node(self, url, max_concurrency=None):
+        if any(node.url == url for node in self.nodes):
+            raise RuntimeException("%s is already in the cluster" % url)
+
+        node = ClusterNode(Browser(url, **self._browser_kwargs), max_concurrency or self.max_concurrency,
+                           **self._pool_kwargs)
+        self.nodes.append(node)
+        return node
+
+    async def drain(self, url):
+        """stop scheduling onto a node, it is removed once its jobs are done"""
+        for node in self.nodes:
+            if node.url == url:
+                node.draining = True
+                if node.active == 0:
+                    await self._remove(node)
+                return True
+
+        return False
+
+    async def _remove(self, node):
+        if node not in self.nodes:
+            return
+
+        self.nodes.remove(node)
+        try:
+            await node.pool.close()
+        finally:
+            await node.browser.close()
+
+        async with self._changed:
+            # waiters may have no node left at all
+            self._changed.notify_all()
+
+    async def check(self, node):
+        node.last_check = time.time()
+        try:
+            await node.browser.version(timeout=self.health_timeout)
+            if self.strategy == self.strategy_open_tabs:
+                node.open_tabs = len(await node.browser.list_tab(timeout=self.health_timeout))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError, AioChromeException) as e:
+            node.failures += 1
+            logger.warning("%s health check failed (%s in a row): %r" % (node, node.failures, e))
+            if node.failures >= self.max_failures and node.healthy:
+                node.healthy = False
+                await self.drain(node.url)
+
+            return False
+
+        node.failures = 0
+        if not node.healthy:
+            node.healthy = True
+            async with self._changed:
+                self._changed.notify_all()
+
+        return True
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.gather(*[self.check(node) for node in list(self.nodes) if not node.draining])
+            await asyncio.sleep(self.health_interval)
+
+    async def start(self):
+        await asyncio.gather(*[self.check(node) for node in list(self.nodes)])
+        self._health_task = asyncio.ensure_future(self._health_loop())
+        return True
+
+    async def stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+
+        for node in list(self.nodes):
+            node.draining = True
+            await self._remove(node)
+
+        return True
+
+    def _pick(self):
+        nodes = [node for node in self.nodes if node.available]
+        if not nodes:
+            return None
+
+        if self.strategy == self.strategy_open_tabs:
+            return min(nodes, key=lambda node: (node.open_tabs + node.active, node.load()))
+
+        return min(nodes, key=lambda node: (node.load(), node.open_tabs))
+
+    def acquire(self, timeout=None):
+        """`async with cluster.acquire() as tab` or `tab = await cluster.acquire()`"""
+        return _AcquireContext(self, timeout)
+
+    async def _acquire(self, timeout=None):
+        deadline = None if timeout is None else self._loop_time() + timeout
+
+        async with self._changed:
+            while True:
+                if not self.nodes:
+                    raise RuntimeException("no browser left in the cluster")
+
+                node = self._pick()
+                if node:
+                    node.active += 1
+                    break
+
+                remaining = None if deadline is None else deadline - self._loop_time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutException("acquire tab from cluster timeout")
+
+                try:
+                    await asyncio.wait_for(self._changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise TimeoutException("acquire tab from cluster timeout")
+
+        try:
+            # what is left of the deadline after waiting for a node
+            remaining = None if deadline is None else deadline - self._loop_time()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutException("acquire tab from cluster timeout")
+
+            tab = await node.pool.acquire(remaining)
+        except BaseException:
+            await self._done(node)
+            raise
+
+        node.jobs += 1
+        self._tab_nodes[tab] = node
+        return tab
+
+    async def release(self, tab):
+        node = self._tab_nodes.pop(tab, None)
+        if node is None:
+            raise RuntimeException("%s is not acquired from this cluster" % tab)
+
+        try:
+            await node.pool.release(tab)
+        finally:
+            await self._done(node)
+
+    async def _done(self, node):
+        node.active -= 1
+        if node.draining and node.active == 0:
+            await self._remove(node)
+            return
+
+        async with self._changed:
+            self._changed.notify()
+
+    async def run(self, job, *args, timeout=None, **kwargs):
+        """await job(tab, *args, **kwargs) on a tab of the cluster"""
+        async with self.acquire(timeout) as tab:
+            return await job(tab, *args, **kwargs)
+
+    def _loop_time(self):
+        return asyncio.get_event_loop().time()
+
+    def stats(self):
+        return dict((node.url, node.stats()) for node in self.nodes)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def __str__(self):
+        return "<BrowserCluster %s nodes>" % len(self.nodes)
+
+    __repr__ = __str__
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from .exceptions import *
+
+
+__all__ = ["JSONCodec", "UJSONCodec", "OrjsonCodec", "get_codec"]
+
+
+class JSONCodec:
+    """stdlib json, always available"""
+
+    name = 'json'
+    # json.loads only accepts bytes since python 3.6
+    accepts_bytes = False
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+
+        return json.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    name = 'ujson'
+    accepts_bytes = True
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+    accepts_bytes = True
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj):
+        # devtools only speaks text frames
+        return self._orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+# preferred order when no codec is given
+codecs = [OrjsonCodec, UJSONCodec, JSONCodec]
+
+
+def get_codec(codec=None):
+    """
+    codec could be None (the fastest installed one), a codec name or a codec instance
+    """
+    if codec is None:
+        for codec_class in codecs:
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    if isinstance(codec, str):
+        for codec_class in codecs:
+            if codec_class.name == codec:
+                try:
+                    return codec_class()
+                except ImportError:
+                    raise RuntimeException("codec %s is not installed" % codec)
+
+        raise RuntimeException("unknown codec: %s" % codec)
+
+    if not callable(getattr(codec, 'dumps', None)) or not callable(getattr(codec, 'loads', None)):
+        raise RuntimeException("codec should have dumps and loads")
+
+    return codec
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from .tab import Tab
+from .exceptions import *
+
+
+__all__ = ["BrowserConnection", "TabSession"]
+
+
+class BrowserConnection(Tab):
+    """
+    one websocket to the browser endpoint, shared by many flattened target sessions.
+
+    messages carrying a `sessionId` are routed to the attached TabSession,
+    everything else is handled like a normal Tab (browser level domains).
+    """
+
+    def __init__(self, **kwargs):
+        # a coroutine function awaited once the connection is back, e.g. Browser.watch
+        self.on_reconnect = kwargs.pop('on_reconnect', None)
+        super().__init__(**kwargs)
+        self.sessions = {}
+        self._start_lock = asyncio.Lock()
+
+    async def _on_message(self, message):
+        session_id = message.get("sessionId")
+        if session_id:
+            session = self.sessions.get(session_id)
+            if session:
+                await session._on_message(message)
+            return
+
+        if message.get("method") == "Target.detachedFromTarget":
+            session = self.sessions.get(message["params"].get("sessionId"))
+            if session:
+                session._detach(UserAbortException("Target %s detached" % session.id))
+
+        await super()._on_message(message)
+
+    def _fail_pending(self, exc):
+        super()._fail_pending(exc)
+        for session in list(self.sessions.values()):
+            session._fail_pending(exc)
+
+    def _lost(self, exc):
+        super()._lost(exc)
+        for session in list(self.sessions.values()):
+            session._detach(exc)
+
+    async def _connection_lost(self, exc):
+        for session in list(self.sessions.values()):
+            session._connected.clear()
+
+        return await super()._connection_lost(exc)
+
+    async def _replay(self):
+        await super()._replay()
+
+        # session ids do not survive the browser connection, attach every session again
+        sessions, self.sessions = self.sessions, {}
+        for session in sessions.values():
+            try:
+                session.session_id = await self.attach(session)
+            except AioChromeException as e:
+                session._detach(e)
+                continue
+
+            await session._replay()
+
+        if self.on_reconnect is not None:
+            await self.on_reconnect()
+
+    async def start(self):
+        # many sessions may ask for the connection at the same time
+        async with self._start_lock:
+            return await super().start()
+
+    async def stop(self):
+        for session in list(self.sessions.values()):
+            session._detach(UserAbortException("Browser connection stopped"))
+
+        return await super().stop()
+
+    async def attach(self, session):
+        result = await self.call_method("Target.attachToTarget", targetId=session.id, flatten=True)
+        self.sessions[result['sessionId']] = session
+        return result['sessionId']
+
+    async def detach(self, session):
+        self.sessions.pop(session.session_id, None)
+        if self._started and not self._stopped.is_set():
+            try:
+                await self.call_method("Target.detachFromTarget", sessionId=session.session_id)
+            except CallMethodException:  # pragma: no cover
+                pass  # target already gone
+
+    def __str__(self):
+        return "<BrowserConnection [%s]>" % self._websocket_url
+
+    __repr__ = __str__
+
+
+class TabSession(Tab):
+    """
+    a Tab which talks to its target through a shared BrowserConnection,
+    it owns no websocket and no receive task.
+
+    its events are queued without waiting: a full `block` queue would hold back
+    the shared websocket, every other session with it, so it drops the new event.
+    """
+
+    _wait_event_queue = False
+
+    def __init__(self, connection, **kwargs):
+        self.connection = connection
+        super().__init__(**kwargs)
+        self.session_id = None
+
+    @property
+    def _ws(self):
+        # the connection may get a new websocket when it reconnects
+        return self.connection._ws
+
+    @_ws.setter
+    def _ws(self, value):
+        pass
+
+    async def _send(self, message, timeout=None):
+        message['sessionId'] = self.session_id
+        return await super()._send(message, timeout=timeout)
+
+    def _detach(self, exc):
+        if self._stopped.is_set():
+            return
+
+        self.connection.sessions.pop(self.session_id, None)
+        self._lost(exc)
+
+    async def start(self):
+        if self._started:
+            return False
+
+        self._started = True
+        self.status = self.status_started
+        self._stopped.clear()
+
+        try:
+            await self.connection.start()
+            self.session_id = await self.connection.attach(self)
+        except BaseException:
+            # the target may be gone already, the session was never started
+            self._started = False
+            self.status = self.status_initial
+            raise
+
+        self._connected.set()
+
+        self._handle_event_task = asyncio.ensure_future(self._handle_event_loop(), loop=self.loop)
+        return True
+
+    async def stop(self):
+        if self._stopped.is_set():
+            return False
+
+        if not self._started:
+            raise RuntimeException("Tab is not running")
+
+        self.status = self.status_stopped
+        self._stopped.set()
+        self._connected.set()
+        exc = UserAbortException("User abort, call stop() when calling method")
+        self._fail_pending(exc)
+        self._fail_watchers(exc)
+        await self.connection.detach(self)
+        if self._handle_event_task:
+            self._handle_event_task.cancel()
+        return True
+
+    async def wait(self, timeout=None):
+        if not self._started:
+            raise RuntimeException("Tab is not running")
+
+        if timeout:
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout)
+                return True
+            except asyncio.TimeoutError:
+                return False
+
+        await self._stopped.wait()
+
+    def __str__(self):
+        return "<TabSession [%s]>" % self.id
+
+    __repr__ = __str__
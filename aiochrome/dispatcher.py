@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import logging
+import functools
+import collections
+
+from .event_queue import _get_param
+
+
+__all__ = ["EventDispatcher"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class EventDispatcher:
+    """
+    take events out of the tab's event queue and call their listeners.
+
+    with concurrency 1 (default) every listener is awaited inline, like before.
+    with a higher concurrency up to `concurrency` listeners run at the same time,
+    events with the same ordering key still run one after another. the ordering
+    key is the event name, or a key set with `set_key` (e.g. `requestId`), which
+    may be shared by several events.
+    """
+
+    def __init__(self, tab, concurrency=1):
+        self.tab = tab
+        self.concurrency = concurrency
+
+        self._keys = {}
+        self._lanes = {}
+        self._lane_tasks = set()
+        self._slots = None
+
+        # event -> [count, errors, total seconds, max seconds]
+        self._stats = {}
+
+    def set_key(self, event, key):
+        """key is a params name or a callable taking the event params, None to reset"""
+        if not key:
+            return self._keys.pop(event, None)
+
+        if isinstance(key, str):
+            key = functools.partial(_get_param, key)
+
+        self._keys[event] = key
+        return True
+
+    def stats(self):
+        result = {}
+        for event, (count, errors, total, maximum) in self._stats.items():
+            result[event] = {
+                "count": count,
+                "errors": errors,
+                "avg": total / count,
+                "max": maximum,
+            }
+
+        return result
+
+    async def _call(self, handler, event):
+        callback, wildcard = handler
+        start = time.monotonic()
+        try:
+            if wildcard:
+                await callback(event['method'], event['params'])
+            else:
+                await callback(**event['params'])
+            error = 0
+        except asyncio.CancelledError:
+            raise  # an Exception before python 3.8, the tab is stopping
+        except Exception:
+            error = 1
+            logger.error("callback %s exception" % event['method'], exc_info=True)
+
+        elapsed = time.monotonic() - start
+        stats = self._stats.get(event['method'])
+        if stats is None:
+            stats = self._stats[event['method']] = [0, 0, 0.0, 0.0]
+
+        stats[0] += 1
+        stats[1] += error
+        stats[2] += elapsed
+        if elapsed > stats[3]:
+            stats[3] = elapsed
+
+        if self.tab.hooks is not None:
+            self.tab.hooks.on_handler(self.tab, event['method'], elapsed, error)
+
+    async def run(self):
+        try:
+            if self.concurrency <= 1:
+                await self._run_inline()
+            else:
+                await self._run_concurrent()
+        finally:
+            for task in list(self._lane_tasks):
+                task.cancel()
+
+    async def _run_inline(self):
+        while True:
+            event = await self.tab.event_queue.get()
+            for handler in self.tab.listeners.take(event['method']):
+                await self._call(handler, event)
+
+    async def _run_concurrent(self):
+        self._slots = asyncio.Semaphore(self.concurrency)
+        while True:
+            # a slot is taken before reading, so a bounded event queue keeps its backpressure
+            await self._slots.acquire()
+            event = await self.tab.event_queue.get()
+            handlers = self.tab.listeners.take(event['method'])
+            if not handlers:
+                self._slots.release()
+                continue
+
+            key_func = self._keys.get(event['method'])
+            lane_key = key_func(event['params']) if key_func else event['method']
+
+            lane = self._lanes.get(lane_key)
+            if lane is None:
+                lane = self._lanes[lane_key] = collections.deque()
+                task = asyncio.ensure_future(self._run_lane(lane_key, lane))
+                self._lane_tasks.add(task)
+                task.add_done_callback(self._lane_tasks.discard)
+
+            lane.append((handlers, event))
+
+    async def _run_lane(self, lane_key, lane):
+        try:
+            while lane:
+                handlers, event = lane.popleft()
+                try:
+                    for handler in handlers:
+                        await self._call(handler, event)
+                finally:
+                    self._slots.release()
+        finally:
+            self._lanes.pop(lane_key, None)
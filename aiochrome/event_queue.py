@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+import collections
+
+from .exceptions import *
+
+
+__all__ = ["EventQueue"]
+
+
+class EventQueue:
+    """
+    a bounded queue for CDP events with overflow policies:
+
+    * `block`: the reader waits until there is room (backpressure to the websocket)
+    * `drop_oldest`: discard the oldest queued event
+    * `drop_newest`: discard the incoming event
+    * `coalesce`: replace a still queued event with the same method and key,
+      set per event with `set_policy(event, 'coalesce', key)`
+
+    maxsize <= 0 means unbounded.
+    """
+
+    policy_block = 'block'
+    policy_drop_oldest = 'drop_oldest'
+    policy_drop_newest = 'drop_newest'
+    policy_coalesce = 'coalesce'
+
+    policies = (policy_block, policy_drop_oldest, policy_drop_newest, policy_coalesce)
+
+    def __init__(self, maxsize=0, policy=policy_block):
+        self._check_policy(policy)
+
+        self.policy = policy
+
+        self.queued = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._items = collections.deque()
+        self._event_policies = {}
+        self._pending_keys = {}
+
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        """
+        can be changed at runtime, a queue already over the new size only takes events again once drained below it
+        """
+        self._maxsize = maxsize
+        if self.full():
+            self._not_full.clear()
+        else:
+            self._not_full.set()
+
+    def _check_policy(self, policy):
+        if policy not in self.policies:
+            raise RuntimeException("unknown event queue policy: %s" % policy)
+
+    def set_policy(self, event, policy, key=None):
+        """
+        key is a params name or a callable taking the event params, the event method is used by default
+        """
+        if not policy:
+            return self._event_policies.pop(event, None)
+
+        self._check_policy(policy)
+
+        if isinstance(key, str):
+            key = functools.partial(_get_param, key)
+
+        self._event_policies[event] = (policy, key)
+        return True
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._items)
+
+    def _append(self, message, key):
+        entry = [message, key]
+        self._items.append(entry)
+        if key is not None:
+            self._pending_keys[key] = entry
+
+        self.queued += 1
+        self._not_empty.set()
+        if self.full():
+            self._not_full.clear()
+
+    def _popleft(self):
+        message, key = self._items.popleft()
+        if key is not None:
+            self._pending_keys.pop(key, None)
+
+        if not self._items:
+            self._not_empty.clear()
+        if not self.full():
+            self._not_full.set()
+
+        return message
+
+    async def put(self, message, wait=True):
+        """
+        return False when the message is dropped or coalesced,
+        without wait a full queue that would block drops the message like `drop_newest`
+        """
+        policy, key_func = self._event_policies.get(message['method'], (self.policy, None))
+
+        key = None
+        if policy == self.policy_coalesce:
+            key = (message['method'], key_func(message.get('params', {})) if key_func else None)
+            entry = self._pending_keys.get(key)
+            if entry:
+                entry[0] = message
+                self.coalesced += 1
+                return False
+
+            # nothing to coalesce with, overflow like the queue does
+            policy = self.policy
+
+        if not wait and policy not in (self.policy_drop_oldest, self.policy_drop_newest):
+            policy = self.policy_drop_newest
+
+        while self.full():
+            if policy == self.policy_drop_newest:
+                self.dropped += 1
+                return False
+
+            if policy == self.policy_drop_oldest:
+                self._popleft()
+                self.dropped += 1
+                break
+
+            await self._not_full.wait()
+
+        self._append(message, key)
+        return True
+
+    async def get(self):
+        while not self._items:
+            await self._not_empty.wait()
+
+        return self._popleft()
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty
+
+        return self._popleft()
+
+    def clear(self):
+        self._items.clear()
+        self._pending_keys.clear()
+        self._not_empty.clear()
+        self._not_full.set()
+
+    def stats(self):
+        return {
+            "size": len(self._items),
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
+def _get_param(name, params):
+    return params.get(name)
@@ -25,4 +25,12 @@ class TimeoutException(AioChromeException):
 
 
 class RuntimeException(AioChromeException):
-    pass
\ No newline at end of file
+    pass
+
+
+class UnknownMethodException(CallMethodException, AttributeError):
+    pass
+
+
+class InvalidParamsException(CallMethodException, TypeError):
+    pass
@@ -0,0 +1,720 @@
+# -*- coding: utf-8 -*-
+
+"""
+an in-process stand-in for chrome's remote debugging endpoint.
+
+it serves the `/json/*` HTTP endpoints, a websocket per target and a browser
+level websocket (flattened `Target.attachToTarget` sessions), with scriptable
+method results, event floods, latency and large payloads. good enough to run
+Browser and Tab without a browser, in tests and in benchmarks.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import gzip
+import base64
+import asyncio
+import signal
+import inspect
+import fnmatch
+import functools
+import collections
+
+from aiohttp import web, WSMsgType
+
+from .protocol_log import read_log
+
+
+__all__ = ["FakeChrome", "FakeTarget", "FakeMethodError", "large_payload"]
+
+
+def large_payload(size):
+    """a base64 string decoding to `size` random bytes, like a screenshot"""
+    return base64.b64encode(os.urandom(size)).decode('ascii')
+
+
+class FakeMethodError(Exception):
+    def __init__(self, message, code=-32000):
+        super().__init__(message)
+        self.code = code
+
+
+class _Client:
+    def __init__(self, ws, target=None, session_id=None):
+        self.ws = ws
+        self.target = target
+        self.session_id = session_id
+
+    async def send(self, message):
+        if self.session_id:
+            message = dict(message, sessionId=self.session_id)
+
+        if not self.ws.closed:
+            await self.ws.send_str(json.dumps(message))
+
+
+class FakeTarget:
+    def __init__(self, fake, url="about:blank", type="page"):
+        self.fake = fake
+        self.id = uuid.uuid4().hex.upper()
+        self.type = type
+        self.url = url
+        self.title = url
+        self.clients = []
+        # Page.setLifecycleEventsEnabled / Network.enable were called
+        self.lifecycle = False
+        self.network = False
+        # Fetch.enable patterns
+        self.fetch_patterns = []
+        # (transferMode, streamCompression) while tracing
+        self.tracing = None
+
+    def to_json(self):
+        return {
+            "description": "",
+            "devtoolsFrontendUrl": "/devtools/inspector.html?ws=%s/devtools/page/%s" % (self.fake.ws_host, self.id),
+            "id": self.id,
+            "title": self.title,
+            "type": self.type,
+            "url": self.url,
+            "webSocketDebuggerUrl": "ws://%s/devtools/page/%s" % (self.fake.ws_host, self.id),
+        }
+
+    def to_info(self):
+        return {
+            "targetId": self.id,
+            "type": self.type,
+            "title": self.title,
+            "url": self.url,
+            "attached": bool(self.clients),
+            "browserContextId": self.fake.browser_context_id,
+        }
+
+    async def emit(self, method, params=None):
+        """send an event to every client of this target"""
+        message = {"method": method, "params": params or {}}
+        for client in list(self.clients):
+            await client.send(message)
+
+    async def flood(self, method, params=None, count=1000, interval=0):
+        """
+        send `count` events, `params` may be a callable taking the event number
+        """
+        for i in range(count):
+            await self.emit(method, params(i) if callable(params) else params)
+            if interval:
+                await asyncio.sleep(interval)
+
+    def _paused_by(self, url, type, stage):
+        for pattern in self.fetch_patterns:
+            if pattern.get("requestStage", "Request") != stage:
+                continue
+            if pattern.get("resourceType") not in (None, type):
+                continue
+            if fnmatch.fnmatchcase(url, pattern.get("urlPattern", "*")):
+                return True
+
+        return False
+
+    async def _pause(self, params):
+        request_id = params["requestId"]
+        future = self.fake._paused[request_id] = asyncio.get_event_loop().create_future()
+        try:
+            await self.emit("Fetch.requestPaused", params)
+            return await future
+        finally:
+            self.fake._paused.pop(request_id, None)
+
+    async def fetch(self, url, type="Document", method="GET", headers=None, status=200, body=b"",
+                    response_headers=None):
+        """
+        load a resource like the page would, through Fetch.requestPaused when Fetch.enable
+        asks for it. return the outcome: `continued` (with the `request_headers` sent to
+        the network), `failed` (with the `errorReason`) or `fulfilled` (with the response
+        `headers`), and the `status` and `body` the page got.
+        """
+        request_id = "interception-job-%s" % uuid.uuid4().hex
+        request = {"url": url, "method": method, "headers": dict(headers or {})}
+        params = {"requestId": request_id, "request": request, "frameId": self.id, "resourceType": type}
+
+        if self._paused_by(url, type, "Request"):
+            action, result = await self._pause(params)
+            if action == "Fetch.failRequest":
+                return {"outcome": "failed", "errorReason": result["errorReason"]}
+
+            if action == "Fetch.fulfillRequest":
+                return {"outcome": "fulfilled", "status": result["responseCode"],
+                        "headers": result.get("responseHeaders", []),
+                        "body": base64.b64decode(result.get("body", ""))}
+
+            if "headers" in result:
+                request["headers"] = dict((h["name"], h["value"]) for h in result["headers"])
+
+        response_headers = response_headers or [{"name": "Content-Type", "value": "text/plain"}]
+        if self._paused_by(url, type, "Response"):
+            self.fake._bodies[request_id] = body
+            try:
+                await self._pause(dict(params, responseStatusCode=status, responseHeaders=response_headers))
+            finally:
+                self.fake._bodies.pop(request_id, None)
+
+        return {"outcome": "continued", "request_headers": request["headers"], "status": status, "body": body}
+
+    def __str__(self):
+        return "<FakeTarget [%s]>" % self.id
+
+    __repr__ = __str__
+
+
+class FakeChrome:
+    """
+    usage:
+
+        async with FakeChrome() as fake:
+            fake.set_method("Runtime.evaluate", {"result": {"type": "number", "value": 2}})
+            browser = aiochrome.Browser(fake.url)
+
+    a method handler is a result dict, or a callable `handler(target, **params)`
+    returning (or resolving to) the result. raise FakeMethodError for an error response.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0, strict=False):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.strict = strict
+
+        self.targets = {}
+        self.methods = {}
+        self.calls = []
+        self.record_calls = True
+
+        self.browser_id = uuid.uuid4().hex
+        self.browser_context_id = uuid.uuid4().hex.upper()
+        # browser websockets which asked for Target.setDiscoverTargets
+        self._discover = set()
+        # requestId -> future of the Fetch call continuing it, and bodies at the response stage
+        self._paused = {}
+        self._bodies = {}
+        self._sessions = {}
+        self._websockets = set()
+        # events sent in the background, cancelled by stop()
+        self._tasks = set()
+        self._runner = None
+
+        self._set_default_methods()
+
+    @property
+    def url(self):
+        return "http://%s:%s" % (self.host, self.port)
+
+    @property
+    def ws_host(self):
+        return "%s:%s" % (self.host, self.port)
+
+    def set_method(self, method, handler, latency=None):
+        """handler None removes the method, latency overrides the global latency"""
+        if handler is None:
+            return self.methods.pop(method, None)
+
+        self.methods[method] = (handler, latency)
+        return True
+
+    def new_target(self, url="about:blank", type="page"):
+        target = FakeTarget(self, url, type)
+        self.targets[target.id] = target
+        self.target_event("Target.targetCreated", target)
+        return target
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def target_event(self, method, target):
+        """send a Target lifecycle event to the browser websockets discovering targets"""
+        if method == "Target.targetDestroyed":
+            params = {"targetId": target.id}
+        else:
+            params = {"targetInfo": target.to_info()}
+
+        for ws in list(self._discover):
+            self._spawn(_Client(ws).send({"method": method, "params": params}))
+
+    async def close_target(self, target_id):
+        target = self.targets.pop(target_id, None)
+        if not target:
+            return False
+
+        for client in list(target.clients):
+            if client.session_id:
+                self._sessions.pop(client.session_id, None)
+                await _Client(client.ws).send({"method": "Target.detachedFromTarget", "params": {
+                    "sessionId": client.session_id, "targetId": target.id}})
+            else:
+                await client.ws.close()
+
+        target.clients = []
+        self.target_event("Target.targetDestroyed", target)
+        return True
+
+    def new_stream(self, data):
+        """a handle for IO.read / IO.close serving data (bytes)"""
+        handle = uuid.uuid4().hex
+        self.streams[handle] = [data, 0]
+        return handle
+
+    async def drop_connections(self, target_id=None):
+        """close websockets from the server side, of one target or all of them (browser included)"""
+        if target_id:
+            websockets = [client.ws for client in self.targets[target_id].clients if not client.session_id]
+        else:
+            websockets = list(self._websockets)
+
+        for ws in websockets:
+            await ws.close()
+
+    def replay_log(self, entries):
+        """
+        answer methods with the responses of a ProtocolLog (see read_log), each method
+        cycling through its recorded answers. truncated frames are skipped, record with
+        `max_frame=None` to replay every answer. return the replayed methods.
+        """
+        responses = collections.defaultdict(collections.deque)
+        for entry in entries:
+            if entry['direction'] != 'recv' or 'id' not in entry or 'method' not in entry:
+                continue
+
+            if 'frame' in entry and not entry.get('truncated'):
+                responses[entry['method']].append(json.loads(entry['frame']))
+
+        def replay(_responses, target, **params):
+            message = _responses[0]
+            _responses.rotate(-1)
+            if 'error' in message:
+                raise FakeMethodError(message['error']['message'], message['error'].get('code', -32000))
+
+            return message.get('result')
+
+        for method, answers in responses.items():
+            self.set_method(method, functools.partial(replay, answers))
+
+        return sorted(responses)
+
+    def _set_default_methods(self):
+        async def navigate(target, url, **kwargs):
+            target.url = target.title = url
+            self.target_event("Target.targetInfoChanged", target)
+            loader_id = uuid.uuid4().hex.upper()
+            self._spawn(self._load_events(target, loader_id))
+            return {"frameId": target.id, "loaderId": loader_id}
+
+        def fetch_enable(target, patterns=None, **kwargs):
+            target.fetch_patterns = patterns or [{"urlPattern": "*"}]
+
+        def fetch_disable(target):
+            target.fetch_patterns = []
+
+        def fetch_resolve(method, target, requestId, **kwargs):
+            future = self._paused.get(requestId)
+            if future is None or future.done():
+                raise FakeMethodError("Invalid InterceptionId.")
+
+            future.set_result((method, kwargs))
+
+        def fetch_response_body(target, requestId):
+            if requestId not in self._bodies:
+                raise FakeMethodError("Can only get response body on HeadersReceived pattern matched requests.")
+
+            return {"body": base64.b64encode(self._bodies[requestId]).decode('ascii'), "base64Encoded": True}
+
+        def tracing_start(target, transferMode="ReportEvents", streamCompression="none", **kwargs):
+            target.tracing = (transferMode, streamCompression)
+
+        async def tracing_end(target):
+            if target.tracing is None:
+                raise FakeMethodError("Tracing is not started")
+
+            transfer_mode, compression = target.tracing
+            data = self.trace_data
+            if transfer_mode == "ReturnAsStream":
+                if compression == "gzip":
+                    data = gzip.compress(data)
+                complete = {"dataLossOccurred": False, "stream": self.new_stream(data), "traceFormat": "json",
+                            "streamCompression": compression}
+            else:
+                complete = {"dataLossOccurred": False}
+                events = json.loads(data.decode('utf-8'))['traceEvents']
+                for i in range(0, len(events), 100):
+                    self._spawn(target.emit("Tracing.dataCollected", {"value": events[i:i + 100]}))
+
+            target.tracing = None
+            self._spawn(target.emit("Tracing.tracingComplete", complete))
+
+        def set_lifecycle_events_enabled(target, enabled):
+            target.lifecycle = enabled
+
+        def network_enable(target, **kwargs):
+            target.network = True
+
+        def network_disable(target):
+            target.network = False
+
+        def evaluate(target, expression, **kwargs):
+            return {"result": {"type": "undefined"}}
+
+        def capture(target, **kwargs):
+            return {"data": base64.b64encode(self.payload).decode('ascii')}
+
+        def layout_metrics(target):
+            width, height = self.content_size
+            return {
+                "layoutViewport": {"pageX": 0, "pageY": 0, "clientWidth": 800, "clientHeight": 600},
+                "visualViewport": {"offsetX": 0, "offsetY": 0, "pageX": 0, "pageY": 0,
+                                   "clientWidth": 800, "clientHeight": 600, "scale": 1},
+                "contentSize": {"x": 0, "y": 0, "width": width, "height": height},
+            }
+
+        def print_to_pdf(target, transferMode="ReturnAsBase64", **kwargs):
+            if transferMode == "ReturnAsStream":
+                return {"stream": self.new_stream(self.payload)}
+
+            return capture(target)
+
+        def io_read(target, handle, offset=None, size=None):
+            if handle not in self.streams:
+                raise FakeMethodError("Invalid stream handle")
+
+            stream = self.streams[handle]
+            if offset is not None:
+                stream[1] = offset
+
+            chunk = stream[0][stream[1]:stream[1] + (size or 64 * 1024)]
+            stream[1] += len(chunk)
+            return {
+                "base64Encoded": True,
+                "data": base64.b64encode(chunk).decode('ascii'),
+                "eof": stream[1] >= len(stream[0]),
+            }
+
+        def io_close(target, handle):
+            if self.streams.pop(handle, None) is None:
+                raise FakeMethodError("Invalid stream handle")
+
+        self.payload = os.urandom(64 * 1024)
+        # width, height of the page for Page.getLayoutMetrics
+        self.content_size = (1280, 3000)
+        # what Tracing.end returns
+        self.trace_data = json.dumps({"traceEvents": [
+            {"pid": 1, "tid": 1, "ts": i, "ph": "X", "cat": "devtools.timeline", "name": "RunTask", "dur": 10}
+            for i in range(10000)]}).encode('utf-8')
+        # seconds each request made by a page after its load event takes
+        self.page_resources = []
+        self.streams = {}
+        self.set_method("Page.navigate", navigate)
+        self.set_method("Tracing.start", tracing_start)
+        self.set_method("Tracing.end", tracing_end)
+        self.set_method("Fetch.enable", fetch_enable)
+        self.set_method("Fetch.disable", fetch_disable)
+        self.set_method("Fetch.getResponseBody", fetch_response_body)
+        for method in ("Fetch.continueRequest", "Fetch.failRequest", "Fetch.fulfillRequest"):
+            self.set_method(method, functools.partial(fetch_resolve, method))
+        self.set_method("Page.setLifecycleEventsEnabled", set_lifecycle_events_enabled)
+        self.set_method("Network.enable", network_enable)
+        self.set_method("Network.disable", network_disable)
+        self.set_method("Runtime.evaluate", evaluate)
+        self.set_method("Page.captureScreenshot", capture)
+        self.set_method("Page.getLayoutMetrics", layout_metrics)
+        self.set_method("Page.printToPDF", print_to_pdf)
+        self.set_method("IO.read", io_read)
+        self.set_method("IO.close", io_close)
+
+    async def _load_events(self, target, loader_id):
+        async def lifecycle(name):
+            if target.lifecycle:
+                await target.emit("Page.lifecycleEvent", {
+                    "frameId": target.id, "loaderId": loader_id, "name": name, "timestamp": time.time()})
+
+        async def request(request_id, url, type, delay=0):
+            if target.network:
+                await target.emit("Network.requestWillBeSent", {
+                    "requestId": request_id, "loaderId": loader_id, "documentURL": target.url,
+                    "request": {"url": url, "method": "GET", "headers": {}},
+                    "timestamp": time.time(), "type": type, "frameId": target.id})
+
+            if delay:
+                await asyncio.sleep(delay)
+
+            if target.network:
+                await target.emit("Network.loadingFinished", {
+                    "requestId": request_id, "timestamp": time.time(), "encodedDataLength": 0})
+
+        await target.emit("Page.frameStartedLoading", {"frameId": target.id})
+        await lifecycle("init")
+        await request(loader_id, target.url, "Document")
+        await lifecycle("commit")
+        await target.emit("Page.domContentEventFired", {"timestamp": 0})
+        await lifecycle("DOMContentLoaded")
+        await target.emit("Page.loadEventFired", {"timestamp": 0})
+        await lifecycle("load")
+
+        # the requests a page makes once it is loaded, see page_resources
+        await asyncio.gather(*[request("%s.%s" % (loader_id, i), "%s/resource/%s" % (target.url, i), "XHR", delay)
+                               for i, delay in enumerate(self.page_resources)])
+        await lifecycle("networkAlmostIdle")
+        await lifecycle("networkIdle")
+        await target.emit("Page.frameStoppedLoading", {"frameId": target.id})
+
+    async def _call(self, target, message):
+        method = message.get("method")
+        params = message.get("params") or {}
+        if self.record_calls:
+            self.calls.append((target.id if target else None, method, params))
+
+        handler, latency = self.methods.get(method, (None, None))
+        latency = self.latency if latency is None else latency
+        if latency:
+            await asyncio.sleep(latency)
+
+        if handler is None:
+            if self.strict:
+                return {"id": message["id"], "error": {"code": -32601, "message": "'%s' wasn't found" % method}}
+
+            return {"id": message["id"], "result": {}}
+
+        try:
+            if callable(handler):
+                result = handler(target, **params)
+                if inspect.isawaitable(result):
+                    result = await result
+            else:
+                result = handler
+        except FakeMethodError as e:
+            return {"id": message["id"], "error": {"code": e.code, "message": str(e)}}
+        except TypeError as e:
+            return {"id": message["id"], "error": {"code": -32602, "message": "Invalid parameters: %s" % e}}
+
+        return {"id": message["id"], "result": result or {}}
+
+    async def _browser_call(self, ws, message):
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if method == "Target.attachToTarget":
+            target = self.targets.get(params.get("targetId"))
+            if not target:
+                return {"id": message["id"], "error": {"code": -32602, "message": "No target with given id found"}}
+
+            session_id = uuid.uuid4().hex.upper()
+            client = _Client(ws, target, session_id)
+            target.clients.append(client)
+            self._sessions[session_id] = (target, client)
+            return {"id": message["id"], "result": {"sessionId": session_id}}
+
+        if method == "Target.setDiscoverTargets":
+            if params.get("discover"):
+                self._discover.add(ws)
+            else:
+                self._discover.discard(ws)
+            return {"id": message["id"], "result": {}}
+
+        if method == "Target.getTargets":
+            return {"id": message["id"], "result": {
+                "targetInfos": [target.to_info() for target in self.targets.values()]}}
+
+        if method == "Target.detachFromTarget":
+            target, client = self._sessions.pop(params.get("sessionId"), (None, None))
+            if not target:
+                return {"id": message["id"], "error": {"code": -32602, "message": "No session with given id"}}
+
+            if client in target.clients:
+                target.clients.remove(client)
+            return {"id": message["id"], "result": {}}
+
+        return await self._call(None, message)
+
+    async def _handle(self, ws, client, message):
+        session_id = message.get("sessionId")
+        if client is None and session_id:
+            target, session_client = self._sessions.get(session_id, (None, None))
+            if not target:
+                response = {"id": message["id"], "error": {"code": -32001, "message": "Session with given id not found."}}
+                await _Client(ws, session_id=session_id).send(response)
+                return
+
+            await session_client.send(await self._call(target, message))
+        elif client is None:
+            await _Client(ws).send(await self._browser_call(ws, message))
+        else:
+            await client.send(await self._call(client.target, message))
+
+    async def _websocket(self, request, client_factory):
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+
+        client = client_factory(ws)
+        tasks = set()
+        self._websockets.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                # answer concurrently, so latency does not serialize the calls
+                task = asyncio.ensure_future(self._handle(ws, client, json.loads(msg.data)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            self._websockets.discard(ws)
+            for task in tasks:
+                task.cancel()
+
+        return ws
+
+    async def _page_websocket(self, request):
+        target = self.targets.get(request.match_info['id'])
+        if not target:
+            raise web.HTTPNotFound()
+
+        def client_factory(ws):
+            client = _Client(ws, target)
+            target.clients.append(client)
+            return client
+
+        try:
+            return await self._websocket(request, client_factory)
+        finally:
+            target.clients = [c for c in target.clients if c.session_id or not c.ws.closed]
+
+    async def _browser_websocket(self, request):
+        def client_factory(ws):
+            return None
+
+        try:
+            return await self._websocket(request, client_factory)
+        finally:
+            self._discover = set(ws for ws in self._discover if not ws.closed)
+            for session_id, (target, client) in list(self._sessions.items()):
+                if client.ws.closed:
+                    self._sessions.pop(session_id, None)
+                    if client in target.clients:
+                        target.clients.remove(client)
+
+    async def _json_list(self, request):
+        return web.json_response([target.to_json() for target in self.targets.values()])
+
+    async def _json_new(self, request):
+        target = self.new_target(request.query_string or "about:blank")
+        return web.json_response(target.to_json())
+
+    async def _json_activate(self, request):
+        if request.match_info['id'] not in self.targets:
+            return web.Response(text="No such target id: %s" % request.match_info['id'], status=404)
+
+        return web.Response(text="Target activated")
+
+    async def _json_close(self, request):
+        if not await self.close_target(request.match_info['id']):
+            return web.Response(text="No such target id: %s" % request.match_info['id'], status=404)
+
+        return web.Response(text="Target is closing")
+
+    async def _json_version(self, request):
+        return web.json_response({
+            "Browser": "HeadlessChrome/62.0.3197.0",
+            "Protocol-Version": "1.2",
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                          "(KHTML, like Gecko) HeadlessChrome/62.0.3197.0 Safari/537.36",
+            "V8-Version": "6.2.369",
+            "WebKit-Version": "537.36",
+            "webSocketDebuggerUrl": "ws://%s/devtools/browser/%s" % (self.ws_host, self.browser_id),
+        })
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get("/json", self._json_list)
+        app.router.add_get("/json/list", self._json_list)
+        app.router.add_get("/json/new", self._json_new)
+        app.router.add_get("/json/activate/{id}", self._json_activate)
+        app.router.add_get("/json/close/{id}", self._json_close)
+        app.router.add_get("/json/version", self._json_version)
+        app.router.add_get("/devtools/page/{id}", self._page_websocket)
+        app.router.add_get("/devtools/browser/{id}", self._browser_websocket)
+        return app
+
+    async def start(self):
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+
+        return self
+
+    async def stop(self):
+        for target_id in list(self.targets):
+            await self.close_target(target_id)
+
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        # the runner would wait for the clients to hang up
+        await self.drop_connections()
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def __str__(self):
+        return "<FakeChrome %s>" % self.url
+
+    __repr__ = __str__
+
+
+def main(argv=None):
+    """
+    run a FakeChrome as if it were a chrome binary, e.g. as the ChromeLauncher stub:
+
+        python -m aiochrome.fake_chrome --remote-debugging-port=9222
+
+    `--replay-log=PATH` answers with the responses of a ProtocolLog.
+    other chrome switches are accepted and ignored.
+    """
+    port = 9222
+    replay = None
+    for arg in (sys.argv[1:] if argv is None else argv):
+        if arg.startswith("--remote-debugging-port="):
+            port = int(arg.split("=", 1)[1])
+        elif arg.startswith("--replay-log="):
+            replay = arg.split("=", 1)[1]
+
+    loop = asyncio.get_event_loop()
+    fake = FakeChrome(port=port)
+    if replay:
+        fake.replay_log(read_log(replay))
+
+    loop.run_until_complete(fake.start())
+
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    loop.run_until_complete(stop.wait())
+    loop.run_until_complete(fake.stop())
+
+
+if __name__ == '__main__':
+    main()
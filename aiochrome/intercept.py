@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+import re
+import time
+import base64
+import asyncio
+import fnmatch
+import logging
+
+from .exceptions import *
+
+
+__all__ = ["Interceptor", "InterceptRule"]
+
+
+logger = logging.getLogger(__name__)
+
+
+resource_types = dict((name.lower(), name) for name in [
+    "Document", "Stylesheet", "Image", "Media", "Font", "Script", "TextTrack", "XHR", "Fetch", "Prefetch",
+    "EventSource", "WebSocket", "Manifest", "SignedExchange", "Ping", "CSPViolationReport", "Preflight", "Other",
+])
+
+
+class InterceptRule:
+    """
+    what to do with the requests matching `types` (resource types, like "Image")
+    and `url` (a glob like "*.woff2" or a compiled regex), both optional:
+
+    * `block`: fail the request with `error_reason`
+    * `headers`: set the `headers` of the request, a None value removes a header
+    * `cache`: fulfill the request from the cache of the Interceptor, or store its response
+    """
+
+    action_block = 'block'
+    action_headers = 'headers'
+    action_cache = 'cache'
+
+    def __init__(self, action, types=None, url=None, headers=None, error_reason="BlockedByClient"):
+        if action not in (self.action_block, self.action_headers, self.action_cache):
+            raise RuntimeException("unknown intercept action: %s" % action)
+
+        self.action = action
+        self.types = None
+        if types:
+            if isinstance(types, str):
+                types = [types]
+
+            unknown = [t for t in types if t.lower() not in resource_types]
+            if unknown:
+                raise RuntimeException("unknown resource types: %s" % ", ".join(unknown))
+
+            self.types = [resource_types[t.lower()] for t in types]
+
+        self.url = re.compile(fnmatch.translate(url)) if isinstance(url, str) else url
+        self.headers = headers or {}
+        self.error_reason = error_reason
+
+    def match(self, url, resource_type):
+        if self.types is not None and resource_type not in self.types:
+            return False
+
+        if self.url is not None and not self.url.match(url):
+            return False
+
+        return True
+
+    def __str__(self):
+        return "<InterceptRule %s %s %s>" % (self.action, self.types, self.url.pattern if self.url else None)
+
+    __repr__ = __str__
+
+
+class Interceptor:
+    """
+    the Fetch domain of a tab driven by a list of InterceptRule (or their kwargs as dicts).
+
+    every Fetch.requestPaused is handled in a task of its own, not by the listener
+    queue, so a slow cache read does not hold back the other requests of the page.
+    """
+
+    def __init__(self, tab, rules, cache=None):
+        self.tab = tab
+        self.rules = [rule if isinstance(rule, InterceptRule) else InterceptRule(**rule) for rule in rules]
+        self.cache = cache
+
+        self._tasks = set()
+        self._started = False
+
+        self.intercepted = 0
+        self.blocked = 0
+        self.fulfilled = 0
+        self.continued = 0
+        self.stored = 0
+        self.errors = 0
+        self.bytes_saved = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def patterns(self):
+        patterns = [{"urlPattern": "*", "requestStage": "Request"}]
+        if self.cache is None:
+            return patterns
+
+        cache_rules = [rule for rule in self.rules if rule.action == InterceptRule.action_cache]
+        if any(rule.types is None for rule in cache_rules):
+            patterns.append({"urlPattern": "*", "requestStage": "Response"})
+        else:
+            for resource_type in sorted(set(t for rule in cache_rules for t in rule.types)):
+                patterns.append({"urlPattern": "*", "resourceType": resource_type, "requestStage": "Response"})
+
+        return patterns
+
+    async def start(self):
+        if self._started:
+            return False
+
+        self.tab._watchers.append(self)
+        self._started = True
+        try:
+            await self.tab.call_method("Fetch.enable", patterns=self.patterns())
+        except BaseException:
+            await self.stop()
+            raise
+
+        return True
+
+    async def stop(self):
+        if not self._started:
+            return False
+
+        self._started = False
+        self.tab._watchers.remove(self)
+        for task in list(self._tasks):
+            task.cancel()
+
+        if self.tab.status == self.tab.status_started:
+            await self.tab.call_method("Fetch.disable")
+
+        return True
+
+    def feed(self, method, params):
+        if method != "Fetch.requestPaused":
+            return
+
+        task = asyncio.ensure_future(self._paused(params, time.monotonic()), loop=self.tab.loop)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def fail(self, exc):
+        # the tab is gone, so are its paused requests
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def _paused(self, params, received):
+        self.intercepted += 1
+        try:
+            if 'responseStatusCode' in params or 'responseErrorReason' in params:
+                await self._response(params)
+            else:
+                await self._request(params)
+        except AioChromeException as e:
+            self.errors += 1
+            logger.warning("intercept %s failed: %s" % (params.get('request', {}).get('url'), e))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # a cache on a full disk, an odd payload: still never leave the request paused
+            self.errors += 1
+            logger.exception("intercept %s failed" % params.get('request', {}).get('url'))
+            await self._continue(params)
+
+        latency = time.monotonic() - received
+        self._latency_total += latency
+        if latency > self._latency_max:
+            self._latency_max = latency
+
+    async def _continue(self, params):
+        if 'requestId' not in params:
+            return
+
+        try:
+            await self.tab.call_method("Fetch.continueRequest", requestId=params['requestId'])
+        except AioChromeException as e:
+            logger.warning("intercept continue %s failed: %s" % (params['requestId'], e))
+
+    def _cacheable(self, params):
+        if self.cache is None or params['request'].get('method', 'GET') != 'GET':
+            return False
+
+        url, resource_type = params['request']['url'], params.get('resourceType')
+        return any(rule.action == InterceptRule.action_cache and rule.match(url, resource_type) for rule in self.rules)
+
+    async def _request(self, params):
+        request = params['request']
+        headers = None
+        for rule in self.rules:
+            if not rule.match(request['url'], params.get('resourceType')):
+                continue
+
+            if rule.action == InterceptRule.action_block:
+                self.blocked += 1
+                return await self.tab.call_method("Fetch.failRequest", requestId=params['requestId'],
+                                                  errorReason=rule.error_reason)
+
+            if rule.action == InterceptRule.action_headers:
+                if headers is None:
+                    headers = dict(request.get('headers', {}))
+
+                for name, value in rule.headers.items():
+                    # header names are case insensitive
+                    for existing in [n for n in headers if n.lower() == name.lower()]:
+                        del headers[existing]
+                    if value is not None:
+                        headers[name] = value
+
+        if self._cacheable(params):
+            entry = await self.cache.lookup(request['url'])
+            if entry is not None:
+                self.fulfilled += 1
+                self.bytes_saved += len(entry['body'])
+                return await self.tab.call_method(
+                    "Fetch.fulfillRequest", requestId=params['requestId'], responseCode=entry['status'],
+                    responseHeaders=entry['headers'], body=base64.b64encode(entry['body']).decode('ascii'))
+
+        self.continued += 1
+        kwargs = {}
+        if headers is not None:
+            kwargs['headers'] = [{"name": name, "value": value} for name, value in headers.items()]
+
+        await self.tab.call_method("Fetch.continueRequest", requestId=params['requestId'], **kwargs)
+
+    async def _response(self, params):
+        if params.get('responseStatusCode') == 200 and self._cacheable(params):
+            result = await self.tab.call_method("Fetch.getResponseBody", requestId=params['requestId'])
+            if result.get('base64Encoded'):
+                body = base64.b64decode(result['body'])
+            else:
+                body = result['body'].encode('utf-8')
+
+            if await self.cache.store(params['request']['url'], 200, params.get('responseHeaders', []), body):
+                self.stored += 1
+
+        await self.tab.call_method("Fetch.continueRequest", requestId=params['requestId'])
+
+    def stats(self):
+        handled = self.intercepted - len(self._tasks)
+        return {
+            "intercepted": self.intercepted,
+            "blocked": self.blocked,
+            "fulfilled": self.fulfilled,
+            "continued": self.continued,
+            "stored": self.stored,
+            "errors": self.errors,
+            "bytes_saved": self.bytes_saved,
+            "avg": self._latency_total / handled if handled else 0.0,
+            "max": self._latency_max,
+        }
+
+    def __str__(self):
+        return "<Interceptor [%s] %s rules>" % (self.tab.id, len(self.rules))
+
+    __repr__ = __str__
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import atexit
+import signal
+import shutil
+import socket
+import asyncio
+import logging
+import tempfile
+import aiohttp
+
+from .browser import Browser
+from .client import default_session
+from .exceptions import *
+
+
+__all__ = ["ChromeLauncher", "ChromeProcess", "find_chrome"]
+
+
+logger = logging.getLogger(__name__)
+
+
+chrome_names = ["google-chrome", "google-chrome-stable", "google-chrome-beta", "chromium", "chromium-browser", "chrome"]
+
+default_args = [
+    "--headless",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--mute-audio",
+]
+
+
+def find_chrome():
+    """$CHROME_PATH, or the first chrome/chromium on $PATH"""
+    if os.getenv("CHROME_PATH"):
+        return os.getenv("CHROME_PATH")
+
+    for name in chrome_names:
+        path = shutil.which(name)
+        if path:
+            return path
+
+    return None
+
+
+def free_port():
+    sock = socket.socket()
+    try:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+# pids still running at interpreter exit, killed there so no chrome is left behind
+_running = set()
+
+
+@atexit.register
+def _kill_orphans():  # pragma: no cover
+    for pid in list(_running):
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(pid, signal.SIGKILL)
+            else:
+                os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+
+class ChromeProcess:
+    """one chrome process with its own port and user-data-dir"""
+
+    def __init__(self, command, port, user_data_dir, args=None):
+        self.command = command
+        self.port = port
+        self.user_data_dir = user_data_dir
+        self.args = args or []
+
+        self.process = None
+        self.restarts = 0
+        self.ready = False
+        self.ready_time = None
+        self.first_tab_time = None
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%s" % self.port
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        command = self.command + self.args + [
+            "--remote-debugging-port=%s" % self.port,
+            "--user-data-dir=%s" % self.user_data_dir,
+            "about:blank",
+        ]
+
+        self.ready = False
+
+        # a new process group, so renderers and helpers go away with it
+        kwargs = {"start_new_session": True} if hasattr(os, 'killpg') else {}
+        self.process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL, **kwargs)
+        _running.add(self.process.pid)
+        return self.process
+
+    async def wait_ready(self, session, timeout=30):
+        """poll /json/version until it answers, return the seconds it took"""
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
+            if not self.running:
+                raise RuntimeException("%s exited with %s during startup" % (self, self.process.returncode))
+
+            try:
+                async with session.get("%s/json/version" % self.url, timeout=1) as rp:
+                    if rp.status == 200:
+                        self.ready = True
+                        self.ready_time = time.monotonic() - start
+                        return self.ready_time
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+            await asyncio.sleep(0.05)
+
+        raise TimeoutException("%s not ready after %ss" % (self, timeout))
+
+    def _signal(self, sig):
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(self.process.pid, sig)
+            else:
+                self.process.send_signal(sig)
+        except (OSError, ProcessLookupError):
+            pass
+
+    async def stop(self, timeout=5):
+        if self.process is None:
+            return False
+
+        if self.running:
+            self._signal(signal.SIGTERM)
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._signal(signal.SIGKILL)
+                await self.process.wait()
+
+        # the group may outlive its leader
+        if hasattr(signal, 'SIGKILL'):
+            self._signal(signal.SIGKILL)
+
+        _running.discard(self.process.pid)
+        return True
+
+    def __str__(self):
+        return "<ChromeProcess %s pid %s>" % (self.url, self.process.pid if self.process else None)
+
+    __repr__ = __str__
+
+
+class ChromeLauncher:
+    """
+    spawn `count` chrome processes, wait until they answer /json/version, restart the
+    ones which crash and kill all of them on stop():
+
+        async with ChromeLauncher(count=4) as launcher:
+            for browser in launcher.browsers:
+                ...
+
+    `executable` is a path or a command list (e.g. a stub for tests), found with
+    find_chrome() by default.
+    """
+
+    def __init__(self, executable=None, count=1, ports=None, args=None, headless=True,
+                 user_data_dir=None, startup_timeout=30, restart=True, max_restarts=5,
+                 warmup=False, browser_kwargs=None):
+        executable = executable or find_chrome()
+        if not executable:
+            raise RuntimeException("chrome not found, set CHROME_PATH or pass executable")
+
+        if ports is not None and len(ports) < count:
+            raise RuntimeException("%s ports for %s browsers" % (len(ports), count))
+
+        self.command = list(executable) if isinstance(executable, (list, tuple)) else [executable]
+        self.count = count
+        self.ports = ports
+        self.args = list(default_args if headless else default_args[1:]) + list(args or [])
+        self.startup_timeout = startup_timeout
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.warmup = warmup
+
+        self._browser_kwargs = browser_kwargs or {}
+        self._user_data_dir = user_data_dir
+        self._temp_dir = None
+        self._supervisors = []
+
+        self.processes = []
+        self.browsers = []
+
+    async def _first_tab(self, process, browser):
+        start = time.monotonic()
+        tab = await browser.new_tab(timeout=self.startup_timeout)
+        await tab.start()
+        await tab.Runtime.evaluate(expression="1", _timeout=self.startup_timeout)
+        await tab.stop()
+        await browser.close_tab(tab, timeout=self.startup_timeout)
+        process.first_tab_time = process.ready_time + time.monotonic() - start
+
+    async def _launch(self, process):
+        await process.start()
+        try:
+            await process.wait_ready(default_session(), self.startup_timeout)
+        except AioChromeException:
+            await process.stop()
+            raise
+
+        logger.info("%s ready in %.3fs" % (process, process.ready_time))
+
+    async def _supervise(self, process, browser):
+        while True:
+            await process.process.wait()
+            if not self.restart or process.restarts >= self.max_restarts:
+                logger.error("%s exited with %s, not restarted" % (process, process.process.returncode))
+                # its pid may be reused, the atexit kill must not find it
+                _running.discard(process.process.pid)
+                return
+
+            process.restarts += 1
+            logger.warning("%s exited with %s, restart %s" % (process, process.process.returncode, process.restarts))
+            _running.discard(process.process.pid)
+            try:
+                await self._launch(process)
+            except AioChromeException:
+                logger.error("%s restart failed" % process, exc_info=True)
+                return
+
+            # tabs of the dead process are gone
+            browser._tabs.clear()
+            if browser._connection:
+                await browser.disconnect()
+
+    async def start(self):
+        if self._user_data_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="aiochrome-")
+
+        base_dir = self._user_data_dir or self._temp_dir
+        ports = self.ports or [free_port() for _ in range(self.count)]
+
+        self.processes = [ChromeProcess(self.command, port, os.path.join(base_dir, "chrome-%s" % port), self.args)
+                          for port in ports[:self.count]]
+
+        try:
+            await asyncio.gather(*[self._launch(process) for process in self.processes])
+        except BaseException:
+            await self.stop()
+            raise
+
+        self.browsers = [Browser(process.url, **self._browser_kwargs) for process in self.processes]
+        if self.warmup:
+            await asyncio.gather(*[self._first_tab(process, browser)
+                                   for process, browser in zip(self.processes, self.browsers)])
+
+        self._supervisors = [asyncio.ensure_future(self._supervise(process, browser))
+                             for process, browser in zip(self.processes, self.browsers)]
+        return self.browsers
+
+    async def stop(self):
+        for task in self._supervisors:
+            task.cancel()
+        self._supervisors = []
+
+        for browser in self.browsers:
+            await browser.close()
+        self.browsers = []
+
+        await asyncio.gather(*[process.stop() for process in self.processes])
+
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+        return True
+
+    def stats(self):
+        return [{
+            "url": process.url,
+            "pid": process.process.pid if process.process else None,
+            "running": process.running,
+            "ready": process.ready,
+            "restarts": process.restarts,
+            "ready_time": process.ready_time,
+            "first_tab_time": process.first_tab_time,
+        } for process in self.processes]
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def __str__(self):
+        return "<ChromeLauncher %s %s processes>" % (" ".join(self.command), len(self.processes))
+
+    __repr__ = __str__
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from .exceptions import *
+
+
+__all__ = ["NavigationWatcher"]
+
+
+class NavigationWatcher:
+    """
+    follow one navigation of a tab with Page.lifecycleEvent and the Network requests
+    of its document, until `wait_until`:
+
+    * `domcontentloaded`: the DOMContentLoaded lifecycle event
+    * `load`: the load lifecycle event
+    * `networkidle`: after load, no request of the document in flight for `idle_time`
+      seconds (or chrome's own networkIdle lifecycle event)
+
+    the tab feeds it every event while it is in `tab._watchers`, and fails it when
+    the tab is stopped or its connection lost.
+    """
+
+    wait_domcontentloaded = 'domcontentloaded'
+    wait_load = 'load'
+    wait_networkidle = 'networkidle'
+
+    lifecycle_names = {
+        wait_domcontentloaded: 'DOMContentLoaded',
+        wait_load: 'load',
+        wait_networkidle: 'networkIdle',
+    }
+
+    def __init__(self, tab, wait_until=wait_load, idle_time=0.5):
+        if wait_until not in self.lifecycle_names:
+            raise RuntimeException("unknown wait_until: %s" % wait_until)
+
+        self.tab = tab
+        self.wait_until = wait_until
+        self.idle_time = idle_time
+
+        self.frame_id = None
+        self.loader_id = None
+        self.start = tab.loop.time()
+        self.timing = {}
+        self.requests = 0
+
+        # events may come before the answer of Page.navigate tells which loader is ours
+        self._lifecycle = {}
+        self._inflight = {}
+        self._idle_handle = None
+        self._error = None
+        self._done = asyncio.Event()
+
+    def _elapsed(self):
+        return round(self.tab.loop.time() - self.start, 6)
+
+    def feed(self, method, params):
+        if method == "Page.lifecycleEvent":
+            names = self._lifecycle.setdefault((params.get('frameId'), params.get('loaderId')), {})
+            names.setdefault(params.get('name'), self._elapsed())
+        elif method == "Network.requestWillBeSent":
+            # a redirect keeps its requestId
+            if params.get('requestId') not in self._inflight:
+                self._inflight[params.get('requestId')] = params.get('loaderId')
+                self.requests += 1
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            self._inflight.pop(params.get('requestId'), None)
+        else:
+            return
+
+        self._check()
+
+    def navigated(self, result):
+        """the result of Page.navigate"""
+        self.timing['navigate'] = self._elapsed()
+        self.frame_id = result.get('frameId')
+        self.loader_id = result.get('loaderId')
+
+        # no loader, a same-document navigation: nothing to wait for
+        if self.loader_id is None:
+            return self._finish()
+
+        self._check()
+
+    def _check(self):
+        if self.loader_id is None or self._done.is_set():
+            return
+
+        names = self._lifecycle.get((self.frame_id, self.loader_id), {})
+        for wait_until, name in self.lifecycle_names.items():
+            if name in names and wait_until not in self.timing:
+                self.timing[wait_until] = names[name]
+
+        if self.wait_until in self.timing:
+            return self._finish()
+
+        if self.wait_until != self.wait_networkidle or self.wait_load not in self.timing:
+            return
+
+        inflight = sum(1 for loader_id in self._inflight.values() if loader_id == self.loader_id)
+        if inflight:
+            self.close()
+        elif self._idle_handle is None:
+            self._idle_handle = self.tab.loop.call_later(self.idle_time, self._idle)
+
+    def _idle(self):
+        self._idle_handle = None
+        self.timing[self.wait_networkidle] = round(self._elapsed() - self.idle_time, 6)
+        self._finish()
+
+    def _finish(self):
+        self.timing['total'] = self._elapsed()
+        self._done.set()
+
+    def fail(self, exc):
+        """the tab is gone, the navigation will never finish"""
+        if self._done.is_set():
+            return
+
+        self._error = exc
+        self.close()
+        self._done.set()
+
+    async def wait(self, timeout=None):
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException("navigation timeout waiting for %s" % self.wait_until)
+
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def __str__(self):
+        return "<NavigationWatcher [%s] %s>" % (self.loader_id, self.wait_until)
+
+    __repr__ = __str__
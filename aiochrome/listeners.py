@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+from .exceptions import *
+
+
+__all__ = ["Listeners"]
+
+
+class _Subscription:
+    __slots__ = ('pattern', 'callback', 'once')
+
+    def __init__(self, pattern, callback, once):
+        self.pattern = pattern
+        self.callback = callback
+        self.once = once
+
+
+class Listeners:
+    """
+    the listeners of a tab, any number per event:
+
+    * `Page.loadEventFired`: called with the event params, `callback(**params)`
+    * `Network.*` (every event of a domain) or `*` (every event): called with the
+      event name and its params, `callback(method, params)`
+    * `once`: removed when it is dispatched for the first time
+
+    listeners of an event run in the order they were added. the listeners of an
+    event name are resolved the first time it is seen and cached until a listener
+    is added or removed, so a message costs one dict lookup.
+
+    take() gives (callback, wildcard) pairs, the dispatcher calls a wildcard
+    listener with the params dict as it is.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        # event -> ((callback, wildcard) pairs, once subscriptions), () when nobody listens
+        self._resolved = {}
+
+    @staticmethod
+    def _matches(pattern, event):
+        if pattern == event or pattern == "*":
+            return True
+
+        return pattern.endswith(".*") and event.startswith(pattern[:-1])
+
+    def _resolve(self, event):
+        callbacks = []
+        once = []
+        for subscription in self._subscriptions:
+            if not self._matches(subscription.pattern, event):
+                continue
+
+            callbacks.append((subscription.callback, subscription.pattern != event))
+            if subscription.once:
+                once.append(subscription)
+
+        resolved = self._resolved[event] = (tuple(callbacks), tuple(once)) if callbacks else ()
+        return resolved
+
+    def add(self, event, callback, once=False):
+        if not callable(callback):
+            raise RuntimeException("callback should be callable")
+
+        self._subscriptions.append(_Subscription(event, callback, once))
+        self._resolved = {}
+        return True
+
+    def remove(self, event, callback=None):
+        """remove a listener of event, or all of them without callback, return the removed callbacks"""
+        removed = [s for s in self._subscriptions if s.pattern == event and (callback is None or s.callback == callback)]
+        if removed:
+            self._subscriptions = [s for s in self._subscriptions if s not in removed]
+            self._resolved = {}
+
+        return [s.callback for s in removed]
+
+    def set(self, event, callback):
+        """the one listener of event, replacing the others, like Tab.set_listener always did"""
+        if not callable(callback):
+            raise RuntimeException("callback should be callable")
+
+        self.remove(event)
+        return self.add(event, callback)
+
+    def get(self, event):
+        """the first listener added for exactly event, or None"""
+        for subscription in self._subscriptions:
+            if subscription.pattern == event:
+                return subscription.callback
+
+        return None
+
+    def take(self, event):
+        """the (callback, wildcard) pairs to dispatch event to, once listeners are removed on the way"""
+        resolved = self._resolved.get(event)
+        if resolved is None:
+            resolved = self._resolve(event)
+
+        if not resolved:
+            return ()
+
+        callbacks, once = resolved
+        if once:
+            self._subscriptions = [s for s in self._subscriptions if s not in once]
+            self._resolved = {}
+
+        return callbacks
+
+    def clear(self):
+        self._subscriptions = []
+        self._resolved = {}
+
+    def __contains__(self, event):
+        """whether anybody listens to event"""
+        resolved = self._resolved.get(event)
+        if resolved is None:
+            resolved = self._resolve(event)
+
+        return bool(resolved)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def __str__(self):
+        return "<Listeners %s>" % len(self._subscriptions)
+
+    __repr__ = __str__
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import uuid
+import bisect
+import asyncio
+import logging
+import collections
+
+
+__all__ = ["Metrics", "Histogram", "MemorySink", "PrometheusTextSink"]
+
+
+logger = logging.getLogger(__name__)
+
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+DEPTH_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        cumulative = 0
+        buckets = collections.OrderedDict()
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class Metrics:
+    """
+    the hooks of Tab, its dispatcher and Browser, recorded as counters and histograms:
+
+        metrics = aiochrome.Metrics(sinks=[aiochrome.PrometheusTextSink("/var/lib/node_exporter/aiochrome.prom")])
+        browser = aiochrome.Browser(hooks=metrics)
+        metrics.start(interval=15)
+
+    a tab without hooks (the default) pays one attribute check per message.
+    any object with the same on_* methods can be used as hooks.
+    """
+
+    # name -> (type, help, label)
+    definitions = collections.OrderedDict([
+        ("aiochrome_call_duration_seconds", ("histogram", "call_method round trip", "method")),
+        ("aiochrome_call_errors_total", ("counter", "calls which failed or timed out", "method")),
+        ("aiochrome_calls_in_flight", ("gauge", "calls waiting for their answer", None)),
+        ("aiochrome_sent_bytes", ("histogram", "size of the sent messages", "method")),
+        ("aiochrome_received_bytes", ("histogram", "size of the received messages", "kind")),
+        ("aiochrome_events_total", ("counter", "events received", "event")),
+        ("aiochrome_event_queue_depth", ("histogram", "event queue size when an event is queued", None)),
+        ("aiochrome_handler_duration_seconds", ("histogram", "event listener duration", "event")),
+        ("aiochrome_handler_errors_total", ("counter", "event listeners which raised", "event")),
+        ("aiochrome_http_duration_seconds", ("histogram", "Browser HTTP calls", "endpoint")),
+        ("aiochrome_http_errors_total", ("counter", "Browser HTTP calls which failed", "endpoint")),
+    ])
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+        self.inflight = 0
+        self._task = None
+
+        self._values = dict((name, {}) for name in self.definitions)
+        self._buckets = {
+            "aiochrome_call_duration_seconds": LATENCY_BUCKETS,
+            "aiochrome_sent_bytes": SIZE_BUCKETS,
+            "aiochrome_received_bytes": SIZE_BUCKETS,
+            "aiochrome_event_queue_depth": DEPTH_BUCKETS,
+            "aiochrome_handler_duration_seconds": LATENCY_BUCKETS,
+            "aiochrome_http_duration_seconds": LATENCY_BUCKETS,
+        }
+
+    def _observe(self, name, label, value):
+        values = self._values[name]
+        histogram = values.get(label)
+        if histogram is None:
+            histogram = values[label] = Histogram(self._buckets[name])
+
+        histogram.observe(value)
+
+    def _inc(self, name, label):
+        values = self._values[name]
+        values[label] = values.get(label, 0) + 1
+
+    # hooks
+
+    def on_send(self, tab, method, size):
+        self.inflight += 1
+        self._observe("aiochrome_sent_bytes", method, size)
+
+    def on_response(self, tab, method, duration, error):
+        self.inflight -= 1
+        self._observe("aiochrome_call_duration_seconds", method, duration)
+        if error:
+            self._inc("aiochrome_call_errors_total", method)
+
+    def on_receive(self, tab, kind, size):
+        self._observe("aiochrome_received_bytes", kind, size)
+
+    def on_event(self, tab, event, queue_depth):
+        self._inc("aiochrome_events_total", event)
+        self._observe("aiochrome_event_queue_depth", None, queue_depth)
+
+    def on_handler(self, tab, event, duration, error):
+        self._observe("aiochrome_handler_duration_seconds", event, duration)
+        if error:
+            self._inc("aiochrome_handler_errors_total", event)
+
+    def on_http(self, browser, endpoint, duration, error):
+        self._observe("aiochrome_http_duration_seconds", endpoint, duration)
+        if error:
+            self._inc("aiochrome_http_errors_total", endpoint)
+
+    # export
+
+    def snapshot(self):
+        """{name: {label: value or histogram dict}}, None is the label of unlabeled metrics"""
+        result = {"aiochrome_calls_in_flight": {None: self.inflight}}
+        for name, values in self._values.items():
+            if name == "aiochrome_calls_in_flight":
+                continue
+
+            result[name] = dict((label, value.snapshot() if isinstance(value, Histogram) else value)
+                                for label, value in values.items())
+
+        return result
+
+    def prometheus(self):
+        """the snapshot in the prometheus text format"""
+        snapshot = self.snapshot()
+        lines = []
+        for name, (kind, help, label_name) in self.definitions.items():
+            lines.append("# HELP %s %s" % (name, help))
+            lines.append("# TYPE %s %s" % (name, kind))
+            for label, value in sorted(snapshot[name].items(), key=lambda item: str(item[0])):
+                labels = [] if label is None else ['%s="%s"' % (label_name, _escape(label))]
+                if kind != "histogram":
+                    lines.append("%s%s %s" % (name, _labels(labels), value))
+                    continue
+
+                for bound, count in value['buckets'].items():
+                    lines.append('%s_bucket%s %s' % (name, _labels(labels + ['le="%s"' % bound]), count))
+                lines.append("%s_sum%s %s" % (name, _labels(labels), value['sum']))
+                lines.append("%s_count%s %s" % (name, _labels(labels), value['count']))
+
+        return "\n".join(lines) + "\n"
+
+    def export(self):
+        for sink in self.sinks:
+            try:
+                sink.write(self)
+            except Exception:
+                logger.error("metrics sink %s failed" % sink, exc_info=True)
+
+    async def _export_loop(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            self.export()
+
+    def start(self, interval=15):
+        """export to the sinks every `interval` seconds"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._export_loop(interval))
+
+        return self._task
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self.export()
+
+    def __str__(self):
+        return "<Metrics %s in flight>" % self.inflight
+
+    __repr__ = __str__
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    return "{%s}" % ",".join(labels) if labels else ""
+
+
+class MemorySink:
+    """keeps the last `size` snapshots with their time"""
+
+    def __init__(self, size=1):
+        self.snapshots = collections.deque(maxlen=size)
+
+    @property
+    def last(self):
+        return self.snapshots[-1][1] if self.snapshots else None
+
+    def write(self, metrics):
+        self.snapshots.append((time.time(), metrics.snapshot()))
+
+
+class PrometheusTextSink:
+    """writes the prometheus text format to a file, e.g. for the node_exporter textfile collector"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, metrics):
+        tmp = "%s.%s.tmp" % (self.path, uuid.uuid4().hex)
+        with open(tmp, "w") as fd:
+            fd.write(metrics.prometheus())
+        os.replace(tmp, self.path)
+
+    def __str__(self):
+        return "<PrometheusTextSink %s>" % self.path
+
+    __repr__ = __str__
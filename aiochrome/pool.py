@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import logging
+import collections
+
+from .tab import Tab
+from .exceptions import *
+
+
+__all__ = ["TabPool"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class _AcquireContext:
+    """`tab = await pool.acquire()` or `async with pool.acquire() as tab`"""
+
+    def __init__(self, pool, timeout):
+        self.pool = pool
+        self.timeout = timeout
+        self.tab = None
+
+    def __await__(self):
+        return self.pool._acquire(self.timeout).__await__()
+
+    async def __aenter__(self):
+        self.tab = await self.pool._acquire(self.timeout)
+        return self.tab
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.pool.release(self.tab)
+
+
+class TabPool:
+    """
+    keep started tabs around and hand them out again, instead of
+    new_tab/start/stop/close_tab for every job.
+
+    a released tab gets its listeners removed and navigates to `reset_url`,
+    it is closed instead when it failed to reset or was used `max_uses` times,
+    and a new tab is opened when less than `min_size` are left.
+    """
+
+    def __init__(self, browser, min_size=0, max_size=10, max_uses=100,
+                 reset_url="about:blank", timeout=10):
+        if max_size < 1 or min_size > max_size:
+            raise RuntimeException("invalid pool size: min %s max %s" % (min_size, max_size))
+
+        self.browser = browser
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.reset_url = reset_url
+        self.timeout = timeout
+
+        self._idle = collections.deque()
+        self._in_use = set()
+        self._uses = {}
+        self._slots = asyncio.Semaphore(max_size)
+        self._opening = 0
+        self._closed = False
+
+        self.acquired = 0
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.unhealthy = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    async def start(self):
+        await self._fill()
+        return True
+
+    async def _fill(self):
+        # idle, in use and being opened count, so releases at the same time open no more than needed
+        while not self._closed and len(self._idle) + len(self._in_use) + self._opening < self.min_size:
+            self._opening += 1
+            try:
+                tab = await self._new_tab()
+            finally:
+                self._opening -= 1
+
+            self._idle.append(tab)
+
+    def acquire(self, timeout=None):
+        return _AcquireContext(self, timeout)
+
+    async def _new_tab(self):
+        tab = await self.browser.new_tab(timeout=self.timeout)
+        await tab.start()
+        self._uses[tab.id] = 0
+        return tab
+
+    async def _discard(self, tab):
+        self._uses.pop(tab.id, None)
+        try:
+            if tab.status == Tab.status_started:
+                await tab.stop()
+            await self.browser.close_tab(tab, timeout=self.timeout)
+        except Exception:
+            logger.warning("close pooled %s failed" % tab, exc_info=True)
+
+    async def _healthy(self, tab):
+        if tab.status != Tab.status_started:
+            return False
+
+        try:
+            await tab.Runtime.evaluate(expression="1", _timeout=self.timeout)
+            return True
+        except AioChromeException:  # TabConnectionException for a closed websocket
+            return False
+
+    async def _acquire(self, timeout=None):
+        if self._closed:
+            raise RuntimeException("TabPool has been closed")
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException("acquire tab from pool timeout")
+
+        wait_time = time.monotonic() - start
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        try:
+            tab = None
+            while self._idle:
+                tab = self._idle.popleft()
+                if await self._healthy(tab):
+                    self.hits += 1
+                    break
+
+                self.unhealthy += 1
+                await self._discard(tab)
+                tab = None
+
+            if tab is None:
+                self.misses += 1
+                tab = await self._new_tab()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self.acquired += 1
+        self._uses[tab.id] += 1
+        self._in_use.add(tab)
+        return tab
+
+    async def release(self, tab):
+        if tab not in self._in_use:
+            raise RuntimeException("%s is not acquired from this pool" % tab)
+
+        self._in_use.discard(tab)
+        try:
+            if self._closed or self._uses.get(tab.id, 0) >= self.max_uses:
+                self.recycled += 1
+                await self._discard(tab)
+                return
+
+            tab.del_all_listeners()
+            tab.event_queue.clear()
+            try:
+                await tab.Page.navigate(url=self.reset_url, _timeout=self.timeout)
+            except AioChromeException:
+                self.unhealthy += 1
+                await self._discard(tab)
+                return
+
+            self._idle.append(tab)
+        finally:
+            try:
+                await self._fill()
+            except Exception:
+                logger.warning("refill %s failed" % self, exc_info=True)
+            finally:
+                self._slots.release()
+
+    async def close(self):
+        self._closed = True
+        while self._idle:
+            await self._discard(self._idle.popleft())
+
+        # tabs in use are closed when released
+        return True
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._idle) + len(self._in_use),
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "acquired": self.acquired,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "recycled": self.recycled,
+            "unhealthy": self.unhealthy,
+            "avg_wait_time": self.wait_time / self.acquired if self.acquired else 0.0,
+            "max_wait_time": self.max_wait_time,
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __str__(self):
+        return "<TabPool %s %s/%s>" % (self.browser.dev_url, len(self._in_use), self.max_size)
+
+    __repr__ = __str__
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+typed bindings of the protocol domains, one module per domain generated from
+browser_protocol.json / js_protocol.json by `python -m aiochrome.protocol.generate`.
+
+a domain module is imported the first time a tab uses the domain. with
+`tab.strict_protocol` off, what the bindings do not know is sent as it is.
+"""
+
+import functools
+import importlib
+
+from ..exceptions import *
+from ._index import DOMAINS, PROTOCOL_VERSION
+
+
+__all__ = ["Domain", "REQUIRED", "load_domain", "DOMAINS", "PROTOCOL_VERSION"]
+
+
+class _Required:
+    def __repr__(self):
+        return "REQUIRED"
+
+
+# default of the required params, so a missing one fails like an unknown one
+REQUIRED = _Required()
+
+
+class Domain:
+    """
+    the methods of a domain, bound to a tab. setting an event name sets its
+    listener, getting it returns the listener.
+
+    with `tab.strict_protocol` unknown methods and params fail before any round
+    trip, without it (default) they go to chrome unchecked, like GenericAttr.
+    """
+
+    __slots__ = ('_tab',)
+
+    _name = None
+    # event names, without the domain
+    _events = frozenset()
+
+    def __init__(self, tab):
+        object.__setattr__(self, '_tab', tab)
+
+    def _invalid(self, method, args, unknown, timeout, params):
+        if not self._tab.strict_protocol:
+            # another chrome version may take them, let it answer
+            params = dict((name, value) for name, value in params.items() if value is not None and value is not REQUIRED)
+            params.update(unknown)
+            return self._tab.call_method("%s.%s" % (self._name, method), *args, _timeout=timeout, **params)
+
+        if args:
+            raise InvalidParamsException("the params should be key=value format")
+
+        if unknown:
+            raise InvalidParamsException("%s.%s got unknown params: %s" % (self._name, method, ", ".join(sorted(unknown))))
+
+        missing = [name for name, value in params.items() if value is REQUIRED]
+        raise InvalidParamsException("%s.%s missing params: %s" % (self._name, method, ", ".join(sorted(missing))))
+
+    def __getattr__(self, item):
+        # methods are found before this is called: an event or a typo
+        name = "%s.%s" % (self._name, item)
+        if item in self._events or not self._tab.strict_protocol:
+            # like GenericAttr: the listener if any, else a call
+            return self._tab.get_listener(name) or functools.partial(self._tab.call_method, name)
+
+        raise UnknownMethodException("%s is not in the protocol %s, call it with tab.call_method" % (
+            name, PROTOCOL_VERSION))
+
+    def __setattr__(self, key, value):
+        if key not in self._events and self._tab.strict_protocol:
+            raise UnknownMethodException("%s.%s is not an event of the protocol %s, use tab.set_listener" % (
+                self._name, key, PROTOCOL_VERSION))
+
+        self._tab.set_listener("%s.%s" % (self._name, key), value)
+
+    def __str__(self):
+        return "<%s [%s]>" % (self._name, self._tab.id)
+
+    __repr__ = __str__
+
+
+_loaded = {}
+
+
+def load_domain(name):
+    """the Domain class of a domain name, None for a domain which is not in the bindings"""
+    domain = _loaded.get(name)
+    if domain is None:
+        module = DOMAINS.get(name)
+        if module is None:
+            return None
+
+        domain = _loaded[name] = getattr(importlib.import_module("." + module, __name__), name)
+
+    return domain
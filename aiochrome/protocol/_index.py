@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+PROTOCOL_VERSION = "0.0.1508733"
+
+# domain -> module
+DOMAINS = {
+    "Accessibility": "accessibility",
+    "Animation": "animation",
+    "Audits": "audits",
+    "Autofill": "autofill",
+    "BackgroundService": "backgroundservice",
+    "BluetoothEmulation": "bluetoothemulation",
+    "Browser": "browser",
+    "CSS": "css",
+    "CacheStorage": "cachestorage",
+    "Cast": "cast",
+    "Console": "console",
+    "DOM": "dom",
+    "DOMDebugger": "domdebugger",
+    "DOMSnapshot": "domsnapshot",
+    "DOMStorage": "domstorage",
+    "Debugger": "debugger",
+    "DeviceAccess": "deviceaccess",
+    "DeviceOrientation": "deviceorientation",
+    "Emulation": "emulation",
+    "EventBreakpoints": "eventbreakpoints",
+    "Extensions": "extensions",
+    "FedCm": "fedcm",
+    "Fetch": "fetch",
+    "FileSystem": "filesystem",
+    "HeadlessExperimental": "headlessexperimental",
+    "HeapProfiler": "heapprofiler",
+    "IO": "io",
+    "IndexedDB": "indexeddb",
+    "Input": "input",
+    "Inspector": "inspector",
+    "LayerTree": "layertree",
+    "Log": "log",
+    "Media": "media",
+    "Memory": "memory",
+    "Network": "network",
+    "Overlay": "overlay",
+    "PWA": "pwa",
+    "Page": "page",
+    "Performance": "performance",
+    "PerformanceTimeline": "performancetimeline",
+    "Preload": "preload",
+    "Profiler": "profiler",
+    "Runtime": "runtime",
+    "Schema": "schema",
+    "Security": "security",
+    "ServiceWorker": "serviceworker",
+    "Storage": "storage",
+    "SystemInfo": "systeminfo",
+    "Target": "target",
+    "Tethering": "tethering",
+    "Tracing": "tracing",
+    "WebAudio": "webaudio",
+    "WebAuthn": "webauthn",
+}
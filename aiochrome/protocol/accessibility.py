@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Accessibility(Domain):
+    __slots__ = ()
+
+    _name = "Accessibility"
+    _events = frozenset(["loadComplete", "nodesUpdated"])
+
+    LOAD_COMPLETE = "Accessibility.loadComplete"
+    NODES_UPDATED = "Accessibility.nodesUpdated"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables the accessibility domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Accessibility.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables the accessibility domain which causes `AXNodeId`s to remain consistent between method calls."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Accessibility.enable", _timeout=_timeout)
+
+    def getPartialAXTree(self, *args, nodeId=None, backendNodeId=None, objectId=None, fetchRelatives=None,
+                         _timeout=None, **unknown):
+        """(experimental) Fetches the accessibility node and partial accessibility tree for this DOM node, if it exists."""
+        if args or unknown:
+            return self._invalid("getPartialAXTree", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId,
+                "fetchRelatives": fetchRelatives})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if fetchRelatives is not None:
+            params["fetchRelatives"] = fetchRelatives
+        return self._tab.call_method("Accessibility.getPartialAXTree", _timeout=_timeout, **params)
+
+    def getFullAXTree(self, *args, depth=None, frameId=None, _timeout=None, **unknown):
+        """(experimental) Fetches the entire accessibility tree for the root Document"""
+        if args or unknown:
+            return self._invalid("getFullAXTree", args, unknown, _timeout, {"depth": depth, "frameId": frameId})
+        params = {}
+        if depth is not None:
+            params["depth"] = depth
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Accessibility.getFullAXTree", _timeout=_timeout, **params)
+
+    def getRootAXNode(self, *args, frameId=None, _timeout=None, **unknown):
+        """(experimental) Fetches the root node."""
+        if args or unknown:
+            return self._invalid("getRootAXNode", args, unknown, _timeout, {"frameId": frameId})
+        params = {}
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Accessibility.getRootAXNode", _timeout=_timeout, **params)
+
+    def getAXNodeAndAncestors(self, *args, nodeId=None, backendNodeId=None, objectId=None, _timeout=None, **unknown):
+        """(experimental) Fetches a node and all ancestors up to and including the root."""
+        if args or unknown:
+            return self._invalid("getAXNodeAndAncestors", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("Accessibility.getAXNodeAndAncestors", _timeout=_timeout, **params)
+
+    def getChildAXNodes(self, *args, id=REQUIRED, frameId=None, _timeout=None, **unknown):
+        """(experimental) Fetches a particular accessibility node by AXNodeId."""
+        if args or unknown or id is REQUIRED:
+            return self._invalid("getChildAXNodes", args, unknown, _timeout, {"id": id, "frameId": frameId})
+        params = {"id": id}
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Accessibility.getChildAXNodes", _timeout=_timeout, **params)
+
+    def queryAXTree(self, *args, nodeId=None, backendNodeId=None, objectId=None, accessibleName=None, role=None,
+                    _timeout=None, **unknown):
+        """(experimental) Query a DOM node's accessibility subtree for accessible name and role."""
+        if args or unknown:
+            return self._invalid("queryAXTree", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId,
+                "accessibleName": accessibleName, "role": role})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if accessibleName is not None:
+            params["accessibleName"] = accessibleName
+        if role is not None:
+            params["role"] = role
+        return self._tab.call_method("Accessibility.queryAXTree", _timeout=_timeout, **params)
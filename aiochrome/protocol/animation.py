@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Animation(Domain):
+    __slots__ = ()
+
+    _name = "Animation"
+    _events = frozenset(["animationCanceled", "animationCreated", "animationStarted", "animationUpdated"])
+
+    ANIMATION_CANCELED = "Animation.animationCanceled"
+    ANIMATION_CREATED = "Animation.animationCreated"
+    ANIMATION_STARTED = "Animation.animationStarted"
+    ANIMATION_UPDATED = "Animation.animationUpdated"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables animation domain notifications."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Animation.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables animation domain notifications."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Animation.enable", _timeout=_timeout)
+
+    def getCurrentTime(self, *args, id=REQUIRED, _timeout=None, **unknown):
+        """Returns the current time of the an animation."""
+        if args or unknown or id is REQUIRED:
+            return self._invalid("getCurrentTime", args, unknown, _timeout, {"id": id})
+        return self._tab.call_method("Animation.getCurrentTime", _timeout=_timeout, id=id)
+
+    def getPlaybackRate(self, *args, _timeout=None, **unknown):
+        """Gets the playback rate of the document timeline."""
+        if args or unknown:
+            return self._invalid("getPlaybackRate", args, unknown, _timeout, {})
+        return self._tab.call_method("Animation.getPlaybackRate", _timeout=_timeout)
+
+    def releaseAnimations(self, *args, animations=REQUIRED, _timeout=None, **unknown):
+        """Releases a set of animations to no longer be manipulated."""
+        if args or unknown or animations is REQUIRED:
+            return self._invalid("releaseAnimations", args, unknown, _timeout, {"animations": animations})
+        return self._tab.call_method("Animation.releaseAnimations", _timeout=_timeout, animations=animations)
+
+    def resolveAnimation(self, *args, animationId=REQUIRED, _timeout=None, **unknown):
+        """Gets the remote object of the Animation."""
+        if args or unknown or animationId is REQUIRED:
+            return self._invalid("resolveAnimation", args, unknown, _timeout, {"animationId": animationId})
+        return self._tab.call_method("Animation.resolveAnimation", _timeout=_timeout, animationId=animationId)
+
+    def seekAnimations(self, *args, animations=REQUIRED, currentTime=REQUIRED, _timeout=None, **unknown):
+        """Seek a set of animations to a particular time within each animation."""
+        if args or unknown or animations is REQUIRED or currentTime is REQUIRED:
+            return self._invalid("seekAnimations", args, unknown, _timeout, {
+                "animations": animations, "currentTime": currentTime})
+        return self._tab.call_method("Animation.seekAnimations", _timeout=_timeout, animations=animations,
+                                     currentTime=currentTime)
+
+    def setPaused(self, *args, animations=REQUIRED, paused=REQUIRED, _timeout=None, **unknown):
+        """Sets the paused state of a set of animations."""
+        if args or unknown or animations is REQUIRED or paused is REQUIRED:
+            return self._invalid("setPaused", args, unknown, _timeout, {"animations": animations, "paused": paused})
+        return self._tab.call_method("Animation.setPaused", _timeout=_timeout, animations=animations, paused=paused)
+
+    def setPlaybackRate(self, *args, playbackRate=REQUIRED, _timeout=None, **unknown):
+        """Sets the playback rate of the document timeline."""
+        if args or unknown or playbackRate is REQUIRED:
+            return self._invalid("setPlaybackRate", args, unknown, _timeout, {"playbackRate": playbackRate})
+        return self._tab.call_method("Animation.setPlaybackRate", _timeout=_timeout, playbackRate=playbackRate)
+
+    def setTiming(self, *args, animationId=REQUIRED, duration=REQUIRED, delay=REQUIRED, _timeout=None, **unknown):
+        """Sets the timing of an animation node."""
+        if args or unknown or animationId is REQUIRED or duration is REQUIRED or delay is REQUIRED:
+            return self._invalid("setTiming", args, unknown, _timeout, {
+                "animationId": animationId, "duration": duration, "delay": delay})
+        return self._tab.call_method("Animation.setTiming", _timeout=_timeout, animationId=animationId,
+                                     duration=duration, delay=delay)
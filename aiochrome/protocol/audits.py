@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Audits(Domain):
+    """Audits domain allows investigation of page violations and possible improvements."""
+
+    __slots__ = ()
+
+    _name = "Audits"
+    _events = frozenset(["issueAdded"])
+
+    ISSUE_ADDED = "Audits.issueAdded"
+
+    def getEncodedResponse(self, *args, requestId=REQUIRED, encoding=REQUIRED, quality=None, sizeOnly=None,
+                           _timeout=None, **unknown):
+        """Returns the response body and size if it were re-encoded with the specified settings."""
+        if args or unknown or requestId is REQUIRED or encoding is REQUIRED:
+            return self._invalid("getEncodedResponse", args, unknown, _timeout, {
+                "requestId": requestId, "encoding": encoding, "quality": quality, "sizeOnly": sizeOnly})
+        params = {"requestId": requestId, "encoding": encoding}
+        if quality is not None:
+            params["quality"] = quality
+        if sizeOnly is not None:
+            params["sizeOnly"] = sizeOnly
+        return self._tab.call_method("Audits.getEncodedResponse", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables issues domain, prevents further issues from being reported to the client."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Audits.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables issues domain, sends the issues collected so far to the client by means of the `issueAdded` event."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Audits.enable", _timeout=_timeout)
+
+    def checkContrast(self, *args, reportAAA=None, _timeout=None, **unknown):
+        """Runs the contrast check for the target page."""
+        if args or unknown:
+            return self._invalid("checkContrast", args, unknown, _timeout, {"reportAAA": reportAAA})
+        params = {}
+        if reportAAA is not None:
+            params["reportAAA"] = reportAAA
+        return self._tab.call_method("Audits.checkContrast", _timeout=_timeout, **params)
+
+    def checkFormsIssues(self, *args, _timeout=None, **unknown):
+        """Runs the form issues check for the target page."""
+        if args or unknown:
+            return self._invalid("checkFormsIssues", args, unknown, _timeout, {})
+        return self._tab.call_method("Audits.checkFormsIssues", _timeout=_timeout)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Autofill(Domain):
+    """Defines commands and events for Autofill."""
+
+    __slots__ = ()
+
+    _name = "Autofill"
+    _events = frozenset(["addressFormFilled"])
+
+    ADDRESS_FORM_FILLED = "Autofill.addressFormFilled"
+
+    def trigger(self, *args, fieldId=REQUIRED, card=REQUIRED, frameId=None, _timeout=None, **unknown):
+        """Trigger autofill on a form identified by the fieldId."""
+        if args or unknown or fieldId is REQUIRED or card is REQUIRED:
+            return self._invalid("trigger", args, unknown, _timeout, {
+                "fieldId": fieldId, "card": card, "frameId": frameId})
+        params = {"fieldId": fieldId, "card": card}
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Autofill.trigger", _timeout=_timeout, **params)
+
+    def setAddresses(self, *args, addresses=REQUIRED, _timeout=None, **unknown):
+        """Set addresses so that developers can verify their forms implementation."""
+        if args or unknown or addresses is REQUIRED:
+            return self._invalid("setAddresses", args, unknown, _timeout, {"addresses": addresses})
+        return self._tab.call_method("Autofill.setAddresses", _timeout=_timeout, addresses=addresses)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables autofill domain notifications."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Autofill.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables autofill domain notifications."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Autofill.enable", _timeout=_timeout)
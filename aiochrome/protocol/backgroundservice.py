@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class BackgroundService(Domain):
+    """Defines events for background web platform features."""
+
+    __slots__ = ()
+
+    _name = "BackgroundService"
+    _events = frozenset(["backgroundServiceEventReceived", "recordingStateChanged"])
+
+    BACKGROUND_SERVICE_EVENT_RECEIVED = "BackgroundService.backgroundServiceEventReceived"
+    RECORDING_STATE_CHANGED = "BackgroundService.recordingStateChanged"
+
+    def startObserving(self, *args, service=REQUIRED, _timeout=None, **unknown):
+        """Enables event updates for the service."""
+        if args or unknown or service is REQUIRED:
+            return self._invalid("startObserving", args, unknown, _timeout, {"service": service})
+        return self._tab.call_method("BackgroundService.startObserving", _timeout=_timeout, service=service)
+
+    def stopObserving(self, *args, service=REQUIRED, _timeout=None, **unknown):
+        """Disables event updates for the service."""
+        if args or unknown or service is REQUIRED:
+            return self._invalid("stopObserving", args, unknown, _timeout, {"service": service})
+        return self._tab.call_method("BackgroundService.stopObserving", _timeout=_timeout, service=service)
+
+    def setRecording(self, *args, shouldRecord=REQUIRED, service=REQUIRED, _timeout=None, **unknown):
+        """Set the recording state for the service."""
+        if args or unknown or shouldRecord is REQUIRED or service is REQUIRED:
+            return self._invalid("setRecording", args, unknown, _timeout, {
+                "shouldRecord": shouldRecord, "service": service})
+        return self._tab.call_method("BackgroundService.setRecording", _timeout=_timeout, shouldRecord=shouldRecord,
+                                     service=service)
+
+    def clearEvents(self, *args, service=REQUIRED, _timeout=None, **unknown):
+        """Clears all stored data for the service."""
+        if args or unknown or service is REQUIRED:
+            return self._invalid("clearEvents", args, unknown, _timeout, {"service": service})
+        return self._tab.call_method("BackgroundService.clearEvents", _timeout=_timeout, service=service)
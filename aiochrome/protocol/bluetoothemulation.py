@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class BluetoothEmulation(Domain):
+    """This domain allows configuring virtual Bluetooth devices to test the web-bluetooth API."""
+
+    __slots__ = ()
+
+    _name = "BluetoothEmulation"
+    _events = frozenset(["characteristicOperationReceived", "descriptorOperationReceived", "gattOperationReceived"])
+
+    CHARACTERISTIC_OPERATION_RECEIVED = "BluetoothEmulation.characteristicOperationReceived"
+    DESCRIPTOR_OPERATION_RECEIVED = "BluetoothEmulation.descriptorOperationReceived"
+    GATT_OPERATION_RECEIVED = "BluetoothEmulation.gattOperationReceived"
+
+    def enable(self, *args, state=REQUIRED, leSupported=REQUIRED, _timeout=None, **unknown):
+        """Enable the BluetoothEmulation domain."""
+        if args or unknown or state is REQUIRED or leSupported is REQUIRED:
+            return self._invalid("enable", args, unknown, _timeout, {"state": state, "leSupported": leSupported})
+        return self._tab.call_method("BluetoothEmulation.enable", _timeout=_timeout, state=state,
+                                     leSupported=leSupported)
+
+    def setSimulatedCentralState(self, *args, state=REQUIRED, _timeout=None, **unknown):
+        """Set the state of the simulated central."""
+        if args or unknown or state is REQUIRED:
+            return self._invalid("setSimulatedCentralState", args, unknown, _timeout, {"state": state})
+        return self._tab.call_method("BluetoothEmulation.setSimulatedCentralState", _timeout=_timeout, state=state)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disable the BluetoothEmulation domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("BluetoothEmulation.disable", _timeout=_timeout)
+
+    def simulatePreconnectedPeripheral(self, *args, address=REQUIRED, name=REQUIRED, manufacturerData=REQUIRED,
+                                       knownServiceUuids=REQUIRED, _timeout=None, **unknown):
+        """Simulates a peripheral with |address|, |name| and |knownServiceUuids| that has already been connected to the system."""
+        invalid = args or unknown or address is REQUIRED or name is REQUIRED or manufacturerData is REQUIRED
+        if invalid or knownServiceUuids is REQUIRED:
+            return self._invalid("simulatePreconnectedPeripheral", args, unknown, _timeout, {
+                "address": address, "name": name, "manufacturerData": manufacturerData,
+                "knownServiceUuids": knownServiceUuids})
+        return self._tab.call_method("BluetoothEmulation.simulatePreconnectedPeripheral", _timeout=_timeout,
+                                     address=address, name=name, manufacturerData=manufacturerData,
+                                     knownServiceUuids=knownServiceUuids)
+
+    def simulateAdvertisement(self, *args, entry=REQUIRED, _timeout=None, **unknown):
+        """Simulates an advertisement packet described in |entry| being received by the central."""
+        if args or unknown or entry is REQUIRED:
+            return self._invalid("simulateAdvertisement", args, unknown, _timeout, {"entry": entry})
+        return self._tab.call_method("BluetoothEmulation.simulateAdvertisement", _timeout=_timeout, entry=entry)
+
+    def simulateGATTOperationResponse(self, *args, address=REQUIRED, type=REQUIRED, code=REQUIRED, _timeout=None,
+                                      **unknown):
+        """Simulates the response code from the peripheral with |address| for a GATT operation of |type|."""
+        if args or unknown or address is REQUIRED or type is REQUIRED or code is REQUIRED:
+            return self._invalid("simulateGATTOperationResponse", args, unknown, _timeout, {
+                "address": address, "type": type, "code": code})
+        return self._tab.call_method("BluetoothEmulation.simulateGATTOperationResponse", _timeout=_timeout,
+                                     address=address, type=type, code=code)
+
+    def simulateCharacteristicOperationResponse(self, *args, characteristicId=REQUIRED, type=REQUIRED, code=REQUIRED,
+                                                data=None, _timeout=None, **unknown):
+        """Simulates the response from the characteristic with |characteristicId| for a characteristic operation of |type|."""
+        if args or unknown or characteristicId is REQUIRED or type is REQUIRED or code is REQUIRED:
+            return self._invalid("simulateCharacteristicOperationResponse", args, unknown, _timeout, {
+                "characteristicId": characteristicId, "type": type, "code": code, "data": data})
+        params = {"characteristicId": characteristicId, "type": type, "code": code}
+        if data is not None:
+            params["data"] = data
+        return self._tab.call_method("BluetoothEmulation.simulateCharacteristicOperationResponse", _timeout=_timeout, **params)
+
+    def simulateDescriptorOperationResponse(self, *args, descriptorId=REQUIRED, type=REQUIRED, code=REQUIRED,
+                                            data=None, _timeout=None, **unknown):
+        """Simulates the response from the descriptor with |descriptorId| for a descriptor operation of |type|."""
+        if args or unknown or descriptorId is REQUIRED or type is REQUIRED or code is REQUIRED:
+            return self._invalid("simulateDescriptorOperationResponse", args, unknown, _timeout, {
+                "descriptorId": descriptorId, "type": type, "code": code, "data": data})
+        params = {"descriptorId": descriptorId, "type": type, "code": code}
+        if data is not None:
+            params["data"] = data
+        return self._tab.call_method("BluetoothEmulation.simulateDescriptorOperationResponse", _timeout=_timeout, **params)
+
+    def addService(self, *args, address=REQUIRED, serviceUuid=REQUIRED, _timeout=None, **unknown):
+        """Adds a service with |serviceUuid| to the peripheral with |address|."""
+        if args or unknown or address is REQUIRED or serviceUuid is REQUIRED:
+            return self._invalid("addService", args, unknown, _timeout, {
+                "address": address, "serviceUuid": serviceUuid})
+        return self._tab.call_method("BluetoothEmulation.addService", _timeout=_timeout, address=address,
+                                     serviceUuid=serviceUuid)
+
+    def removeService(self, *args, serviceId=REQUIRED, _timeout=None, **unknown):
+        """Removes the service respresented by |serviceId| from the simulated central."""
+        if args or unknown or serviceId is REQUIRED:
+            return self._invalid("removeService", args, unknown, _timeout, {"serviceId": serviceId})
+        return self._tab.call_method("BluetoothEmulation.removeService", _timeout=_timeout, serviceId=serviceId)
+
+    def addCharacteristic(self, *args, serviceId=REQUIRED, characteristicUuid=REQUIRED, properties=REQUIRED,
+                          _timeout=None, **unknown):
+        """Adds a characteristic with |characteristicUuid| and |properties| to the service represented by |serviceId|."""
+        if args or unknown or serviceId is REQUIRED or characteristicUuid is REQUIRED or properties is REQUIRED:
+            return self._invalid("addCharacteristic", args, unknown, _timeout, {
+                "serviceId": serviceId, "characteristicUuid": characteristicUuid, "properties": properties})
+        return self._tab.call_method("BluetoothEmulation.addCharacteristic", _timeout=_timeout, serviceId=serviceId,
+                                     characteristicUuid=characteristicUuid, properties=properties)
+
+    def removeCharacteristic(self, *args, characteristicId=REQUIRED, _timeout=None, **unknown):
+        """Removes the characteristic respresented by |characteristicId| from the simulated central."""
+        if args or unknown or characteristicId is REQUIRED:
+            return self._invalid("removeCharacteristic", args, unknown, _timeout, {
+                "characteristicId": characteristicId})
+        return self._tab.call_method("BluetoothEmulation.removeCharacteristic", _timeout=_timeout,
+                                     characteristicId=characteristicId)
+
+    def addDescriptor(self, *args, characteristicId=REQUIRED, descriptorUuid=REQUIRED, _timeout=None, **unknown):
+        """Adds a descriptor with |descriptorUuid| to the characteristic respresented by |characteristicId|."""
+        if args or unknown or characteristicId is REQUIRED or descriptorUuid is REQUIRED:
+            return self._invalid("addDescriptor", args, unknown, _timeout, {
+                "characteristicId": characteristicId, "descriptorUuid": descriptorUuid})
+        return self._tab.call_method("BluetoothEmulation.addDescriptor", _timeout=_timeout,
+                                     characteristicId=characteristicId, descriptorUuid=descriptorUuid)
+
+    def removeDescriptor(self, *args, descriptorId=REQUIRED, _timeout=None, **unknown):
+        """Removes the descriptor with |descriptorId| from the simulated central."""
+        if args or unknown or descriptorId is REQUIRED:
+            return self._invalid("removeDescriptor", args, unknown, _timeout, {"descriptorId": descriptorId})
+        return self._tab.call_method("BluetoothEmulation.removeDescriptor", _timeout=_timeout,
+                                     descriptorId=descriptorId)
+
+    def simulateGATTDisconnection(self, *args, address=REQUIRED, _timeout=None, **unknown):
+        """Simulates a GATT disconnection from the peripheral with |address|."""
+        if args or unknown or address is REQUIRED:
+            return self._invalid("simulateGATTDisconnection", args, unknown, _timeout, {"address": address})
+        return self._tab.call_method("BluetoothEmulation.simulateGATTDisconnection", _timeout=_timeout, address=address)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Browser(Domain):
+    """The Browser domain defines methods and events for browser managing."""
+
+    __slots__ = ()
+
+    _name = "Browser"
+    _events = frozenset(["downloadProgress", "downloadWillBegin"])
+
+    DOWNLOAD_PROGRESS = "Browser.downloadProgress"
+    DOWNLOAD_WILL_BEGIN = "Browser.downloadWillBegin"
+
+    def setPermission(self, *args, permission=REQUIRED, setting=REQUIRED, origin=None, embeddingOrigin=None,
+                      browserContextId=None, _timeout=None, **unknown):
+        """(experimental) Set permission settings for given requesting and embedding origins."""
+        if args or unknown or permission is REQUIRED or setting is REQUIRED:
+            return self._invalid("setPermission", args, unknown, _timeout, {
+                "permission": permission, "setting": setting, "origin": origin, "embeddingOrigin": embeddingOrigin,
+                "browserContextId": browserContextId})
+        params = {"permission": permission, "setting": setting}
+        if origin is not None:
+            params["origin"] = origin
+        if embeddingOrigin is not None:
+            params["embeddingOrigin"] = embeddingOrigin
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Browser.setPermission", _timeout=_timeout, **params)
+
+    def grantPermissions(self, *args, permissions=REQUIRED, origin=None, browserContextId=None, _timeout=None,
+                         **unknown):
+        """(experimental) Grant specific permissions to the given origin and reject all others."""
+        if args or unknown or permissions is REQUIRED:
+            return self._invalid("grantPermissions", args, unknown, _timeout, {
+                "permissions": permissions, "origin": origin, "browserContextId": browserContextId})
+        params = {"permissions": permissions}
+        if origin is not None:
+            params["origin"] = origin
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Browser.grantPermissions", _timeout=_timeout, **params)
+
+    def resetPermissions(self, *args, browserContextId=None, _timeout=None, **unknown):
+        """Reset all permission management for all origins."""
+        if args or unknown:
+            return self._invalid("resetPermissions", args, unknown, _timeout, {"browserContextId": browserContextId})
+        params = {}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Browser.resetPermissions", _timeout=_timeout, **params)
+
+    def setDownloadBehavior(self, *args, behavior=REQUIRED, browserContextId=None, downloadPath=None,
+                            eventsEnabled=None, _timeout=None, **unknown):
+        """(experimental) Set the behavior when downloading a file."""
+        if args or unknown or behavior is REQUIRED:
+            return self._invalid("setDownloadBehavior", args, unknown, _timeout, {
+                "behavior": behavior, "browserContextId": browserContextId, "downloadPath": downloadPath,
+                "eventsEnabled": eventsEnabled})
+        params = {"behavior": behavior}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        if downloadPath is not None:
+            params["downloadPath"] = downloadPath
+        if eventsEnabled is not None:
+            params["eventsEnabled"] = eventsEnabled
+        return self._tab.call_method("Browser.setDownloadBehavior", _timeout=_timeout, **params)
+
+    def cancelDownload(self, *args, guid=REQUIRED, browserContextId=None, _timeout=None, **unknown):
+        """(experimental) Cancel a download if in progress"""
+        if args or unknown or guid is REQUIRED:
+            return self._invalid("cancelDownload", args, unknown, _timeout, {
+                "guid": guid, "browserContextId": browserContextId})
+        params = {"guid": guid}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Browser.cancelDownload", _timeout=_timeout, **params)
+
+    def close(self, *args, _timeout=None, **unknown):
+        """Close browser gracefully."""
+        if args or unknown:
+            return self._invalid("close", args, unknown, _timeout, {})
+        return self._tab.call_method("Browser.close", _timeout=_timeout)
+
+    def crash(self, *args, _timeout=None, **unknown):
+        """(experimental) Crashes browser on the main thread."""
+        if args or unknown:
+            return self._invalid("crash", args, unknown, _timeout, {})
+        return self._tab.call_method("Browser.crash", _timeout=_timeout)
+
+    def crashGpuProcess(self, *args, _timeout=None, **unknown):
+        """(experimental) Crashes GPU process."""
+        if args or unknown:
+            return self._invalid("crashGpuProcess", args, unknown, _timeout, {})
+        return self._tab.call_method("Browser.crashGpuProcess", _timeout=_timeout)
+
+    def getVersion(self, *args, _timeout=None, **unknown):
+        """Returns version information."""
+        if args or unknown:
+            return self._invalid("getVersion", args, unknown, _timeout, {})
+        return self._tab.call_method("Browser.getVersion", _timeout=_timeout)
+
+    def getBrowserCommandLine(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the command line switches for the browser process if, and only if --enable-automation is on the commandline."""
+        if args or unknown:
+            return self._invalid("getBrowserCommandLine", args, unknown, _timeout, {})
+        return self._tab.call_method("Browser.getBrowserCommandLine", _timeout=_timeout)
+
+    def getHistograms(self, *args, query=None, delta=None, _timeout=None, **unknown):
+        """(experimental) Get Chrome histograms."""
+        if args or unknown:
+            return self._invalid("getHistograms", args, unknown, _timeout, {"query": query, "delta": delta})
+        params = {}
+        if query is not None:
+            params["query"] = query
+        if delta is not None:
+            params["delta"] = delta
+        return self._tab.call_method("Browser.getHistograms", _timeout=_timeout, **params)
+
+    def getHistogram(self, *args, name=REQUIRED, delta=None, _timeout=None, **unknown):
+        """(experimental) Get a Chrome histogram by name."""
+        if args or unknown or name is REQUIRED:
+            return self._invalid("getHistogram", args, unknown, _timeout, {"name": name, "delta": delta})
+        params = {"name": name}
+        if delta is not None:
+            params["delta"] = delta
+        return self._tab.call_method("Browser.getHistogram", _timeout=_timeout, **params)
+
+    def getWindowBounds(self, *args, windowId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Get position and size of the browser window."""
+        if args or unknown or windowId is REQUIRED:
+            return self._invalid("getWindowBounds", args, unknown, _timeout, {"windowId": windowId})
+        return self._tab.call_method("Browser.getWindowBounds", _timeout=_timeout, windowId=windowId)
+
+    def getWindowForTarget(self, *args, targetId=None, _timeout=None, **unknown):
+        """(experimental) Get the browser window that contains the devtools target."""
+        if args or unknown:
+            return self._invalid("getWindowForTarget", args, unknown, _timeout, {"targetId": targetId})
+        params = {}
+        if targetId is not None:
+            params["targetId"] = targetId
+        return self._tab.call_method("Browser.getWindowForTarget", _timeout=_timeout, **params)
+
+    def setWindowBounds(self, *args, windowId=REQUIRED, bounds=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Set position and/or size of the browser window."""
+        if args or unknown or windowId is REQUIRED or bounds is REQUIRED:
+            return self._invalid("setWindowBounds", args, unknown, _timeout, {"windowId": windowId, "bounds": bounds})
+        return self._tab.call_method("Browser.setWindowBounds", _timeout=_timeout, windowId=windowId, bounds=bounds)
+
+    def setContentsSize(self, *args, windowId=REQUIRED, width=None, height=None, _timeout=None, **unknown):
+        """(experimental) Set size of the browser contents resizing browser window as necessary."""
+        if args or unknown or windowId is REQUIRED:
+            return self._invalid("setContentsSize", args, unknown, _timeout, {
+                "windowId": windowId, "width": width, "height": height})
+        params = {"windowId": windowId}
+        if width is not None:
+            params["width"] = width
+        if height is not None:
+            params["height"] = height
+        return self._tab.call_method("Browser.setContentsSize", _timeout=_timeout, **params)
+
+    def setDockTile(self, *args, badgeLabel=None, image=None, _timeout=None, **unknown):
+        """(experimental) Set dock tile details, platform-specific."""
+        if args or unknown:
+            return self._invalid("setDockTile", args, unknown, _timeout, {"badgeLabel": badgeLabel, "image": image})
+        params = {}
+        if badgeLabel is not None:
+            params["badgeLabel"] = badgeLabel
+        if image is not None:
+            params["image"] = image
+        return self._tab.call_method("Browser.setDockTile", _timeout=_timeout, **params)
+
+    def executeBrowserCommand(self, *args, commandId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Invoke custom browser commands used by telemetry."""
+        if args or unknown or commandId is REQUIRED:
+            return self._invalid("executeBrowserCommand", args, unknown, _timeout, {"commandId": commandId})
+        return self._tab.call_method("Browser.executeBrowserCommand", _timeout=_timeout, commandId=commandId)
+
+    def addPrivacySandboxEnrollmentOverride(self, *args, url=REQUIRED, _timeout=None, **unknown):
+        """Allows a site to use privacy sandbox features that require enrollment without the site actually being enrolled."""
+        if args or unknown or url is REQUIRED:
+            return self._invalid("addPrivacySandboxEnrollmentOverride", args, unknown, _timeout, {"url": url})
+        return self._tab.call_method("Browser.addPrivacySandboxEnrollmentOverride", _timeout=_timeout, url=url)
+
+    def addPrivacySandboxCoordinatorKeyConfig(self, *args, api=REQUIRED, coordinatorOrigin=REQUIRED,
+                                              keyConfig=REQUIRED, browserContextId=None, _timeout=None, **unknown):
+        """Configures encryption keys used with a given privacy sandbox API to talk to a trusted coordinator."""
+        if args or unknown or api is REQUIRED or coordinatorOrigin is REQUIRED or keyConfig is REQUIRED:
+            return self._invalid("addPrivacySandboxCoordinatorKeyConfig", args, unknown, _timeout, {
+                "api": api, "coordinatorOrigin": coordinatorOrigin, "keyConfig": keyConfig,
+                "browserContextId": browserContextId})
+        params = {"api": api, "coordinatorOrigin": coordinatorOrigin, "keyConfig": keyConfig}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Browser.addPrivacySandboxCoordinatorKeyConfig", _timeout=_timeout, **params)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class CacheStorage(Domain):
+    __slots__ = ()
+
+    _name = "CacheStorage"
+    _events = frozenset([])
+
+    def deleteCache(self, *args, cacheId=REQUIRED, _timeout=None, **unknown):
+        """Deletes a cache."""
+        if args or unknown or cacheId is REQUIRED:
+            return self._invalid("deleteCache", args, unknown, _timeout, {"cacheId": cacheId})
+        return self._tab.call_method("CacheStorage.deleteCache", _timeout=_timeout, cacheId=cacheId)
+
+    def deleteEntry(self, *args, cacheId=REQUIRED, request=REQUIRED, _timeout=None, **unknown):
+        """Deletes a cache entry."""
+        if args or unknown or cacheId is REQUIRED or request is REQUIRED:
+            return self._invalid("deleteEntry", args, unknown, _timeout, {"cacheId": cacheId, "request": request})
+        return self._tab.call_method("CacheStorage.deleteEntry", _timeout=_timeout, cacheId=cacheId, request=request)
+
+    def requestCacheNames(self, *args, securityOrigin=None, storageKey=None, storageBucket=None, _timeout=None,
+                          **unknown):
+        """Requests cache names."""
+        if args or unknown:
+            return self._invalid("requestCacheNames", args, unknown, _timeout, {
+                "securityOrigin": securityOrigin, "storageKey": storageKey, "storageBucket": storageBucket})
+        params = {}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("CacheStorage.requestCacheNames", _timeout=_timeout, **params)
+
+    def requestCachedResponse(self, *args, cacheId=REQUIRED, requestURL=REQUIRED, requestHeaders=REQUIRED,
+                              _timeout=None, **unknown):
+        """Fetches cache entry."""
+        if args or unknown or cacheId is REQUIRED or requestURL is REQUIRED or requestHeaders is REQUIRED:
+            return self._invalid("requestCachedResponse", args, unknown, _timeout, {
+                "cacheId": cacheId, "requestURL": requestURL, "requestHeaders": requestHeaders})
+        return self._tab.call_method("CacheStorage.requestCachedResponse", _timeout=_timeout, cacheId=cacheId,
+                                     requestURL=requestURL, requestHeaders=requestHeaders)
+
+    def requestEntries(self, *args, cacheId=REQUIRED, skipCount=None, pageSize=None, pathFilter=None, _timeout=None,
+                       **unknown):
+        """Requests data from cache."""
+        if args or unknown or cacheId is REQUIRED:
+            return self._invalid("requestEntries", args, unknown, _timeout, {
+                "cacheId": cacheId, "skipCount": skipCount, "pageSize": pageSize, "pathFilter": pathFilter})
+        params = {"cacheId": cacheId}
+        if skipCount is not None:
+            params["skipCount"] = skipCount
+        if pageSize is not None:
+            params["pageSize"] = pageSize
+        if pathFilter is not None:
+            params["pathFilter"] = pathFilter
+        return self._tab.call_method("CacheStorage.requestEntries", _timeout=_timeout, **params)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Cast(Domain):
+    """A domain for interacting with Cast, Presentation API, and Remote Playback API functionalities."""
+
+    __slots__ = ()
+
+    _name = "Cast"
+    _events = frozenset(["issueUpdated", "sinksUpdated"])
+
+    ISSUE_UPDATED = "Cast.issueUpdated"
+    SINKS_UPDATED = "Cast.sinksUpdated"
+
+    def enable(self, *args, presentationUrl=None, _timeout=None, **unknown):
+        """Starts observing for sinks that can be used for tab mirroring, and if set, sinks compatible with |presentationUrl| as well."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"presentationUrl": presentationUrl})
+        params = {}
+        if presentationUrl is not None:
+            params["presentationUrl"] = presentationUrl
+        return self._tab.call_method("Cast.enable", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Stops observing for sinks and issues."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Cast.disable", _timeout=_timeout)
+
+    def setSinkToUse(self, *args, sinkName=REQUIRED, _timeout=None, **unknown):
+        """Sets a sink to be used when the web page requests the browser to choose a sink via Presentation API, Remote Playback API, or Cast SDK."""
+        if args or unknown or sinkName is REQUIRED:
+            return self._invalid("setSinkToUse", args, unknown, _timeout, {"sinkName": sinkName})
+        return self._tab.call_method("Cast.setSinkToUse", _timeout=_timeout, sinkName=sinkName)
+
+    def startDesktopMirroring(self, *args, sinkName=REQUIRED, _timeout=None, **unknown):
+        """Starts mirroring the desktop to the sink."""
+        if args or unknown or sinkName is REQUIRED:
+            return self._invalid("startDesktopMirroring", args, unknown, _timeout, {"sinkName": sinkName})
+        return self._tab.call_method("Cast.startDesktopMirroring", _timeout=_timeout, sinkName=sinkName)
+
+    def startTabMirroring(self, *args, sinkName=REQUIRED, _timeout=None, **unknown):
+        """Starts mirroring the tab to the sink."""
+        if args or unknown or sinkName is REQUIRED:
+            return self._invalid("startTabMirroring", args, unknown, _timeout, {"sinkName": sinkName})
+        return self._tab.call_method("Cast.startTabMirroring", _timeout=_timeout, sinkName=sinkName)
+
+    def stopCasting(self, *args, sinkName=REQUIRED, _timeout=None, **unknown):
+        """Stops the active Cast session on the sink."""
+        if args or unknown or sinkName is REQUIRED:
+            return self._invalid("stopCasting", args, unknown, _timeout, {"sinkName": sinkName})
+        return self._tab.call_method("Cast.stopCasting", _timeout=_timeout, sinkName=sinkName)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Console(Domain):
+    """This domain is deprecated - use Runtime or Log instead."""
+
+    __slots__ = ()
+
+    _name = "Console"
+    _events = frozenset(["messageAdded"])
+
+    MESSAGE_ADDED = "Console.messageAdded"
+
+    def clearMessages(self, *args, _timeout=None, **unknown):
+        """Does nothing."""
+        if args or unknown:
+            return self._invalid("clearMessages", args, unknown, _timeout, {})
+        return self._tab.call_method("Console.clearMessages", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables console domain, prevents further console messages from being reported to the client."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Console.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables console domain, sends the messages collected so far to the client by means of the `messageAdded` notification."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Console.enable", _timeout=_timeout)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class CSS(Domain):
+    """This domain exposes CSS read/write operations."""
+
+    __slots__ = ()
+
+    _name = "CSS"
+    _events = frozenset([
+        "computedStyleUpdated", "fontsUpdated", "mediaQueryResultChanged", "styleSheetAdded", "styleSheetChanged",
+        "styleSheetRemoved"])
+
+    COMPUTED_STYLE_UPDATED = "CSS.computedStyleUpdated"
+    FONTS_UPDATED = "CSS.fontsUpdated"
+    MEDIA_QUERY_RESULT_CHANGED = "CSS.mediaQueryResultChanged"
+    STYLE_SHEET_ADDED = "CSS.styleSheetAdded"
+    STYLE_SHEET_CHANGED = "CSS.styleSheetChanged"
+    STYLE_SHEET_REMOVED = "CSS.styleSheetRemoved"
+
+    def addRule(self, *args, styleSheetId=REQUIRED, ruleText=REQUIRED, location=REQUIRED,
+                nodeForPropertySyntaxValidation=None, _timeout=None, **unknown):
+        """Inserts a new rule with the given `ruleText` in a stylesheet with given `styleSheetId`, at the position specified by `location`."""
+        if args or unknown or styleSheetId is REQUIRED or ruleText is REQUIRED or location is REQUIRED:
+            return self._invalid("addRule", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "ruleText": ruleText, "location": location,
+                "nodeForPropertySyntaxValidation": nodeForPropertySyntaxValidation})
+        params = {"styleSheetId": styleSheetId, "ruleText": ruleText, "location": location}
+        if nodeForPropertySyntaxValidation is not None:
+            params["nodeForPropertySyntaxValidation"] = nodeForPropertySyntaxValidation
+        return self._tab.call_method("CSS.addRule", _timeout=_timeout, **params)
+
+    def collectClassNames(self, *args, styleSheetId=REQUIRED, _timeout=None, **unknown):
+        """Returns all class names from specified stylesheet."""
+        if args or unknown or styleSheetId is REQUIRED:
+            return self._invalid("collectClassNames", args, unknown, _timeout, {"styleSheetId": styleSheetId})
+        return self._tab.call_method("CSS.collectClassNames", _timeout=_timeout, styleSheetId=styleSheetId)
+
+    def createStyleSheet(self, *args, frameId=REQUIRED, force=None, _timeout=None, **unknown):
+        """Creates a new special "via-inspector" stylesheet in the frame with given `frameId`."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("createStyleSheet", args, unknown, _timeout, {"frameId": frameId, "force": force})
+        params = {"frameId": frameId}
+        if force is not None:
+            params["force"] = force
+        return self._tab.call_method("CSS.createStyleSheet", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables the CSS agent for the given page."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables the CSS agent for the given page."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.enable", _timeout=_timeout)
+
+    def forcePseudoState(self, *args, nodeId=REQUIRED, forcedPseudoClasses=REQUIRED, _timeout=None, **unknown):
+        """Ensures that the given node will have specified pseudo-classes whenever its style is computed by the browser."""
+        if args or unknown or nodeId is REQUIRED or forcedPseudoClasses is REQUIRED:
+            return self._invalid("forcePseudoState", args, unknown, _timeout, {
+                "nodeId": nodeId, "forcedPseudoClasses": forcedPseudoClasses})
+        return self._tab.call_method("CSS.forcePseudoState", _timeout=_timeout, nodeId=nodeId,
+                                     forcedPseudoClasses=forcedPseudoClasses)
+
+    def forceStartingStyle(self, *args, nodeId=REQUIRED, forced=REQUIRED, _timeout=None, **unknown):
+        """Ensures that the given node is in its starting-style state."""
+        if args or unknown or nodeId is REQUIRED or forced is REQUIRED:
+            return self._invalid("forceStartingStyle", args, unknown, _timeout, {"nodeId": nodeId, "forced": forced})
+        return self._tab.call_method("CSS.forceStartingStyle", _timeout=_timeout, nodeId=nodeId, forced=forced)
+
+    def getBackgroundColors(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getBackgroundColors", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getBackgroundColors", _timeout=_timeout, nodeId=nodeId)
+
+    def getComputedStyleForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Returns the computed style for a DOM node identified by `nodeId`."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getComputedStyleForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getComputedStyleForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def resolveValues(self, *args, values=REQUIRED, nodeId=REQUIRED, propertyName=None, pseudoType=None,
+                      pseudoIdentifier=None, _timeout=None, **unknown):
+        """(experimental) Resolve the specified values in the context of the provided element."""
+        if args or unknown or values is REQUIRED or nodeId is REQUIRED:
+            return self._invalid("resolveValues", args, unknown, _timeout, {
+                "values": values, "nodeId": nodeId, "propertyName": propertyName, "pseudoType": pseudoType,
+                "pseudoIdentifier": pseudoIdentifier})
+        params = {"values": values, "nodeId": nodeId}
+        if propertyName is not None:
+            params["propertyName"] = propertyName
+        if pseudoType is not None:
+            params["pseudoType"] = pseudoType
+        if pseudoIdentifier is not None:
+            params["pseudoIdentifier"] = pseudoIdentifier
+        return self._tab.call_method("CSS.resolveValues", _timeout=_timeout, **params)
+
+    def getLonghandProperties(self, *args, shorthandName=REQUIRED, value=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or shorthandName is REQUIRED or value is REQUIRED:
+            return self._invalid("getLonghandProperties", args, unknown, _timeout, {
+                "shorthandName": shorthandName, "value": value})
+        return self._tab.call_method("CSS.getLonghandProperties", _timeout=_timeout, shorthandName=shorthandName,
+                                     value=value)
+
+    def getInlineStylesForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Returns the styles defined inline (explicitly in the "style" attribute and implicitly, using DOM attributes) for a DOM node identified by `nodeId`."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getInlineStylesForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getInlineStylesForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def getAnimatedStylesForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns the styles coming from animations & transitions including the animation & transition styles coming from inheritance chain."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getAnimatedStylesForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getAnimatedStylesForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def getMatchedStylesForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Returns requested styles for a DOM node identified by `nodeId`."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getMatchedStylesForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getMatchedStylesForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def getEnvironmentVariables(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the values of the default UA-defined environment variables used in env()"""
+        if args or unknown:
+            return self._invalid("getEnvironmentVariables", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.getEnvironmentVariables", _timeout=_timeout)
+
+    def getMediaQueries(self, *args, _timeout=None, **unknown):
+        """Returns all media queries parsed by the rendering engine."""
+        if args or unknown:
+            return self._invalid("getMediaQueries", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.getMediaQueries", _timeout=_timeout)
+
+    def getPlatformFontsForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Requests information about platform fonts which we used to render child TextNodes in the given node."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getPlatformFontsForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getPlatformFontsForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def getStyleSheetText(self, *args, styleSheetId=REQUIRED, _timeout=None, **unknown):
+        """Returns the current textual content for a stylesheet."""
+        if args or unknown or styleSheetId is REQUIRED:
+            return self._invalid("getStyleSheetText", args, unknown, _timeout, {"styleSheetId": styleSheetId})
+        return self._tab.call_method("CSS.getStyleSheetText", _timeout=_timeout, styleSheetId=styleSheetId)
+
+    def getLayersForNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns all layers parsed by the rendering engine for the tree scope of a node."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getLayersForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("CSS.getLayersForNode", _timeout=_timeout, nodeId=nodeId)
+
+    def getLocationForSelector(self, *args, styleSheetId=REQUIRED, selectorText=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Given a CSS selector text and a style sheet ID, getLocationForSelector returns an array of locations of the CSS selector in the style sheet."""
+        if args or unknown or styleSheetId is REQUIRED or selectorText is REQUIRED:
+            return self._invalid("getLocationForSelector", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "selectorText": selectorText})
+        return self._tab.call_method("CSS.getLocationForSelector", _timeout=_timeout, styleSheetId=styleSheetId,
+                                     selectorText=selectorText)
+
+    def trackComputedStyleUpdatesForNode(self, *args, nodeId=None, _timeout=None, **unknown):
+        """(experimental) Starts tracking the given node for the computed style updates and whenever the computed style is updated for node, it queues a `computedStyleUpdated` event with throttling."""
+        if args or unknown:
+            return self._invalid("trackComputedStyleUpdatesForNode", args, unknown, _timeout, {"nodeId": nodeId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        return self._tab.call_method("CSS.trackComputedStyleUpdatesForNode", _timeout=_timeout, **params)
+
+    def trackComputedStyleUpdates(self, *args, propertiesToTrack=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Starts tracking the given computed styles for updates."""
+        if args or unknown or propertiesToTrack is REQUIRED:
+            return self._invalid("trackComputedStyleUpdates", args, unknown, _timeout, {
+                "propertiesToTrack": propertiesToTrack})
+        return self._tab.call_method("CSS.trackComputedStyleUpdates", _timeout=_timeout,
+                                     propertiesToTrack=propertiesToTrack)
+
+    def takeComputedStyleUpdates(self, *args, _timeout=None, **unknown):
+        """(experimental) Polls the next batch of computed style updates."""
+        if args or unknown:
+            return self._invalid("takeComputedStyleUpdates", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.takeComputedStyleUpdates", _timeout=_timeout)
+
+    def setEffectivePropertyValueForNode(self, *args, nodeId=REQUIRED, propertyName=REQUIRED, value=REQUIRED,
+                                         _timeout=None, **unknown):
+        """Find a rule with the given active property for the given node and set the new value for this property"""
+        if args or unknown or nodeId is REQUIRED or propertyName is REQUIRED or value is REQUIRED:
+            return self._invalid("setEffectivePropertyValueForNode", args, unknown, _timeout, {
+                "nodeId": nodeId, "propertyName": propertyName, "value": value})
+        return self._tab.call_method("CSS.setEffectivePropertyValueForNode", _timeout=_timeout, nodeId=nodeId,
+                                     propertyName=propertyName, value=value)
+
+    def setPropertyRulePropertyName(self, *args, styleSheetId=REQUIRED, range=REQUIRED, propertyName=REQUIRED,
+                                    _timeout=None, **unknown):
+        """Modifies the property rule property name."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or propertyName is REQUIRED:
+            return self._invalid("setPropertyRulePropertyName", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "propertyName": propertyName})
+        return self._tab.call_method("CSS.setPropertyRulePropertyName", _timeout=_timeout, styleSheetId=styleSheetId,
+                                     range=range, propertyName=propertyName)
+
+    def setKeyframeKey(self, *args, styleSheetId=REQUIRED, range=REQUIRED, keyText=REQUIRED, _timeout=None, **unknown):
+        """Modifies the keyframe rule key text."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or keyText is REQUIRED:
+            return self._invalid("setKeyframeKey", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "keyText": keyText})
+        return self._tab.call_method("CSS.setKeyframeKey", _timeout=_timeout, styleSheetId=styleSheetId, range=range,
+                                     keyText=keyText)
+
+    def setMediaText(self, *args, styleSheetId=REQUIRED, range=REQUIRED, text=REQUIRED, _timeout=None, **unknown):
+        """Modifies the rule selector."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or text is REQUIRED:
+            return self._invalid("setMediaText", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "text": text})
+        return self._tab.call_method("CSS.setMediaText", _timeout=_timeout, styleSheetId=styleSheetId, range=range,
+                                     text=text)
+
+    def setContainerQueryText(self, *args, styleSheetId=REQUIRED, range=REQUIRED, text=REQUIRED, _timeout=None,
+                              **unknown):
+        """(experimental) Modifies the expression of a container query."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or text is REQUIRED:
+            return self._invalid("setContainerQueryText", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "text": text})
+        return self._tab.call_method("CSS.setContainerQueryText", _timeout=_timeout, styleSheetId=styleSheetId,
+                                     range=range, text=text)
+
+    def setSupportsText(self, *args, styleSheetId=REQUIRED, range=REQUIRED, text=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Modifies the expression of a supports at-rule."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or text is REQUIRED:
+            return self._invalid("setSupportsText", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "text": text})
+        return self._tab.call_method("CSS.setSupportsText", _timeout=_timeout, styleSheetId=styleSheetId, range=range,
+                                     text=text)
+
+    def setScopeText(self, *args, styleSheetId=REQUIRED, range=REQUIRED, text=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Modifies the expression of a scope at-rule."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or text is REQUIRED:
+            return self._invalid("setScopeText", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "text": text})
+        return self._tab.call_method("CSS.setScopeText", _timeout=_timeout, styleSheetId=styleSheetId, range=range,
+                                     text=text)
+
+    def setRuleSelector(self, *args, styleSheetId=REQUIRED, range=REQUIRED, selector=REQUIRED, _timeout=None,
+                        **unknown):
+        """Modifies the rule selector."""
+        if args or unknown or styleSheetId is REQUIRED or range is REQUIRED or selector is REQUIRED:
+            return self._invalid("setRuleSelector", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "range": range, "selector": selector})
+        return self._tab.call_method("CSS.setRuleSelector", _timeout=_timeout, styleSheetId=styleSheetId, range=range,
+                                     selector=selector)
+
+    def setStyleSheetText(self, *args, styleSheetId=REQUIRED, text=REQUIRED, _timeout=None, **unknown):
+        """Sets the new stylesheet text."""
+        if args or unknown or styleSheetId is REQUIRED or text is REQUIRED:
+            return self._invalid("setStyleSheetText", args, unknown, _timeout, {
+                "styleSheetId": styleSheetId, "text": text})
+        return self._tab.call_method("CSS.setStyleSheetText", _timeout=_timeout, styleSheetId=styleSheetId, text=text)
+
+    def setStyleTexts(self, *args, edits=REQUIRED, nodeForPropertySyntaxValidation=None, _timeout=None, **unknown):
+        """Applies specified style edits one after another in the given order."""
+        if args or unknown or edits is REQUIRED:
+            return self._invalid("setStyleTexts", args, unknown, _timeout, {
+                "edits": edits, "nodeForPropertySyntaxValidation": nodeForPropertySyntaxValidation})
+        params = {"edits": edits}
+        if nodeForPropertySyntaxValidation is not None:
+            params["nodeForPropertySyntaxValidation"] = nodeForPropertySyntaxValidation
+        return self._tab.call_method("CSS.setStyleTexts", _timeout=_timeout, **params)
+
+    def startRuleUsageTracking(self, *args, _timeout=None, **unknown):
+        """Enables the selector recording."""
+        if args or unknown:
+            return self._invalid("startRuleUsageTracking", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.startRuleUsageTracking", _timeout=_timeout)
+
+    def stopRuleUsageTracking(self, *args, _timeout=None, **unknown):
+        """Stop tracking rule usage and return the list of rules that were used since last call to `takeCoverageDelta` (or since start of coverage instrumentation)."""
+        if args or unknown:
+            return self._invalid("stopRuleUsageTracking", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.stopRuleUsageTracking", _timeout=_timeout)
+
+    def takeCoverageDelta(self, *args, _timeout=None, **unknown):
+        """Obtain list of rules that became used since last call to this method (or since start of coverage instrumentation)."""
+        if args or unknown:
+            return self._invalid("takeCoverageDelta", args, unknown, _timeout, {})
+        return self._tab.call_method("CSS.takeCoverageDelta", _timeout=_timeout)
+
+    def setLocalFontsEnabled(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables/disables rendering of local CSS fonts (enabled by default)."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setLocalFontsEnabled", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("CSS.setLocalFontsEnabled", _timeout=_timeout, enabled=enabled)
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Debugger(Domain):
+    """Debugger domain exposes JavaScript debugging capabilities."""
+
+    __slots__ = ()
+
+    _name = "Debugger"
+    _events = frozenset(["breakpointResolved", "paused", "resumed", "scriptFailedToParse", "scriptParsed"])
+
+    BREAKPOINT_RESOLVED = "Debugger.breakpointResolved"
+    PAUSED = "Debugger.paused"
+    RESUMED = "Debugger.resumed"
+    SCRIPT_FAILED_TO_PARSE = "Debugger.scriptFailedToParse"
+    SCRIPT_PARSED = "Debugger.scriptParsed"
+
+    def continueToLocation(self, *args, location=REQUIRED, targetCallFrames=None, _timeout=None, **unknown):
+        """Continues execution until specific location is reached."""
+        if args or unknown or location is REQUIRED:
+            return self._invalid("continueToLocation", args, unknown, _timeout, {
+                "location": location, "targetCallFrames": targetCallFrames})
+        params = {"location": location}
+        if targetCallFrames is not None:
+            params["targetCallFrames"] = targetCallFrames
+        return self._tab.call_method("Debugger.continueToLocation", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables debugger for given page."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Debugger.disable", _timeout=_timeout)
+
+    def enable(self, *args, maxScriptsCacheSize=None, _timeout=None, **unknown):
+        """Enables debugger for the given page."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"maxScriptsCacheSize": maxScriptsCacheSize})
+        params = {}
+        if maxScriptsCacheSize is not None:
+            params["maxScriptsCacheSize"] = maxScriptsCacheSize
+        return self._tab.call_method("Debugger.enable", _timeout=_timeout, **params)
+
+    def evaluateOnCallFrame(self, *args, callFrameId=REQUIRED, expression=REQUIRED, objectGroup=None,
+                            includeCommandLineAPI=None, silent=None, returnByValue=None, generatePreview=None,
+                            throwOnSideEffect=None, timeout=None, _timeout=None, **unknown):
+        """Evaluates expression on a given call frame."""
+        if args or unknown or callFrameId is REQUIRED or expression is REQUIRED:
+            return self._invalid("evaluateOnCallFrame", args, unknown, _timeout, {
+                "callFrameId": callFrameId, "expression": expression, "objectGroup": objectGroup,
+                "includeCommandLineAPI": includeCommandLineAPI, "silent": silent, "returnByValue": returnByValue,
+                "generatePreview": generatePreview, "throwOnSideEffect": throwOnSideEffect, "timeout": timeout})
+        params = {"callFrameId": callFrameId, "expression": expression}
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        if includeCommandLineAPI is not None:
+            params["includeCommandLineAPI"] = includeCommandLineAPI
+        if silent is not None:
+            params["silent"] = silent
+        if returnByValue is not None:
+            params["returnByValue"] = returnByValue
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        if throwOnSideEffect is not None:
+            params["throwOnSideEffect"] = throwOnSideEffect
+        if timeout is not None:
+            params["timeout"] = timeout
+        return self._tab.call_method("Debugger.evaluateOnCallFrame", _timeout=_timeout, **params)
+
+    def getPossibleBreakpoints(self, *args, start=REQUIRED, end=None, restrictToFunction=None, _timeout=None,
+                               **unknown):
+        """Returns possible locations for breakpoint."""
+        if args or unknown or start is REQUIRED:
+            return self._invalid("getPossibleBreakpoints", args, unknown, _timeout, {
+                "start": start, "end": end, "restrictToFunction": restrictToFunction})
+        params = {"start": start}
+        if end is not None:
+            params["end"] = end
+        if restrictToFunction is not None:
+            params["restrictToFunction"] = restrictToFunction
+        return self._tab.call_method("Debugger.getPossibleBreakpoints", _timeout=_timeout, **params)
+
+    def getScriptSource(self, *args, scriptId=REQUIRED, _timeout=None, **unknown):
+        """Returns source for the script with given id."""
+        if args or unknown or scriptId is REQUIRED:
+            return self._invalid("getScriptSource", args, unknown, _timeout, {"scriptId": scriptId})
+        return self._tab.call_method("Debugger.getScriptSource", _timeout=_timeout, scriptId=scriptId)
+
+    def disassembleWasmModule(self, *args, scriptId=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or scriptId is REQUIRED:
+            return self._invalid("disassembleWasmModule", args, unknown, _timeout, {"scriptId": scriptId})
+        return self._tab.call_method("Debugger.disassembleWasmModule", _timeout=_timeout, scriptId=scriptId)
+
+    def nextWasmDisassemblyChunk(self, *args, streamId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Disassemble the next chunk of lines for the module corresponding to the stream."""
+        if args or unknown or streamId is REQUIRED:
+            return self._invalid("nextWasmDisassemblyChunk", args, unknown, _timeout, {"streamId": streamId})
+        return self._tab.call_method("Debugger.nextWasmDisassemblyChunk", _timeout=_timeout, streamId=streamId)
+
+    def getWasmBytecode(self, *args, scriptId=REQUIRED, _timeout=None, **unknown):
+        """(deprecated) This command is deprecated."""
+        if args or unknown or scriptId is REQUIRED:
+            return self._invalid("getWasmBytecode", args, unknown, _timeout, {"scriptId": scriptId})
+        return self._tab.call_method("Debugger.getWasmBytecode", _timeout=_timeout, scriptId=scriptId)
+
+    def getStackTrace(self, *args, stackTraceId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns stack trace with given `stackTraceId`."""
+        if args or unknown or stackTraceId is REQUIRED:
+            return self._invalid("getStackTrace", args, unknown, _timeout, {"stackTraceId": stackTraceId})
+        return self._tab.call_method("Debugger.getStackTrace", _timeout=_timeout, stackTraceId=stackTraceId)
+
+    def pause(self, *args, _timeout=None, **unknown):
+        """Stops on the next JavaScript statement."""
+        if args or unknown:
+            return self._invalid("pause", args, unknown, _timeout, {})
+        return self._tab.call_method("Debugger.pause", _timeout=_timeout)
+
+    def pauseOnAsyncCall(self, *args, parentStackTraceId=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated)"""
+        if args or unknown or parentStackTraceId is REQUIRED:
+            return self._invalid("pauseOnAsyncCall", args, unknown, _timeout, {
+                "parentStackTraceId": parentStackTraceId})
+        return self._tab.call_method("Debugger.pauseOnAsyncCall", _timeout=_timeout,
+                                     parentStackTraceId=parentStackTraceId)
+
+    def removeBreakpoint(self, *args, breakpointId=REQUIRED, _timeout=None, **unknown):
+        """Removes JavaScript breakpoint."""
+        if args or unknown or breakpointId is REQUIRED:
+            return self._invalid("removeBreakpoint", args, unknown, _timeout, {"breakpointId": breakpointId})
+        return self._tab.call_method("Debugger.removeBreakpoint", _timeout=_timeout, breakpointId=breakpointId)
+
+    def restartFrame(self, *args, callFrameId=REQUIRED, mode=None, _timeout=None, **unknown):
+        """Restarts particular call frame from the beginning."""
+        if args or unknown or callFrameId is REQUIRED:
+            return self._invalid("restartFrame", args, unknown, _timeout, {"callFrameId": callFrameId, "mode": mode})
+        params = {"callFrameId": callFrameId}
+        if mode is not None:
+            params["mode"] = mode
+        return self._tab.call_method("Debugger.restartFrame", _timeout=_timeout, **params)
+
+    def resume(self, *args, terminateOnResume=None, _timeout=None, **unknown):
+        """Resumes JavaScript execution."""
+        if args or unknown:
+            return self._invalid("resume", args, unknown, _timeout, {"terminateOnResume": terminateOnResume})
+        params = {}
+        if terminateOnResume is not None:
+            params["terminateOnResume"] = terminateOnResume
+        return self._tab.call_method("Debugger.resume", _timeout=_timeout, **params)
+
+    def searchInContent(self, *args, scriptId=REQUIRED, query=REQUIRED, caseSensitive=None, isRegex=None,
+                        _timeout=None, **unknown):
+        """Searches for given string in script content."""
+        if args or unknown or scriptId is REQUIRED or query is REQUIRED:
+            return self._invalid("searchInContent", args, unknown, _timeout, {
+                "scriptId": scriptId, "query": query, "caseSensitive": caseSensitive, "isRegex": isRegex})
+        params = {"scriptId": scriptId, "query": query}
+        if caseSensitive is not None:
+            params["caseSensitive"] = caseSensitive
+        if isRegex is not None:
+            params["isRegex"] = isRegex
+        return self._tab.call_method("Debugger.searchInContent", _timeout=_timeout, **params)
+
+    def setAsyncCallStackDepth(self, *args, maxDepth=REQUIRED, _timeout=None, **unknown):
+        """Enables or disables async call stacks tracking."""
+        if args or unknown or maxDepth is REQUIRED:
+            return self._invalid("setAsyncCallStackDepth", args, unknown, _timeout, {"maxDepth": maxDepth})
+        return self._tab.call_method("Debugger.setAsyncCallStackDepth", _timeout=_timeout, maxDepth=maxDepth)
+
+    def setBlackboxExecutionContexts(self, *args, uniqueIds=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Replace previous blackbox execution contexts with passed ones."""
+        if args or unknown or uniqueIds is REQUIRED:
+            return self._invalid("setBlackboxExecutionContexts", args, unknown, _timeout, {"uniqueIds": uniqueIds})
+        return self._tab.call_method("Debugger.setBlackboxExecutionContexts", _timeout=_timeout, uniqueIds=uniqueIds)
+
+    def setBlackboxPatterns(self, *args, patterns=REQUIRED, skipAnonymous=None, _timeout=None, **unknown):
+        """(experimental) Replace previous blackbox patterns with passed ones."""
+        if args or unknown or patterns is REQUIRED:
+            return self._invalid("setBlackboxPatterns", args, unknown, _timeout, {
+                "patterns": patterns, "skipAnonymous": skipAnonymous})
+        params = {"patterns": patterns}
+        if skipAnonymous is not None:
+            params["skipAnonymous"] = skipAnonymous
+        return self._tab.call_method("Debugger.setBlackboxPatterns", _timeout=_timeout, **params)
+
+    def setBlackboxedRanges(self, *args, scriptId=REQUIRED, positions=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Makes backend skip steps in the script in blackboxed ranges."""
+        if args or unknown or scriptId is REQUIRED or positions is REQUIRED:
+            return self._invalid("setBlackboxedRanges", args, unknown, _timeout, {
+                "scriptId": scriptId, "positions": positions})
+        return self._tab.call_method("Debugger.setBlackboxedRanges", _timeout=_timeout, scriptId=scriptId,
+                                     positions=positions)
+
+    def setBreakpoint(self, *args, location=REQUIRED, condition=None, _timeout=None, **unknown):
+        """Sets JavaScript breakpoint at a given location."""
+        if args or unknown or location is REQUIRED:
+            return self._invalid("setBreakpoint", args, unknown, _timeout, {
+                "location": location, "condition": condition})
+        params = {"location": location}
+        if condition is not None:
+            params["condition"] = condition
+        return self._tab.call_method("Debugger.setBreakpoint", _timeout=_timeout, **params)
+
+    def setInstrumentationBreakpoint(self, *args, instrumentation=REQUIRED, _timeout=None, **unknown):
+        """Sets instrumentation breakpoint."""
+        if args or unknown or instrumentation is REQUIRED:
+            return self._invalid("setInstrumentationBreakpoint", args, unknown, _timeout, {
+                "instrumentation": instrumentation})
+        return self._tab.call_method("Debugger.setInstrumentationBreakpoint", _timeout=_timeout,
+                                     instrumentation=instrumentation)
+
+    def setBreakpointByUrl(self, *args, lineNumber=REQUIRED, url=None, urlRegex=None, scriptHash=None,
+                           columnNumber=None, condition=None, _timeout=None, **unknown):
+        """Sets JavaScript breakpoint at given location specified either by URL or URL regex."""
+        if args or unknown or lineNumber is REQUIRED:
+            return self._invalid("setBreakpointByUrl", args, unknown, _timeout, {
+                "lineNumber": lineNumber, "url": url, "urlRegex": urlRegex, "scriptHash": scriptHash,
+                "columnNumber": columnNumber, "condition": condition})
+        params = {"lineNumber": lineNumber}
+        if url is not None:
+            params["url"] = url
+        if urlRegex is not None:
+            params["urlRegex"] = urlRegex
+        if scriptHash is not None:
+            params["scriptHash"] = scriptHash
+        if columnNumber is not None:
+            params["columnNumber"] = columnNumber
+        if condition is not None:
+            params["condition"] = condition
+        return self._tab.call_method("Debugger.setBreakpointByUrl", _timeout=_timeout, **params)
+
+    def setBreakpointOnFunctionCall(self, *args, objectId=REQUIRED, condition=None, _timeout=None, **unknown):
+        """(experimental) Sets JavaScript breakpoint before each call to the given function."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("setBreakpointOnFunctionCall", args, unknown, _timeout, {
+                "objectId": objectId, "condition": condition})
+        params = {"objectId": objectId}
+        if condition is not None:
+            params["condition"] = condition
+        return self._tab.call_method("Debugger.setBreakpointOnFunctionCall", _timeout=_timeout, **params)
+
+    def setBreakpointsActive(self, *args, active=REQUIRED, _timeout=None, **unknown):
+        """Activates / deactivates all breakpoints on the page."""
+        if args or unknown or active is REQUIRED:
+            return self._invalid("setBreakpointsActive", args, unknown, _timeout, {"active": active})
+        return self._tab.call_method("Debugger.setBreakpointsActive", _timeout=_timeout, active=active)
+
+    def setPauseOnExceptions(self, *args, state=REQUIRED, _timeout=None, **unknown):
+        """Defines pause on exceptions state."""
+        if args or unknown or state is REQUIRED:
+            return self._invalid("setPauseOnExceptions", args, unknown, _timeout, {"state": state})
+        return self._tab.call_method("Debugger.setPauseOnExceptions", _timeout=_timeout, state=state)
+
+    def setReturnValue(self, *args, newValue=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Changes return value in top frame."""
+        if args or unknown or newValue is REQUIRED:
+            return self._invalid("setReturnValue", args, unknown, _timeout, {"newValue": newValue})
+        return self._tab.call_method("Debugger.setReturnValue", _timeout=_timeout, newValue=newValue)
+
+    def setScriptSource(self, *args, scriptId=REQUIRED, scriptSource=REQUIRED, dryRun=None, allowTopFrameEditing=None,
+                        _timeout=None, **unknown):
+        """Edits JavaScript source live."""
+        if args or unknown or scriptId is REQUIRED or scriptSource is REQUIRED:
+            return self._invalid("setScriptSource", args, unknown, _timeout, {
+                "scriptId": scriptId, "scriptSource": scriptSource, "dryRun": dryRun,
+                "allowTopFrameEditing": allowTopFrameEditing})
+        params = {"scriptId": scriptId, "scriptSource": scriptSource}
+        if dryRun is not None:
+            params["dryRun"] = dryRun
+        if allowTopFrameEditing is not None:
+            params["allowTopFrameEditing"] = allowTopFrameEditing
+        return self._tab.call_method("Debugger.setScriptSource", _timeout=_timeout, **params)
+
+    def setSkipAllPauses(self, *args, skip=REQUIRED, _timeout=None, **unknown):
+        """Makes page not interrupt on any pauses (breakpoint, exception, dom exception etc)."""
+        if args or unknown or skip is REQUIRED:
+            return self._invalid("setSkipAllPauses", args, unknown, _timeout, {"skip": skip})
+        return self._tab.call_method("Debugger.setSkipAllPauses", _timeout=_timeout, skip=skip)
+
+    def setVariableValue(self, *args, scopeNumber=REQUIRED, variableName=REQUIRED, newValue=REQUIRED,
+                         callFrameId=REQUIRED, _timeout=None, **unknown):
+        """Changes value of variable in a callframe."""
+        invalid = args or unknown or scopeNumber is REQUIRED or variableName is REQUIRED
+        if invalid or newValue is REQUIRED or callFrameId is REQUIRED:
+            return self._invalid("setVariableValue", args, unknown, _timeout, {
+                "scopeNumber": scopeNumber, "variableName": variableName, "newValue": newValue,
+                "callFrameId": callFrameId})
+        return self._tab.call_method("Debugger.setVariableValue", _timeout=_timeout, scopeNumber=scopeNumber,
+                                     variableName=variableName, newValue=newValue, callFrameId=callFrameId)
+
+    def stepInto(self, *args, breakOnAsyncCall=None, skipList=None, _timeout=None, **unknown):
+        """Steps into the function call."""
+        if args or unknown:
+            return self._invalid("stepInto", args, unknown, _timeout, {
+                "breakOnAsyncCall": breakOnAsyncCall, "skipList": skipList})
+        params = {}
+        if breakOnAsyncCall is not None:
+            params["breakOnAsyncCall"] = breakOnAsyncCall
+        if skipList is not None:
+            params["skipList"] = skipList
+        return self._tab.call_method("Debugger.stepInto", _timeout=_timeout, **params)
+
+    def stepOut(self, *args, _timeout=None, **unknown):
+        """Steps out of the function call."""
+        if args or unknown:
+            return self._invalid("stepOut", args, unknown, _timeout, {})
+        return self._tab.call_method("Debugger.stepOut", _timeout=_timeout)
+
+    def stepOver(self, *args, skipList=None, _timeout=None, **unknown):
+        """Steps over the statement."""
+        if args or unknown:
+            return self._invalid("stepOver", args, unknown, _timeout, {"skipList": skipList})
+        params = {}
+        if skipList is not None:
+            params["skipList"] = skipList
+        return self._tab.call_method("Debugger.stepOver", _timeout=_timeout, **params)
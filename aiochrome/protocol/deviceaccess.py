@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DeviceAccess(Domain):
+    __slots__ = ()
+
+    _name = "DeviceAccess"
+    _events = frozenset(["deviceRequestPrompted"])
+
+    DEVICE_REQUEST_PROMPTED = "DeviceAccess.deviceRequestPrompted"
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enable events in this domain."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("DeviceAccess.enable", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disable events in this domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("DeviceAccess.disable", _timeout=_timeout)
+
+    def selectPrompt(self, *args, id=REQUIRED, deviceId=REQUIRED, _timeout=None, **unknown):
+        """Select a device in response to a DeviceAccess.deviceRequestPrompted event."""
+        if args or unknown or id is REQUIRED or deviceId is REQUIRED:
+            return self._invalid("selectPrompt", args, unknown, _timeout, {"id": id, "deviceId": deviceId})
+        return self._tab.call_method("DeviceAccess.selectPrompt", _timeout=_timeout, id=id, deviceId=deviceId)
+
+    def cancelPrompt(self, *args, id=REQUIRED, _timeout=None, **unknown):
+        """Cancel a prompt in response to a DeviceAccess.deviceRequestPrompted event."""
+        if args or unknown or id is REQUIRED:
+            return self._invalid("cancelPrompt", args, unknown, _timeout, {"id": id})
+        return self._tab.call_method("DeviceAccess.cancelPrompt", _timeout=_timeout, id=id)
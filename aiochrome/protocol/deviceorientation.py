@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DeviceOrientation(Domain):
+    __slots__ = ()
+
+    _name = "DeviceOrientation"
+    _events = frozenset([])
+
+    def clearDeviceOrientationOverride(self, *args, _timeout=None, **unknown):
+        """Clears the overridden Device Orientation."""
+        if args or unknown:
+            return self._invalid("clearDeviceOrientationOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("DeviceOrientation.clearDeviceOrientationOverride", _timeout=_timeout)
+
+    def setDeviceOrientationOverride(self, *args, alpha=REQUIRED, beta=REQUIRED, gamma=REQUIRED, _timeout=None,
+                                     **unknown):
+        """Overrides the Device Orientation."""
+        if args or unknown or alpha is REQUIRED or beta is REQUIRED or gamma is REQUIRED:
+            return self._invalid("setDeviceOrientationOverride", args, unknown, _timeout, {
+                "alpha": alpha, "beta": beta, "gamma": gamma})
+        return self._tab.call_method("DeviceOrientation.setDeviceOrientationOverride", _timeout=_timeout, alpha=alpha,
+                                     beta=beta, gamma=gamma)
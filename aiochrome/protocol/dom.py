@@ -0,0 +1,509 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DOM(Domain):
+    """This domain exposes DOM read/write operations."""
+
+    __slots__ = ()
+
+    _name = "DOM"
+    _events = frozenset([
+        "attributeModified", "attributeRemoved", "characterDataModified", "childNodeCountUpdated", "childNodeInserted",
+        "childNodeRemoved", "distributedNodesUpdated", "documentUpdated", "inlineStyleInvalidated",
+        "pseudoElementAdded", "pseudoElementRemoved", "scrollableFlagUpdated", "setChildNodes", "shadowRootPopped",
+        "shadowRootPushed", "topLayerElementsUpdated"])
+
+    ATTRIBUTE_MODIFIED = "DOM.attributeModified"
+    ATTRIBUTE_REMOVED = "DOM.attributeRemoved"
+    CHARACTER_DATA_MODIFIED = "DOM.characterDataModified"
+    CHILD_NODE_COUNT_UPDATED = "DOM.childNodeCountUpdated"
+    CHILD_NODE_INSERTED = "DOM.childNodeInserted"
+    CHILD_NODE_REMOVED = "DOM.childNodeRemoved"
+    DISTRIBUTED_NODES_UPDATED = "DOM.distributedNodesUpdated"
+    DOCUMENT_UPDATED = "DOM.documentUpdated"
+    INLINE_STYLE_INVALIDATED = "DOM.inlineStyleInvalidated"
+    PSEUDO_ELEMENT_ADDED = "DOM.pseudoElementAdded"
+    PSEUDO_ELEMENT_REMOVED = "DOM.pseudoElementRemoved"
+    SCROLLABLE_FLAG_UPDATED = "DOM.scrollableFlagUpdated"
+    SET_CHILD_NODES = "DOM.setChildNodes"
+    SHADOW_ROOT_POPPED = "DOM.shadowRootPopped"
+    SHADOW_ROOT_PUSHED = "DOM.shadowRootPushed"
+    TOP_LAYER_ELEMENTS_UPDATED = "DOM.topLayerElementsUpdated"
+
+    def collectClassNamesFromSubtree(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Collects class names for the node with given id and all of it's child nodes."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("collectClassNamesFromSubtree", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.collectClassNamesFromSubtree", _timeout=_timeout, nodeId=nodeId)
+
+    def copyTo(self, *args, nodeId=REQUIRED, targetNodeId=REQUIRED, insertBeforeNodeId=None, _timeout=None, **unknown):
+        """(experimental) Creates a deep copy of the specified node and places it into the target container before the given anchor."""
+        if args or unknown or nodeId is REQUIRED or targetNodeId is REQUIRED:
+            return self._invalid("copyTo", args, unknown, _timeout, {
+                "nodeId": nodeId, "targetNodeId": targetNodeId, "insertBeforeNodeId": insertBeforeNodeId})
+        params = {"nodeId": nodeId, "targetNodeId": targetNodeId}
+        if insertBeforeNodeId is not None:
+            params["insertBeforeNodeId"] = insertBeforeNodeId
+        return self._tab.call_method("DOM.copyTo", _timeout=_timeout, **params)
+
+    def describeNode(self, *args, nodeId=None, backendNodeId=None, objectId=None, depth=None, pierce=None,
+                     _timeout=None, **unknown):
+        """Describes node given its id, does not require domain to be enabled."""
+        if args or unknown:
+            return self._invalid("describeNode", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId, "depth": depth,
+                "pierce": pierce})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if depth is not None:
+            params["depth"] = depth
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOM.describeNode", _timeout=_timeout, **params)
+
+    def scrollIntoViewIfNeeded(self, *args, nodeId=None, backendNodeId=None, objectId=None, rect=None, _timeout=None,
+                               **unknown):
+        """Scrolls the specified rect of the given node into view if not already visible."""
+        if args or unknown:
+            return self._invalid("scrollIntoViewIfNeeded", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId, "rect": rect})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if rect is not None:
+            params["rect"] = rect
+        return self._tab.call_method("DOM.scrollIntoViewIfNeeded", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables DOM agent for the given page."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.disable", _timeout=_timeout)
+
+    def discardSearchResults(self, *args, searchId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Discards search results from the session with the given id."""
+        if args or unknown or searchId is REQUIRED:
+            return self._invalid("discardSearchResults", args, unknown, _timeout, {"searchId": searchId})
+        return self._tab.call_method("DOM.discardSearchResults", _timeout=_timeout, searchId=searchId)
+
+    def enable(self, *args, includeWhitespace=None, _timeout=None, **unknown):
+        """Enables DOM agent for the given page."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"includeWhitespace": includeWhitespace})
+        params = {}
+        if includeWhitespace is not None:
+            params["includeWhitespace"] = includeWhitespace
+        return self._tab.call_method("DOM.enable", _timeout=_timeout, **params)
+
+    def focus(self, *args, nodeId=None, backendNodeId=None, objectId=None, _timeout=None, **unknown):
+        """Focuses the given element."""
+        if args or unknown:
+            return self._invalid("focus", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("DOM.focus", _timeout=_timeout, **params)
+
+    def getAttributes(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Returns attributes for the specified node."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getAttributes", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.getAttributes", _timeout=_timeout, nodeId=nodeId)
+
+    def getBoxModel(self, *args, nodeId=None, backendNodeId=None, objectId=None, _timeout=None, **unknown):
+        """Returns boxes for the given node."""
+        if args or unknown:
+            return self._invalid("getBoxModel", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("DOM.getBoxModel", _timeout=_timeout, **params)
+
+    def getContentQuads(self, *args, nodeId=None, backendNodeId=None, objectId=None, _timeout=None, **unknown):
+        """(experimental) Returns quads that describe node position on the page."""
+        if args or unknown:
+            return self._invalid("getContentQuads", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("DOM.getContentQuads", _timeout=_timeout, **params)
+
+    def getDocument(self, *args, depth=None, pierce=None, _timeout=None, **unknown):
+        """Returns the root DOM node (and optionally the subtree) to the caller."""
+        if args or unknown:
+            return self._invalid("getDocument", args, unknown, _timeout, {"depth": depth, "pierce": pierce})
+        params = {}
+        if depth is not None:
+            params["depth"] = depth
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOM.getDocument", _timeout=_timeout, **params)
+
+    def getFlattenedDocument(self, *args, depth=None, pierce=None, _timeout=None, **unknown):
+        """(deprecated) Returns the root DOM node (and optionally the subtree) to the caller."""
+        if args or unknown:
+            return self._invalid("getFlattenedDocument", args, unknown, _timeout, {"depth": depth, "pierce": pierce})
+        params = {}
+        if depth is not None:
+            params["depth"] = depth
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOM.getFlattenedDocument", _timeout=_timeout, **params)
+
+    def getNodesForSubtreeByStyle(self, *args, nodeId=REQUIRED, computedStyles=REQUIRED, pierce=None, _timeout=None,
+                                  **unknown):
+        """(experimental) Finds nodes with a given computed style in a subtree."""
+        if args or unknown or nodeId is REQUIRED or computedStyles is REQUIRED:
+            return self._invalid("getNodesForSubtreeByStyle", args, unknown, _timeout, {
+                "nodeId": nodeId, "computedStyles": computedStyles, "pierce": pierce})
+        params = {"nodeId": nodeId, "computedStyles": computedStyles}
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOM.getNodesForSubtreeByStyle", _timeout=_timeout, **params)
+
+    def getNodeForLocation(self, *args, x=REQUIRED, y=REQUIRED, includeUserAgentShadowDOM=None,
+                           ignorePointerEventsNone=None, _timeout=None, **unknown):
+        """Returns node id at given location."""
+        if args or unknown or x is REQUIRED or y is REQUIRED:
+            return self._invalid("getNodeForLocation", args, unknown, _timeout, {
+                "x": x, "y": y, "includeUserAgentShadowDOM": includeUserAgentShadowDOM,
+                "ignorePointerEventsNone": ignorePointerEventsNone})
+        params = {"x": x, "y": y}
+        if includeUserAgentShadowDOM is not None:
+            params["includeUserAgentShadowDOM"] = includeUserAgentShadowDOM
+        if ignorePointerEventsNone is not None:
+            params["ignorePointerEventsNone"] = ignorePointerEventsNone
+        return self._tab.call_method("DOM.getNodeForLocation", _timeout=_timeout, **params)
+
+    def getOuterHTML(self, *args, nodeId=None, backendNodeId=None, objectId=None, includeShadowDOM=None, _timeout=None,
+                     **unknown):
+        """Returns node's HTML markup."""
+        if args or unknown:
+            return self._invalid("getOuterHTML", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId,
+                "includeShadowDOM": includeShadowDOM})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if includeShadowDOM is not None:
+            params["includeShadowDOM"] = includeShadowDOM
+        return self._tab.call_method("DOM.getOuterHTML", _timeout=_timeout, **params)
+
+    def getRelayoutBoundary(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns the id of the nearest ancestor that is a relayout boundary."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getRelayoutBoundary", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.getRelayoutBoundary", _timeout=_timeout, nodeId=nodeId)
+
+    def getSearchResults(self, *args, searchId=REQUIRED, fromIndex=REQUIRED, toIndex=REQUIRED, _timeout=None,
+                         **unknown):
+        """(experimental) Returns search results from given `fromIndex` to given `toIndex` from the search with the given identifier."""
+        if args or unknown or searchId is REQUIRED or fromIndex is REQUIRED or toIndex is REQUIRED:
+            return self._invalid("getSearchResults", args, unknown, _timeout, {
+                "searchId": searchId, "fromIndex": fromIndex, "toIndex": toIndex})
+        return self._tab.call_method("DOM.getSearchResults", _timeout=_timeout, searchId=searchId, fromIndex=fromIndex,
+                                     toIndex=toIndex)
+
+    def hideHighlight(self, *args, _timeout=None, **unknown):
+        """Hides any highlight."""
+        if args or unknown:
+            return self._invalid("hideHighlight", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.hideHighlight", _timeout=_timeout)
+
+    def highlightNode(self, *args, _timeout=None, **unknown):
+        """Highlights DOM node."""
+        if args or unknown:
+            return self._invalid("highlightNode", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.highlightNode", _timeout=_timeout)
+
+    def highlightRect(self, *args, _timeout=None, **unknown):
+        """Highlights given rectangle."""
+        if args or unknown:
+            return self._invalid("highlightRect", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.highlightRect", _timeout=_timeout)
+
+    def markUndoableState(self, *args, _timeout=None, **unknown):
+        """(experimental) Marks last undoable state."""
+        if args or unknown:
+            return self._invalid("markUndoableState", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.markUndoableState", _timeout=_timeout)
+
+    def moveTo(self, *args, nodeId=REQUIRED, targetNodeId=REQUIRED, insertBeforeNodeId=None, _timeout=None, **unknown):
+        """Moves node into the new container, places it before the given anchor."""
+        if args or unknown or nodeId is REQUIRED or targetNodeId is REQUIRED:
+            return self._invalid("moveTo", args, unknown, _timeout, {
+                "nodeId": nodeId, "targetNodeId": targetNodeId, "insertBeforeNodeId": insertBeforeNodeId})
+        params = {"nodeId": nodeId, "targetNodeId": targetNodeId}
+        if insertBeforeNodeId is not None:
+            params["insertBeforeNodeId"] = insertBeforeNodeId
+        return self._tab.call_method("DOM.moveTo", _timeout=_timeout, **params)
+
+    def performSearch(self, *args, query=REQUIRED, includeUserAgentShadowDOM=None, _timeout=None, **unknown):
+        """(experimental) Searches for a given string in the DOM tree."""
+        if args or unknown or query is REQUIRED:
+            return self._invalid("performSearch", args, unknown, _timeout, {
+                "query": query, "includeUserAgentShadowDOM": includeUserAgentShadowDOM})
+        params = {"query": query}
+        if includeUserAgentShadowDOM is not None:
+            params["includeUserAgentShadowDOM"] = includeUserAgentShadowDOM
+        return self._tab.call_method("DOM.performSearch", _timeout=_timeout, **params)
+
+    def pushNodeByPathToFrontend(self, *args, path=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Requests that the node is sent to the caller given its path."""
+        if args or unknown or path is REQUIRED:
+            return self._invalid("pushNodeByPathToFrontend", args, unknown, _timeout, {"path": path})
+        return self._tab.call_method("DOM.pushNodeByPathToFrontend", _timeout=_timeout, path=path)
+
+    def pushNodesByBackendIdsToFrontend(self, *args, backendNodeIds=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Requests that a batch of nodes is sent to the caller given their backend node ids."""
+        if args or unknown or backendNodeIds is REQUIRED:
+            return self._invalid("pushNodesByBackendIdsToFrontend", args, unknown, _timeout, {
+                "backendNodeIds": backendNodeIds})
+        return self._tab.call_method("DOM.pushNodesByBackendIdsToFrontend", _timeout=_timeout,
+                                     backendNodeIds=backendNodeIds)
+
+    def querySelector(self, *args, nodeId=REQUIRED, selector=REQUIRED, _timeout=None, **unknown):
+        """Executes `querySelector` on a given node."""
+        if args or unknown or nodeId is REQUIRED or selector is REQUIRED:
+            return self._invalid("querySelector", args, unknown, _timeout, {"nodeId": nodeId, "selector": selector})
+        return self._tab.call_method("DOM.querySelector", _timeout=_timeout, nodeId=nodeId, selector=selector)
+
+    def querySelectorAll(self, *args, nodeId=REQUIRED, selector=REQUIRED, _timeout=None, **unknown):
+        """Executes `querySelectorAll` on a given node."""
+        if args or unknown or nodeId is REQUIRED or selector is REQUIRED:
+            return self._invalid("querySelectorAll", args, unknown, _timeout, {"nodeId": nodeId, "selector": selector})
+        return self._tab.call_method("DOM.querySelectorAll", _timeout=_timeout, nodeId=nodeId, selector=selector)
+
+    def getTopLayerElements(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns NodeIds of current top layer elements."""
+        if args or unknown:
+            return self._invalid("getTopLayerElements", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.getTopLayerElements", _timeout=_timeout)
+
+    def getElementByRelation(self, *args, nodeId=REQUIRED, relation=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns the NodeId of the matched element according to certain relations."""
+        if args or unknown or nodeId is REQUIRED or relation is REQUIRED:
+            return self._invalid("getElementByRelation", args, unknown, _timeout, {
+                "nodeId": nodeId, "relation": relation})
+        return self._tab.call_method("DOM.getElementByRelation", _timeout=_timeout, nodeId=nodeId, relation=relation)
+
+    def redo(self, *args, _timeout=None, **unknown):
+        """(experimental) Re-does the last undone action."""
+        if args or unknown:
+            return self._invalid("redo", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.redo", _timeout=_timeout)
+
+    def removeAttribute(self, *args, nodeId=REQUIRED, name=REQUIRED, _timeout=None, **unknown):
+        """Removes attribute with given name from an element with given id."""
+        if args or unknown or nodeId is REQUIRED or name is REQUIRED:
+            return self._invalid("removeAttribute", args, unknown, _timeout, {"nodeId": nodeId, "name": name})
+        return self._tab.call_method("DOM.removeAttribute", _timeout=_timeout, nodeId=nodeId, name=name)
+
+    def removeNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """Removes node with given id."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("removeNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.removeNode", _timeout=_timeout, nodeId=nodeId)
+
+    def requestChildNodes(self, *args, nodeId=REQUIRED, depth=None, pierce=None, _timeout=None, **unknown):
+        """Requests that children of the node with given id are returned to the caller in form of `setChildNodes` events where not only immediate children are retrieved, but all children down to the specified depth."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("requestChildNodes", args, unknown, _timeout, {
+                "nodeId": nodeId, "depth": depth, "pierce": pierce})
+        params = {"nodeId": nodeId}
+        if depth is not None:
+            params["depth"] = depth
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOM.requestChildNodes", _timeout=_timeout, **params)
+
+    def requestNode(self, *args, objectId=REQUIRED, _timeout=None, **unknown):
+        """Requests that the node is sent to the caller given the JavaScript node object reference."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("requestNode", args, unknown, _timeout, {"objectId": objectId})
+        return self._tab.call_method("DOM.requestNode", _timeout=_timeout, objectId=objectId)
+
+    def resolveNode(self, *args, nodeId=None, backendNodeId=None, objectGroup=None, executionContextId=None,
+                    _timeout=None, **unknown):
+        """Resolves the JavaScript node object for a given NodeId or BackendNodeId."""
+        if args or unknown:
+            return self._invalid("resolveNode", args, unknown, _timeout, {
+                "nodeId": nodeId, "backendNodeId": backendNodeId, "objectGroup": objectGroup,
+                "executionContextId": executionContextId})
+        params = {}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        return self._tab.call_method("DOM.resolveNode", _timeout=_timeout, **params)
+
+    def setAttributeValue(self, *args, nodeId=REQUIRED, name=REQUIRED, value=REQUIRED, _timeout=None, **unknown):
+        """Sets attribute for an element with given id."""
+        if args or unknown or nodeId is REQUIRED or name is REQUIRED or value is REQUIRED:
+            return self._invalid("setAttributeValue", args, unknown, _timeout, {
+                "nodeId": nodeId, "name": name, "value": value})
+        return self._tab.call_method("DOM.setAttributeValue", _timeout=_timeout, nodeId=nodeId, name=name, value=value)
+
+    def setAttributesAsText(self, *args, nodeId=REQUIRED, text=REQUIRED, name=None, _timeout=None, **unknown):
+        """Sets attributes on element with given id."""
+        if args or unknown or nodeId is REQUIRED or text is REQUIRED:
+            return self._invalid("setAttributesAsText", args, unknown, _timeout, {
+                "nodeId": nodeId, "text": text, "name": name})
+        params = {"nodeId": nodeId, "text": text}
+        if name is not None:
+            params["name"] = name
+        return self._tab.call_method("DOM.setAttributesAsText", _timeout=_timeout, **params)
+
+    def setFileInputFiles(self, *args, files=REQUIRED, nodeId=None, backendNodeId=None, objectId=None, _timeout=None,
+                          **unknown):
+        """Sets files for the given file input element."""
+        if args or unknown or files is REQUIRED:
+            return self._invalid("setFileInputFiles", args, unknown, _timeout, {
+                "files": files, "nodeId": nodeId, "backendNodeId": backendNodeId, "objectId": objectId})
+        params = {"files": files}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("DOM.setFileInputFiles", _timeout=_timeout, **params)
+
+    def setNodeStackTracesEnabled(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Sets if stack traces should be captured for Nodes."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("setNodeStackTracesEnabled", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("DOM.setNodeStackTracesEnabled", _timeout=_timeout, enable=enable)
+
+    def getNodeStackTraces(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Gets stack traces associated with a Node."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getNodeStackTraces", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.getNodeStackTraces", _timeout=_timeout, nodeId=nodeId)
+
+    def getFileInfo(self, *args, objectId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns file information for the given File wrapper."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("getFileInfo", args, unknown, _timeout, {"objectId": objectId})
+        return self._tab.call_method("DOM.getFileInfo", _timeout=_timeout, objectId=objectId)
+
+    def getDetachedDomNodes(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns list of detached nodes"""
+        if args or unknown:
+            return self._invalid("getDetachedDomNodes", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.getDetachedDomNodes", _timeout=_timeout)
+
+    def setInspectedNode(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables console to refer to the node with given id via $x (see Command Line API for more details $x functions)."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("setInspectedNode", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.setInspectedNode", _timeout=_timeout, nodeId=nodeId)
+
+    def setNodeName(self, *args, nodeId=REQUIRED, name=REQUIRED, _timeout=None, **unknown):
+        """Sets node name for a node with given id."""
+        if args or unknown or nodeId is REQUIRED or name is REQUIRED:
+            return self._invalid("setNodeName", args, unknown, _timeout, {"nodeId": nodeId, "name": name})
+        return self._tab.call_method("DOM.setNodeName", _timeout=_timeout, nodeId=nodeId, name=name)
+
+    def setNodeValue(self, *args, nodeId=REQUIRED, value=REQUIRED, _timeout=None, **unknown):
+        """Sets node value for a node with given id."""
+        if args or unknown or nodeId is REQUIRED or value is REQUIRED:
+            return self._invalid("setNodeValue", args, unknown, _timeout, {"nodeId": nodeId, "value": value})
+        return self._tab.call_method("DOM.setNodeValue", _timeout=_timeout, nodeId=nodeId, value=value)
+
+    def setOuterHTML(self, *args, nodeId=REQUIRED, outerHTML=REQUIRED, _timeout=None, **unknown):
+        """Sets node HTML markup, returns new node id."""
+        if args or unknown or nodeId is REQUIRED or outerHTML is REQUIRED:
+            return self._invalid("setOuterHTML", args, unknown, _timeout, {"nodeId": nodeId, "outerHTML": outerHTML})
+        return self._tab.call_method("DOM.setOuterHTML", _timeout=_timeout, nodeId=nodeId, outerHTML=outerHTML)
+
+    def undo(self, *args, _timeout=None, **unknown):
+        """(experimental) Undoes the last performed action."""
+        if args or unknown:
+            return self._invalid("undo", args, unknown, _timeout, {})
+        return self._tab.call_method("DOM.undo", _timeout=_timeout)
+
+    def getFrameOwner(self, *args, frameId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns iframe node that owns iframe with the given domain."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("getFrameOwner", args, unknown, _timeout, {"frameId": frameId})
+        return self._tab.call_method("DOM.getFrameOwner", _timeout=_timeout, frameId=frameId)
+
+    def getContainerForNode(self, *args, nodeId=REQUIRED, containerName=None, physicalAxes=None, logicalAxes=None,
+                            queriesScrollState=None, queriesAnchored=None, _timeout=None, **unknown):
+        """(experimental) Returns the query container of the given node based on container query conditions: containerName, physical and logical axes, and whether it queries scroll-state or anchored elements."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getContainerForNode", args, unknown, _timeout, {
+                "nodeId": nodeId, "containerName": containerName, "physicalAxes": physicalAxes,
+                "logicalAxes": logicalAxes, "queriesScrollState": queriesScrollState,
+                "queriesAnchored": queriesAnchored})
+        params = {"nodeId": nodeId}
+        if containerName is not None:
+            params["containerName"] = containerName
+        if physicalAxes is not None:
+            params["physicalAxes"] = physicalAxes
+        if logicalAxes is not None:
+            params["logicalAxes"] = logicalAxes
+        if queriesScrollState is not None:
+            params["queriesScrollState"] = queriesScrollState
+        if queriesAnchored is not None:
+            params["queriesAnchored"] = queriesAnchored
+        return self._tab.call_method("DOM.getContainerForNode", _timeout=_timeout, **params)
+
+    def getQueryingDescendantsForContainer(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns the descendants of a container query container that have container queries against this container."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getQueryingDescendantsForContainer", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("DOM.getQueryingDescendantsForContainer", _timeout=_timeout, nodeId=nodeId)
+
+    def getAnchorElement(self, *args, nodeId=REQUIRED, anchorSpecifier=None, _timeout=None, **unknown):
+        """(experimental) Returns the target anchor element of the given anchor query according to https://www.w3.org/TR/css-anchor-position-1/#target."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getAnchorElement", args, unknown, _timeout, {
+                "nodeId": nodeId, "anchorSpecifier": anchorSpecifier})
+        params = {"nodeId": nodeId}
+        if anchorSpecifier is not None:
+            params["anchorSpecifier"] = anchorSpecifier
+        return self._tab.call_method("DOM.getAnchorElement", _timeout=_timeout, **params)
+
+    def forceShowPopover(self, *args, nodeId=REQUIRED, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) When enabling, this API force-opens the popover identified by nodeId and keeps it open until disabled."""
+        if args or unknown or nodeId is REQUIRED or enable is REQUIRED:
+            return self._invalid("forceShowPopover", args, unknown, _timeout, {"nodeId": nodeId, "enable": enable})
+        return self._tab.call_method("DOM.forceShowPopover", _timeout=_timeout, nodeId=nodeId, enable=enable)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DOMDebugger(Domain):
+    """DOM debugging allows setting breakpoints on particular DOM operations and events."""
+
+    __slots__ = ()
+
+    _name = "DOMDebugger"
+    _events = frozenset([])
+
+    def getEventListeners(self, *args, objectId=REQUIRED, depth=None, pierce=None, _timeout=None, **unknown):
+        """Returns event listeners of the given object."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("getEventListeners", args, unknown, _timeout, {
+                "objectId": objectId, "depth": depth, "pierce": pierce})
+        params = {"objectId": objectId}
+        if depth is not None:
+            params["depth"] = depth
+        if pierce is not None:
+            params["pierce"] = pierce
+        return self._tab.call_method("DOMDebugger.getEventListeners", _timeout=_timeout, **params)
+
+    def removeDOMBreakpoint(self, *args, nodeId=REQUIRED, type=REQUIRED, _timeout=None, **unknown):
+        """Removes DOM breakpoint that was set using `setDOMBreakpoint`."""
+        if args or unknown or nodeId is REQUIRED or type is REQUIRED:
+            return self._invalid("removeDOMBreakpoint", args, unknown, _timeout, {"nodeId": nodeId, "type": type})
+        return self._tab.call_method("DOMDebugger.removeDOMBreakpoint", _timeout=_timeout, nodeId=nodeId, type=type)
+
+    def removeEventListenerBreakpoint(self, *args, eventName=REQUIRED, targetName=None, _timeout=None, **unknown):
+        """Removes breakpoint on particular DOM event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("removeEventListenerBreakpoint", args, unknown, _timeout, {
+                "eventName": eventName, "targetName": targetName})
+        params = {"eventName": eventName}
+        if targetName is not None:
+            params["targetName"] = targetName
+        return self._tab.call_method("DOMDebugger.removeEventListenerBreakpoint", _timeout=_timeout, **params)
+
+    def removeInstrumentationBreakpoint(self, *args, eventName=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Removes breakpoint on particular native event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("removeInstrumentationBreakpoint", args, unknown, _timeout, {"eventName": eventName})
+        return self._tab.call_method("DOMDebugger.removeInstrumentationBreakpoint", _timeout=_timeout,
+                                     eventName=eventName)
+
+    def removeXHRBreakpoint(self, *args, url=REQUIRED, _timeout=None, **unknown):
+        """Removes breakpoint from XMLHttpRequest."""
+        if args or unknown or url is REQUIRED:
+            return self._invalid("removeXHRBreakpoint", args, unknown, _timeout, {"url": url})
+        return self._tab.call_method("DOMDebugger.removeXHRBreakpoint", _timeout=_timeout, url=url)
+
+    def setBreakOnCSPViolation(self, *args, violationTypes=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Sets breakpoint on particular CSP violations."""
+        if args or unknown or violationTypes is REQUIRED:
+            return self._invalid("setBreakOnCSPViolation", args, unknown, _timeout, {"violationTypes": violationTypes})
+        return self._tab.call_method("DOMDebugger.setBreakOnCSPViolation", _timeout=_timeout,
+                                     violationTypes=violationTypes)
+
+    def setDOMBreakpoint(self, *args, nodeId=REQUIRED, type=REQUIRED, _timeout=None, **unknown):
+        """Sets breakpoint on particular operation with DOM."""
+        if args or unknown or nodeId is REQUIRED or type is REQUIRED:
+            return self._invalid("setDOMBreakpoint", args, unknown, _timeout, {"nodeId": nodeId, "type": type})
+        return self._tab.call_method("DOMDebugger.setDOMBreakpoint", _timeout=_timeout, nodeId=nodeId, type=type)
+
+    def setEventListenerBreakpoint(self, *args, eventName=REQUIRED, targetName=None, _timeout=None, **unknown):
+        """Sets breakpoint on particular DOM event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("setEventListenerBreakpoint", args, unknown, _timeout, {
+                "eventName": eventName, "targetName": targetName})
+        params = {"eventName": eventName}
+        if targetName is not None:
+            params["targetName"] = targetName
+        return self._tab.call_method("DOMDebugger.setEventListenerBreakpoint", _timeout=_timeout, **params)
+
+    def setInstrumentationBreakpoint(self, *args, eventName=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Sets breakpoint on particular native event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("setInstrumentationBreakpoint", args, unknown, _timeout, {"eventName": eventName})
+        return self._tab.call_method("DOMDebugger.setInstrumentationBreakpoint", _timeout=_timeout, eventName=eventName)
+
+    def setXHRBreakpoint(self, *args, url=REQUIRED, _timeout=None, **unknown):
+        """Sets breakpoint on XMLHttpRequest."""
+        if args or unknown or url is REQUIRED:
+            return self._invalid("setXHRBreakpoint", args, unknown, _timeout, {"url": url})
+        return self._tab.call_method("DOMDebugger.setXHRBreakpoint", _timeout=_timeout, url=url)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DOMSnapshot(Domain):
+    """This domain facilitates obtaining document snapshots with DOM, layout, and style information."""
+
+    __slots__ = ()
+
+    _name = "DOMSnapshot"
+    _events = frozenset([])
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables DOM snapshot agent for the given page."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("DOMSnapshot.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables DOM snapshot agent for the given page."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("DOMSnapshot.enable", _timeout=_timeout)
+
+    def getSnapshot(self, *args, computedStyleWhitelist=REQUIRED, includeEventListeners=None, includePaintOrder=None,
+                    includeUserAgentShadowTree=None, _timeout=None, **unknown):
+        """(deprecated) Returns a document snapshot, including the full DOM tree of the root node (including iframes, template contents, and imported documents) in a flattened array, as well as layout and white-listed computed style information for the nodes."""
+        if args or unknown or computedStyleWhitelist is REQUIRED:
+            return self._invalid("getSnapshot", args, unknown, _timeout, {
+                "computedStyleWhitelist": computedStyleWhitelist, "includeEventListeners": includeEventListeners,
+                "includePaintOrder": includePaintOrder, "includeUserAgentShadowTree": includeUserAgentShadowTree})
+        params = {"computedStyleWhitelist": computedStyleWhitelist}
+        if includeEventListeners is not None:
+            params["includeEventListeners"] = includeEventListeners
+        if includePaintOrder is not None:
+            params["includePaintOrder"] = includePaintOrder
+        if includeUserAgentShadowTree is not None:
+            params["includeUserAgentShadowTree"] = includeUserAgentShadowTree
+        return self._tab.call_method("DOMSnapshot.getSnapshot", _timeout=_timeout, **params)
+
+    def captureSnapshot(self, *args, computedStyles=REQUIRED, includePaintOrder=None, includeDOMRects=None,
+                        includeBlendedBackgroundColors=None, includeTextColorOpacities=None, _timeout=None, **unknown):
+        """Returns a document snapshot, including the full DOM tree of the root node (including iframes, template contents, and imported documents) in a flattened array, as well as layout and white-listed computed style information for the nodes."""
+        if args or unknown or computedStyles is REQUIRED:
+            return self._invalid("captureSnapshot", args, unknown, _timeout, {
+                "computedStyles": computedStyles, "includePaintOrder": includePaintOrder,
+                "includeDOMRects": includeDOMRects, "includeBlendedBackgroundColors": includeBlendedBackgroundColors,
+                "includeTextColorOpacities": includeTextColorOpacities})
+        params = {"computedStyles": computedStyles}
+        if includePaintOrder is not None:
+            params["includePaintOrder"] = includePaintOrder
+        if includeDOMRects is not None:
+            params["includeDOMRects"] = includeDOMRects
+        if includeBlendedBackgroundColors is not None:
+            params["includeBlendedBackgroundColors"] = includeBlendedBackgroundColors
+        if includeTextColorOpacities is not None:
+            params["includeTextColorOpacities"] = includeTextColorOpacities
+        return self._tab.call_method("DOMSnapshot.captureSnapshot", _timeout=_timeout, **params)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class DOMStorage(Domain):
+    """Query and modify DOM storage."""
+
+    __slots__ = ()
+
+    _name = "DOMStorage"
+    _events = frozenset([
+        "domStorageItemAdded", "domStorageItemRemoved", "domStorageItemUpdated", "domStorageItemsCleared"])
+
+    DOM_STORAGE_ITEM_ADDED = "DOMStorage.domStorageItemAdded"
+    DOM_STORAGE_ITEM_REMOVED = "DOMStorage.domStorageItemRemoved"
+    DOM_STORAGE_ITEM_UPDATED = "DOMStorage.domStorageItemUpdated"
+    DOM_STORAGE_ITEMS_CLEARED = "DOMStorage.domStorageItemsCleared"
+
+    def clear(self, *args, storageId=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or storageId is REQUIRED:
+            return self._invalid("clear", args, unknown, _timeout, {"storageId": storageId})
+        return self._tab.call_method("DOMStorage.clear", _timeout=_timeout, storageId=storageId)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables storage tracking, prevents storage events from being sent to the client."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("DOMStorage.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables storage tracking, storage events will now be delivered to the client."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("DOMStorage.enable", _timeout=_timeout)
+
+    def getDOMStorageItems(self, *args, storageId=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or storageId is REQUIRED:
+            return self._invalid("getDOMStorageItems", args, unknown, _timeout, {"storageId": storageId})
+        return self._tab.call_method("DOMStorage.getDOMStorageItems", _timeout=_timeout, storageId=storageId)
+
+    def removeDOMStorageItem(self, *args, storageId=REQUIRED, key=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or storageId is REQUIRED or key is REQUIRED:
+            return self._invalid("removeDOMStorageItem", args, unknown, _timeout, {"storageId": storageId, "key": key})
+        return self._tab.call_method("DOMStorage.removeDOMStorageItem", _timeout=_timeout, storageId=storageId, key=key)
+
+    def setDOMStorageItem(self, *args, storageId=REQUIRED, key=REQUIRED, value=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or storageId is REQUIRED or key is REQUIRED or value is REQUIRED:
+            return self._invalid("setDOMStorageItem", args, unknown, _timeout, {
+                "storageId": storageId, "key": key, "value": value})
+        return self._tab.call_method("DOMStorage.setDOMStorageItem", _timeout=_timeout, storageId=storageId, key=key,
+                                     value=value)
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Emulation(Domain):
+    """This domain emulates different environments for the page."""
+
+    __slots__ = ()
+
+    _name = "Emulation"
+    _events = frozenset(["virtualTimeBudgetExpired"])
+
+    VIRTUAL_TIME_BUDGET_EXPIRED = "Emulation.virtualTimeBudgetExpired"
+
+    def canEmulate(self, *args, _timeout=None, **unknown):
+        """(deprecated) Tells whether emulation is supported."""
+        if args or unknown:
+            return self._invalid("canEmulate", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.canEmulate", _timeout=_timeout)
+
+    def clearDeviceMetricsOverride(self, *args, _timeout=None, **unknown):
+        """Clears the overridden device metrics."""
+        if args or unknown:
+            return self._invalid("clearDeviceMetricsOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.clearDeviceMetricsOverride", _timeout=_timeout)
+
+    def clearGeolocationOverride(self, *args, _timeout=None, **unknown):
+        """Clears the overridden Geolocation Position and Error."""
+        if args or unknown:
+            return self._invalid("clearGeolocationOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.clearGeolocationOverride", _timeout=_timeout)
+
+    def resetPageScaleFactor(self, *args, _timeout=None, **unknown):
+        """(experimental) Requests that page scale factor is reset to initial values."""
+        if args or unknown:
+            return self._invalid("resetPageScaleFactor", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.resetPageScaleFactor", _timeout=_timeout)
+
+    def setFocusEmulationEnabled(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables or disables simulating a focused and active page."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setFocusEmulationEnabled", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Emulation.setFocusEmulationEnabled", _timeout=_timeout, enabled=enabled)
+
+    def setAutoDarkModeOverride(self, *args, enabled=None, _timeout=None, **unknown):
+        """(experimental) Automatically render all web contents using a dark theme."""
+        if args or unknown:
+            return self._invalid("setAutoDarkModeOverride", args, unknown, _timeout, {"enabled": enabled})
+        params = {}
+        if enabled is not None:
+            params["enabled"] = enabled
+        return self._tab.call_method("Emulation.setAutoDarkModeOverride", _timeout=_timeout, **params)
+
+    def setCPUThrottlingRate(self, *args, rate=REQUIRED, _timeout=None, **unknown):
+        """Enables CPU throttling to emulate slow CPUs."""
+        if args or unknown or rate is REQUIRED:
+            return self._invalid("setCPUThrottlingRate", args, unknown, _timeout, {"rate": rate})
+        return self._tab.call_method("Emulation.setCPUThrottlingRate", _timeout=_timeout, rate=rate)
+
+    def setDefaultBackgroundColorOverride(self, *args, color=None, _timeout=None, **unknown):
+        """Sets or clears an override of the default background color of the frame."""
+        if args or unknown:
+            return self._invalid("setDefaultBackgroundColorOverride", args, unknown, _timeout, {"color": color})
+        params = {}
+        if color is not None:
+            params["color"] = color
+        return self._tab.call_method("Emulation.setDefaultBackgroundColorOverride", _timeout=_timeout, **params)
+
+    def setSafeAreaInsetsOverride(self, *args, insets=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Overrides the values for env(safe-area-inset-*) and env(safe-area-max-inset-*)."""
+        if args or unknown or insets is REQUIRED:
+            return self._invalid("setSafeAreaInsetsOverride", args, unknown, _timeout, {"insets": insets})
+        return self._tab.call_method("Emulation.setSafeAreaInsetsOverride", _timeout=_timeout, insets=insets)
+
+    def setDeviceMetricsOverride(self, *args, width=REQUIRED, height=REQUIRED, deviceScaleFactor=REQUIRED,
+                                 mobile=REQUIRED, scale=None, screenWidth=None, screenHeight=None, positionX=None,
+                                 positionY=None, dontSetVisibleSize=None, screenOrientation=None, viewport=None,
+                                 displayFeature=None, devicePosture=None, _timeout=None, **unknown):
+        """Overrides the values of device screen dimensions (window.screen.width, window.screen.height, window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media query results)."""
+        invalid = args or unknown or width is REQUIRED or height is REQUIRED
+        if invalid or deviceScaleFactor is REQUIRED or mobile is REQUIRED:
+            return self._invalid("setDeviceMetricsOverride", args, unknown, _timeout, {
+                "width": width, "height": height, "deviceScaleFactor": deviceScaleFactor, "mobile": mobile,
+                "scale": scale, "screenWidth": screenWidth, "screenHeight": screenHeight, "positionX": positionX,
+                "positionY": positionY, "dontSetVisibleSize": dontSetVisibleSize,
+                "screenOrientation": screenOrientation, "viewport": viewport, "displayFeature": displayFeature,
+                "devicePosture": devicePosture})
+        params = {"width": width, "height": height, "deviceScaleFactor": deviceScaleFactor, "mobile": mobile}
+        if scale is not None:
+            params["scale"] = scale
+        if screenWidth is not None:
+            params["screenWidth"] = screenWidth
+        if screenHeight is not None:
+            params["screenHeight"] = screenHeight
+        if positionX is not None:
+            params["positionX"] = positionX
+        if positionY is not None:
+            params["positionY"] = positionY
+        if dontSetVisibleSize is not None:
+            params["dontSetVisibleSize"] = dontSetVisibleSize
+        if screenOrientation is not None:
+            params["screenOrientation"] = screenOrientation
+        if viewport is not None:
+            params["viewport"] = viewport
+        if displayFeature is not None:
+            params["displayFeature"] = displayFeature
+        if devicePosture is not None:
+            params["devicePosture"] = devicePosture
+        return self._tab.call_method("Emulation.setDeviceMetricsOverride", _timeout=_timeout, **params)
+
+    def setDevicePostureOverride(self, *args, posture=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Start reporting the given posture value to the Device Posture API."""
+        if args or unknown or posture is REQUIRED:
+            return self._invalid("setDevicePostureOverride", args, unknown, _timeout, {"posture": posture})
+        return self._tab.call_method("Emulation.setDevicePostureOverride", _timeout=_timeout, posture=posture)
+
+    def clearDevicePostureOverride(self, *args, _timeout=None, **unknown):
+        """(experimental) Clears a device posture override set with either setDeviceMetricsOverride() or setDevicePostureOverride() and starts using posture information from the platform again."""
+        if args or unknown:
+            return self._invalid("clearDevicePostureOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.clearDevicePostureOverride", _timeout=_timeout)
+
+    def setDisplayFeaturesOverride(self, *args, features=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Start using the given display features to pupulate the Viewport Segments API."""
+        if args or unknown or features is REQUIRED:
+            return self._invalid("setDisplayFeaturesOverride", args, unknown, _timeout, {"features": features})
+        return self._tab.call_method("Emulation.setDisplayFeaturesOverride", _timeout=_timeout, features=features)
+
+    def clearDisplayFeaturesOverride(self, *args, _timeout=None, **unknown):
+        """(experimental) Clears the display features override set with either setDeviceMetricsOverride() or setDisplayFeaturesOverride() and starts using display features from the platform again."""
+        if args or unknown:
+            return self._invalid("clearDisplayFeaturesOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.clearDisplayFeaturesOverride", _timeout=_timeout)
+
+    def setScrollbarsHidden(self, *args, hidden=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or hidden is REQUIRED:
+            return self._invalid("setScrollbarsHidden", args, unknown, _timeout, {"hidden": hidden})
+        return self._tab.call_method("Emulation.setScrollbarsHidden", _timeout=_timeout, hidden=hidden)
+
+    def setDocumentCookieDisabled(self, *args, disabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or disabled is REQUIRED:
+            return self._invalid("setDocumentCookieDisabled", args, unknown, _timeout, {"disabled": disabled})
+        return self._tab.call_method("Emulation.setDocumentCookieDisabled", _timeout=_timeout, disabled=disabled)
+
+    def setEmitTouchEventsForMouse(self, *args, enabled=REQUIRED, configuration=None, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setEmitTouchEventsForMouse", args, unknown, _timeout, {
+                "enabled": enabled, "configuration": configuration})
+        params = {"enabled": enabled}
+        if configuration is not None:
+            params["configuration"] = configuration
+        return self._tab.call_method("Emulation.setEmitTouchEventsForMouse", _timeout=_timeout, **params)
+
+    def setEmulatedMedia(self, *args, media=None, features=None, _timeout=None, **unknown):
+        """Emulates the given media type or media feature for CSS media queries."""
+        if args or unknown:
+            return self._invalid("setEmulatedMedia", args, unknown, _timeout, {"media": media, "features": features})
+        params = {}
+        if media is not None:
+            params["media"] = media
+        if features is not None:
+            params["features"] = features
+        return self._tab.call_method("Emulation.setEmulatedMedia", _timeout=_timeout, **params)
+
+    def setEmulatedVisionDeficiency(self, *args, type=REQUIRED, _timeout=None, **unknown):
+        """Emulates the given vision deficiency."""
+        if args or unknown or type is REQUIRED:
+            return self._invalid("setEmulatedVisionDeficiency", args, unknown, _timeout, {"type": type})
+        return self._tab.call_method("Emulation.setEmulatedVisionDeficiency", _timeout=_timeout, type=type)
+
+    def setEmulatedOSTextScale(self, *args, scale=None, _timeout=None, **unknown):
+        """Emulates the given OS text scale."""
+        if args or unknown:
+            return self._invalid("setEmulatedOSTextScale", args, unknown, _timeout, {"scale": scale})
+        params = {}
+        if scale is not None:
+            params["scale"] = scale
+        return self._tab.call_method("Emulation.setEmulatedOSTextScale", _timeout=_timeout, **params)
+
+    def setGeolocationOverride(self, *args, latitude=None, longitude=None, accuracy=None, altitude=None,
+                               altitudeAccuracy=None, heading=None, speed=None, _timeout=None, **unknown):
+        """Overrides the Geolocation Position or Error."""
+        if args or unknown:
+            return self._invalid("setGeolocationOverride", args, unknown, _timeout, {
+                "latitude": latitude, "longitude": longitude, "accuracy": accuracy, "altitude": altitude,
+                "altitudeAccuracy": altitudeAccuracy, "heading": heading, "speed": speed})
+        params = {}
+        if latitude is not None:
+            params["latitude"] = latitude
+        if longitude is not None:
+            params["longitude"] = longitude
+        if accuracy is not None:
+            params["accuracy"] = accuracy
+        if altitude is not None:
+            params["altitude"] = altitude
+        if altitudeAccuracy is not None:
+            params["altitudeAccuracy"] = altitudeAccuracy
+        if heading is not None:
+            params["heading"] = heading
+        if speed is not None:
+            params["speed"] = speed
+        return self._tab.call_method("Emulation.setGeolocationOverride", _timeout=_timeout, **params)
+
+    def getOverriddenSensorInformation(self, *args, type=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or type is REQUIRED:
+            return self._invalid("getOverriddenSensorInformation", args, unknown, _timeout, {"type": type})
+        return self._tab.call_method("Emulation.getOverriddenSensorInformation", _timeout=_timeout, type=type)
+
+    def setSensorOverrideEnabled(self, *args, enabled=REQUIRED, type=REQUIRED, metadata=None, _timeout=None, **unknown):
+        """(experimental) Overrides a platform sensor of a given type."""
+        if args or unknown or enabled is REQUIRED or type is REQUIRED:
+            return self._invalid("setSensorOverrideEnabled", args, unknown, _timeout, {
+                "enabled": enabled, "type": type, "metadata": metadata})
+        params = {"enabled": enabled, "type": type}
+        if metadata is not None:
+            params["metadata"] = metadata
+        return self._tab.call_method("Emulation.setSensorOverrideEnabled", _timeout=_timeout, **params)
+
+    def setSensorOverrideReadings(self, *args, type=REQUIRED, reading=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Updates the sensor readings reported by a sensor type previously overridden by setSensorOverrideEnabled."""
+        if args or unknown or type is REQUIRED or reading is REQUIRED:
+            return self._invalid("setSensorOverrideReadings", args, unknown, _timeout, {
+                "type": type, "reading": reading})
+        return self._tab.call_method("Emulation.setSensorOverrideReadings", _timeout=_timeout, type=type,
+                                     reading=reading)
+
+    def setPressureSourceOverrideEnabled(self, *args, enabled=REQUIRED, source=REQUIRED, metadata=None, _timeout=None,
+                                         **unknown):
+        """(experimental) Overrides a pressure source of a given type, as used by the Compute Pressure API, so that updates to PressureObserver.observe() are provided via setPressureStateOverride instead of being retrieved from platform-provided telemetry data."""
+        if args or unknown or enabled is REQUIRED or source is REQUIRED:
+            return self._invalid("setPressureSourceOverrideEnabled", args, unknown, _timeout, {
+                "enabled": enabled, "source": source, "metadata": metadata})
+        params = {"enabled": enabled, "source": source}
+        if metadata is not None:
+            params["metadata"] = metadata
+        return self._tab.call_method("Emulation.setPressureSourceOverrideEnabled", _timeout=_timeout, **params)
+
+    def setPressureStateOverride(self, *args, source=REQUIRED, state=REQUIRED, _timeout=None, **unknown):
+        """(experimental) TODO: OBSOLETE: To remove when setPressureDataOverride is merged."""
+        if args or unknown or source is REQUIRED or state is REQUIRED:
+            return self._invalid("setPressureStateOverride", args, unknown, _timeout, {
+                "source": source, "state": state})
+        return self._tab.call_method("Emulation.setPressureStateOverride", _timeout=_timeout, source=source,
+                                     state=state)
+
+    def setPressureDataOverride(self, *args, source=REQUIRED, state=REQUIRED, ownContributionEstimate=None,
+                                _timeout=None, **unknown):
+        """(experimental) Provides a given pressure data set that will be processed and eventually be delivered to PressureObserver users."""
+        if args or unknown or source is REQUIRED or state is REQUIRED:
+            return self._invalid("setPressureDataOverride", args, unknown, _timeout, {
+                "source": source, "state": state, "ownContributionEstimate": ownContributionEstimate})
+        params = {"source": source, "state": state}
+        if ownContributionEstimate is not None:
+            params["ownContributionEstimate"] = ownContributionEstimate
+        return self._tab.call_method("Emulation.setPressureDataOverride", _timeout=_timeout, **params)
+
+    def setIdleOverride(self, *args, isUserActive=REQUIRED, isScreenUnlocked=REQUIRED, _timeout=None, **unknown):
+        """Overrides the Idle state."""
+        if args or unknown or isUserActive is REQUIRED or isScreenUnlocked is REQUIRED:
+            return self._invalid("setIdleOverride", args, unknown, _timeout, {
+                "isUserActive": isUserActive, "isScreenUnlocked": isScreenUnlocked})
+        return self._tab.call_method("Emulation.setIdleOverride", _timeout=_timeout, isUserActive=isUserActive,
+                                     isScreenUnlocked=isScreenUnlocked)
+
+    def clearIdleOverride(self, *args, _timeout=None, **unknown):
+        """Clears Idle state overrides."""
+        if args or unknown:
+            return self._invalid("clearIdleOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.clearIdleOverride", _timeout=_timeout)
+
+    def setNavigatorOverrides(self, *args, platform=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Overrides value returned by the javascript navigator object."""
+        if args or unknown or platform is REQUIRED:
+            return self._invalid("setNavigatorOverrides", args, unknown, _timeout, {"platform": platform})
+        return self._tab.call_method("Emulation.setNavigatorOverrides", _timeout=_timeout, platform=platform)
+
+    def setPageScaleFactor(self, *args, pageScaleFactor=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Sets a specified page scale factor."""
+        if args or unknown or pageScaleFactor is REQUIRED:
+            return self._invalid("setPageScaleFactor", args, unknown, _timeout, {"pageScaleFactor": pageScaleFactor})
+        return self._tab.call_method("Emulation.setPageScaleFactor", _timeout=_timeout, pageScaleFactor=pageScaleFactor)
+
+    def setScriptExecutionDisabled(self, *args, value=REQUIRED, _timeout=None, **unknown):
+        """Switches script execution in the page."""
+        if args or unknown or value is REQUIRED:
+            return self._invalid("setScriptExecutionDisabled", args, unknown, _timeout, {"value": value})
+        return self._tab.call_method("Emulation.setScriptExecutionDisabled", _timeout=_timeout, value=value)
+
+    def setTouchEmulationEnabled(self, *args, enabled=REQUIRED, maxTouchPoints=None, _timeout=None, **unknown):
+        """Enables touch on platforms which do not support them."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setTouchEmulationEnabled", args, unknown, _timeout, {
+                "enabled": enabled, "maxTouchPoints": maxTouchPoints})
+        params = {"enabled": enabled}
+        if maxTouchPoints is not None:
+            params["maxTouchPoints"] = maxTouchPoints
+        return self._tab.call_method("Emulation.setTouchEmulationEnabled", _timeout=_timeout, **params)
+
+    def setVirtualTimePolicy(self, *args, policy=REQUIRED, budget=None, maxVirtualTimeTaskStarvationCount=None,
+                             initialVirtualTime=None, _timeout=None, **unknown):
+        """(experimental) Turns on virtual time for all frames (replacing real-time with a synthetic time source) and sets the current virtual time policy."""
+        if args or unknown or policy is REQUIRED:
+            return self._invalid("setVirtualTimePolicy", args, unknown, _timeout, {
+                "policy": policy, "budget": budget,
+                "maxVirtualTimeTaskStarvationCount": maxVirtualTimeTaskStarvationCount,
+                "initialVirtualTime": initialVirtualTime})
+        params = {"policy": policy}
+        if budget is not None:
+            params["budget"] = budget
+        if maxVirtualTimeTaskStarvationCount is not None:
+            params["maxVirtualTimeTaskStarvationCount"] = maxVirtualTimeTaskStarvationCount
+        if initialVirtualTime is not None:
+            params["initialVirtualTime"] = initialVirtualTime
+        return self._tab.call_method("Emulation.setVirtualTimePolicy", _timeout=_timeout, **params)
+
+    def setLocaleOverride(self, *args, locale=None, _timeout=None, **unknown):
+        """(experimental) Overrides default host system locale with the specified one."""
+        if args or unknown:
+            return self._invalid("setLocaleOverride", args, unknown, _timeout, {"locale": locale})
+        params = {}
+        if locale is not None:
+            params["locale"] = locale
+        return self._tab.call_method("Emulation.setLocaleOverride", _timeout=_timeout, **params)
+
+    def setTimezoneOverride(self, *args, timezoneId=REQUIRED, _timeout=None, **unknown):
+        """Overrides default host system timezone with the specified one."""
+        if args or unknown or timezoneId is REQUIRED:
+            return self._invalid("setTimezoneOverride", args, unknown, _timeout, {"timezoneId": timezoneId})
+        return self._tab.call_method("Emulation.setTimezoneOverride", _timeout=_timeout, timezoneId=timezoneId)
+
+    def setVisibleSize(self, *args, width=REQUIRED, height=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Resizes the frame/viewport of the page."""
+        if args or unknown or width is REQUIRED or height is REQUIRED:
+            return self._invalid("setVisibleSize", args, unknown, _timeout, {"width": width, "height": height})
+        return self._tab.call_method("Emulation.setVisibleSize", _timeout=_timeout, width=width, height=height)
+
+    def setDisabledImageTypes(self, *args, imageTypes=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or imageTypes is REQUIRED:
+            return self._invalid("setDisabledImageTypes", args, unknown, _timeout, {"imageTypes": imageTypes})
+        return self._tab.call_method("Emulation.setDisabledImageTypes", _timeout=_timeout, imageTypes=imageTypes)
+
+    def setDataSaverOverride(self, *args, dataSaverEnabled=None, _timeout=None, **unknown):
+        """(experimental) Override the value of navigator.connection.saveData"""
+        if args or unknown:
+            return self._invalid("setDataSaverOverride", args, unknown, _timeout, {
+                "dataSaverEnabled": dataSaverEnabled})
+        params = {}
+        if dataSaverEnabled is not None:
+            params["dataSaverEnabled"] = dataSaverEnabled
+        return self._tab.call_method("Emulation.setDataSaverOverride", _timeout=_timeout, **params)
+
+    def setHardwareConcurrencyOverride(self, *args, hardwareConcurrency=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or hardwareConcurrency is REQUIRED:
+            return self._invalid("setHardwareConcurrencyOverride", args, unknown, _timeout, {
+                "hardwareConcurrency": hardwareConcurrency})
+        return self._tab.call_method("Emulation.setHardwareConcurrencyOverride", _timeout=_timeout,
+                                     hardwareConcurrency=hardwareConcurrency)
+
+    def setUserAgentOverride(self, *args, userAgent=REQUIRED, acceptLanguage=None, platform=None,
+                             userAgentMetadata=None, _timeout=None, **unknown):
+        """Allows overriding user agent with the given string."""
+        if args or unknown or userAgent is REQUIRED:
+            return self._invalid("setUserAgentOverride", args, unknown, _timeout, {
+                "userAgent": userAgent, "acceptLanguage": acceptLanguage, "platform": platform,
+                "userAgentMetadata": userAgentMetadata})
+        params = {"userAgent": userAgent}
+        if acceptLanguage is not None:
+            params["acceptLanguage"] = acceptLanguage
+        if platform is not None:
+            params["platform"] = platform
+        if userAgentMetadata is not None:
+            params["userAgentMetadata"] = userAgentMetadata
+        return self._tab.call_method("Emulation.setUserAgentOverride", _timeout=_timeout, **params)
+
+    def setAutomationOverride(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Allows overriding the automation flag."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setAutomationOverride", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Emulation.setAutomationOverride", _timeout=_timeout, enabled=enabled)
+
+    def setSmallViewportHeightDifferenceOverride(self, *args, difference=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Allows overriding the difference between the small and large viewport sizes, which determine the value of the `svh` and `lvh` unit, respectively."""
+        if args or unknown or difference is REQUIRED:
+            return self._invalid("setSmallViewportHeightDifferenceOverride", args, unknown, _timeout, {
+                "difference": difference})
+        return self._tab.call_method("Emulation.setSmallViewportHeightDifferenceOverride", _timeout=_timeout,
+                                     difference=difference)
+
+    def getScreenInfos(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns device's screen configuration."""
+        if args or unknown:
+            return self._invalid("getScreenInfos", args, unknown, _timeout, {})
+        return self._tab.call_method("Emulation.getScreenInfos", _timeout=_timeout)
+
+    def addScreen(self, *args, left=REQUIRED, top=REQUIRED, width=REQUIRED, height=REQUIRED, workAreaInsets=None,
+                  devicePixelRatio=None, rotation=None, colorDepth=None, label=None, isInternal=None, _timeout=None,
+                  **unknown):
+        """(experimental) Add a new screen to the device."""
+        if args or unknown or left is REQUIRED or top is REQUIRED or width is REQUIRED or height is REQUIRED:
+            return self._invalid("addScreen", args, unknown, _timeout, {
+                "left": left, "top": top, "width": width, "height": height, "workAreaInsets": workAreaInsets,
+                "devicePixelRatio": devicePixelRatio, "rotation": rotation, "colorDepth": colorDepth, "label": label,
+                "isInternal": isInternal})
+        params = {"left": left, "top": top, "width": width, "height": height}
+        if workAreaInsets is not None:
+            params["workAreaInsets"] = workAreaInsets
+        if devicePixelRatio is not None:
+            params["devicePixelRatio"] = devicePixelRatio
+        if rotation is not None:
+            params["rotation"] = rotation
+        if colorDepth is not None:
+            params["colorDepth"] = colorDepth
+        if label is not None:
+            params["label"] = label
+        if isInternal is not None:
+            params["isInternal"] = isInternal
+        return self._tab.call_method("Emulation.addScreen", _timeout=_timeout, **params)
+
+    def removeScreen(self, *args, screenId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Remove screen from the device."""
+        if args or unknown or screenId is REQUIRED:
+            return self._invalid("removeScreen", args, unknown, _timeout, {"screenId": screenId})
+        return self._tab.call_method("Emulation.removeScreen", _timeout=_timeout, screenId=screenId)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class EventBreakpoints(Domain):
+    """EventBreakpoints permits setting JavaScript breakpoints on operations and events occurring in native code invoked from JavaScript."""
+
+    __slots__ = ()
+
+    _name = "EventBreakpoints"
+    _events = frozenset([])
+
+    def setInstrumentationBreakpoint(self, *args, eventName=REQUIRED, _timeout=None, **unknown):
+        """Sets breakpoint on particular native event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("setInstrumentationBreakpoint", args, unknown, _timeout, {"eventName": eventName})
+        return self._tab.call_method("EventBreakpoints.setInstrumentationBreakpoint", _timeout=_timeout,
+                                     eventName=eventName)
+
+    def removeInstrumentationBreakpoint(self, *args, eventName=REQUIRED, _timeout=None, **unknown):
+        """Removes breakpoint on particular native event."""
+        if args or unknown or eventName is REQUIRED:
+            return self._invalid("removeInstrumentationBreakpoint", args, unknown, _timeout, {"eventName": eventName})
+        return self._tab.call_method("EventBreakpoints.removeInstrumentationBreakpoint", _timeout=_timeout,
+                                     eventName=eventName)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Removes all breakpoints"""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("EventBreakpoints.disable", _timeout=_timeout)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Extensions(Domain):
+    """Defines commands and events for browser extensions."""
+
+    __slots__ = ()
+
+    _name = "Extensions"
+    _events = frozenset([])
+
+    def loadUnpacked(self, *args, path=REQUIRED, _timeout=None, **unknown):
+        """Installs an unpacked extension from the filesystem similar to --load-extension CLI flags."""
+        if args or unknown or path is REQUIRED:
+            return self._invalid("loadUnpacked", args, unknown, _timeout, {"path": path})
+        return self._tab.call_method("Extensions.loadUnpacked", _timeout=_timeout, path=path)
+
+    def uninstall(self, *args, id=REQUIRED, _timeout=None, **unknown):
+        """Uninstalls an unpacked extension (others not supported) from the profile."""
+        if args or unknown or id is REQUIRED:
+            return self._invalid("uninstall", args, unknown, _timeout, {"id": id})
+        return self._tab.call_method("Extensions.uninstall", _timeout=_timeout, id=id)
+
+    def getStorageItems(self, *args, id=REQUIRED, storageArea=REQUIRED, keys=None, _timeout=None, **unknown):
+        """Gets data from extension storage in the given `storageArea`."""
+        if args or unknown or id is REQUIRED or storageArea is REQUIRED:
+            return self._invalid("getStorageItems", args, unknown, _timeout, {
+                "id": id, "storageArea": storageArea, "keys": keys})
+        params = {"id": id, "storageArea": storageArea}
+        if keys is not None:
+            params["keys"] = keys
+        return self._tab.call_method("Extensions.getStorageItems", _timeout=_timeout, **params)
+
+    def removeStorageItems(self, *args, id=REQUIRED, storageArea=REQUIRED, keys=REQUIRED, _timeout=None, **unknown):
+        """Removes `keys` from extension storage in the given `storageArea`."""
+        if args or unknown or id is REQUIRED or storageArea is REQUIRED or keys is REQUIRED:
+            return self._invalid("removeStorageItems", args, unknown, _timeout, {
+                "id": id, "storageArea": storageArea, "keys": keys})
+        return self._tab.call_method("Extensions.removeStorageItems", _timeout=_timeout, id=id,
+                                     storageArea=storageArea, keys=keys)
+
+    def clearStorageItems(self, *args, id=REQUIRED, storageArea=REQUIRED, _timeout=None, **unknown):
+        """Clears extension storage in the given `storageArea`."""
+        if args or unknown or id is REQUIRED or storageArea is REQUIRED:
+            return self._invalid("clearStorageItems", args, unknown, _timeout, {"id": id, "storageArea": storageArea})
+        return self._tab.call_method("Extensions.clearStorageItems", _timeout=_timeout, id=id, storageArea=storageArea)
+
+    def setStorageItems(self, *args, id=REQUIRED, storageArea=REQUIRED, values=REQUIRED, _timeout=None, **unknown):
+        """Sets `values` in extension storage in the given `storageArea`."""
+        if args or unknown or id is REQUIRED or storageArea is REQUIRED or values is REQUIRED:
+            return self._invalid("setStorageItems", args, unknown, _timeout, {
+                "id": id, "storageArea": storageArea, "values": values})
+        return self._tab.call_method("Extensions.setStorageItems", _timeout=_timeout, id=id, storageArea=storageArea,
+                                     values=values)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class FedCm(Domain):
+    """This domain allows interacting with the FedCM dialog."""
+
+    __slots__ = ()
+
+    _name = "FedCm"
+    _events = frozenset(["dialogClosed", "dialogShown"])
+
+    DIALOG_CLOSED = "FedCm.dialogClosed"
+    DIALOG_SHOWN = "FedCm.dialogShown"
+
+    def enable(self, *args, disableRejectionDelay=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"disableRejectionDelay": disableRejectionDelay})
+        params = {}
+        if disableRejectionDelay is not None:
+            params["disableRejectionDelay"] = disableRejectionDelay
+        return self._tab.call_method("FedCm.enable", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("FedCm.disable", _timeout=_timeout)
+
+    def selectAccount(self, *args, dialogId=REQUIRED, accountIndex=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or dialogId is REQUIRED or accountIndex is REQUIRED:
+            return self._invalid("selectAccount", args, unknown, _timeout, {
+                "dialogId": dialogId, "accountIndex": accountIndex})
+        return self._tab.call_method("FedCm.selectAccount", _timeout=_timeout, dialogId=dialogId,
+                                     accountIndex=accountIndex)
+
+    def clickDialogButton(self, *args, dialogId=REQUIRED, dialogButton=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or dialogId is REQUIRED or dialogButton is REQUIRED:
+            return self._invalid("clickDialogButton", args, unknown, _timeout, {
+                "dialogId": dialogId, "dialogButton": dialogButton})
+        return self._tab.call_method("FedCm.clickDialogButton", _timeout=_timeout, dialogId=dialogId,
+                                     dialogButton=dialogButton)
+
+    def openUrl(self, *args, dialogId=REQUIRED, accountIndex=REQUIRED, accountUrlType=REQUIRED, _timeout=None,
+                **unknown):
+        if args or unknown or dialogId is REQUIRED or accountIndex is REQUIRED or accountUrlType is REQUIRED:
+            return self._invalid("openUrl", args, unknown, _timeout, {
+                "dialogId": dialogId, "accountIndex": accountIndex, "accountUrlType": accountUrlType})
+        return self._tab.call_method("FedCm.openUrl", _timeout=_timeout, dialogId=dialogId, accountIndex=accountIndex,
+                                     accountUrlType=accountUrlType)
+
+    def dismissDialog(self, *args, dialogId=REQUIRED, triggerCooldown=None, _timeout=None, **unknown):
+        if args or unknown or dialogId is REQUIRED:
+            return self._invalid("dismissDialog", args, unknown, _timeout, {
+                "dialogId": dialogId, "triggerCooldown": triggerCooldown})
+        params = {"dialogId": dialogId}
+        if triggerCooldown is not None:
+            params["triggerCooldown"] = triggerCooldown
+        return self._tab.call_method("FedCm.dismissDialog", _timeout=_timeout, **params)
+
+    def resetCooldown(self, *args, _timeout=None, **unknown):
+        """Resets the cooldown time, if any, to allow the next FedCM call to show a dialog even if one was recently dismissed by the user."""
+        if args or unknown:
+            return self._invalid("resetCooldown", args, unknown, _timeout, {})
+        return self._tab.call_method("FedCm.resetCooldown", _timeout=_timeout)
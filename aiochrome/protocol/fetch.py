@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Fetch(Domain):
+    """A domain for letting clients substitute browser's network layer with client code."""
+
+    __slots__ = ()
+
+    _name = "Fetch"
+    _events = frozenset(["authRequired", "requestPaused"])
+
+    AUTH_REQUIRED = "Fetch.authRequired"
+    REQUEST_PAUSED = "Fetch.requestPaused"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables the fetch domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Fetch.disable", _timeout=_timeout)
+
+    def enable(self, *args, patterns=None, handleAuthRequests=None, _timeout=None, **unknown):
+        """Enables issuing of requestPaused events."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {
+                "patterns": patterns, "handleAuthRequests": handleAuthRequests})
+        params = {}
+        if patterns is not None:
+            params["patterns"] = patterns
+        if handleAuthRequests is not None:
+            params["handleAuthRequests"] = handleAuthRequests
+        return self._tab.call_method("Fetch.enable", _timeout=_timeout, **params)
+
+    def failRequest(self, *args, requestId=REQUIRED, errorReason=REQUIRED, _timeout=None, **unknown):
+        """Causes the request to fail with specified reason."""
+        if args or unknown or requestId is REQUIRED or errorReason is REQUIRED:
+            return self._invalid("failRequest", args, unknown, _timeout, {
+                "requestId": requestId, "errorReason": errorReason})
+        return self._tab.call_method("Fetch.failRequest", _timeout=_timeout, requestId=requestId,
+                                     errorReason=errorReason)
+
+    def fulfillRequest(self, *args, requestId=REQUIRED, responseCode=REQUIRED, responseHeaders=None,
+                       binaryResponseHeaders=None, body=None, responsePhrase=None, _timeout=None, **unknown):
+        """Provides response to the request."""
+        if args or unknown or requestId is REQUIRED or responseCode is REQUIRED:
+            return self._invalid("fulfillRequest", args, unknown, _timeout, {
+                "requestId": requestId, "responseCode": responseCode, "responseHeaders": responseHeaders,
+                "binaryResponseHeaders": binaryResponseHeaders, "body": body, "responsePhrase": responsePhrase})
+        params = {"requestId": requestId, "responseCode": responseCode}
+        if responseHeaders is not None:
+            params["responseHeaders"] = responseHeaders
+        if binaryResponseHeaders is not None:
+            params["binaryResponseHeaders"] = binaryResponseHeaders
+        if body is not None:
+            params["body"] = body
+        if responsePhrase is not None:
+            params["responsePhrase"] = responsePhrase
+        return self._tab.call_method("Fetch.fulfillRequest", _timeout=_timeout, **params)
+
+    def continueRequest(self, *args, requestId=REQUIRED, url=None, method=None, postData=None, headers=None,
+                        interceptResponse=None, _timeout=None, **unknown):
+        """Continues the request, optionally modifying some of its parameters."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("continueRequest", args, unknown, _timeout, {
+                "requestId": requestId, "url": url, "method": method, "postData": postData, "headers": headers,
+                "interceptResponse": interceptResponse})
+        params = {"requestId": requestId}
+        if url is not None:
+            params["url"] = url
+        if method is not None:
+            params["method"] = method
+        if postData is not None:
+            params["postData"] = postData
+        if headers is not None:
+            params["headers"] = headers
+        if interceptResponse is not None:
+            params["interceptResponse"] = interceptResponse
+        return self._tab.call_method("Fetch.continueRequest", _timeout=_timeout, **params)
+
+    def continueWithAuth(self, *args, requestId=REQUIRED, authChallengeResponse=REQUIRED, _timeout=None, **unknown):
+        """Continues a request supplying authChallengeResponse following authRequired event."""
+        if args or unknown or requestId is REQUIRED or authChallengeResponse is REQUIRED:
+            return self._invalid("continueWithAuth", args, unknown, _timeout, {
+                "requestId": requestId, "authChallengeResponse": authChallengeResponse})
+        return self._tab.call_method("Fetch.continueWithAuth", _timeout=_timeout, requestId=requestId,
+                                     authChallengeResponse=authChallengeResponse)
+
+    def continueResponse(self, *args, requestId=REQUIRED, responseCode=None, responsePhrase=None, responseHeaders=None,
+                         binaryResponseHeaders=None, _timeout=None, **unknown):
+        """(experimental) Continues loading of the paused response, optionally modifying the response headers."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("continueResponse", args, unknown, _timeout, {
+                "requestId": requestId, "responseCode": responseCode, "responsePhrase": responsePhrase,
+                "responseHeaders": responseHeaders, "binaryResponseHeaders": binaryResponseHeaders})
+        params = {"requestId": requestId}
+        if responseCode is not None:
+            params["responseCode"] = responseCode
+        if responsePhrase is not None:
+            params["responsePhrase"] = responsePhrase
+        if responseHeaders is not None:
+            params["responseHeaders"] = responseHeaders
+        if binaryResponseHeaders is not None:
+            params["binaryResponseHeaders"] = binaryResponseHeaders
+        return self._tab.call_method("Fetch.continueResponse", _timeout=_timeout, **params)
+
+    def getResponseBody(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """Causes the body of the response to be received from the server and returned as a single string."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("getResponseBody", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Fetch.getResponseBody", _timeout=_timeout, requestId=requestId)
+
+    def takeResponseBodyAsStream(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """Returns a handle to the stream representing the response body."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("takeResponseBodyAsStream", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Fetch.takeResponseBodyAsStream", _timeout=_timeout, requestId=requestId)
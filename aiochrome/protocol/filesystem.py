@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class FileSystem(Domain):
+    __slots__ = ()
+
+    _name = "FileSystem"
+    _events = frozenset([])
+
+    def getDirectory(self, *args, bucketFileSystemLocator=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or bucketFileSystemLocator is REQUIRED:
+            return self._invalid("getDirectory", args, unknown, _timeout, {
+                "bucketFileSystemLocator": bucketFileSystemLocator})
+        return self._tab.call_method("FileSystem.getDirectory", _timeout=_timeout,
+                                     bucketFileSystemLocator=bucketFileSystemLocator)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""
+generate the domain modules of aiochrome.protocol from the protocol JSON files,
+e.g. those of the devtools-protocol npm package:
+
+    python -m aiochrome.protocol.generate browser_protocol.json js_protocol.json --version 0.0.1508733
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+
+
+HEADER = "# -*- coding: utf-8 -*-\n\n# generated by aiochrome/protocol/generate.py from devtools-protocol %s, do not edit\n"
+
+
+def constant_name(name):
+    """loadEventFired -> LOAD_EVENT_FIRED"""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).upper()
+
+
+def summary(description):
+    """the first sentence of a description, for a one line docstring"""
+    description = " ".join((description or "").split())
+    match = re.match(r"(.+?\.)(\s|$)", description)
+    line = match.group(1) if match else description
+    return line.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def bracket_column(head):
+    """the column after the last bracket left open in head, where its continuation lines go"""
+    opened = []
+    for column, char in enumerate(head):
+        if char in "([{":
+            opened.append(column + 1)
+        elif char in ")]}":
+            opened.pop()
+
+    return opened[-1]
+
+
+def wrap(head, items, tail, hanging=None, sep=", "):
+    """
+    items after head, wrapped at 120 columns: aligned with the bracket left open
+    at the end of head, or from the next line with `hanging` spaces
+    """
+    line = head + sep.join(items) + tail
+    if len(line) <= 120:
+        return [line]
+
+    if hanging is None:
+        indent = bracket_column(head)
+        lines = [head]
+    else:
+        indent = hanging
+        lines = [head.rstrip(), " " * indent]
+
+    for item in items:
+        if len(lines[-1]) > indent and len(lines[-1]) + len(item) + len(sep) > 120:
+            lines[-1] = lines[-1].rstrip()
+            lines.append(" " * indent)
+        lines[-1] += item + sep
+
+    lines[-1] = lines[-1][:-len(sep)] + tail
+    return lines
+
+
+def condition(checks, indent):
+    """
+    `if check or check ...:`, a long one is chained over a few statements, so that
+    no line breaks before or after an `or` (W503/W504)
+    """
+    line = " " * indent + "if %s:" % " or ".join(checks)
+    if len(line) <= 120:
+        return [line]
+
+    chunks = [[]]
+    for check in checks:
+        if chunks[-1] and len(" or ".join(chunks[-1] + [check])) > 120 - indent - len("invalid = invalid or :"):
+            chunks.append([])
+        chunks[-1].append(check)
+
+    lines = [" " * indent + "invalid = %s" % " or ".join(chunks[0])]
+    for chunk in chunks[1:-1]:
+        lines.append(" " * indent + "invalid = invalid or %s" % " or ".join(chunk))
+    lines.append(" " * indent + "if invalid or %s:" % " or ".join(chunks[-1]))
+    return lines
+
+
+def generate_command(domain, command):
+    name = "%s.%s" % (domain, command['name'])
+    parameters = command.get('parameters', [])
+    required = [p['name'] for p in parameters if not p.get('optional')]
+    optional = [p['name'] for p in parameters if p.get('optional')]
+
+    # params are checked in the body, to fail with an InvalidParamsException before any round trip
+    signature = ["*args"] + ["%s=REQUIRED" % p for p in required] + ["%s=None" % p for p in optional] + \
+        ["_timeout=None", "**unknown"]
+    lines = wrap("    def %s(self, " % command['name'], signature, "):")
+
+    doc = summary(command.get('description'))
+    flags = [flag for flag in ('experimental', 'deprecated') if command.get(flag)]
+    if flags:
+        doc = ("(%s) %s" % (", ".join(flags), doc)).strip()
+    if doc:
+        lines.append('        """%s"""' % doc)
+
+    lines.extend(condition(["args", "unknown"] + ["%s is REQUIRED" % p for p in required], 8))
+    lines.extend(wrap('            return self._invalid("%s", args, unknown, _timeout, {' % command['name'],
+                      ['"%s": %s' % (p, p) for p in required + optional], "})", hanging=16))
+
+    if not parameters:
+        lines.append('        return self._tab.call_method("%s", _timeout=_timeout)' % name)
+        return lines
+
+    if not optional:
+        items = ['%s=%s' % (p, p) for p in required]
+        lines.extend(wrap('        return self._tab.call_method("%s", _timeout=_timeout, ' % name, items, ")"))
+        return lines
+
+    items = ['"%s": %s' % (p, p) for p in required]
+    lines.extend(wrap("        params = {", items, "}"))
+    for p in optional:
+        lines.append("        if %s is not None:" % p)
+        lines.append('            params["%s"] = %s' % (p, p))
+    lines.append('        return self._tab.call_method("%s", _timeout=_timeout, **params)' % name)
+    return lines
+
+
+def generate_domain(domain, version):
+    name = domain['domain']
+    events = sorted(event['name'] for event in domain.get('events', []))
+
+    lines = [HEADER % version, "from . import Domain, REQUIRED", "", "", "class %s(Domain):" % name]
+    doc = summary(domain.get('description'))
+    if doc:
+        lines.append('    """%s"""' % doc)
+        lines.append("")
+
+    lines.append("    __slots__ = ()")
+    lines.append("")
+    lines.append('    _name = "%s"' % name)
+    lines.extend(wrap("    _events = frozenset([", ['"%s"' % event for event in events], "])", hanging=8))
+
+    if events:
+        lines.append("")
+        for event in events:
+            lines.append('    %s = "%s.%s"' % (constant_name(event), name, event))
+
+    for command in domain.get('commands', []):
+        lines.append("")
+        lines.extend(generate_command(name, command))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate(paths, output, version):
+    domains = []
+    for path in paths:
+        with open(path, encoding='utf-8') as fd:
+            domains.extend(json.load(fd)['domains'])
+
+    for name in os.listdir(output):
+        if name.endswith(".py") and name not in ("__init__.py", "generate.py"):
+            os.remove(os.path.join(output, name))
+
+    index = {}
+    for domain in sorted(domains, key=lambda domain: domain['domain']):
+        module = domain['domain'].lower()
+        index[domain['domain']] = module
+        with open(os.path.join(output, module + ".py"), "w", encoding='utf-8') as fd:
+            fd.write(generate_domain(domain, version))
+
+    lines = [HEADER % version, 'PROTOCOL_VERSION = "%s"' % version, "", "# domain -> module", "DOMAINS = {"]
+    for name in sorted(index):
+        lines.append('    "%s": "%s",' % (name, index[name]))
+    lines.append("}")
+
+    with open(os.path.join(output, "_index.py"), "w", encoding='utf-8') as fd:
+        fd.write("\n".join(lines) + "\n")
+
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="generate the aiochrome.protocol domain modules")
+    parser.add_argument("protocols", nargs="+", help="browser_protocol.json, js_protocol.json")
+    parser.add_argument("--version", default="unknown", help="version of the protocol files")
+    parser.add_argument("--output", default=os.path.dirname(os.path.abspath(__file__)))
+    options = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    index = generate(options.protocols, options.output, options.version)
+    print("%s domains written to %s" % (len(index), options.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class HeadlessExperimental(Domain):
+    """This domain provides experimental commands only supported in headless mode."""
+
+    __slots__ = ()
+
+    _name = "HeadlessExperimental"
+    _events = frozenset([])
+
+    def beginFrame(self, *args, frameTimeTicks=None, interval=None, noDisplayUpdates=None, screenshot=None,
+                   _timeout=None, **unknown):
+        """Sends a BeginFrame to the target and returns when the frame was completed."""
+        if args or unknown:
+            return self._invalid("beginFrame", args, unknown, _timeout, {
+                "frameTimeTicks": frameTimeTicks, "interval": interval, "noDisplayUpdates": noDisplayUpdates,
+                "screenshot": screenshot})
+        params = {}
+        if frameTimeTicks is not None:
+            params["frameTimeTicks"] = frameTimeTicks
+        if interval is not None:
+            params["interval"] = interval
+        if noDisplayUpdates is not None:
+            params["noDisplayUpdates"] = noDisplayUpdates
+        if screenshot is not None:
+            params["screenshot"] = screenshot
+        return self._tab.call_method("HeadlessExperimental.beginFrame", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """(deprecated) Disables headless events for the target."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("HeadlessExperimental.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """(deprecated) Enables headless events for the target."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("HeadlessExperimental.enable", _timeout=_timeout)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class HeapProfiler(Domain):
+    __slots__ = ()
+
+    _name = "HeapProfiler"
+    _events = frozenset([
+        "addHeapSnapshotChunk", "heapStatsUpdate", "lastSeenObjectId", "reportHeapSnapshotProgress", "resetProfiles"])
+
+    ADD_HEAP_SNAPSHOT_CHUNK = "HeapProfiler.addHeapSnapshotChunk"
+    HEAP_STATS_UPDATE = "HeapProfiler.heapStatsUpdate"
+    LAST_SEEN_OBJECT_ID = "HeapProfiler.lastSeenObjectId"
+    REPORT_HEAP_SNAPSHOT_PROGRESS = "HeapProfiler.reportHeapSnapshotProgress"
+    RESET_PROFILES = "HeapProfiler.resetProfiles"
+
+    def addInspectedHeapObject(self, *args, heapObjectId=REQUIRED, _timeout=None, **unknown):
+        """Enables console to refer to the node with given id via $x (see Command Line API for more details $x functions)."""
+        if args or unknown or heapObjectId is REQUIRED:
+            return self._invalid("addInspectedHeapObject", args, unknown, _timeout, {"heapObjectId": heapObjectId})
+        return self._tab.call_method("HeapProfiler.addInspectedHeapObject", _timeout=_timeout,
+                                     heapObjectId=heapObjectId)
+
+    def collectGarbage(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("collectGarbage", args, unknown, _timeout, {})
+        return self._tab.call_method("HeapProfiler.collectGarbage", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("HeapProfiler.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("HeapProfiler.enable", _timeout=_timeout)
+
+    def getHeapObjectId(self, *args, objectId=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("getHeapObjectId", args, unknown, _timeout, {"objectId": objectId})
+        return self._tab.call_method("HeapProfiler.getHeapObjectId", _timeout=_timeout, objectId=objectId)
+
+    def getObjectByHeapObjectId(self, *args, objectId=REQUIRED, objectGroup=None, _timeout=None, **unknown):
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("getObjectByHeapObjectId", args, unknown, _timeout, {
+                "objectId": objectId, "objectGroup": objectGroup})
+        params = {"objectId": objectId}
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        return self._tab.call_method("HeapProfiler.getObjectByHeapObjectId", _timeout=_timeout, **params)
+
+    def getSamplingProfile(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("getSamplingProfile", args, unknown, _timeout, {})
+        return self._tab.call_method("HeapProfiler.getSamplingProfile", _timeout=_timeout)
+
+    def startSampling(self, *args, samplingInterval=None, includeObjectsCollectedByMajorGC=None,
+                      includeObjectsCollectedByMinorGC=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("startSampling", args, unknown, _timeout, {
+                "samplingInterval": samplingInterval,
+                "includeObjectsCollectedByMajorGC": includeObjectsCollectedByMajorGC,
+                "includeObjectsCollectedByMinorGC": includeObjectsCollectedByMinorGC})
+        params = {}
+        if samplingInterval is not None:
+            params["samplingInterval"] = samplingInterval
+        if includeObjectsCollectedByMajorGC is not None:
+            params["includeObjectsCollectedByMajorGC"] = includeObjectsCollectedByMajorGC
+        if includeObjectsCollectedByMinorGC is not None:
+            params["includeObjectsCollectedByMinorGC"] = includeObjectsCollectedByMinorGC
+        return self._tab.call_method("HeapProfiler.startSampling", _timeout=_timeout, **params)
+
+    def startTrackingHeapObjects(self, *args, trackAllocations=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("startTrackingHeapObjects", args, unknown, _timeout, {
+                "trackAllocations": trackAllocations})
+        params = {}
+        if trackAllocations is not None:
+            params["trackAllocations"] = trackAllocations
+        return self._tab.call_method("HeapProfiler.startTrackingHeapObjects", _timeout=_timeout, **params)
+
+    def stopSampling(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("stopSampling", args, unknown, _timeout, {})
+        return self._tab.call_method("HeapProfiler.stopSampling", _timeout=_timeout)
+
+    def stopTrackingHeapObjects(self, *args, reportProgress=None, treatGlobalObjectsAsRoots=None,
+                                captureNumericValue=None, exposeInternals=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("stopTrackingHeapObjects", args, unknown, _timeout, {
+                "reportProgress": reportProgress, "treatGlobalObjectsAsRoots": treatGlobalObjectsAsRoots,
+                "captureNumericValue": captureNumericValue, "exposeInternals": exposeInternals})
+        params = {}
+        if reportProgress is not None:
+            params["reportProgress"] = reportProgress
+        if treatGlobalObjectsAsRoots is not None:
+            params["treatGlobalObjectsAsRoots"] = treatGlobalObjectsAsRoots
+        if captureNumericValue is not None:
+            params["captureNumericValue"] = captureNumericValue
+        if exposeInternals is not None:
+            params["exposeInternals"] = exposeInternals
+        return self._tab.call_method("HeapProfiler.stopTrackingHeapObjects", _timeout=_timeout, **params)
+
+    def takeHeapSnapshot(self, *args, reportProgress=None, treatGlobalObjectsAsRoots=None, captureNumericValue=None,
+                         exposeInternals=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("takeHeapSnapshot", args, unknown, _timeout, {
+                "reportProgress": reportProgress, "treatGlobalObjectsAsRoots": treatGlobalObjectsAsRoots,
+                "captureNumericValue": captureNumericValue, "exposeInternals": exposeInternals})
+        params = {}
+        if reportProgress is not None:
+            params["reportProgress"] = reportProgress
+        if treatGlobalObjectsAsRoots is not None:
+            params["treatGlobalObjectsAsRoots"] = treatGlobalObjectsAsRoots
+        if captureNumericValue is not None:
+            params["captureNumericValue"] = captureNumericValue
+        if exposeInternals is not None:
+            params["exposeInternals"] = exposeInternals
+        return self._tab.call_method("HeapProfiler.takeHeapSnapshot", _timeout=_timeout, **params)
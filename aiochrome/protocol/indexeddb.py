@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class IndexedDB(Domain):
+    __slots__ = ()
+
+    _name = "IndexedDB"
+    _events = frozenset([])
+
+    def clearObjectStore(self, *args, databaseName=REQUIRED, objectStoreName=REQUIRED, securityOrigin=None,
+                         storageKey=None, storageBucket=None, _timeout=None, **unknown):
+        """Clears all entries from an object store."""
+        if args or unknown or databaseName is REQUIRED or objectStoreName is REQUIRED:
+            return self._invalid("clearObjectStore", args, unknown, _timeout, {
+                "databaseName": databaseName, "objectStoreName": objectStoreName, "securityOrigin": securityOrigin,
+                "storageKey": storageKey, "storageBucket": storageBucket})
+        params = {"databaseName": databaseName, "objectStoreName": objectStoreName}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.clearObjectStore", _timeout=_timeout, **params)
+
+    def deleteDatabase(self, *args, databaseName=REQUIRED, securityOrigin=None, storageKey=None, storageBucket=None,
+                       _timeout=None, **unknown):
+        """Deletes a database."""
+        if args or unknown or databaseName is REQUIRED:
+            return self._invalid("deleteDatabase", args, unknown, _timeout, {
+                "databaseName": databaseName, "securityOrigin": securityOrigin, "storageKey": storageKey,
+                "storageBucket": storageBucket})
+        params = {"databaseName": databaseName}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.deleteDatabase", _timeout=_timeout, **params)
+
+    def deleteObjectStoreEntries(self, *args, databaseName=REQUIRED, objectStoreName=REQUIRED, keyRange=REQUIRED,
+                                 securityOrigin=None, storageKey=None, storageBucket=None, _timeout=None, **unknown):
+        """Delete a range of entries from an object store"""
+        if args or unknown or databaseName is REQUIRED or objectStoreName is REQUIRED or keyRange is REQUIRED:
+            return self._invalid("deleteObjectStoreEntries", args, unknown, _timeout, {
+                "databaseName": databaseName, "objectStoreName": objectStoreName, "keyRange": keyRange,
+                "securityOrigin": securityOrigin, "storageKey": storageKey, "storageBucket": storageBucket})
+        params = {"databaseName": databaseName, "objectStoreName": objectStoreName, "keyRange": keyRange}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.deleteObjectStoreEntries", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables events from backend."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("IndexedDB.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables events from backend."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("IndexedDB.enable", _timeout=_timeout)
+
+    def requestData(self, *args, databaseName=REQUIRED, objectStoreName=REQUIRED, indexName=REQUIRED,
+                    skipCount=REQUIRED, pageSize=REQUIRED, securityOrigin=None, storageKey=None, storageBucket=None,
+                    keyRange=None, _timeout=None, **unknown):
+        """Requests data from object store or index."""
+        invalid = args or unknown or databaseName is REQUIRED or objectStoreName is REQUIRED
+        if invalid or indexName is REQUIRED or skipCount is REQUIRED or pageSize is REQUIRED:
+            return self._invalid("requestData", args, unknown, _timeout, {
+                "databaseName": databaseName, "objectStoreName": objectStoreName, "indexName": indexName,
+                "skipCount": skipCount, "pageSize": pageSize, "securityOrigin": securityOrigin,
+                "storageKey": storageKey, "storageBucket": storageBucket, "keyRange": keyRange})
+        params = {"databaseName": databaseName, "objectStoreName": objectStoreName, "indexName": indexName,
+                  "skipCount": skipCount, "pageSize": pageSize}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        if keyRange is not None:
+            params["keyRange"] = keyRange
+        return self._tab.call_method("IndexedDB.requestData", _timeout=_timeout, **params)
+
+    def getMetadata(self, *args, databaseName=REQUIRED, objectStoreName=REQUIRED, securityOrigin=None, storageKey=None,
+                    storageBucket=None, _timeout=None, **unknown):
+        """Gets metadata of an object store."""
+        if args or unknown or databaseName is REQUIRED or objectStoreName is REQUIRED:
+            return self._invalid("getMetadata", args, unknown, _timeout, {
+                "databaseName": databaseName, "objectStoreName": objectStoreName, "securityOrigin": securityOrigin,
+                "storageKey": storageKey, "storageBucket": storageBucket})
+        params = {"databaseName": databaseName, "objectStoreName": objectStoreName}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.getMetadata", _timeout=_timeout, **params)
+
+    def requestDatabase(self, *args, databaseName=REQUIRED, securityOrigin=None, storageKey=None, storageBucket=None,
+                        _timeout=None, **unknown):
+        """Requests database with given name in given frame."""
+        if args or unknown or databaseName is REQUIRED:
+            return self._invalid("requestDatabase", args, unknown, _timeout, {
+                "databaseName": databaseName, "securityOrigin": securityOrigin, "storageKey": storageKey,
+                "storageBucket": storageBucket})
+        params = {"databaseName": databaseName}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.requestDatabase", _timeout=_timeout, **params)
+
+    def requestDatabaseNames(self, *args, securityOrigin=None, storageKey=None, storageBucket=None, _timeout=None,
+                             **unknown):
+        """Requests database names for given security origin."""
+        if args or unknown:
+            return self._invalid("requestDatabaseNames", args, unknown, _timeout, {
+                "securityOrigin": securityOrigin, "storageKey": storageKey, "storageBucket": storageBucket})
+        params = {}
+        if securityOrigin is not None:
+            params["securityOrigin"] = securityOrigin
+        if storageKey is not None:
+            params["storageKey"] = storageKey
+        if storageBucket is not None:
+            params["storageBucket"] = storageBucket
+        return self._tab.call_method("IndexedDB.requestDatabaseNames", _timeout=_timeout, **params)
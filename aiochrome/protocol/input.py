@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Input(Domain):
+    __slots__ = ()
+
+    _name = "Input"
+    _events = frozenset(["dragIntercepted"])
+
+    DRAG_INTERCEPTED = "Input.dragIntercepted"
+
+    def dispatchDragEvent(self, *args, type=REQUIRED, x=REQUIRED, y=REQUIRED, data=REQUIRED, modifiers=None,
+                          _timeout=None, **unknown):
+        """(experimental) Dispatches a drag event into the page."""
+        if args or unknown or type is REQUIRED or x is REQUIRED or y is REQUIRED or data is REQUIRED:
+            return self._invalid("dispatchDragEvent", args, unknown, _timeout, {
+                "type": type, "x": x, "y": y, "data": data, "modifiers": modifiers})
+        params = {"type": type, "x": x, "y": y, "data": data}
+        if modifiers is not None:
+            params["modifiers"] = modifiers
+        return self._tab.call_method("Input.dispatchDragEvent", _timeout=_timeout, **params)
+
+    def dispatchKeyEvent(self, *args, type=REQUIRED, modifiers=None, timestamp=None, text=None, unmodifiedText=None,
+                         keyIdentifier=None, code=None, key=None, windowsVirtualKeyCode=None,
+                         nativeVirtualKeyCode=None, autoRepeat=None, isKeypad=None, isSystemKey=None, location=None,
+                         commands=None, _timeout=None, **unknown):
+        """Dispatches a key event to the page."""
+        if args or unknown or type is REQUIRED:
+            return self._invalid("dispatchKeyEvent", args, unknown, _timeout, {
+                "type": type, "modifiers": modifiers, "timestamp": timestamp, "text": text,
+                "unmodifiedText": unmodifiedText, "keyIdentifier": keyIdentifier, "code": code, "key": key,
+                "windowsVirtualKeyCode": windowsVirtualKeyCode, "nativeVirtualKeyCode": nativeVirtualKeyCode,
+                "autoRepeat": autoRepeat, "isKeypad": isKeypad, "isSystemKey": isSystemKey, "location": location,
+                "commands": commands})
+        params = {"type": type}
+        if modifiers is not None:
+            params["modifiers"] = modifiers
+        if timestamp is not None:
+            params["timestamp"] = timestamp
+        if text is not None:
+            params["text"] = text
+        if unmodifiedText is not None:
+            params["unmodifiedText"] = unmodifiedText
+        if keyIdentifier is not None:
+            params["keyIdentifier"] = keyIdentifier
+        if code is not None:
+            params["code"] = code
+        if key is not None:
+            params["key"] = key
+        if windowsVirtualKeyCode is not None:
+            params["windowsVirtualKeyCode"] = windowsVirtualKeyCode
+        if nativeVirtualKeyCode is not None:
+            params["nativeVirtualKeyCode"] = nativeVirtualKeyCode
+        if autoRepeat is not None:
+            params["autoRepeat"] = autoRepeat
+        if isKeypad is not None:
+            params["isKeypad"] = isKeypad
+        if isSystemKey is not None:
+            params["isSystemKey"] = isSystemKey
+        if location is not None:
+            params["location"] = location
+        if commands is not None:
+            params["commands"] = commands
+        return self._tab.call_method("Input.dispatchKeyEvent", _timeout=_timeout, **params)
+
+    def insertText(self, *args, text=REQUIRED, _timeout=None, **unknown):
+        """(experimental) This method emulates inserting text that doesn't come from a key press, for example an emoji keyboard or an IME."""
+        if args or unknown or text is REQUIRED:
+            return self._invalid("insertText", args, unknown, _timeout, {"text": text})
+        return self._tab.call_method("Input.insertText", _timeout=_timeout, text=text)
+
+    def imeSetComposition(self, *args, text=REQUIRED, selectionStart=REQUIRED, selectionEnd=REQUIRED,
+                          replacementStart=None, replacementEnd=None, _timeout=None, **unknown):
+        """(experimental) This method sets the current candidate text for IME."""
+        if args or unknown or text is REQUIRED or selectionStart is REQUIRED or selectionEnd is REQUIRED:
+            return self._invalid("imeSetComposition", args, unknown, _timeout, {
+                "text": text, "selectionStart": selectionStart, "selectionEnd": selectionEnd,
+                "replacementStart": replacementStart, "replacementEnd": replacementEnd})
+        params = {"text": text, "selectionStart": selectionStart, "selectionEnd": selectionEnd}
+        if replacementStart is not None:
+            params["replacementStart"] = replacementStart
+        if replacementEnd is not None:
+            params["replacementEnd"] = replacementEnd
+        return self._tab.call_method("Input.imeSetComposition", _timeout=_timeout, **params)
+
+    def dispatchMouseEvent(self, *args, type=REQUIRED, x=REQUIRED, y=REQUIRED, modifiers=None, timestamp=None,
+                           button=None, buttons=None, clickCount=None, force=None, tangentialPressure=None, tiltX=None,
+                           tiltY=None, twist=None, deltaX=None, deltaY=None, pointerType=None, _timeout=None,
+                           **unknown):
+        """Dispatches a mouse event to the page."""
+        if args or unknown or type is REQUIRED or x is REQUIRED or y is REQUIRED:
+            return self._invalid("dispatchMouseEvent", args, unknown, _timeout, {
+                "type": type, "x": x, "y": y, "modifiers": modifiers, "timestamp": timestamp, "button": button,
+                "buttons": buttons, "clickCount": clickCount, "force": force, "tangentialPressure": tangentialPressure,
+                "tiltX": tiltX, "tiltY": tiltY, "twist": twist, "deltaX": deltaX, "deltaY": deltaY,
+                "pointerType": pointerType})
+        params = {"type": type, "x": x, "y": y}
+        if modifiers is not None:
+            params["modifiers"] = modifiers
+        if timestamp is not None:
+            params["timestamp"] = timestamp
+        if button is not None:
+            params["button"] = button
+        if buttons is not None:
+            params["buttons"] = buttons
+        if clickCount is not None:
+            params["clickCount"] = clickCount
+        if force is not None:
+            params["force"] = force
+        if tangentialPressure is not None:
+            params["tangentialPressure"] = tangentialPressure
+        if tiltX is not None:
+            params["tiltX"] = tiltX
+        if tiltY is not None:
+            params["tiltY"] = tiltY
+        if twist is not None:
+            params["twist"] = twist
+        if deltaX is not None:
+            params["deltaX"] = deltaX
+        if deltaY is not None:
+            params["deltaY"] = deltaY
+        if pointerType is not None:
+            params["pointerType"] = pointerType
+        return self._tab.call_method("Input.dispatchMouseEvent", _timeout=_timeout, **params)
+
+    def dispatchTouchEvent(self, *args, type=REQUIRED, touchPoints=REQUIRED, modifiers=None, timestamp=None,
+                           _timeout=None, **unknown):
+        """Dispatches a touch event to the page."""
+        if args or unknown or type is REQUIRED or touchPoints is REQUIRED:
+            return self._invalid("dispatchTouchEvent", args, unknown, _timeout, {
+                "type": type, "touchPoints": touchPoints, "modifiers": modifiers, "timestamp": timestamp})
+        params = {"type": type, "touchPoints": touchPoints}
+        if modifiers is not None:
+            params["modifiers"] = modifiers
+        if timestamp is not None:
+            params["timestamp"] = timestamp
+        return self._tab.call_method("Input.dispatchTouchEvent", _timeout=_timeout, **params)
+
+    def cancelDragging(self, *args, _timeout=None, **unknown):
+        """Cancels any active dragging in the page."""
+        if args or unknown:
+            return self._invalid("cancelDragging", args, unknown, _timeout, {})
+        return self._tab.call_method("Input.cancelDragging", _timeout=_timeout)
+
+    def emulateTouchFromMouseEvent(self, *args, type=REQUIRED, x=REQUIRED, y=REQUIRED, button=REQUIRED, timestamp=None,
+                                   deltaX=None, deltaY=None, modifiers=None, clickCount=None, _timeout=None, **unknown):
+        """(experimental) Emulates touch event from the mouse event parameters."""
+        if args or unknown or type is REQUIRED or x is REQUIRED or y is REQUIRED or button is REQUIRED:
+            return self._invalid("emulateTouchFromMouseEvent", args, unknown, _timeout, {
+                "type": type, "x": x, "y": y, "button": button, "timestamp": timestamp, "deltaX": deltaX,
+                "deltaY": deltaY, "modifiers": modifiers, "clickCount": clickCount})
+        params = {"type": type, "x": x, "y": y, "button": button}
+        if timestamp is not None:
+            params["timestamp"] = timestamp
+        if deltaX is not None:
+            params["deltaX"] = deltaX
+        if deltaY is not None:
+            params["deltaY"] = deltaY
+        if modifiers is not None:
+            params["modifiers"] = modifiers
+        if clickCount is not None:
+            params["clickCount"] = clickCount
+        return self._tab.call_method("Input.emulateTouchFromMouseEvent", _timeout=_timeout, **params)
+
+    def setIgnoreInputEvents(self, *args, ignore=REQUIRED, _timeout=None, **unknown):
+        """Ignores input events (useful while auditing page)."""
+        if args or unknown or ignore is REQUIRED:
+            return self._invalid("setIgnoreInputEvents", args, unknown, _timeout, {"ignore": ignore})
+        return self._tab.call_method("Input.setIgnoreInputEvents", _timeout=_timeout, ignore=ignore)
+
+    def setInterceptDrags(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Prevents default drag and drop behavior and instead emits `Input.dragIntercepted` events."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setInterceptDrags", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Input.setInterceptDrags", _timeout=_timeout, enabled=enabled)
+
+    def synthesizePinchGesture(self, *args, x=REQUIRED, y=REQUIRED, scaleFactor=REQUIRED, relativeSpeed=None,
+                               gestureSourceType=None, _timeout=None, **unknown):
+        """(experimental) Synthesizes a pinch gesture over a time period by issuing appropriate touch events."""
+        if args or unknown or x is REQUIRED or y is REQUIRED or scaleFactor is REQUIRED:
+            return self._invalid("synthesizePinchGesture", args, unknown, _timeout, {
+                "x": x, "y": y, "scaleFactor": scaleFactor, "relativeSpeed": relativeSpeed,
+                "gestureSourceType": gestureSourceType})
+        params = {"x": x, "y": y, "scaleFactor": scaleFactor}
+        if relativeSpeed is not None:
+            params["relativeSpeed"] = relativeSpeed
+        if gestureSourceType is not None:
+            params["gestureSourceType"] = gestureSourceType
+        return self._tab.call_method("Input.synthesizePinchGesture", _timeout=_timeout, **params)
+
+    def synthesizeScrollGesture(self, *args, x=REQUIRED, y=REQUIRED, xDistance=None, yDistance=None, xOverscroll=None,
+                                yOverscroll=None, preventFling=None, speed=None, gestureSourceType=None,
+                                repeatCount=None, repeatDelayMs=None, interactionMarkerName=None, _timeout=None,
+                                **unknown):
+        """(experimental) Synthesizes a scroll gesture over a time period by issuing appropriate touch events."""
+        if args or unknown or x is REQUIRED or y is REQUIRED:
+            return self._invalid("synthesizeScrollGesture", args, unknown, _timeout, {
+                "x": x, "y": y, "xDistance": xDistance, "yDistance": yDistance, "xOverscroll": xOverscroll,
+                "yOverscroll": yOverscroll, "preventFling": preventFling, "speed": speed,
+                "gestureSourceType": gestureSourceType, "repeatCount": repeatCount, "repeatDelayMs": repeatDelayMs,
+                "interactionMarkerName": interactionMarkerName})
+        params = {"x": x, "y": y}
+        if xDistance is not None:
+            params["xDistance"] = xDistance
+        if yDistance is not None:
+            params["yDistance"] = yDistance
+        if xOverscroll is not None:
+            params["xOverscroll"] = xOverscroll
+        if yOverscroll is not None:
+            params["yOverscroll"] = yOverscroll
+        if preventFling is not None:
+            params["preventFling"] = preventFling
+        if speed is not None:
+            params["speed"] = speed
+        if gestureSourceType is not None:
+            params["gestureSourceType"] = gestureSourceType
+        if repeatCount is not None:
+            params["repeatCount"] = repeatCount
+        if repeatDelayMs is not None:
+            params["repeatDelayMs"] = repeatDelayMs
+        if interactionMarkerName is not None:
+            params["interactionMarkerName"] = interactionMarkerName
+        return self._tab.call_method("Input.synthesizeScrollGesture", _timeout=_timeout, **params)
+
+    def synthesizeTapGesture(self, *args, x=REQUIRED, y=REQUIRED, duration=None, tapCount=None, gestureSourceType=None,
+                             _timeout=None, **unknown):
+        """(experimental) Synthesizes a tap gesture over a time period by issuing appropriate touch events."""
+        if args or unknown or x is REQUIRED or y is REQUIRED:
+            return self._invalid("synthesizeTapGesture", args, unknown, _timeout, {
+                "x": x, "y": y, "duration": duration, "tapCount": tapCount, "gestureSourceType": gestureSourceType})
+        params = {"x": x, "y": y}
+        if duration is not None:
+            params["duration"] = duration
+        if tapCount is not None:
+            params["tapCount"] = tapCount
+        if gestureSourceType is not None:
+            params["gestureSourceType"] = gestureSourceType
+        return self._tab.call_method("Input.synthesizeTapGesture", _timeout=_timeout, **params)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Inspector(Domain):
+    __slots__ = ()
+
+    _name = "Inspector"
+    _events = frozenset(["detached", "targetCrashed", "targetReloadedAfterCrash"])
+
+    DETACHED = "Inspector.detached"
+    TARGET_CRASHED = "Inspector.targetCrashed"
+    TARGET_RELOADED_AFTER_CRASH = "Inspector.targetReloadedAfterCrash"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables inspector domain notifications."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Inspector.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables inspector domain notifications."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Inspector.enable", _timeout=_timeout)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class IO(Domain):
+    """Input/Output operations for streams produced by DevTools."""
+
+    __slots__ = ()
+
+    _name = "IO"
+    _events = frozenset([])
+
+    def close(self, *args, handle=REQUIRED, _timeout=None, **unknown):
+        """Close the stream, discard any temporary backing storage."""
+        if args or unknown or handle is REQUIRED:
+            return self._invalid("close", args, unknown, _timeout, {"handle": handle})
+        return self._tab.call_method("IO.close", _timeout=_timeout, handle=handle)
+
+    def read(self, *args, handle=REQUIRED, offset=None, size=None, _timeout=None, **unknown):
+        """Read a chunk of the stream"""
+        if args or unknown or handle is REQUIRED:
+            return self._invalid("read", args, unknown, _timeout, {"handle": handle, "offset": offset, "size": size})
+        params = {"handle": handle}
+        if offset is not None:
+            params["offset"] = offset
+        if size is not None:
+            params["size"] = size
+        return self._tab.call_method("IO.read", _timeout=_timeout, **params)
+
+    def resolveBlob(self, *args, objectId=REQUIRED, _timeout=None, **unknown):
+        """Return UUID of Blob object specified by a remote object id."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("resolveBlob", args, unknown, _timeout, {"objectId": objectId})
+        return self._tab.call_method("IO.resolveBlob", _timeout=_timeout, objectId=objectId)
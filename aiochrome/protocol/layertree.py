@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class LayerTree(Domain):
+    __slots__ = ()
+
+    _name = "LayerTree"
+    _events = frozenset(["layerPainted", "layerTreeDidChange"])
+
+    LAYER_PAINTED = "LayerTree.layerPainted"
+    LAYER_TREE_DID_CHANGE = "LayerTree.layerTreeDidChange"
+
+    def compositingReasons(self, *args, layerId=REQUIRED, _timeout=None, **unknown):
+        """Provides the reasons why the given layer was composited."""
+        if args or unknown or layerId is REQUIRED:
+            return self._invalid("compositingReasons", args, unknown, _timeout, {"layerId": layerId})
+        return self._tab.call_method("LayerTree.compositingReasons", _timeout=_timeout, layerId=layerId)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables compositing tree inspection."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("LayerTree.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables compositing tree inspection."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("LayerTree.enable", _timeout=_timeout)
+
+    def loadSnapshot(self, *args, tiles=REQUIRED, _timeout=None, **unknown):
+        """Returns the snapshot identifier."""
+        if args or unknown or tiles is REQUIRED:
+            return self._invalid("loadSnapshot", args, unknown, _timeout, {"tiles": tiles})
+        return self._tab.call_method("LayerTree.loadSnapshot", _timeout=_timeout, tiles=tiles)
+
+    def makeSnapshot(self, *args, layerId=REQUIRED, _timeout=None, **unknown):
+        """Returns the layer snapshot identifier."""
+        if args or unknown or layerId is REQUIRED:
+            return self._invalid("makeSnapshot", args, unknown, _timeout, {"layerId": layerId})
+        return self._tab.call_method("LayerTree.makeSnapshot", _timeout=_timeout, layerId=layerId)
+
+    def profileSnapshot(self, *args, snapshotId=REQUIRED, minRepeatCount=None, minDuration=None, clipRect=None,
+                        _timeout=None, **unknown):
+        if args or unknown or snapshotId is REQUIRED:
+            return self._invalid("profileSnapshot", args, unknown, _timeout, {
+                "snapshotId": snapshotId, "minRepeatCount": minRepeatCount, "minDuration": minDuration,
+                "clipRect": clipRect})
+        params = {"snapshotId": snapshotId}
+        if minRepeatCount is not None:
+            params["minRepeatCount"] = minRepeatCount
+        if minDuration is not None:
+            params["minDuration"] = minDuration
+        if clipRect is not None:
+            params["clipRect"] = clipRect
+        return self._tab.call_method("LayerTree.profileSnapshot", _timeout=_timeout, **params)
+
+    def releaseSnapshot(self, *args, snapshotId=REQUIRED, _timeout=None, **unknown):
+        """Releases layer snapshot captured by the back-end."""
+        if args or unknown or snapshotId is REQUIRED:
+            return self._invalid("releaseSnapshot", args, unknown, _timeout, {"snapshotId": snapshotId})
+        return self._tab.call_method("LayerTree.releaseSnapshot", _timeout=_timeout, snapshotId=snapshotId)
+
+    def replaySnapshot(self, *args, snapshotId=REQUIRED, fromStep=None, toStep=None, scale=None, _timeout=None,
+                       **unknown):
+        """Replays the layer snapshot and returns the resulting bitmap."""
+        if args or unknown or snapshotId is REQUIRED:
+            return self._invalid("replaySnapshot", args, unknown, _timeout, {
+                "snapshotId": snapshotId, "fromStep": fromStep, "toStep": toStep, "scale": scale})
+        params = {"snapshotId": snapshotId}
+        if fromStep is not None:
+            params["fromStep"] = fromStep
+        if toStep is not None:
+            params["toStep"] = toStep
+        if scale is not None:
+            params["scale"] = scale
+        return self._tab.call_method("LayerTree.replaySnapshot", _timeout=_timeout, **params)
+
+    def snapshotCommandLog(self, *args, snapshotId=REQUIRED, _timeout=None, **unknown):
+        """Replays the layer snapshot and returns canvas log."""
+        if args or unknown or snapshotId is REQUIRED:
+            return self._invalid("snapshotCommandLog", args, unknown, _timeout, {"snapshotId": snapshotId})
+        return self._tab.call_method("LayerTree.snapshotCommandLog", _timeout=_timeout, snapshotId=snapshotId)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Log(Domain):
+    """Provides access to log entries."""
+
+    __slots__ = ()
+
+    _name = "Log"
+    _events = frozenset(["entryAdded"])
+
+    ENTRY_ADDED = "Log.entryAdded"
+
+    def clear(self, *args, _timeout=None, **unknown):
+        """Clears the log."""
+        if args or unknown:
+            return self._invalid("clear", args, unknown, _timeout, {})
+        return self._tab.call_method("Log.clear", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables log domain, prevents further log entries from being reported to the client."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Log.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables log domain, sends the entries collected so far to the client by means of the `entryAdded` notification."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Log.enable", _timeout=_timeout)
+
+    def startViolationsReport(self, *args, config=REQUIRED, _timeout=None, **unknown):
+        """start violation reporting."""
+        if args or unknown or config is REQUIRED:
+            return self._invalid("startViolationsReport", args, unknown, _timeout, {"config": config})
+        return self._tab.call_method("Log.startViolationsReport", _timeout=_timeout, config=config)
+
+    def stopViolationsReport(self, *args, _timeout=None, **unknown):
+        """Stop violation reporting."""
+        if args or unknown:
+            return self._invalid("stopViolationsReport", args, unknown, _timeout, {})
+        return self._tab.call_method("Log.stopViolationsReport", _timeout=_timeout)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Media(Domain):
+    """This domain allows detailed inspection of media elements."""
+
+    __slots__ = ()
+
+    _name = "Media"
+    _events = frozenset([
+        "playerCreated", "playerErrorsRaised", "playerEventsAdded", "playerMessagesLogged", "playerPropertiesChanged"])
+
+    PLAYER_CREATED = "Media.playerCreated"
+    PLAYER_ERRORS_RAISED = "Media.playerErrorsRaised"
+    PLAYER_EVENTS_ADDED = "Media.playerEventsAdded"
+    PLAYER_MESSAGES_LOGGED = "Media.playerMessagesLogged"
+    PLAYER_PROPERTIES_CHANGED = "Media.playerPropertiesChanged"
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables the Media domain"""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Media.enable", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables the Media domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Media.disable", _timeout=_timeout)
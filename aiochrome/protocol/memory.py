@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Memory(Domain):
+    __slots__ = ()
+
+    _name = "Memory"
+    _events = frozenset([])
+
+    def getDOMCounters(self, *args, _timeout=None, **unknown):
+        """Retruns current DOM object counters."""
+        if args or unknown:
+            return self._invalid("getDOMCounters", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.getDOMCounters", _timeout=_timeout)
+
+    def getDOMCountersForLeakDetection(self, *args, _timeout=None, **unknown):
+        """Retruns DOM object counters after preparing renderer for leak detection."""
+        if args or unknown:
+            return self._invalid("getDOMCountersForLeakDetection", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.getDOMCountersForLeakDetection", _timeout=_timeout)
+
+    def prepareForLeakDetection(self, *args, _timeout=None, **unknown):
+        """Prepares for leak detection by terminating workers, stopping spellcheckers, dropping non-essential internal caches, running garbage collections, etc."""
+        if args or unknown:
+            return self._invalid("prepareForLeakDetection", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.prepareForLeakDetection", _timeout=_timeout)
+
+    def forciblyPurgeJavaScriptMemory(self, *args, _timeout=None, **unknown):
+        """Simulate OomIntervention by purging V8 memory."""
+        if args or unknown:
+            return self._invalid("forciblyPurgeJavaScriptMemory", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.forciblyPurgeJavaScriptMemory", _timeout=_timeout)
+
+    def setPressureNotificationsSuppressed(self, *args, suppressed=REQUIRED, _timeout=None, **unknown):
+        """Enable/disable suppressing memory pressure notifications in all processes."""
+        if args or unknown or suppressed is REQUIRED:
+            return self._invalid("setPressureNotificationsSuppressed", args, unknown, _timeout, {
+                "suppressed": suppressed})
+        return self._tab.call_method("Memory.setPressureNotificationsSuppressed", _timeout=_timeout,
+                                     suppressed=suppressed)
+
+    def simulatePressureNotification(self, *args, level=REQUIRED, _timeout=None, **unknown):
+        """Simulate a memory pressure notification in all processes."""
+        if args or unknown or level is REQUIRED:
+            return self._invalid("simulatePressureNotification", args, unknown, _timeout, {"level": level})
+        return self._tab.call_method("Memory.simulatePressureNotification", _timeout=_timeout, level=level)
+
+    def startSampling(self, *args, samplingInterval=None, suppressRandomness=None, _timeout=None, **unknown):
+        """Start collecting native memory profile."""
+        if args or unknown:
+            return self._invalid("startSampling", args, unknown, _timeout, {
+                "samplingInterval": samplingInterval, "suppressRandomness": suppressRandomness})
+        params = {}
+        if samplingInterval is not None:
+            params["samplingInterval"] = samplingInterval
+        if suppressRandomness is not None:
+            params["suppressRandomness"] = suppressRandomness
+        return self._tab.call_method("Memory.startSampling", _timeout=_timeout, **params)
+
+    def stopSampling(self, *args, _timeout=None, **unknown):
+        """Stop collecting native memory profile."""
+        if args or unknown:
+            return self._invalid("stopSampling", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.stopSampling", _timeout=_timeout)
+
+    def getAllTimeSamplingProfile(self, *args, _timeout=None, **unknown):
+        """Retrieve native memory allocations profile collected since renderer process startup."""
+        if args or unknown:
+            return self._invalid("getAllTimeSamplingProfile", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.getAllTimeSamplingProfile", _timeout=_timeout)
+
+    def getBrowserSamplingProfile(self, *args, _timeout=None, **unknown):
+        """Retrieve native memory allocations profile collected since browser process startup."""
+        if args or unknown:
+            return self._invalid("getBrowserSamplingProfile", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.getBrowserSamplingProfile", _timeout=_timeout)
+
+    def getSamplingProfile(self, *args, _timeout=None, **unknown):
+        """Retrieve native memory allocations profile collected since last `startSampling` call."""
+        if args or unknown:
+            return self._invalid("getSamplingProfile", args, unknown, _timeout, {})
+        return self._tab.call_method("Memory.getSamplingProfile", _timeout=_timeout)
@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Network(Domain):
+    """Network domain allows tracking network activities of the page."""
+
+    __slots__ = ()
+
+    _name = "Network"
+    _events = frozenset([
+        "dataReceived", "directTCPSocketAborted", "directTCPSocketChunkReceived", "directTCPSocketChunkSent",
+        "directTCPSocketClosed", "directTCPSocketCreated", "directTCPSocketOpened", "directUDPSocketAborted",
+        "directUDPSocketChunkReceived", "directUDPSocketChunkSent", "directUDPSocketClosed", "directUDPSocketCreated",
+        "directUDPSocketOpened", "eventSourceMessageReceived", "loadingFailed", "loadingFinished", "policyUpdated",
+        "reportingApiEndpointsChangedForOrigin", "reportingApiReportAdded", "reportingApiReportUpdated",
+        "requestIntercepted", "requestServedFromCache", "requestWillBeSent", "requestWillBeSentExtraInfo",
+        "resourceChangedPriority", "responseReceived", "responseReceivedEarlyHints", "responseReceivedExtraInfo",
+        "signedExchangeReceived", "subresourceWebBundleInnerResponseError", "subresourceWebBundleInnerResponseParsed",
+        "subresourceWebBundleMetadataError", "subresourceWebBundleMetadataReceived", "trustTokenOperationDone",
+        "webSocketClosed", "webSocketCreated", "webSocketFrameError", "webSocketFrameReceived", "webSocketFrameSent",
+        "webSocketHandshakeResponseReceived", "webSocketWillSendHandshakeRequest", "webTransportClosed",
+        "webTransportConnectionEstablished", "webTransportCreated"])
+
+    DATA_RECEIVED = "Network.dataReceived"
+    DIRECT_TCP_SOCKET_ABORTED = "Network.directTCPSocketAborted"
+    DIRECT_TCP_SOCKET_CHUNK_RECEIVED = "Network.directTCPSocketChunkReceived"
+    DIRECT_TCP_SOCKET_CHUNK_SENT = "Network.directTCPSocketChunkSent"
+    DIRECT_TCP_SOCKET_CLOSED = "Network.directTCPSocketClosed"
+    DIRECT_TCP_SOCKET_CREATED = "Network.directTCPSocketCreated"
+    DIRECT_TCP_SOCKET_OPENED = "Network.directTCPSocketOpened"
+    DIRECT_UDP_SOCKET_ABORTED = "Network.directUDPSocketAborted"
+    DIRECT_UDP_SOCKET_CHUNK_RECEIVED = "Network.directUDPSocketChunkReceived"
+    DIRECT_UDP_SOCKET_CHUNK_SENT = "Network.directUDPSocketChunkSent"
+    DIRECT_UDP_SOCKET_CLOSED = "Network.directUDPSocketClosed"
+    DIRECT_UDP_SOCKET_CREATED = "Network.directUDPSocketCreated"
+    DIRECT_UDP_SOCKET_OPENED = "Network.directUDPSocketOpened"
+    EVENT_SOURCE_MESSAGE_RECEIVED = "Network.eventSourceMessageReceived"
+    LOADING_FAILED = "Network.loadingFailed"
+    LOADING_FINISHED = "Network.loadingFinished"
+    POLICY_UPDATED = "Network.policyUpdated"
+    REPORTING_API_ENDPOINTS_CHANGED_FOR_ORIGIN = "Network.reportingApiEndpointsChangedForOrigin"
+    REPORTING_API_REPORT_ADDED = "Network.reportingApiReportAdded"
+    REPORTING_API_REPORT_UPDATED = "Network.reportingApiReportUpdated"
+    REQUEST_INTERCEPTED = "Network.requestIntercepted"
+    REQUEST_SERVED_FROM_CACHE = "Network.requestServedFromCache"
+    REQUEST_WILL_BE_SENT = "Network.requestWillBeSent"
+    REQUEST_WILL_BE_SENT_EXTRA_INFO = "Network.requestWillBeSentExtraInfo"
+    RESOURCE_CHANGED_PRIORITY = "Network.resourceChangedPriority"
+    RESPONSE_RECEIVED = "Network.responseReceived"
+    RESPONSE_RECEIVED_EARLY_HINTS = "Network.responseReceivedEarlyHints"
+    RESPONSE_RECEIVED_EXTRA_INFO = "Network.responseReceivedExtraInfo"
+    SIGNED_EXCHANGE_RECEIVED = "Network.signedExchangeReceived"
+    SUBRESOURCE_WEB_BUNDLE_INNER_RESPONSE_ERROR = "Network.subresourceWebBundleInnerResponseError"
+    SUBRESOURCE_WEB_BUNDLE_INNER_RESPONSE_PARSED = "Network.subresourceWebBundleInnerResponseParsed"
+    SUBRESOURCE_WEB_BUNDLE_METADATA_ERROR = "Network.subresourceWebBundleMetadataError"
+    SUBRESOURCE_WEB_BUNDLE_METADATA_RECEIVED = "Network.subresourceWebBundleMetadataReceived"
+    TRUST_TOKEN_OPERATION_DONE = "Network.trustTokenOperationDone"
+    WEB_SOCKET_CLOSED = "Network.webSocketClosed"
+    WEB_SOCKET_CREATED = "Network.webSocketCreated"
+    WEB_SOCKET_FRAME_ERROR = "Network.webSocketFrameError"
+    WEB_SOCKET_FRAME_RECEIVED = "Network.webSocketFrameReceived"
+    WEB_SOCKET_FRAME_SENT = "Network.webSocketFrameSent"
+    WEB_SOCKET_HANDSHAKE_RESPONSE_RECEIVED = "Network.webSocketHandshakeResponseReceived"
+    WEB_SOCKET_WILL_SEND_HANDSHAKE_REQUEST = "Network.webSocketWillSendHandshakeRequest"
+    WEB_TRANSPORT_CLOSED = "Network.webTransportClosed"
+    WEB_TRANSPORT_CONNECTION_ESTABLISHED = "Network.webTransportConnectionEstablished"
+    WEB_TRANSPORT_CREATED = "Network.webTransportCreated"
+
+    def getIPProtectionProxyStatus(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns enum representing if IP Proxy of requests is available or reason it is not active."""
+        if args or unknown:
+            return self._invalid("getIPProtectionProxyStatus", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.getIPProtectionProxyStatus", _timeout=_timeout)
+
+    def setAcceptedEncodings(self, *args, encodings=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Sets a list of content encodings that will be accepted."""
+        if args or unknown or encodings is REQUIRED:
+            return self._invalid("setAcceptedEncodings", args, unknown, _timeout, {"encodings": encodings})
+        return self._tab.call_method("Network.setAcceptedEncodings", _timeout=_timeout, encodings=encodings)
+
+    def clearAcceptedEncodingsOverride(self, *args, _timeout=None, **unknown):
+        """(experimental) Clears accepted encodings set by setAcceptedEncodings"""
+        if args or unknown:
+            return self._invalid("clearAcceptedEncodingsOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.clearAcceptedEncodingsOverride", _timeout=_timeout)
+
+    def canClearBrowserCache(self, *args, _timeout=None, **unknown):
+        """(deprecated) Tells whether clearing browser cache is supported."""
+        if args or unknown:
+            return self._invalid("canClearBrowserCache", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.canClearBrowserCache", _timeout=_timeout)
+
+    def canClearBrowserCookies(self, *args, _timeout=None, **unknown):
+        """(deprecated) Tells whether clearing browser cookies is supported."""
+        if args or unknown:
+            return self._invalid("canClearBrowserCookies", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.canClearBrowserCookies", _timeout=_timeout)
+
+    def canEmulateNetworkConditions(self, *args, _timeout=None, **unknown):
+        """(deprecated) Tells whether emulation of network conditions is supported."""
+        if args or unknown:
+            return self._invalid("canEmulateNetworkConditions", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.canEmulateNetworkConditions", _timeout=_timeout)
+
+    def clearBrowserCache(self, *args, _timeout=None, **unknown):
+        """Clears browser cache."""
+        if args or unknown:
+            return self._invalid("clearBrowserCache", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.clearBrowserCache", _timeout=_timeout)
+
+    def clearBrowserCookies(self, *args, _timeout=None, **unknown):
+        """Clears browser cookies."""
+        if args or unknown:
+            return self._invalid("clearBrowserCookies", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.clearBrowserCookies", _timeout=_timeout)
+
+    def continueInterceptedRequest(self, *args, interceptionId=REQUIRED, errorReason=None, rawResponse=None, url=None,
+                                   method=None, postData=None, headers=None, authChallengeResponse=None, _timeout=None,
+                                   **unknown):
+        """(experimental, deprecated) Response to Network.requestIntercepted which either modifies the request to continue with any modifications, or blocks it, or completes it with the provided response bytes."""
+        if args or unknown or interceptionId is REQUIRED:
+            return self._invalid("continueInterceptedRequest", args, unknown, _timeout, {
+                "interceptionId": interceptionId, "errorReason": errorReason, "rawResponse": rawResponse, "url": url,
+                "method": method, "postData": postData, "headers": headers,
+                "authChallengeResponse": authChallengeResponse})
+        params = {"interceptionId": interceptionId}
+        if errorReason is not None:
+            params["errorReason"] = errorReason
+        if rawResponse is not None:
+            params["rawResponse"] = rawResponse
+        if url is not None:
+            params["url"] = url
+        if method is not None:
+            params["method"] = method
+        if postData is not None:
+            params["postData"] = postData
+        if headers is not None:
+            params["headers"] = headers
+        if authChallengeResponse is not None:
+            params["authChallengeResponse"] = authChallengeResponse
+        return self._tab.call_method("Network.continueInterceptedRequest", _timeout=_timeout, **params)
+
+    def deleteCookies(self, *args, name=REQUIRED, url=None, domain=None, path=None, partitionKey=None, _timeout=None,
+                      **unknown):
+        """Deletes browser cookies with matching name and url or domain/path/partitionKey pair."""
+        if args or unknown or name is REQUIRED:
+            return self._invalid("deleteCookies", args, unknown, _timeout, {
+                "name": name, "url": url, "domain": domain, "path": path, "partitionKey": partitionKey})
+        params = {"name": name}
+        if url is not None:
+            params["url"] = url
+        if domain is not None:
+            params["domain"] = domain
+        if path is not None:
+            params["path"] = path
+        if partitionKey is not None:
+            params["partitionKey"] = partitionKey
+        return self._tab.call_method("Network.deleteCookies", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables network tracking, prevents network events from being sent to the client."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.disable", _timeout=_timeout)
+
+    def emulateNetworkConditions(self, *args, offline=REQUIRED, latency=REQUIRED, downloadThroughput=REQUIRED,
+                                 uploadThroughput=REQUIRED, connectionType=None, packetLoss=None,
+                                 packetQueueLength=None, packetReordering=None, _timeout=None, **unknown):
+        """Activates emulation of network conditions."""
+        invalid = args or unknown or offline is REQUIRED or latency is REQUIRED
+        if invalid or downloadThroughput is REQUIRED or uploadThroughput is REQUIRED:
+            return self._invalid("emulateNetworkConditions", args, unknown, _timeout, {
+                "offline": offline, "latency": latency, "downloadThroughput": downloadThroughput,
+                "uploadThroughput": uploadThroughput, "connectionType": connectionType, "packetLoss": packetLoss,
+                "packetQueueLength": packetQueueLength, "packetReordering": packetReordering})
+        params = {"offline": offline, "latency": latency, "downloadThroughput": downloadThroughput,
+                  "uploadThroughput": uploadThroughput}
+        if connectionType is not None:
+            params["connectionType"] = connectionType
+        if packetLoss is not None:
+            params["packetLoss"] = packetLoss
+        if packetQueueLength is not None:
+            params["packetQueueLength"] = packetQueueLength
+        if packetReordering is not None:
+            params["packetReordering"] = packetReordering
+        return self._tab.call_method("Network.emulateNetworkConditions", _timeout=_timeout, **params)
+
+    def enable(self, *args, maxTotalBufferSize=None, maxResourceBufferSize=None, maxPostDataSize=None,
+               reportDirectSocketTraffic=None, enableDurableMessages=None, _timeout=None, **unknown):
+        """Enables network tracking, network events will now be delivered to the client."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {
+                "maxTotalBufferSize": maxTotalBufferSize, "maxResourceBufferSize": maxResourceBufferSize,
+                "maxPostDataSize": maxPostDataSize, "reportDirectSocketTraffic": reportDirectSocketTraffic,
+                "enableDurableMessages": enableDurableMessages})
+        params = {}
+        if maxTotalBufferSize is not None:
+            params["maxTotalBufferSize"] = maxTotalBufferSize
+        if maxResourceBufferSize is not None:
+            params["maxResourceBufferSize"] = maxResourceBufferSize
+        if maxPostDataSize is not None:
+            params["maxPostDataSize"] = maxPostDataSize
+        if reportDirectSocketTraffic is not None:
+            params["reportDirectSocketTraffic"] = reportDirectSocketTraffic
+        if enableDurableMessages is not None:
+            params["enableDurableMessages"] = enableDurableMessages
+        return self._tab.call_method("Network.enable", _timeout=_timeout, **params)
+
+    def getAllCookies(self, *args, _timeout=None, **unknown):
+        """(deprecated) Returns all browser cookies."""
+        if args or unknown:
+            return self._invalid("getAllCookies", args, unknown, _timeout, {})
+        return self._tab.call_method("Network.getAllCookies", _timeout=_timeout)
+
+    def getCertificate(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns the DER-encoded certificate."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("getCertificate", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Network.getCertificate", _timeout=_timeout, origin=origin)
+
+    def getCookies(self, *args, urls=None, _timeout=None, **unknown):
+        """Returns all browser cookies for the current URL."""
+        if args or unknown:
+            return self._invalid("getCookies", args, unknown, _timeout, {"urls": urls})
+        params = {}
+        if urls is not None:
+            params["urls"] = urls
+        return self._tab.call_method("Network.getCookies", _timeout=_timeout, **params)
+
+    def getResponseBody(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """Returns content served for the given request."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("getResponseBody", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Network.getResponseBody", _timeout=_timeout, requestId=requestId)
+
+    def getRequestPostData(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """Returns post data sent with the request."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("getRequestPostData", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Network.getRequestPostData", _timeout=_timeout, requestId=requestId)
+
+    def getResponseBodyForInterception(self, *args, interceptionId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns content served for the given currently intercepted request."""
+        if args or unknown or interceptionId is REQUIRED:
+            return self._invalid("getResponseBodyForInterception", args, unknown, _timeout, {
+                "interceptionId": interceptionId})
+        return self._tab.call_method("Network.getResponseBodyForInterception", _timeout=_timeout,
+                                     interceptionId=interceptionId)
+
+    def takeResponseBodyForInterceptionAsStream(self, *args, interceptionId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns a handle to the stream representing the response body."""
+        if args or unknown or interceptionId is REQUIRED:
+            return self._invalid("takeResponseBodyForInterceptionAsStream", args, unknown, _timeout, {
+                "interceptionId": interceptionId})
+        return self._tab.call_method("Network.takeResponseBodyForInterceptionAsStream", _timeout=_timeout,
+                                     interceptionId=interceptionId)
+
+    def replayXHR(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) This method sends a new XMLHttpRequest which is identical to the original one."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("replayXHR", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Network.replayXHR", _timeout=_timeout, requestId=requestId)
+
+    def searchInResponseBody(self, *args, requestId=REQUIRED, query=REQUIRED, caseSensitive=None, isRegex=None,
+                             _timeout=None, **unknown):
+        """(experimental) Searches for given string in response content."""
+        if args or unknown or requestId is REQUIRED or query is REQUIRED:
+            return self._invalid("searchInResponseBody", args, unknown, _timeout, {
+                "requestId": requestId, "query": query, "caseSensitive": caseSensitive, "isRegex": isRegex})
+        params = {"requestId": requestId, "query": query}
+        if caseSensitive is not None:
+            params["caseSensitive"] = caseSensitive
+        if isRegex is not None:
+            params["isRegex"] = isRegex
+        return self._tab.call_method("Network.searchInResponseBody", _timeout=_timeout, **params)
+
+    def setBlockedURLs(self, *args, urls=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Blocks URLs from loading."""
+        if args or unknown or urls is REQUIRED:
+            return self._invalid("setBlockedURLs", args, unknown, _timeout, {"urls": urls})
+        return self._tab.call_method("Network.setBlockedURLs", _timeout=_timeout, urls=urls)
+
+    def setBypassServiceWorker(self, *args, bypass=REQUIRED, _timeout=None, **unknown):
+        """Toggles ignoring of service worker for each request."""
+        if args or unknown or bypass is REQUIRED:
+            return self._invalid("setBypassServiceWorker", args, unknown, _timeout, {"bypass": bypass})
+        return self._tab.call_method("Network.setBypassServiceWorker", _timeout=_timeout, bypass=bypass)
+
+    def setCacheDisabled(self, *args, cacheDisabled=REQUIRED, _timeout=None, **unknown):
+        """Toggles ignoring cache for each request."""
+        if args or unknown or cacheDisabled is REQUIRED:
+            return self._invalid("setCacheDisabled", args, unknown, _timeout, {"cacheDisabled": cacheDisabled})
+        return self._tab.call_method("Network.setCacheDisabled", _timeout=_timeout, cacheDisabled=cacheDisabled)
+
+    def setCookie(self, *args, name=REQUIRED, value=REQUIRED, url=None, domain=None, path=None, secure=None,
+                  httpOnly=None, sameSite=None, expires=None, priority=None, sameParty=None, sourceScheme=None,
+                  sourcePort=None, partitionKey=None, _timeout=None, **unknown):
+        """Sets a cookie with the given cookie data; may overwrite equivalent cookies if they exist."""
+        if args or unknown or name is REQUIRED or value is REQUIRED:
+            return self._invalid("setCookie", args, unknown, _timeout, {
+                "name": name, "value": value, "url": url, "domain": domain, "path": path, "secure": secure,
+                "httpOnly": httpOnly, "sameSite": sameSite, "expires": expires, "priority": priority,
+                "sameParty": sameParty, "sourceScheme": sourceScheme, "sourcePort": sourcePort,
+                "partitionKey": partitionKey})
+        params = {"name": name, "value": value}
+        if url is not None:
+            params["url"] = url
+        if domain is not None:
+            params["domain"] = domain
+        if path is not None:
+            params["path"] = path
+        if secure is not None:
+            params["secure"] = secure
+        if httpOnly is not None:
+            params["httpOnly"] = httpOnly
+        if sameSite is not None:
+            params["sameSite"] = sameSite
+        if expires is not None:
+            params["expires"] = expires
+        if priority is not None:
+            params["priority"] = priority
+        if sameParty is not None:
+            params["sameParty"] = sameParty
+        if sourceScheme is not None:
+            params["sourceScheme"] = sourceScheme
+        if sourcePort is not None:
+            params["sourcePort"] = sourcePort
+        if partitionKey is not None:
+            params["partitionKey"] = partitionKey
+        return self._tab.call_method("Network.setCookie", _timeout=_timeout, **params)
+
+    def setCookies(self, *args, cookies=REQUIRED, _timeout=None, **unknown):
+        """Sets given cookies."""
+        if args or unknown or cookies is REQUIRED:
+            return self._invalid("setCookies", args, unknown, _timeout, {"cookies": cookies})
+        return self._tab.call_method("Network.setCookies", _timeout=_timeout, cookies=cookies)
+
+    def setExtraHTTPHeaders(self, *args, headers=REQUIRED, _timeout=None, **unknown):
+        """Specifies whether to always send extra HTTP headers with the requests from this page."""
+        if args or unknown or headers is REQUIRED:
+            return self._invalid("setExtraHTTPHeaders", args, unknown, _timeout, {"headers": headers})
+        return self._tab.call_method("Network.setExtraHTTPHeaders", _timeout=_timeout, headers=headers)
+
+    def setAttachDebugStack(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Specifies whether to attach a page script stack id in requests"""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setAttachDebugStack", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Network.setAttachDebugStack", _timeout=_timeout, enabled=enabled)
+
+    def setRequestInterception(self, *args, patterns=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Sets the requests to intercept that match the provided patterns and optionally resource types."""
+        if args or unknown or patterns is REQUIRED:
+            return self._invalid("setRequestInterception", args, unknown, _timeout, {"patterns": patterns})
+        return self._tab.call_method("Network.setRequestInterception", _timeout=_timeout, patterns=patterns)
+
+    def setUserAgentOverride(self, *args, userAgent=REQUIRED, acceptLanguage=None, platform=None,
+                             userAgentMetadata=None, _timeout=None, **unknown):
+        """Allows overriding user agent with the given string."""
+        if args or unknown or userAgent is REQUIRED:
+            return self._invalid("setUserAgentOverride", args, unknown, _timeout, {
+                "userAgent": userAgent, "acceptLanguage": acceptLanguage, "platform": platform,
+                "userAgentMetadata": userAgentMetadata})
+        params = {"userAgent": userAgent}
+        if acceptLanguage is not None:
+            params["acceptLanguage"] = acceptLanguage
+        if platform is not None:
+            params["platform"] = platform
+        if userAgentMetadata is not None:
+            params["userAgentMetadata"] = userAgentMetadata
+        return self._tab.call_method("Network.setUserAgentOverride", _timeout=_timeout, **params)
+
+    def streamResourceContent(self, *args, requestId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables streaming of the response for the given requestId."""
+        if args or unknown or requestId is REQUIRED:
+            return self._invalid("streamResourceContent", args, unknown, _timeout, {"requestId": requestId})
+        return self._tab.call_method("Network.streamResourceContent", _timeout=_timeout, requestId=requestId)
+
+    def getSecurityIsolationStatus(self, *args, frameId=None, _timeout=None, **unknown):
+        """(experimental) Returns information about the COEP/COOP isolation status."""
+        if args or unknown:
+            return self._invalid("getSecurityIsolationStatus", args, unknown, _timeout, {"frameId": frameId})
+        params = {}
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Network.getSecurityIsolationStatus", _timeout=_timeout, **params)
+
+    def enableReportingApi(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables tracking for the Reporting API, events generated by the Reporting API will now be delivered to the client."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("enableReportingApi", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("Network.enableReportingApi", _timeout=_timeout, enable=enable)
+
+    def loadNetworkResource(self, *args, url=REQUIRED, options=REQUIRED, frameId=None, _timeout=None, **unknown):
+        """(experimental) Fetches the resource and returns the content."""
+        if args or unknown or url is REQUIRED or options is REQUIRED:
+            return self._invalid("loadNetworkResource", args, unknown, _timeout, {
+                "url": url, "options": options, "frameId": frameId})
+        params = {"url": url, "options": options}
+        if frameId is not None:
+            params["frameId"] = frameId
+        return self._tab.call_method("Network.loadNetworkResource", _timeout=_timeout, **params)
+
+    def setCookieControls(self, *args, enableThirdPartyCookieRestriction=REQUIRED,
+                          disableThirdPartyCookieMetadata=REQUIRED, disableThirdPartyCookieHeuristics=REQUIRED,
+                          _timeout=None, **unknown):
+        """(experimental) Sets Controls for third-party cookie access Page reload is required before the new cookie behavior will be observed"""
+        invalid = args or unknown or enableThirdPartyCookieRestriction is REQUIRED
+        invalid = invalid or disableThirdPartyCookieMetadata is REQUIRED
+        if invalid or disableThirdPartyCookieHeuristics is REQUIRED:
+            return self._invalid("setCookieControls", args, unknown, _timeout, {
+                "enableThirdPartyCookieRestriction": enableThirdPartyCookieRestriction,
+                "disableThirdPartyCookieMetadata": disableThirdPartyCookieMetadata,
+                "disableThirdPartyCookieHeuristics": disableThirdPartyCookieHeuristics})
+        return self._tab.call_method("Network.setCookieControls", _timeout=_timeout,
+                                     enableThirdPartyCookieRestriction=enableThirdPartyCookieRestriction,
+                                     disableThirdPartyCookieMetadata=disableThirdPartyCookieMetadata,
+                                     disableThirdPartyCookieHeuristics=disableThirdPartyCookieHeuristics)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Overlay(Domain):
+    """This domain provides various functionality related to drawing atop the inspected page."""
+
+    __slots__ = ()
+
+    _name = "Overlay"
+    _events = frozenset([
+        "inspectModeCanceled", "inspectNodeRequested", "nodeHighlightRequested", "screenshotRequested"])
+
+    INSPECT_MODE_CANCELED = "Overlay.inspectModeCanceled"
+    INSPECT_NODE_REQUESTED = "Overlay.inspectNodeRequested"
+    NODE_HIGHLIGHT_REQUESTED = "Overlay.nodeHighlightRequested"
+    SCREENSHOT_REQUESTED = "Overlay.screenshotRequested"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables domain notifications."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Overlay.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables domain notifications."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Overlay.enable", _timeout=_timeout)
+
+    def getHighlightObjectForTest(self, *args, nodeId=REQUIRED, includeDistance=None, includeStyle=None,
+                                  colorFormat=None, showAccessibilityInfo=None, _timeout=None, **unknown):
+        """For testing."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getHighlightObjectForTest", args, unknown, _timeout, {
+                "nodeId": nodeId, "includeDistance": includeDistance, "includeStyle": includeStyle,
+                "colorFormat": colorFormat, "showAccessibilityInfo": showAccessibilityInfo})
+        params = {"nodeId": nodeId}
+        if includeDistance is not None:
+            params["includeDistance"] = includeDistance
+        if includeStyle is not None:
+            params["includeStyle"] = includeStyle
+        if colorFormat is not None:
+            params["colorFormat"] = colorFormat
+        if showAccessibilityInfo is not None:
+            params["showAccessibilityInfo"] = showAccessibilityInfo
+        return self._tab.call_method("Overlay.getHighlightObjectForTest", _timeout=_timeout, **params)
+
+    def getGridHighlightObjectsForTest(self, *args, nodeIds=REQUIRED, _timeout=None, **unknown):
+        """For Persistent Grid testing."""
+        if args or unknown or nodeIds is REQUIRED:
+            return self._invalid("getGridHighlightObjectsForTest", args, unknown, _timeout, {"nodeIds": nodeIds})
+        return self._tab.call_method("Overlay.getGridHighlightObjectsForTest", _timeout=_timeout, nodeIds=nodeIds)
+
+    def getSourceOrderHighlightObjectForTest(self, *args, nodeId=REQUIRED, _timeout=None, **unknown):
+        """For Source Order Viewer testing."""
+        if args or unknown or nodeId is REQUIRED:
+            return self._invalid("getSourceOrderHighlightObjectForTest", args, unknown, _timeout, {"nodeId": nodeId})
+        return self._tab.call_method("Overlay.getSourceOrderHighlightObjectForTest", _timeout=_timeout, nodeId=nodeId)
+
+    def hideHighlight(self, *args, _timeout=None, **unknown):
+        """Hides any highlight."""
+        if args or unknown:
+            return self._invalid("hideHighlight", args, unknown, _timeout, {})
+        return self._tab.call_method("Overlay.hideHighlight", _timeout=_timeout)
+
+    def highlightFrame(self, *args, frameId=REQUIRED, contentColor=None, contentOutlineColor=None, _timeout=None,
+                       **unknown):
+        """(deprecated) Highlights owner element of the frame with given id."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("highlightFrame", args, unknown, _timeout, {
+                "frameId": frameId, "contentColor": contentColor, "contentOutlineColor": contentOutlineColor})
+        params = {"frameId": frameId}
+        if contentColor is not None:
+            params["contentColor"] = contentColor
+        if contentOutlineColor is not None:
+            params["contentOutlineColor"] = contentOutlineColor
+        return self._tab.call_method("Overlay.highlightFrame", _timeout=_timeout, **params)
+
+    def highlightNode(self, *args, highlightConfig=REQUIRED, nodeId=None, backendNodeId=None, objectId=None,
+                      selector=None, _timeout=None, **unknown):
+        """Highlights DOM node with given id or with the given JavaScript object wrapper."""
+        if args or unknown or highlightConfig is REQUIRED:
+            return self._invalid("highlightNode", args, unknown, _timeout, {
+                "highlightConfig": highlightConfig, "nodeId": nodeId, "backendNodeId": backendNodeId,
+                "objectId": objectId, "selector": selector})
+        params = {"highlightConfig": highlightConfig}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        if selector is not None:
+            params["selector"] = selector
+        return self._tab.call_method("Overlay.highlightNode", _timeout=_timeout, **params)
+
+    def highlightQuad(self, *args, quad=REQUIRED, color=None, outlineColor=None, _timeout=None, **unknown):
+        """Highlights given quad."""
+        if args or unknown or quad is REQUIRED:
+            return self._invalid("highlightQuad", args, unknown, _timeout, {
+                "quad": quad, "color": color, "outlineColor": outlineColor})
+        params = {"quad": quad}
+        if color is not None:
+            params["color"] = color
+        if outlineColor is not None:
+            params["outlineColor"] = outlineColor
+        return self._tab.call_method("Overlay.highlightQuad", _timeout=_timeout, **params)
+
+    def highlightRect(self, *args, x=REQUIRED, y=REQUIRED, width=REQUIRED, height=REQUIRED, color=None,
+                      outlineColor=None, _timeout=None, **unknown):
+        """Highlights given rectangle."""
+        if args or unknown or x is REQUIRED or y is REQUIRED or width is REQUIRED or height is REQUIRED:
+            return self._invalid("highlightRect", args, unknown, _timeout, {
+                "x": x, "y": y, "width": width, "height": height, "color": color, "outlineColor": outlineColor})
+        params = {"x": x, "y": y, "width": width, "height": height}
+        if color is not None:
+            params["color"] = color
+        if outlineColor is not None:
+            params["outlineColor"] = outlineColor
+        return self._tab.call_method("Overlay.highlightRect", _timeout=_timeout, **params)
+
+    def highlightSourceOrder(self, *args, sourceOrderConfig=REQUIRED, nodeId=None, backendNodeId=None, objectId=None,
+                             _timeout=None, **unknown):
+        """Highlights the source order of the children of the DOM node with given id or with the given JavaScript object wrapper."""
+        if args or unknown or sourceOrderConfig is REQUIRED:
+            return self._invalid("highlightSourceOrder", args, unknown, _timeout, {
+                "sourceOrderConfig": sourceOrderConfig, "nodeId": nodeId, "backendNodeId": backendNodeId,
+                "objectId": objectId})
+        params = {"sourceOrderConfig": sourceOrderConfig}
+        if nodeId is not None:
+            params["nodeId"] = nodeId
+        if backendNodeId is not None:
+            params["backendNodeId"] = backendNodeId
+        if objectId is not None:
+            params["objectId"] = objectId
+        return self._tab.call_method("Overlay.highlightSourceOrder", _timeout=_timeout, **params)
+
+    def setInspectMode(self, *args, mode=REQUIRED, highlightConfig=None, _timeout=None, **unknown):
+        """Enters the 'inspect' mode."""
+        if args or unknown or mode is REQUIRED:
+            return self._invalid("setInspectMode", args, unknown, _timeout, {
+                "mode": mode, "highlightConfig": highlightConfig})
+        params = {"mode": mode}
+        if highlightConfig is not None:
+            params["highlightConfig"] = highlightConfig
+        return self._tab.call_method("Overlay.setInspectMode", _timeout=_timeout, **params)
+
+    def setShowAdHighlights(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """Highlights owner element of all frames detected to be ads."""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowAdHighlights", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowAdHighlights", _timeout=_timeout, show=show)
+
+    def setPausedInDebuggerMessage(self, *args, message=None, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("setPausedInDebuggerMessage", args, unknown, _timeout, {"message": message})
+        params = {}
+        if message is not None:
+            params["message"] = message
+        return self._tab.call_method("Overlay.setPausedInDebuggerMessage", _timeout=_timeout, **params)
+
+    def setShowDebugBorders(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """Requests that backend shows debug borders on layers"""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowDebugBorders", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowDebugBorders", _timeout=_timeout, show=show)
+
+    def setShowFPSCounter(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """Requests that backend shows the FPS counter"""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowFPSCounter", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowFPSCounter", _timeout=_timeout, show=show)
+
+    def setShowGridOverlays(self, *args, gridNodeHighlightConfigs=REQUIRED, _timeout=None, **unknown):
+        """Highlight multiple elements with the CSS Grid overlay."""
+        if args or unknown or gridNodeHighlightConfigs is REQUIRED:
+            return self._invalid("setShowGridOverlays", args, unknown, _timeout, {
+                "gridNodeHighlightConfigs": gridNodeHighlightConfigs})
+        return self._tab.call_method("Overlay.setShowGridOverlays", _timeout=_timeout,
+                                     gridNodeHighlightConfigs=gridNodeHighlightConfigs)
+
+    def setShowFlexOverlays(self, *args, flexNodeHighlightConfigs=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or flexNodeHighlightConfigs is REQUIRED:
+            return self._invalid("setShowFlexOverlays", args, unknown, _timeout, {
+                "flexNodeHighlightConfigs": flexNodeHighlightConfigs})
+        return self._tab.call_method("Overlay.setShowFlexOverlays", _timeout=_timeout,
+                                     flexNodeHighlightConfigs=flexNodeHighlightConfigs)
+
+    def setShowScrollSnapOverlays(self, *args, scrollSnapHighlightConfigs=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or scrollSnapHighlightConfigs is REQUIRED:
+            return self._invalid("setShowScrollSnapOverlays", args, unknown, _timeout, {
+                "scrollSnapHighlightConfigs": scrollSnapHighlightConfigs})
+        return self._tab.call_method("Overlay.setShowScrollSnapOverlays", _timeout=_timeout,
+                                     scrollSnapHighlightConfigs=scrollSnapHighlightConfigs)
+
+    def setShowContainerQueryOverlays(self, *args, containerQueryHighlightConfigs=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or containerQueryHighlightConfigs is REQUIRED:
+            return self._invalid("setShowContainerQueryOverlays", args, unknown, _timeout, {
+                "containerQueryHighlightConfigs": containerQueryHighlightConfigs})
+        return self._tab.call_method("Overlay.setShowContainerQueryOverlays", _timeout=_timeout,
+                                     containerQueryHighlightConfigs=containerQueryHighlightConfigs)
+
+    def setShowPaintRects(self, *args, result=REQUIRED, _timeout=None, **unknown):
+        """Requests that backend shows paint rectangles"""
+        if args or unknown or result is REQUIRED:
+            return self._invalid("setShowPaintRects", args, unknown, _timeout, {"result": result})
+        return self._tab.call_method("Overlay.setShowPaintRects", _timeout=_timeout, result=result)
+
+    def setShowLayoutShiftRegions(self, *args, result=REQUIRED, _timeout=None, **unknown):
+        """Requests that backend shows layout shift regions"""
+        if args or unknown or result is REQUIRED:
+            return self._invalid("setShowLayoutShiftRegions", args, unknown, _timeout, {"result": result})
+        return self._tab.call_method("Overlay.setShowLayoutShiftRegions", _timeout=_timeout, result=result)
+
+    def setShowScrollBottleneckRects(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """Requests that backend shows scroll bottleneck rects"""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowScrollBottleneckRects", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowScrollBottleneckRects", _timeout=_timeout, show=show)
+
+    def setShowHitTestBorders(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """(deprecated) Deprecated, no longer has any effect."""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowHitTestBorders", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowHitTestBorders", _timeout=_timeout, show=show)
+
+    def setShowWebVitals(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """(deprecated) Deprecated, no longer has any effect."""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowWebVitals", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowWebVitals", _timeout=_timeout, show=show)
+
+    def setShowViewportSizeOnResize(self, *args, show=REQUIRED, _timeout=None, **unknown):
+        """Paints viewport size upon main frame resize."""
+        if args or unknown or show is REQUIRED:
+            return self._invalid("setShowViewportSizeOnResize", args, unknown, _timeout, {"show": show})
+        return self._tab.call_method("Overlay.setShowViewportSizeOnResize", _timeout=_timeout, show=show)
+
+    def setShowHinge(self, *args, hingeConfig=None, _timeout=None, **unknown):
+        """Add a dual screen device hinge"""
+        if args or unknown:
+            return self._invalid("setShowHinge", args, unknown, _timeout, {"hingeConfig": hingeConfig})
+        params = {}
+        if hingeConfig is not None:
+            params["hingeConfig"] = hingeConfig
+        return self._tab.call_method("Overlay.setShowHinge", _timeout=_timeout, **params)
+
+    def setShowIsolatedElements(self, *args, isolatedElementHighlightConfigs=REQUIRED, _timeout=None, **unknown):
+        """Show elements in isolation mode with overlays."""
+        if args or unknown or isolatedElementHighlightConfigs is REQUIRED:
+            return self._invalid("setShowIsolatedElements", args, unknown, _timeout, {
+                "isolatedElementHighlightConfigs": isolatedElementHighlightConfigs})
+        return self._tab.call_method("Overlay.setShowIsolatedElements", _timeout=_timeout,
+                                     isolatedElementHighlightConfigs=isolatedElementHighlightConfigs)
+
+    def setShowWindowControlsOverlay(self, *args, windowControlsOverlayConfig=None, _timeout=None, **unknown):
+        """Show Window Controls Overlay for PWA"""
+        if args or unknown:
+            return self._invalid("setShowWindowControlsOverlay", args, unknown, _timeout, {
+                "windowControlsOverlayConfig": windowControlsOverlayConfig})
+        params = {}
+        if windowControlsOverlayConfig is not None:
+            params["windowControlsOverlayConfig"] = windowControlsOverlayConfig
+        return self._tab.call_method("Overlay.setShowWindowControlsOverlay", _timeout=_timeout, **params)
@@ -0,0 +1,599 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Page(Domain):
+    """Actions and events related to the inspected page belong to the page domain."""
+
+    __slots__ = ()
+
+    _name = "Page"
+    _events = frozenset([
+        "backForwardCacheNotUsed", "compilationCacheProduced", "documentOpened", "domContentEventFired",
+        "downloadProgress", "downloadWillBegin", "fileChooserOpened", "frameAttached",
+        "frameClearedScheduledNavigation", "frameDetached", "frameNavigated", "frameRequestedNavigation",
+        "frameResized", "frameScheduledNavigation", "frameStartedLoading", "frameStartedNavigating",
+        "frameStoppedLoading", "frameSubtreeWillBeDetached", "interstitialHidden", "interstitialShown",
+        "javascriptDialogClosed", "javascriptDialogOpening", "lifecycleEvent", "loadEventFired",
+        "navigatedWithinDocument", "screencastFrame", "screencastVisibilityChanged", "windowOpen"])
+
+    BACK_FORWARD_CACHE_NOT_USED = "Page.backForwardCacheNotUsed"
+    COMPILATION_CACHE_PRODUCED = "Page.compilationCacheProduced"
+    DOCUMENT_OPENED = "Page.documentOpened"
+    DOM_CONTENT_EVENT_FIRED = "Page.domContentEventFired"
+    DOWNLOAD_PROGRESS = "Page.downloadProgress"
+    DOWNLOAD_WILL_BEGIN = "Page.downloadWillBegin"
+    FILE_CHOOSER_OPENED = "Page.fileChooserOpened"
+    FRAME_ATTACHED = "Page.frameAttached"
+    FRAME_CLEARED_SCHEDULED_NAVIGATION = "Page.frameClearedScheduledNavigation"
+    FRAME_DETACHED = "Page.frameDetached"
+    FRAME_NAVIGATED = "Page.frameNavigated"
+    FRAME_REQUESTED_NAVIGATION = "Page.frameRequestedNavigation"
+    FRAME_RESIZED = "Page.frameResized"
+    FRAME_SCHEDULED_NAVIGATION = "Page.frameScheduledNavigation"
+    FRAME_STARTED_LOADING = "Page.frameStartedLoading"
+    FRAME_STARTED_NAVIGATING = "Page.frameStartedNavigating"
+    FRAME_STOPPED_LOADING = "Page.frameStoppedLoading"
+    FRAME_SUBTREE_WILL_BE_DETACHED = "Page.frameSubtreeWillBeDetached"
+    INTERSTITIAL_HIDDEN = "Page.interstitialHidden"
+    INTERSTITIAL_SHOWN = "Page.interstitialShown"
+    JAVASCRIPT_DIALOG_CLOSED = "Page.javascriptDialogClosed"
+    JAVASCRIPT_DIALOG_OPENING = "Page.javascriptDialogOpening"
+    LIFECYCLE_EVENT = "Page.lifecycleEvent"
+    LOAD_EVENT_FIRED = "Page.loadEventFired"
+    NAVIGATED_WITHIN_DOCUMENT = "Page.navigatedWithinDocument"
+    SCREENCAST_FRAME = "Page.screencastFrame"
+    SCREENCAST_VISIBILITY_CHANGED = "Page.screencastVisibilityChanged"
+    WINDOW_OPEN = "Page.windowOpen"
+
+    def addScriptToEvaluateOnLoad(self, *args, scriptSource=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Deprecated, please use addScriptToEvaluateOnNewDocument instead."""
+        if args or unknown or scriptSource is REQUIRED:
+            return self._invalid("addScriptToEvaluateOnLoad", args, unknown, _timeout, {"scriptSource": scriptSource})
+        return self._tab.call_method("Page.addScriptToEvaluateOnLoad", _timeout=_timeout, scriptSource=scriptSource)
+
+    def addScriptToEvaluateOnNewDocument(self, *args, source=REQUIRED, worldName=None, includeCommandLineAPI=None,
+                                         runImmediately=None, _timeout=None, **unknown):
+        """Evaluates given script in every frame upon creation (before loading frame's scripts)."""
+        if args or unknown or source is REQUIRED:
+            return self._invalid("addScriptToEvaluateOnNewDocument", args, unknown, _timeout, {
+                "source": source, "worldName": worldName, "includeCommandLineAPI": includeCommandLineAPI,
+                "runImmediately": runImmediately})
+        params = {"source": source}
+        if worldName is not None:
+            params["worldName"] = worldName
+        if includeCommandLineAPI is not None:
+            params["includeCommandLineAPI"] = includeCommandLineAPI
+        if runImmediately is not None:
+            params["runImmediately"] = runImmediately
+        return self._tab.call_method("Page.addScriptToEvaluateOnNewDocument", _timeout=_timeout, **params)
+
+    def bringToFront(self, *args, _timeout=None, **unknown):
+        """Brings page to front (activates tab)."""
+        if args or unknown:
+            return self._invalid("bringToFront", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.bringToFront", _timeout=_timeout)
+
+    def captureScreenshot(self, *args, format=None, quality=None, clip=None, fromSurface=None,
+                          captureBeyondViewport=None, optimizeForSpeed=None, _timeout=None, **unknown):
+        """Capture page screenshot."""
+        if args or unknown:
+            return self._invalid("captureScreenshot", args, unknown, _timeout, {
+                "format": format, "quality": quality, "clip": clip, "fromSurface": fromSurface,
+                "captureBeyondViewport": captureBeyondViewport, "optimizeForSpeed": optimizeForSpeed})
+        params = {}
+        if format is not None:
+            params["format"] = format
+        if quality is not None:
+            params["quality"] = quality
+        if clip is not None:
+            params["clip"] = clip
+        if fromSurface is not None:
+            params["fromSurface"] = fromSurface
+        if captureBeyondViewport is not None:
+            params["captureBeyondViewport"] = captureBeyondViewport
+        if optimizeForSpeed is not None:
+            params["optimizeForSpeed"] = optimizeForSpeed
+        return self._tab.call_method("Page.captureScreenshot", _timeout=_timeout, **params)
+
+    def captureSnapshot(self, *args, format=None, _timeout=None, **unknown):
+        """(experimental) Returns a snapshot of the page as a string."""
+        if args or unknown:
+            return self._invalid("captureSnapshot", args, unknown, _timeout, {"format": format})
+        params = {}
+        if format is not None:
+            params["format"] = format
+        return self._tab.call_method("Page.captureSnapshot", _timeout=_timeout, **params)
+
+    def clearDeviceMetricsOverride(self, *args, _timeout=None, **unknown):
+        """(experimental, deprecated) Clears the overridden device metrics."""
+        if args or unknown:
+            return self._invalid("clearDeviceMetricsOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.clearDeviceMetricsOverride", _timeout=_timeout)
+
+    def clearDeviceOrientationOverride(self, *args, _timeout=None, **unknown):
+        """(experimental, deprecated) Clears the overridden Device Orientation."""
+        if args or unknown:
+            return self._invalid("clearDeviceOrientationOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.clearDeviceOrientationOverride", _timeout=_timeout)
+
+    def clearGeolocationOverride(self, *args, _timeout=None, **unknown):
+        """(deprecated) Clears the overridden Geolocation Position and Error."""
+        if args or unknown:
+            return self._invalid("clearGeolocationOverride", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.clearGeolocationOverride", _timeout=_timeout)
+
+    def createIsolatedWorld(self, *args, frameId=REQUIRED, worldName=None, grantUniveralAccess=None, _timeout=None,
+                            **unknown):
+        """Creates an isolated world for the given frame."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("createIsolatedWorld", args, unknown, _timeout, {
+                "frameId": frameId, "worldName": worldName, "grantUniveralAccess": grantUniveralAccess})
+        params = {"frameId": frameId}
+        if worldName is not None:
+            params["worldName"] = worldName
+        if grantUniveralAccess is not None:
+            params["grantUniveralAccess"] = grantUniveralAccess
+        return self._tab.call_method("Page.createIsolatedWorld", _timeout=_timeout, **params)
+
+    def deleteCookie(self, *args, cookieName=REQUIRED, url=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Deletes browser cookie with given name, domain and path."""
+        if args or unknown or cookieName is REQUIRED or url is REQUIRED:
+            return self._invalid("deleteCookie", args, unknown, _timeout, {"cookieName": cookieName, "url": url})
+        return self._tab.call_method("Page.deleteCookie", _timeout=_timeout, cookieName=cookieName, url=url)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables page domain notifications."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.disable", _timeout=_timeout)
+
+    def enable(self, *args, enableFileChooserOpenedEvent=None, _timeout=None, **unknown):
+        """Enables page domain notifications."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {
+                "enableFileChooserOpenedEvent": enableFileChooserOpenedEvent})
+        params = {}
+        if enableFileChooserOpenedEvent is not None:
+            params["enableFileChooserOpenedEvent"] = enableFileChooserOpenedEvent
+        return self._tab.call_method("Page.enable", _timeout=_timeout, **params)
+
+    def getAppManifest(self, *args, manifestId=None, _timeout=None, **unknown):
+        """Gets the processed manifest for this current document."""
+        if args or unknown:
+            return self._invalid("getAppManifest", args, unknown, _timeout, {"manifestId": manifestId})
+        params = {}
+        if manifestId is not None:
+            params["manifestId"] = manifestId
+        return self._tab.call_method("Page.getAppManifest", _timeout=_timeout, **params)
+
+    def getInstallabilityErrors(self, *args, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown:
+            return self._invalid("getInstallabilityErrors", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getInstallabilityErrors", _timeout=_timeout)
+
+    def getManifestIcons(self, *args, _timeout=None, **unknown):
+        """(experimental, deprecated) Deprecated because it's not guaranteed that the returned icon is in fact the one used for PWA installation."""
+        if args or unknown:
+            return self._invalid("getManifestIcons", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getManifestIcons", _timeout=_timeout)
+
+    def getAppId(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the unique (PWA) app id."""
+        if args or unknown:
+            return self._invalid("getAppId", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getAppId", _timeout=_timeout)
+
+    def getAdScriptAncestry(self, *args, frameId=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("getAdScriptAncestry", args, unknown, _timeout, {"frameId": frameId})
+        return self._tab.call_method("Page.getAdScriptAncestry", _timeout=_timeout, frameId=frameId)
+
+    def getFrameTree(self, *args, _timeout=None, **unknown):
+        """Returns present frame tree structure."""
+        if args or unknown:
+            return self._invalid("getFrameTree", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getFrameTree", _timeout=_timeout)
+
+    def getLayoutMetrics(self, *args, _timeout=None, **unknown):
+        """Returns metrics relating to the layouting of the page, such as viewport bounds/scale."""
+        if args or unknown:
+            return self._invalid("getLayoutMetrics", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getLayoutMetrics", _timeout=_timeout)
+
+    def getNavigationHistory(self, *args, _timeout=None, **unknown):
+        """Returns navigation history for the current page."""
+        if args or unknown:
+            return self._invalid("getNavigationHistory", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getNavigationHistory", _timeout=_timeout)
+
+    def resetNavigationHistory(self, *args, _timeout=None, **unknown):
+        """Resets navigation history for the current page."""
+        if args or unknown:
+            return self._invalid("resetNavigationHistory", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.resetNavigationHistory", _timeout=_timeout)
+
+    def getResourceContent(self, *args, frameId=REQUIRED, url=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Returns content of the given resource."""
+        if args or unknown or frameId is REQUIRED or url is REQUIRED:
+            return self._invalid("getResourceContent", args, unknown, _timeout, {"frameId": frameId, "url": url})
+        return self._tab.call_method("Page.getResourceContent", _timeout=_timeout, frameId=frameId, url=url)
+
+    def getResourceTree(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns present frame / resource tree structure."""
+        if args or unknown:
+            return self._invalid("getResourceTree", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.getResourceTree", _timeout=_timeout)
+
+    def handleJavaScriptDialog(self, *args, accept=REQUIRED, promptText=None, _timeout=None, **unknown):
+        """Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload)."""
+        if args or unknown or accept is REQUIRED:
+            return self._invalid("handleJavaScriptDialog", args, unknown, _timeout, {
+                "accept": accept, "promptText": promptText})
+        params = {"accept": accept}
+        if promptText is not None:
+            params["promptText"] = promptText
+        return self._tab.call_method("Page.handleJavaScriptDialog", _timeout=_timeout, **params)
+
+    def navigate(self, *args, url=REQUIRED, referrer=None, transitionType=None, frameId=None, referrerPolicy=None,
+                 _timeout=None, **unknown):
+        """Navigates current page to the given URL."""
+        if args or unknown or url is REQUIRED:
+            return self._invalid("navigate", args, unknown, _timeout, {
+                "url": url, "referrer": referrer, "transitionType": transitionType, "frameId": frameId,
+                "referrerPolicy": referrerPolicy})
+        params = {"url": url}
+        if referrer is not None:
+            params["referrer"] = referrer
+        if transitionType is not None:
+            params["transitionType"] = transitionType
+        if frameId is not None:
+            params["frameId"] = frameId
+        if referrerPolicy is not None:
+            params["referrerPolicy"] = referrerPolicy
+        return self._tab.call_method("Page.navigate", _timeout=_timeout, **params)
+
+    def navigateToHistoryEntry(self, *args, entryId=REQUIRED, _timeout=None, **unknown):
+        """Navigates current page to the given history entry."""
+        if args or unknown or entryId is REQUIRED:
+            return self._invalid("navigateToHistoryEntry", args, unknown, _timeout, {"entryId": entryId})
+        return self._tab.call_method("Page.navigateToHistoryEntry", _timeout=_timeout, entryId=entryId)
+
+    def printToPDF(self, *args, landscape=None, displayHeaderFooter=None, printBackground=None, scale=None,
+                   paperWidth=None, paperHeight=None, marginTop=None, marginBottom=None, marginLeft=None,
+                   marginRight=None, pageRanges=None, headerTemplate=None, footerTemplate=None, preferCSSPageSize=None,
+                   transferMode=None, generateTaggedPDF=None, generateDocumentOutline=None, _timeout=None, **unknown):
+        """Print page as PDF."""
+        if args or unknown:
+            return self._invalid("printToPDF", args, unknown, _timeout, {
+                "landscape": landscape, "displayHeaderFooter": displayHeaderFooter, "printBackground": printBackground,
+                "scale": scale, "paperWidth": paperWidth, "paperHeight": paperHeight, "marginTop": marginTop,
+                "marginBottom": marginBottom, "marginLeft": marginLeft, "marginRight": marginRight,
+                "pageRanges": pageRanges, "headerTemplate": headerTemplate, "footerTemplate": footerTemplate,
+                "preferCSSPageSize": preferCSSPageSize, "transferMode": transferMode,
+                "generateTaggedPDF": generateTaggedPDF, "generateDocumentOutline": generateDocumentOutline})
+        params = {}
+        if landscape is not None:
+            params["landscape"] = landscape
+        if displayHeaderFooter is not None:
+            params["displayHeaderFooter"] = displayHeaderFooter
+        if printBackground is not None:
+            params["printBackground"] = printBackground
+        if scale is not None:
+            params["scale"] = scale
+        if paperWidth is not None:
+            params["paperWidth"] = paperWidth
+        if paperHeight is not None:
+            params["paperHeight"] = paperHeight
+        if marginTop is not None:
+            params["marginTop"] = marginTop
+        if marginBottom is not None:
+            params["marginBottom"] = marginBottom
+        if marginLeft is not None:
+            params["marginLeft"] = marginLeft
+        if marginRight is not None:
+            params["marginRight"] = marginRight
+        if pageRanges is not None:
+            params["pageRanges"] = pageRanges
+        if headerTemplate is not None:
+            params["headerTemplate"] = headerTemplate
+        if footerTemplate is not None:
+            params["footerTemplate"] = footerTemplate
+        if preferCSSPageSize is not None:
+            params["preferCSSPageSize"] = preferCSSPageSize
+        if transferMode is not None:
+            params["transferMode"] = transferMode
+        if generateTaggedPDF is not None:
+            params["generateTaggedPDF"] = generateTaggedPDF
+        if generateDocumentOutline is not None:
+            params["generateDocumentOutline"] = generateDocumentOutline
+        return self._tab.call_method("Page.printToPDF", _timeout=_timeout, **params)
+
+    def reload(self, *args, ignoreCache=None, scriptToEvaluateOnLoad=None, loaderId=None, _timeout=None, **unknown):
+        """Reloads given page optionally ignoring the cache."""
+        if args or unknown:
+            return self._invalid("reload", args, unknown, _timeout, {
+                "ignoreCache": ignoreCache, "scriptToEvaluateOnLoad": scriptToEvaluateOnLoad, "loaderId": loaderId})
+        params = {}
+        if ignoreCache is not None:
+            params["ignoreCache"] = ignoreCache
+        if scriptToEvaluateOnLoad is not None:
+            params["scriptToEvaluateOnLoad"] = scriptToEvaluateOnLoad
+        if loaderId is not None:
+            params["loaderId"] = loaderId
+        return self._tab.call_method("Page.reload", _timeout=_timeout, **params)
+
+    def removeScriptToEvaluateOnLoad(self, *args, identifier=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Deprecated, please use removeScriptToEvaluateOnNewDocument instead."""
+        if args or unknown or identifier is REQUIRED:
+            return self._invalid("removeScriptToEvaluateOnLoad", args, unknown, _timeout, {"identifier": identifier})
+        return self._tab.call_method("Page.removeScriptToEvaluateOnLoad", _timeout=_timeout, identifier=identifier)
+
+    def removeScriptToEvaluateOnNewDocument(self, *args, identifier=REQUIRED, _timeout=None, **unknown):
+        """Removes given script from the list."""
+        if args or unknown or identifier is REQUIRED:
+            return self._invalid("removeScriptToEvaluateOnNewDocument", args, unknown, _timeout, {
+                "identifier": identifier})
+        return self._tab.call_method("Page.removeScriptToEvaluateOnNewDocument", _timeout=_timeout,
+                                     identifier=identifier)
+
+    def screencastFrameAck(self, *args, sessionId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Acknowledges that a screencast frame has been received by the frontend."""
+        if args or unknown or sessionId is REQUIRED:
+            return self._invalid("screencastFrameAck", args, unknown, _timeout, {"sessionId": sessionId})
+        return self._tab.call_method("Page.screencastFrameAck", _timeout=_timeout, sessionId=sessionId)
+
+    def searchInResource(self, *args, frameId=REQUIRED, url=REQUIRED, query=REQUIRED, caseSensitive=None, isRegex=None,
+                         _timeout=None, **unknown):
+        """(experimental) Searches for given string in resource content."""
+        if args or unknown or frameId is REQUIRED or url is REQUIRED or query is REQUIRED:
+            return self._invalid("searchInResource", args, unknown, _timeout, {
+                "frameId": frameId, "url": url, "query": query, "caseSensitive": caseSensitive, "isRegex": isRegex})
+        params = {"frameId": frameId, "url": url, "query": query}
+        if caseSensitive is not None:
+            params["caseSensitive"] = caseSensitive
+        if isRegex is not None:
+            params["isRegex"] = isRegex
+        return self._tab.call_method("Page.searchInResource", _timeout=_timeout, **params)
+
+    def setAdBlockingEnabled(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enable Chrome's experimental ad filter on all sites."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setAdBlockingEnabled", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Page.setAdBlockingEnabled", _timeout=_timeout, enabled=enabled)
+
+    def setBypassCSP(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """Enable page Content Security Policy by-passing."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setBypassCSP", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Page.setBypassCSP", _timeout=_timeout, enabled=enabled)
+
+    def getPermissionsPolicyState(self, *args, frameId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Get Permissions Policy state on given frame."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("getPermissionsPolicyState", args, unknown, _timeout, {"frameId": frameId})
+        return self._tab.call_method("Page.getPermissionsPolicyState", _timeout=_timeout, frameId=frameId)
+
+    def getOriginTrials(self, *args, frameId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Get Origin Trials on given frame."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("getOriginTrials", args, unknown, _timeout, {"frameId": frameId})
+        return self._tab.call_method("Page.getOriginTrials", _timeout=_timeout, frameId=frameId)
+
+    def setDeviceMetricsOverride(self, *args, width=REQUIRED, height=REQUIRED, deviceScaleFactor=REQUIRED,
+                                 mobile=REQUIRED, scale=None, screenWidth=None, screenHeight=None, positionX=None,
+                                 positionY=None, dontSetVisibleSize=None, screenOrientation=None, viewport=None,
+                                 _timeout=None, **unknown):
+        """(experimental, deprecated) Overrides the values of device screen dimensions (window.screen.width, window.screen.height, window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media query results)."""
+        invalid = args or unknown or width is REQUIRED or height is REQUIRED
+        if invalid or deviceScaleFactor is REQUIRED or mobile is REQUIRED:
+            return self._invalid("setDeviceMetricsOverride", args, unknown, _timeout, {
+                "width": width, "height": height, "deviceScaleFactor": deviceScaleFactor, "mobile": mobile,
+                "scale": scale, "screenWidth": screenWidth, "screenHeight": screenHeight, "positionX": positionX,
+                "positionY": positionY, "dontSetVisibleSize": dontSetVisibleSize,
+                "screenOrientation": screenOrientation, "viewport": viewport})
+        params = {"width": width, "height": height, "deviceScaleFactor": deviceScaleFactor, "mobile": mobile}
+        if scale is not None:
+            params["scale"] = scale
+        if screenWidth is not None:
+            params["screenWidth"] = screenWidth
+        if screenHeight is not None:
+            params["screenHeight"] = screenHeight
+        if positionX is not None:
+            params["positionX"] = positionX
+        if positionY is not None:
+            params["positionY"] = positionY
+        if dontSetVisibleSize is not None:
+            params["dontSetVisibleSize"] = dontSetVisibleSize
+        if screenOrientation is not None:
+            params["screenOrientation"] = screenOrientation
+        if viewport is not None:
+            params["viewport"] = viewport
+        return self._tab.call_method("Page.setDeviceMetricsOverride", _timeout=_timeout, **params)
+
+    def setDeviceOrientationOverride(self, *args, alpha=REQUIRED, beta=REQUIRED, gamma=REQUIRED, _timeout=None,
+                                     **unknown):
+        """(experimental, deprecated) Overrides the Device Orientation."""
+        if args or unknown or alpha is REQUIRED or beta is REQUIRED or gamma is REQUIRED:
+            return self._invalid("setDeviceOrientationOverride", args, unknown, _timeout, {
+                "alpha": alpha, "beta": beta, "gamma": gamma})
+        return self._tab.call_method("Page.setDeviceOrientationOverride", _timeout=_timeout, alpha=alpha, beta=beta,
+                                     gamma=gamma)
+
+    def setFontFamilies(self, *args, fontFamilies=REQUIRED, forScripts=None, _timeout=None, **unknown):
+        """(experimental) Set generic font families."""
+        if args or unknown or fontFamilies is REQUIRED:
+            return self._invalid("setFontFamilies", args, unknown, _timeout, {
+                "fontFamilies": fontFamilies, "forScripts": forScripts})
+        params = {"fontFamilies": fontFamilies}
+        if forScripts is not None:
+            params["forScripts"] = forScripts
+        return self._tab.call_method("Page.setFontFamilies", _timeout=_timeout, **params)
+
+    def setFontSizes(self, *args, fontSizes=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Set default font sizes."""
+        if args or unknown or fontSizes is REQUIRED:
+            return self._invalid("setFontSizes", args, unknown, _timeout, {"fontSizes": fontSizes})
+        return self._tab.call_method("Page.setFontSizes", _timeout=_timeout, fontSizes=fontSizes)
+
+    def setDocumentContent(self, *args, frameId=REQUIRED, html=REQUIRED, _timeout=None, **unknown):
+        """Sets given markup as the document's HTML."""
+        if args or unknown or frameId is REQUIRED or html is REQUIRED:
+            return self._invalid("setDocumentContent", args, unknown, _timeout, {"frameId": frameId, "html": html})
+        return self._tab.call_method("Page.setDocumentContent", _timeout=_timeout, frameId=frameId, html=html)
+
+    def setDownloadBehavior(self, *args, behavior=REQUIRED, downloadPath=None, _timeout=None, **unknown):
+        """(experimental, deprecated) Set the behavior when downloading a file."""
+        if args or unknown or behavior is REQUIRED:
+            return self._invalid("setDownloadBehavior", args, unknown, _timeout, {
+                "behavior": behavior, "downloadPath": downloadPath})
+        params = {"behavior": behavior}
+        if downloadPath is not None:
+            params["downloadPath"] = downloadPath
+        return self._tab.call_method("Page.setDownloadBehavior", _timeout=_timeout, **params)
+
+    def setGeolocationOverride(self, *args, latitude=None, longitude=None, accuracy=None, _timeout=None, **unknown):
+        """(deprecated) Overrides the Geolocation Position or Error."""
+        if args or unknown:
+            return self._invalid("setGeolocationOverride", args, unknown, _timeout, {
+                "latitude": latitude, "longitude": longitude, "accuracy": accuracy})
+        params = {}
+        if latitude is not None:
+            params["latitude"] = latitude
+        if longitude is not None:
+            params["longitude"] = longitude
+        if accuracy is not None:
+            params["accuracy"] = accuracy
+        return self._tab.call_method("Page.setGeolocationOverride", _timeout=_timeout, **params)
+
+    def setLifecycleEventsEnabled(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """Controls whether page will emit lifecycle events."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setLifecycleEventsEnabled", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Page.setLifecycleEventsEnabled", _timeout=_timeout, enabled=enabled)
+
+    def setTouchEmulationEnabled(self, *args, enabled=REQUIRED, configuration=None, _timeout=None, **unknown):
+        """(experimental, deprecated) Toggles mouse event-based touch event emulation."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setTouchEmulationEnabled", args, unknown, _timeout, {
+                "enabled": enabled, "configuration": configuration})
+        params = {"enabled": enabled}
+        if configuration is not None:
+            params["configuration"] = configuration
+        return self._tab.call_method("Page.setTouchEmulationEnabled", _timeout=_timeout, **params)
+
+    def startScreencast(self, *args, format=None, quality=None, maxWidth=None, maxHeight=None, everyNthFrame=None,
+                        _timeout=None, **unknown):
+        """(experimental) Starts sending each frame using the `screencastFrame` event."""
+        if args or unknown:
+            return self._invalid("startScreencast", args, unknown, _timeout, {
+                "format": format, "quality": quality, "maxWidth": maxWidth, "maxHeight": maxHeight,
+                "everyNthFrame": everyNthFrame})
+        params = {}
+        if format is not None:
+            params["format"] = format
+        if quality is not None:
+            params["quality"] = quality
+        if maxWidth is not None:
+            params["maxWidth"] = maxWidth
+        if maxHeight is not None:
+            params["maxHeight"] = maxHeight
+        if everyNthFrame is not None:
+            params["everyNthFrame"] = everyNthFrame
+        return self._tab.call_method("Page.startScreencast", _timeout=_timeout, **params)
+
+    def stopLoading(self, *args, _timeout=None, **unknown):
+        """Force the page stop all navigations and pending resource fetches."""
+        if args or unknown:
+            return self._invalid("stopLoading", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.stopLoading", _timeout=_timeout)
+
+    def crash(self, *args, _timeout=None, **unknown):
+        """(experimental) Crashes renderer on the IO thread, generates minidumps."""
+        if args or unknown:
+            return self._invalid("crash", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.crash", _timeout=_timeout)
+
+    def close(self, *args, _timeout=None, **unknown):
+        """Tries to close page, running its beforeunload hooks, if any."""
+        if args or unknown:
+            return self._invalid("close", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.close", _timeout=_timeout)
+
+    def setWebLifecycleState(self, *args, state=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Tries to update the web lifecycle state of the page."""
+        if args or unknown or state is REQUIRED:
+            return self._invalid("setWebLifecycleState", args, unknown, _timeout, {"state": state})
+        return self._tab.call_method("Page.setWebLifecycleState", _timeout=_timeout, state=state)
+
+    def stopScreencast(self, *args, _timeout=None, **unknown):
+        """(experimental) Stops sending each frame in the `screencastFrame`."""
+        if args or unknown:
+            return self._invalid("stopScreencast", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.stopScreencast", _timeout=_timeout)
+
+    def produceCompilationCache(self, *args, scripts=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Requests backend to produce compilation cache for the specified scripts."""
+        if args or unknown or scripts is REQUIRED:
+            return self._invalid("produceCompilationCache", args, unknown, _timeout, {"scripts": scripts})
+        return self._tab.call_method("Page.produceCompilationCache", _timeout=_timeout, scripts=scripts)
+
+    def addCompilationCache(self, *args, url=REQUIRED, data=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Seeds compilation cache for given url."""
+        if args or unknown or url is REQUIRED or data is REQUIRED:
+            return self._invalid("addCompilationCache", args, unknown, _timeout, {"url": url, "data": data})
+        return self._tab.call_method("Page.addCompilationCache", _timeout=_timeout, url=url, data=data)
+
+    def clearCompilationCache(self, *args, _timeout=None, **unknown):
+        """(experimental) Clears seeded compilation cache."""
+        if args or unknown:
+            return self._invalid("clearCompilationCache", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.clearCompilationCache", _timeout=_timeout)
+
+    def setSPCTransactionMode(self, *args, mode=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Sets the Secure Payment Confirmation transaction mode."""
+        if args or unknown or mode is REQUIRED:
+            return self._invalid("setSPCTransactionMode", args, unknown, _timeout, {"mode": mode})
+        return self._tab.call_method("Page.setSPCTransactionMode", _timeout=_timeout, mode=mode)
+
+    def setRPHRegistrationMode(self, *args, mode=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Extensions for Custom Handlers API: https://html.spec.whatwg.org/multipage/system-state.html#rph-automation"""
+        if args or unknown or mode is REQUIRED:
+            return self._invalid("setRPHRegistrationMode", args, unknown, _timeout, {"mode": mode})
+        return self._tab.call_method("Page.setRPHRegistrationMode", _timeout=_timeout, mode=mode)
+
+    def generateTestReport(self, *args, message=REQUIRED, group=None, _timeout=None, **unknown):
+        """(experimental) Generates a report for testing."""
+        if args or unknown or message is REQUIRED:
+            return self._invalid("generateTestReport", args, unknown, _timeout, {"message": message, "group": group})
+        params = {"message": message}
+        if group is not None:
+            params["group"] = group
+        return self._tab.call_method("Page.generateTestReport", _timeout=_timeout, **params)
+
+    def waitForDebugger(self, *args, _timeout=None, **unknown):
+        """(experimental) Pauses page execution."""
+        if args or unknown:
+            return self._invalid("waitForDebugger", args, unknown, _timeout, {})
+        return self._tab.call_method("Page.waitForDebugger", _timeout=_timeout)
+
+    def setInterceptFileChooserDialog(self, *args, enabled=REQUIRED, cancel=None, _timeout=None, **unknown):
+        """Intercept file chooser requests and transfer control to protocol clients."""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setInterceptFileChooserDialog", args, unknown, _timeout, {
+                "enabled": enabled, "cancel": cancel})
+        params = {"enabled": enabled}
+        if cancel is not None:
+            params["cancel"] = cancel
+        return self._tab.call_method("Page.setInterceptFileChooserDialog", _timeout=_timeout, **params)
+
+    def setPrerenderingAllowed(self, *args, isAllowed=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enable/disable prerendering manually."""
+        if args or unknown or isAllowed is REQUIRED:
+            return self._invalid("setPrerenderingAllowed", args, unknown, _timeout, {"isAllowed": isAllowed})
+        return self._tab.call_method("Page.setPrerenderingAllowed", _timeout=_timeout, isAllowed=isAllowed)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Performance(Domain):
+    __slots__ = ()
+
+    _name = "Performance"
+    _events = frozenset(["metrics"])
+
+    METRICS = "Performance.metrics"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disable collecting and reporting metrics."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Performance.disable", _timeout=_timeout)
+
+    def enable(self, *args, timeDomain=None, _timeout=None, **unknown):
+        """Enable collecting and reporting metrics."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"timeDomain": timeDomain})
+        params = {}
+        if timeDomain is not None:
+            params["timeDomain"] = timeDomain
+        return self._tab.call_method("Performance.enable", _timeout=_timeout, **params)
+
+    def setTimeDomain(self, *args, timeDomain=REQUIRED, _timeout=None, **unknown):
+        """(experimental, deprecated) Sets time domain to use for collecting and reporting duration metrics."""
+        if args or unknown or timeDomain is REQUIRED:
+            return self._invalid("setTimeDomain", args, unknown, _timeout, {"timeDomain": timeDomain})
+        return self._tab.call_method("Performance.setTimeDomain", _timeout=_timeout, timeDomain=timeDomain)
+
+    def getMetrics(self, *args, _timeout=None, **unknown):
+        """Retrieve current values of run-time metrics."""
+        if args or unknown:
+            return self._invalid("getMetrics", args, unknown, _timeout, {})
+        return self._tab.call_method("Performance.getMetrics", _timeout=_timeout)
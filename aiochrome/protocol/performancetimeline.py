@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class PerformanceTimeline(Domain):
+    """Reporting of performance timeline events, as specified in https://w3c.github.io/performance-timeline/#dom-performanceobserver."""
+
+    __slots__ = ()
+
+    _name = "PerformanceTimeline"
+    _events = frozenset(["timelineEventAdded"])
+
+    TIMELINE_EVENT_ADDED = "PerformanceTimeline.timelineEventAdded"
+
+    def enable(self, *args, eventTypes=REQUIRED, _timeout=None, **unknown):
+        """Previously buffered events would be reported before method returns."""
+        if args or unknown or eventTypes is REQUIRED:
+            return self._invalid("enable", args, unknown, _timeout, {"eventTypes": eventTypes})
+        return self._tab.call_method("PerformanceTimeline.enable", _timeout=_timeout, eventTypes=eventTypes)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Preload(Domain):
+    __slots__ = ()
+
+    _name = "Preload"
+    _events = frozenset([
+        "prefetchStatusUpdated", "preloadEnabledStateUpdated", "preloadingAttemptSourcesUpdated",
+        "prerenderStatusUpdated", "ruleSetRemoved", "ruleSetUpdated"])
+
+    PREFETCH_STATUS_UPDATED = "Preload.prefetchStatusUpdated"
+    PRELOAD_ENABLED_STATE_UPDATED = "Preload.preloadEnabledStateUpdated"
+    PRELOADING_ATTEMPT_SOURCES_UPDATED = "Preload.preloadingAttemptSourcesUpdated"
+    PRERENDER_STATUS_UPDATED = "Preload.prerenderStatusUpdated"
+    RULE_SET_REMOVED = "Preload.ruleSetRemoved"
+    RULE_SET_UPDATED = "Preload.ruleSetUpdated"
+
+    def enable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Preload.enable", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Preload.disable", _timeout=_timeout)
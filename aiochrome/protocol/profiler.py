@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Profiler(Domain):
+    __slots__ = ()
+
+    _name = "Profiler"
+    _events = frozenset(["consoleProfileFinished", "consoleProfileStarted", "preciseCoverageDeltaUpdate"])
+
+    CONSOLE_PROFILE_FINISHED = "Profiler.consoleProfileFinished"
+    CONSOLE_PROFILE_STARTED = "Profiler.consoleProfileStarted"
+    PRECISE_COVERAGE_DELTA_UPDATE = "Profiler.preciseCoverageDeltaUpdate"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.enable", _timeout=_timeout)
+
+    def getBestEffortCoverage(self, *args, _timeout=None, **unknown):
+        """Collect coverage data for the current isolate."""
+        if args or unknown:
+            return self._invalid("getBestEffortCoverage", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.getBestEffortCoverage", _timeout=_timeout)
+
+    def setSamplingInterval(self, *args, interval=REQUIRED, _timeout=None, **unknown):
+        """Changes CPU profiler sampling interval."""
+        if args or unknown or interval is REQUIRED:
+            return self._invalid("setSamplingInterval", args, unknown, _timeout, {"interval": interval})
+        return self._tab.call_method("Profiler.setSamplingInterval", _timeout=_timeout, interval=interval)
+
+    def start(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("start", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.start", _timeout=_timeout)
+
+    def startPreciseCoverage(self, *args, callCount=None, detailed=None, allowTriggeredUpdates=None, _timeout=None,
+                             **unknown):
+        """Enable precise code coverage."""
+        if args or unknown:
+            return self._invalid("startPreciseCoverage", args, unknown, _timeout, {
+                "callCount": callCount, "detailed": detailed, "allowTriggeredUpdates": allowTriggeredUpdates})
+        params = {}
+        if callCount is not None:
+            params["callCount"] = callCount
+        if detailed is not None:
+            params["detailed"] = detailed
+        if allowTriggeredUpdates is not None:
+            params["allowTriggeredUpdates"] = allowTriggeredUpdates
+        return self._tab.call_method("Profiler.startPreciseCoverage", _timeout=_timeout, **params)
+
+    def stop(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("stop", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.stop", _timeout=_timeout)
+
+    def stopPreciseCoverage(self, *args, _timeout=None, **unknown):
+        """Disable precise code coverage."""
+        if args or unknown:
+            return self._invalid("stopPreciseCoverage", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.stopPreciseCoverage", _timeout=_timeout)
+
+    def takePreciseCoverage(self, *args, _timeout=None, **unknown):
+        """Collect coverage data for the current isolate, and resets execution counters."""
+        if args or unknown:
+            return self._invalid("takePreciseCoverage", args, unknown, _timeout, {})
+        return self._tab.call_method("Profiler.takePreciseCoverage", _timeout=_timeout)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class PWA(Domain):
+    """This domain allows interacting with the browser to control PWAs."""
+
+    __slots__ = ()
+
+    _name = "PWA"
+    _events = frozenset([])
+
+    def getOsAppState(self, *args, manifestId=REQUIRED, _timeout=None, **unknown):
+        """Returns the following OS state for the given manifest id."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("getOsAppState", args, unknown, _timeout, {"manifestId": manifestId})
+        return self._tab.call_method("PWA.getOsAppState", _timeout=_timeout, manifestId=manifestId)
+
+    def install(self, *args, manifestId=REQUIRED, installUrlOrBundleUrl=None, _timeout=None, **unknown):
+        """Installs the given manifest identity, optionally using the given installUrlOrBundleUrl IWA-specific install description: manifestId corresponds to isolated-app:// + web_package::SignedWebBundleId File installation mode: The installUrlOrBundleUrl can be either file:// or http(s):// pointing to a signed web bundle (.swbn)."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("install", args, unknown, _timeout, {
+                "manifestId": manifestId, "installUrlOrBundleUrl": installUrlOrBundleUrl})
+        params = {"manifestId": manifestId}
+        if installUrlOrBundleUrl is not None:
+            params["installUrlOrBundleUrl"] = installUrlOrBundleUrl
+        return self._tab.call_method("PWA.install", _timeout=_timeout, **params)
+
+    def uninstall(self, *args, manifestId=REQUIRED, _timeout=None, **unknown):
+        """Uninstalls the given manifest_id and closes any opened app windows."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("uninstall", args, unknown, _timeout, {"manifestId": manifestId})
+        return self._tab.call_method("PWA.uninstall", _timeout=_timeout, manifestId=manifestId)
+
+    def launch(self, *args, manifestId=REQUIRED, url=None, _timeout=None, **unknown):
+        """Launches the installed web app, or an url in the same web app instead of the default start url if it is provided."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("launch", args, unknown, _timeout, {"manifestId": manifestId, "url": url})
+        params = {"manifestId": manifestId}
+        if url is not None:
+            params["url"] = url
+        return self._tab.call_method("PWA.launch", _timeout=_timeout, **params)
+
+    def launchFilesInApp(self, *args, manifestId=REQUIRED, files=REQUIRED, _timeout=None, **unknown):
+        """Opens one or more local files from an installed web app identified by its manifestId."""
+        if args or unknown or manifestId is REQUIRED or files is REQUIRED:
+            return self._invalid("launchFilesInApp", args, unknown, _timeout, {
+                "manifestId": manifestId, "files": files})
+        return self._tab.call_method("PWA.launchFilesInApp", _timeout=_timeout, manifestId=manifestId, files=files)
+
+    def openCurrentPageInApp(self, *args, manifestId=REQUIRED, _timeout=None, **unknown):
+        """Opens the current page in its web app identified by the manifest id, needs to be called on a page target."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("openCurrentPageInApp", args, unknown, _timeout, {"manifestId": manifestId})
+        return self._tab.call_method("PWA.openCurrentPageInApp", _timeout=_timeout, manifestId=manifestId)
+
+    def changeAppUserSettings(self, *args, manifestId=REQUIRED, linkCapturing=None, displayMode=None, _timeout=None,
+                              **unknown):
+        """Changes user settings of the web app identified by its manifestId."""
+        if args or unknown or manifestId is REQUIRED:
+            return self._invalid("changeAppUserSettings", args, unknown, _timeout, {
+                "manifestId": manifestId, "linkCapturing": linkCapturing, "displayMode": displayMode})
+        params = {"manifestId": manifestId}
+        if linkCapturing is not None:
+            params["linkCapturing"] = linkCapturing
+        if displayMode is not None:
+            params["displayMode"] = displayMode
+        return self._tab.call_method("PWA.changeAppUserSettings", _timeout=_timeout, **params)
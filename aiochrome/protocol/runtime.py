@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Runtime(Domain):
+    """Runtime domain exposes JavaScript runtime by means of remote evaluation and mirror objects."""
+
+    __slots__ = ()
+
+    _name = "Runtime"
+    _events = frozenset([
+        "bindingCalled", "consoleAPICalled", "exceptionRevoked", "exceptionThrown", "executionContextCreated",
+        "executionContextDestroyed", "executionContextsCleared", "inspectRequested"])
+
+    BINDING_CALLED = "Runtime.bindingCalled"
+    CONSOLE_API_CALLED = "Runtime.consoleAPICalled"
+    EXCEPTION_REVOKED = "Runtime.exceptionRevoked"
+    EXCEPTION_THROWN = "Runtime.exceptionThrown"
+    EXECUTION_CONTEXT_CREATED = "Runtime.executionContextCreated"
+    EXECUTION_CONTEXT_DESTROYED = "Runtime.executionContextDestroyed"
+    EXECUTION_CONTEXTS_CLEARED = "Runtime.executionContextsCleared"
+    INSPECT_REQUESTED = "Runtime.inspectRequested"
+
+    def awaitPromise(self, *args, promiseObjectId=REQUIRED, returnByValue=None, generatePreview=None, _timeout=None,
+                     **unknown):
+        """Add handler to promise with given promise object id."""
+        if args or unknown or promiseObjectId is REQUIRED:
+            return self._invalid("awaitPromise", args, unknown, _timeout, {
+                "promiseObjectId": promiseObjectId, "returnByValue": returnByValue, "generatePreview": generatePreview})
+        params = {"promiseObjectId": promiseObjectId}
+        if returnByValue is not None:
+            params["returnByValue"] = returnByValue
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        return self._tab.call_method("Runtime.awaitPromise", _timeout=_timeout, **params)
+
+    def callFunctionOn(self, *args, functionDeclaration=REQUIRED, objectId=None, arguments=None, silent=None,
+                       returnByValue=None, generatePreview=None, userGesture=None, awaitPromise=None,
+                       executionContextId=None, objectGroup=None, throwOnSideEffect=None, uniqueContextId=None,
+                       serializationOptions=None, _timeout=None, **unknown):
+        """Calls function with given declaration on the given object."""
+        if args or unknown or functionDeclaration is REQUIRED:
+            return self._invalid("callFunctionOn", args, unknown, _timeout, {
+                "functionDeclaration": functionDeclaration, "objectId": objectId, "arguments": arguments,
+                "silent": silent, "returnByValue": returnByValue, "generatePreview": generatePreview,
+                "userGesture": userGesture, "awaitPromise": awaitPromise, "executionContextId": executionContextId,
+                "objectGroup": objectGroup, "throwOnSideEffect": throwOnSideEffect, "uniqueContextId": uniqueContextId,
+                "serializationOptions": serializationOptions})
+        params = {"functionDeclaration": functionDeclaration}
+        if objectId is not None:
+            params["objectId"] = objectId
+        if arguments is not None:
+            params["arguments"] = arguments
+        if silent is not None:
+            params["silent"] = silent
+        if returnByValue is not None:
+            params["returnByValue"] = returnByValue
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        if userGesture is not None:
+            params["userGesture"] = userGesture
+        if awaitPromise is not None:
+            params["awaitPromise"] = awaitPromise
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        if throwOnSideEffect is not None:
+            params["throwOnSideEffect"] = throwOnSideEffect
+        if uniqueContextId is not None:
+            params["uniqueContextId"] = uniqueContextId
+        if serializationOptions is not None:
+            params["serializationOptions"] = serializationOptions
+        return self._tab.call_method("Runtime.callFunctionOn", _timeout=_timeout, **params)
+
+    def compileScript(self, *args, expression=REQUIRED, sourceURL=REQUIRED, persistScript=REQUIRED,
+                      executionContextId=None, _timeout=None, **unknown):
+        """Compiles expression."""
+        if args or unknown or expression is REQUIRED or sourceURL is REQUIRED or persistScript is REQUIRED:
+            return self._invalid("compileScript", args, unknown, _timeout, {
+                "expression": expression, "sourceURL": sourceURL, "persistScript": persistScript,
+                "executionContextId": executionContextId})
+        params = {"expression": expression, "sourceURL": sourceURL, "persistScript": persistScript}
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        return self._tab.call_method("Runtime.compileScript", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables reporting of execution contexts creation."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.disable", _timeout=_timeout)
+
+    def discardConsoleEntries(self, *args, _timeout=None, **unknown):
+        """Discards collected exceptions and console API calls."""
+        if args or unknown:
+            return self._invalid("discardConsoleEntries", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.discardConsoleEntries", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables reporting of execution contexts creation by means of `executionContextCreated` event."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.enable", _timeout=_timeout)
+
+    def evaluate(self, *args, expression=REQUIRED, objectGroup=None, includeCommandLineAPI=None, silent=None,
+                 contextId=None, returnByValue=None, generatePreview=None, userGesture=None, awaitPromise=None,
+                 throwOnSideEffect=None, timeout=None, disableBreaks=None, replMode=None,
+                 allowUnsafeEvalBlockedByCSP=None, uniqueContextId=None, serializationOptions=None, _timeout=None,
+                 **unknown):
+        """Evaluates expression on global object."""
+        if args or unknown or expression is REQUIRED:
+            return self._invalid("evaluate", args, unknown, _timeout, {
+                "expression": expression, "objectGroup": objectGroup, "includeCommandLineAPI": includeCommandLineAPI,
+                "silent": silent, "contextId": contextId, "returnByValue": returnByValue,
+                "generatePreview": generatePreview, "userGesture": userGesture, "awaitPromise": awaitPromise,
+                "throwOnSideEffect": throwOnSideEffect, "timeout": timeout, "disableBreaks": disableBreaks,
+                "replMode": replMode, "allowUnsafeEvalBlockedByCSP": allowUnsafeEvalBlockedByCSP,
+                "uniqueContextId": uniqueContextId, "serializationOptions": serializationOptions})
+        params = {"expression": expression}
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        if includeCommandLineAPI is not None:
+            params["includeCommandLineAPI"] = includeCommandLineAPI
+        if silent is not None:
+            params["silent"] = silent
+        if contextId is not None:
+            params["contextId"] = contextId
+        if returnByValue is not None:
+            params["returnByValue"] = returnByValue
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        if userGesture is not None:
+            params["userGesture"] = userGesture
+        if awaitPromise is not None:
+            params["awaitPromise"] = awaitPromise
+        if throwOnSideEffect is not None:
+            params["throwOnSideEffect"] = throwOnSideEffect
+        if timeout is not None:
+            params["timeout"] = timeout
+        if disableBreaks is not None:
+            params["disableBreaks"] = disableBreaks
+        if replMode is not None:
+            params["replMode"] = replMode
+        if allowUnsafeEvalBlockedByCSP is not None:
+            params["allowUnsafeEvalBlockedByCSP"] = allowUnsafeEvalBlockedByCSP
+        if uniqueContextId is not None:
+            params["uniqueContextId"] = uniqueContextId
+        if serializationOptions is not None:
+            params["serializationOptions"] = serializationOptions
+        return self._tab.call_method("Runtime.evaluate", _timeout=_timeout, **params)
+
+    def getIsolateId(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the isolate id."""
+        if args or unknown:
+            return self._invalid("getIsolateId", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.getIsolateId", _timeout=_timeout)
+
+    def getHeapUsage(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the JavaScript heap usage."""
+        if args or unknown:
+            return self._invalid("getHeapUsage", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.getHeapUsage", _timeout=_timeout)
+
+    def getProperties(self, *args, objectId=REQUIRED, ownProperties=None, accessorPropertiesOnly=None,
+                      generatePreview=None, nonIndexedPropertiesOnly=None, _timeout=None, **unknown):
+        """Returns properties of a given object."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("getProperties", args, unknown, _timeout, {
+                "objectId": objectId, "ownProperties": ownProperties, "accessorPropertiesOnly": accessorPropertiesOnly,
+                "generatePreview": generatePreview, "nonIndexedPropertiesOnly": nonIndexedPropertiesOnly})
+        params = {"objectId": objectId}
+        if ownProperties is not None:
+            params["ownProperties"] = ownProperties
+        if accessorPropertiesOnly is not None:
+            params["accessorPropertiesOnly"] = accessorPropertiesOnly
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        if nonIndexedPropertiesOnly is not None:
+            params["nonIndexedPropertiesOnly"] = nonIndexedPropertiesOnly
+        return self._tab.call_method("Runtime.getProperties", _timeout=_timeout, **params)
+
+    def globalLexicalScopeNames(self, *args, executionContextId=None, _timeout=None, **unknown):
+        """Returns all let, const and class variables from global scope."""
+        if args or unknown:
+            return self._invalid("globalLexicalScopeNames", args, unknown, _timeout, {
+                "executionContextId": executionContextId})
+        params = {}
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        return self._tab.call_method("Runtime.globalLexicalScopeNames", _timeout=_timeout, **params)
+
+    def queryObjects(self, *args, prototypeObjectId=REQUIRED, objectGroup=None, _timeout=None, **unknown):
+        if args or unknown or prototypeObjectId is REQUIRED:
+            return self._invalid("queryObjects", args, unknown, _timeout, {
+                "prototypeObjectId": prototypeObjectId, "objectGroup": objectGroup})
+        params = {"prototypeObjectId": prototypeObjectId}
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        return self._tab.call_method("Runtime.queryObjects", _timeout=_timeout, **params)
+
+    def releaseObject(self, *args, objectId=REQUIRED, _timeout=None, **unknown):
+        """Releases remote object with given id."""
+        if args or unknown or objectId is REQUIRED:
+            return self._invalid("releaseObject", args, unknown, _timeout, {"objectId": objectId})
+        return self._tab.call_method("Runtime.releaseObject", _timeout=_timeout, objectId=objectId)
+
+    def releaseObjectGroup(self, *args, objectGroup=REQUIRED, _timeout=None, **unknown):
+        """Releases all remote objects that belong to a given group."""
+        if args or unknown or objectGroup is REQUIRED:
+            return self._invalid("releaseObjectGroup", args, unknown, _timeout, {"objectGroup": objectGroup})
+        return self._tab.call_method("Runtime.releaseObjectGroup", _timeout=_timeout, objectGroup=objectGroup)
+
+    def runIfWaitingForDebugger(self, *args, _timeout=None, **unknown):
+        """Tells inspected instance to run if it was waiting for debugger to attach."""
+        if args or unknown:
+            return self._invalid("runIfWaitingForDebugger", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.runIfWaitingForDebugger", _timeout=_timeout)
+
+    def runScript(self, *args, scriptId=REQUIRED, executionContextId=None, objectGroup=None, silent=None,
+                  includeCommandLineAPI=None, returnByValue=None, generatePreview=None, awaitPromise=None,
+                  _timeout=None, **unknown):
+        """Runs script with given id in a given context."""
+        if args or unknown or scriptId is REQUIRED:
+            return self._invalid("runScript", args, unknown, _timeout, {
+                "scriptId": scriptId, "executionContextId": executionContextId, "objectGroup": objectGroup,
+                "silent": silent, "includeCommandLineAPI": includeCommandLineAPI, "returnByValue": returnByValue,
+                "generatePreview": generatePreview, "awaitPromise": awaitPromise})
+        params = {"scriptId": scriptId}
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        if objectGroup is not None:
+            params["objectGroup"] = objectGroup
+        if silent is not None:
+            params["silent"] = silent
+        if includeCommandLineAPI is not None:
+            params["includeCommandLineAPI"] = includeCommandLineAPI
+        if returnByValue is not None:
+            params["returnByValue"] = returnByValue
+        if generatePreview is not None:
+            params["generatePreview"] = generatePreview
+        if awaitPromise is not None:
+            params["awaitPromise"] = awaitPromise
+        return self._tab.call_method("Runtime.runScript", _timeout=_timeout, **params)
+
+    def setAsyncCallStackDepth(self, *args, maxDepth=REQUIRED, _timeout=None, **unknown):
+        """Enables or disables async call stacks tracking."""
+        if args or unknown or maxDepth is REQUIRED:
+            return self._invalid("setAsyncCallStackDepth", args, unknown, _timeout, {"maxDepth": maxDepth})
+        return self._tab.call_method("Runtime.setAsyncCallStackDepth", _timeout=_timeout, maxDepth=maxDepth)
+
+    def setCustomObjectFormatterEnabled(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setCustomObjectFormatterEnabled", args, unknown, _timeout, {"enabled": enabled})
+        return self._tab.call_method("Runtime.setCustomObjectFormatterEnabled", _timeout=_timeout, enabled=enabled)
+
+    def setMaxCallStackSizeToCapture(self, *args, size=REQUIRED, _timeout=None, **unknown):
+        """(experimental)"""
+        if args or unknown or size is REQUIRED:
+            return self._invalid("setMaxCallStackSizeToCapture", args, unknown, _timeout, {"size": size})
+        return self._tab.call_method("Runtime.setMaxCallStackSizeToCapture", _timeout=_timeout, size=size)
+
+    def terminateExecution(self, *args, _timeout=None, **unknown):
+        """(experimental) Terminate current or next JavaScript execution."""
+        if args or unknown:
+            return self._invalid("terminateExecution", args, unknown, _timeout, {})
+        return self._tab.call_method("Runtime.terminateExecution", _timeout=_timeout)
+
+    def addBinding(self, *args, name=REQUIRED, executionContextId=None, executionContextName=None, _timeout=None,
+                   **unknown):
+        """If executionContextId is empty, adds binding with the given name on the global objects of all inspected contexts, including those created later, bindings survive reloads."""
+        if args or unknown or name is REQUIRED:
+            return self._invalid("addBinding", args, unknown, _timeout, {
+                "name": name, "executionContextId": executionContextId, "executionContextName": executionContextName})
+        params = {"name": name}
+        if executionContextId is not None:
+            params["executionContextId"] = executionContextId
+        if executionContextName is not None:
+            params["executionContextName"] = executionContextName
+        return self._tab.call_method("Runtime.addBinding", _timeout=_timeout, **params)
+
+    def removeBinding(self, *args, name=REQUIRED, _timeout=None, **unknown):
+        """This method does not remove binding function from global object but unsubscribes current runtime agent from Runtime.bindingCalled notifications."""
+        if args or unknown or name is REQUIRED:
+            return self._invalid("removeBinding", args, unknown, _timeout, {"name": name})
+        return self._tab.call_method("Runtime.removeBinding", _timeout=_timeout, name=name)
+
+    def getExceptionDetails(self, *args, errorObjectId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) This method tries to lookup and populate exception details for a JavaScript Error object."""
+        if args or unknown or errorObjectId is REQUIRED:
+            return self._invalid("getExceptionDetails", args, unknown, _timeout, {"errorObjectId": errorObjectId})
+        return self._tab.call_method("Runtime.getExceptionDetails", _timeout=_timeout, errorObjectId=errorObjectId)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Schema(Domain):
+    """This domain is deprecated."""
+
+    __slots__ = ()
+
+    _name = "Schema"
+    _events = frozenset([])
+
+    def getDomains(self, *args, _timeout=None, **unknown):
+        """Returns supported domains."""
+        if args or unknown:
+            return self._invalid("getDomains", args, unknown, _timeout, {})
+        return self._tab.call_method("Schema.getDomains", _timeout=_timeout)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Security(Domain):
+    __slots__ = ()
+
+    _name = "Security"
+    _events = frozenset(["certificateError", "securityStateChanged", "visibleSecurityStateChanged"])
+
+    CERTIFICATE_ERROR = "Security.certificateError"
+    SECURITY_STATE_CHANGED = "Security.securityStateChanged"
+    VISIBLE_SECURITY_STATE_CHANGED = "Security.visibleSecurityStateChanged"
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables tracking security state changes."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("Security.disable", _timeout=_timeout)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables tracking security state changes."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("Security.enable", _timeout=_timeout)
+
+    def setIgnoreCertificateErrors(self, *args, ignore=REQUIRED, _timeout=None, **unknown):
+        """Enable/disable whether all certificate errors should be ignored."""
+        if args or unknown or ignore is REQUIRED:
+            return self._invalid("setIgnoreCertificateErrors", args, unknown, _timeout, {"ignore": ignore})
+        return self._tab.call_method("Security.setIgnoreCertificateErrors", _timeout=_timeout, ignore=ignore)
+
+    def handleCertificateError(self, *args, eventId=REQUIRED, action=REQUIRED, _timeout=None, **unknown):
+        """(deprecated) Handles a certificate error that fired a certificateError event."""
+        if args or unknown or eventId is REQUIRED or action is REQUIRED:
+            return self._invalid("handleCertificateError", args, unknown, _timeout, {
+                "eventId": eventId, "action": action})
+        return self._tab.call_method("Security.handleCertificateError", _timeout=_timeout, eventId=eventId,
+                                     action=action)
+
+    def setOverrideCertificateErrors(self, *args, override=REQUIRED, _timeout=None, **unknown):
+        """(deprecated) Enable/disable overriding certificate errors."""
+        if args or unknown or override is REQUIRED:
+            return self._invalid("setOverrideCertificateErrors", args, unknown, _timeout, {"override": override})
+        return self._tab.call_method("Security.setOverrideCertificateErrors", _timeout=_timeout, override=override)
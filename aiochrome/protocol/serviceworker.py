@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class ServiceWorker(Domain):
+    __slots__ = ()
+
+    _name = "ServiceWorker"
+    _events = frozenset(["workerErrorReported", "workerRegistrationUpdated", "workerVersionUpdated"])
+
+    WORKER_ERROR_REPORTED = "ServiceWorker.workerErrorReported"
+    WORKER_REGISTRATION_UPDATED = "ServiceWorker.workerRegistrationUpdated"
+    WORKER_VERSION_UPDATED = "ServiceWorker.workerVersionUpdated"
+
+    def deliverPushMessage(self, *args, origin=REQUIRED, registrationId=REQUIRED, data=REQUIRED, _timeout=None,
+                           **unknown):
+        if args or unknown or origin is REQUIRED or registrationId is REQUIRED or data is REQUIRED:
+            return self._invalid("deliverPushMessage", args, unknown, _timeout, {
+                "origin": origin, "registrationId": registrationId, "data": data})
+        return self._tab.call_method("ServiceWorker.deliverPushMessage", _timeout=_timeout, origin=origin,
+                                     registrationId=registrationId, data=data)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("ServiceWorker.disable", _timeout=_timeout)
+
+    def dispatchSyncEvent(self, *args, origin=REQUIRED, registrationId=REQUIRED, tag=REQUIRED, lastChance=REQUIRED,
+                          _timeout=None, **unknown):
+        invalid = args or unknown or origin is REQUIRED or registrationId is REQUIRED or tag is REQUIRED
+        if invalid or lastChance is REQUIRED:
+            return self._invalid("dispatchSyncEvent", args, unknown, _timeout, {
+                "origin": origin, "registrationId": registrationId, "tag": tag, "lastChance": lastChance})
+        return self._tab.call_method("ServiceWorker.dispatchSyncEvent", _timeout=_timeout, origin=origin,
+                                     registrationId=registrationId, tag=tag, lastChance=lastChance)
+
+    def dispatchPeriodicSyncEvent(self, *args, origin=REQUIRED, registrationId=REQUIRED, tag=REQUIRED, _timeout=None,
+                                  **unknown):
+        if args or unknown or origin is REQUIRED or registrationId is REQUIRED or tag is REQUIRED:
+            return self._invalid("dispatchPeriodicSyncEvent", args, unknown, _timeout, {
+                "origin": origin, "registrationId": registrationId, "tag": tag})
+        return self._tab.call_method("ServiceWorker.dispatchPeriodicSyncEvent", _timeout=_timeout, origin=origin,
+                                     registrationId=registrationId, tag=tag)
+
+    def enable(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("ServiceWorker.enable", _timeout=_timeout)
+
+    def setForceUpdateOnPageLoad(self, *args, forceUpdateOnPageLoad=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or forceUpdateOnPageLoad is REQUIRED:
+            return self._invalid("setForceUpdateOnPageLoad", args, unknown, _timeout, {
+                "forceUpdateOnPageLoad": forceUpdateOnPageLoad})
+        return self._tab.call_method("ServiceWorker.setForceUpdateOnPageLoad", _timeout=_timeout,
+                                     forceUpdateOnPageLoad=forceUpdateOnPageLoad)
+
+    def skipWaiting(self, *args, scopeURL=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or scopeURL is REQUIRED:
+            return self._invalid("skipWaiting", args, unknown, _timeout, {"scopeURL": scopeURL})
+        return self._tab.call_method("ServiceWorker.skipWaiting", _timeout=_timeout, scopeURL=scopeURL)
+
+    def startWorker(self, *args, scopeURL=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or scopeURL is REQUIRED:
+            return self._invalid("startWorker", args, unknown, _timeout, {"scopeURL": scopeURL})
+        return self._tab.call_method("ServiceWorker.startWorker", _timeout=_timeout, scopeURL=scopeURL)
+
+    def stopAllWorkers(self, *args, _timeout=None, **unknown):
+        if args or unknown:
+            return self._invalid("stopAllWorkers", args, unknown, _timeout, {})
+        return self._tab.call_method("ServiceWorker.stopAllWorkers", _timeout=_timeout)
+
+    def stopWorker(self, *args, versionId=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or versionId is REQUIRED:
+            return self._invalid("stopWorker", args, unknown, _timeout, {"versionId": versionId})
+        return self._tab.call_method("ServiceWorker.stopWorker", _timeout=_timeout, versionId=versionId)
+
+    def unregister(self, *args, scopeURL=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or scopeURL is REQUIRED:
+            return self._invalid("unregister", args, unknown, _timeout, {"scopeURL": scopeURL})
+        return self._tab.call_method("ServiceWorker.unregister", _timeout=_timeout, scopeURL=scopeURL)
+
+    def updateRegistration(self, *args, scopeURL=REQUIRED, _timeout=None, **unknown):
+        if args or unknown or scopeURL is REQUIRED:
+            return self._invalid("updateRegistration", args, unknown, _timeout, {"scopeURL": scopeURL})
+        return self._tab.call_method("ServiceWorker.updateRegistration", _timeout=_timeout, scopeURL=scopeURL)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Storage(Domain):
+    __slots__ = ()
+
+    _name = "Storage"
+    _events = frozenset([
+        "attributionReportingReportSent", "attributionReportingSourceRegistered",
+        "attributionReportingTriggerRegistered", "attributionReportingVerboseDebugReportSent",
+        "cacheStorageContentUpdated", "cacheStorageListUpdated", "indexedDBContentUpdated", "indexedDBListUpdated",
+        "interestGroupAccessed", "interestGroupAuctionEventOccurred", "interestGroupAuctionNetworkRequestCreated",
+        "sharedStorageAccessed", "sharedStorageWorkletOperationExecutionFinished", "storageBucketCreatedOrUpdated",
+        "storageBucketDeleted"])
+
+    ATTRIBUTION_REPORTING_REPORT_SENT = "Storage.attributionReportingReportSent"
+    ATTRIBUTION_REPORTING_SOURCE_REGISTERED = "Storage.attributionReportingSourceRegistered"
+    ATTRIBUTION_REPORTING_TRIGGER_REGISTERED = "Storage.attributionReportingTriggerRegistered"
+    ATTRIBUTION_REPORTING_VERBOSE_DEBUG_REPORT_SENT = "Storage.attributionReportingVerboseDebugReportSent"
+    CACHE_STORAGE_CONTENT_UPDATED = "Storage.cacheStorageContentUpdated"
+    CACHE_STORAGE_LIST_UPDATED = "Storage.cacheStorageListUpdated"
+    INDEXED_DB_CONTENT_UPDATED = "Storage.indexedDBContentUpdated"
+    INDEXED_DB_LIST_UPDATED = "Storage.indexedDBListUpdated"
+    INTEREST_GROUP_ACCESSED = "Storage.interestGroupAccessed"
+    INTEREST_GROUP_AUCTION_EVENT_OCCURRED = "Storage.interestGroupAuctionEventOccurred"
+    INTEREST_GROUP_AUCTION_NETWORK_REQUEST_CREATED = "Storage.interestGroupAuctionNetworkRequestCreated"
+    SHARED_STORAGE_ACCESSED = "Storage.sharedStorageAccessed"
+    SHARED_STORAGE_WORKLET_OPERATION_EXECUTION_FINISHED = "Storage.sharedStorageWorkletOperationExecutionFinished"
+    STORAGE_BUCKET_CREATED_OR_UPDATED = "Storage.storageBucketCreatedOrUpdated"
+    STORAGE_BUCKET_DELETED = "Storage.storageBucketDeleted"
+
+    def getStorageKeyForFrame(self, *args, frameId=REQUIRED, _timeout=None, **unknown):
+        """Returns a storage key given a frame id."""
+        if args or unknown or frameId is REQUIRED:
+            return self._invalid("getStorageKeyForFrame", args, unknown, _timeout, {"frameId": frameId})
+        return self._tab.call_method("Storage.getStorageKeyForFrame", _timeout=_timeout, frameId=frameId)
+
+    def clearDataForOrigin(self, *args, origin=REQUIRED, storageTypes=REQUIRED, _timeout=None, **unknown):
+        """Clears storage for origin."""
+        if args or unknown or origin is REQUIRED or storageTypes is REQUIRED:
+            return self._invalid("clearDataForOrigin", args, unknown, _timeout, {
+                "origin": origin, "storageTypes": storageTypes})
+        return self._tab.call_method("Storage.clearDataForOrigin", _timeout=_timeout, origin=origin,
+                                     storageTypes=storageTypes)
+
+    def clearDataForStorageKey(self, *args, storageKey=REQUIRED, storageTypes=REQUIRED, _timeout=None, **unknown):
+        """Clears storage for storage key."""
+        if args or unknown or storageKey is REQUIRED or storageTypes is REQUIRED:
+            return self._invalid("clearDataForStorageKey", args, unknown, _timeout, {
+                "storageKey": storageKey, "storageTypes": storageTypes})
+        return self._tab.call_method("Storage.clearDataForStorageKey", _timeout=_timeout, storageKey=storageKey,
+                                     storageTypes=storageTypes)
+
+    def getCookies(self, *args, browserContextId=None, _timeout=None, **unknown):
+        """Returns all browser cookies."""
+        if args or unknown:
+            return self._invalid("getCookies", args, unknown, _timeout, {"browserContextId": browserContextId})
+        params = {}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Storage.getCookies", _timeout=_timeout, **params)
+
+    def setCookies(self, *args, cookies=REQUIRED, browserContextId=None, _timeout=None, **unknown):
+        """Sets given cookies."""
+        if args or unknown or cookies is REQUIRED:
+            return self._invalid("setCookies", args, unknown, _timeout, {
+                "cookies": cookies, "browserContextId": browserContextId})
+        params = {"cookies": cookies}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Storage.setCookies", _timeout=_timeout, **params)
+
+    def clearCookies(self, *args, browserContextId=None, _timeout=None, **unknown):
+        """Clears cookies."""
+        if args or unknown:
+            return self._invalid("clearCookies", args, unknown, _timeout, {"browserContextId": browserContextId})
+        params = {}
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        return self._tab.call_method("Storage.clearCookies", _timeout=_timeout, **params)
+
+    def getUsageAndQuota(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """Returns usage and quota in bytes."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("getUsageAndQuota", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Storage.getUsageAndQuota", _timeout=_timeout, origin=origin)
+
+    def overrideQuotaForOrigin(self, *args, origin=REQUIRED, quotaSize=None, _timeout=None, **unknown):
+        """(experimental) Override quota for the specified origin"""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("overrideQuotaForOrigin", args, unknown, _timeout, {
+                "origin": origin, "quotaSize": quotaSize})
+        params = {"origin": origin}
+        if quotaSize is not None:
+            params["quotaSize"] = quotaSize
+        return self._tab.call_method("Storage.overrideQuotaForOrigin", _timeout=_timeout, **params)
+
+    def trackCacheStorageForOrigin(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """Registers origin to be notified when an update occurs to its cache storage list."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("trackCacheStorageForOrigin", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Storage.trackCacheStorageForOrigin", _timeout=_timeout, origin=origin)
+
+    def trackCacheStorageForStorageKey(self, *args, storageKey=REQUIRED, _timeout=None, **unknown):
+        """Registers storage key to be notified when an update occurs to its cache storage list."""
+        if args or unknown or storageKey is REQUIRED:
+            return self._invalid("trackCacheStorageForStorageKey", args, unknown, _timeout, {"storageKey": storageKey})
+        return self._tab.call_method("Storage.trackCacheStorageForStorageKey", _timeout=_timeout, storageKey=storageKey)
+
+    def trackIndexedDBForOrigin(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """Registers origin to be notified when an update occurs to its IndexedDB."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("trackIndexedDBForOrigin", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Storage.trackIndexedDBForOrigin", _timeout=_timeout, origin=origin)
+
+    def trackIndexedDBForStorageKey(self, *args, storageKey=REQUIRED, _timeout=None, **unknown):
+        """Registers storage key to be notified when an update occurs to its IndexedDB."""
+        if args or unknown or storageKey is REQUIRED:
+            return self._invalid("trackIndexedDBForStorageKey", args, unknown, _timeout, {"storageKey": storageKey})
+        return self._tab.call_method("Storage.trackIndexedDBForStorageKey", _timeout=_timeout, storageKey=storageKey)
+
+    def untrackCacheStorageForOrigin(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """Unregisters origin from receiving notifications for cache storage."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("untrackCacheStorageForOrigin", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Storage.untrackCacheStorageForOrigin", _timeout=_timeout, origin=origin)
+
+    def untrackCacheStorageForStorageKey(self, *args, storageKey=REQUIRED, _timeout=None, **unknown):
+        """Unregisters storage key from receiving notifications for cache storage."""
+        if args or unknown or storageKey is REQUIRED:
+            return self._invalid("untrackCacheStorageForStorageKey", args, unknown, _timeout, {
+                "storageKey": storageKey})
+        return self._tab.call_method("Storage.untrackCacheStorageForStorageKey", _timeout=_timeout,
+                                     storageKey=storageKey)
+
+    def untrackIndexedDBForOrigin(self, *args, origin=REQUIRED, _timeout=None, **unknown):
+        """Unregisters origin from receiving notifications for IndexedDB."""
+        if args or unknown or origin is REQUIRED:
+            return self._invalid("untrackIndexedDBForOrigin", args, unknown, _timeout, {"origin": origin})
+        return self._tab.call_method("Storage.untrackIndexedDBForOrigin", _timeout=_timeout, origin=origin)
+
+    def untrackIndexedDBForStorageKey(self, *args, storageKey=REQUIRED, _timeout=None, **unknown):
+        """Unregisters storage key from receiving notifications for IndexedDB."""
+        if args or unknown or storageKey is REQUIRED:
+            return self._invalid("untrackIndexedDBForStorageKey", args, unknown, _timeout, {"storageKey": storageKey})
+        return self._tab.call_method("Storage.untrackIndexedDBForStorageKey", _timeout=_timeout, storageKey=storageKey)
+
+    def getTrustTokens(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the number of stored Trust Tokens per issuer for the current browsing context."""
+        if args or unknown:
+            return self._invalid("getTrustTokens", args, unknown, _timeout, {})
+        return self._tab.call_method("Storage.getTrustTokens", _timeout=_timeout)
+
+    def clearTrustTokens(self, *args, issuerOrigin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Removes all Trust Tokens issued by the provided issuerOrigin."""
+        if args or unknown or issuerOrigin is REQUIRED:
+            return self._invalid("clearTrustTokens", args, unknown, _timeout, {"issuerOrigin": issuerOrigin})
+        return self._tab.call_method("Storage.clearTrustTokens", _timeout=_timeout, issuerOrigin=issuerOrigin)
+
+    def getInterestGroupDetails(self, *args, ownerOrigin=REQUIRED, name=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Gets details for a named interest group."""
+        if args or unknown or ownerOrigin is REQUIRED or name is REQUIRED:
+            return self._invalid("getInterestGroupDetails", args, unknown, _timeout, {
+                "ownerOrigin": ownerOrigin, "name": name})
+        return self._tab.call_method("Storage.getInterestGroupDetails", _timeout=_timeout, ownerOrigin=ownerOrigin,
+                                     name=name)
+
+    def setInterestGroupTracking(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables/Disables issuing of interestGroupAccessed events."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("setInterestGroupTracking", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("Storage.setInterestGroupTracking", _timeout=_timeout, enable=enable)
+
+    def setInterestGroupAuctionTracking(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables/Disables issuing of interestGroupAuctionEventOccurred and interestGroupAuctionNetworkRequestCreated."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("setInterestGroupAuctionTracking", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("Storage.setInterestGroupAuctionTracking", _timeout=_timeout, enable=enable)
+
+    def getSharedStorageMetadata(self, *args, ownerOrigin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Gets metadata for an origin's shared storage."""
+        if args or unknown or ownerOrigin is REQUIRED:
+            return self._invalid("getSharedStorageMetadata", args, unknown, _timeout, {"ownerOrigin": ownerOrigin})
+        return self._tab.call_method("Storage.getSharedStorageMetadata", _timeout=_timeout, ownerOrigin=ownerOrigin)
+
+    def getSharedStorageEntries(self, *args, ownerOrigin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Gets the entries in an given origin's shared storage."""
+        if args or unknown or ownerOrigin is REQUIRED:
+            return self._invalid("getSharedStorageEntries", args, unknown, _timeout, {"ownerOrigin": ownerOrigin})
+        return self._tab.call_method("Storage.getSharedStorageEntries", _timeout=_timeout, ownerOrigin=ownerOrigin)
+
+    def setSharedStorageEntry(self, *args, ownerOrigin=REQUIRED, key=REQUIRED, value=REQUIRED, ignoreIfPresent=None,
+                              _timeout=None, **unknown):
+        """(experimental) Sets entry with `key` and `value` for a given origin's shared storage."""
+        if args or unknown or ownerOrigin is REQUIRED or key is REQUIRED or value is REQUIRED:
+            return self._invalid("setSharedStorageEntry", args, unknown, _timeout, {
+                "ownerOrigin": ownerOrigin, "key": key, "value": value, "ignoreIfPresent": ignoreIfPresent})
+        params = {"ownerOrigin": ownerOrigin, "key": key, "value": value}
+        if ignoreIfPresent is not None:
+            params["ignoreIfPresent"] = ignoreIfPresent
+        return self._tab.call_method("Storage.setSharedStorageEntry", _timeout=_timeout, **params)
+
+    def deleteSharedStorageEntry(self, *args, ownerOrigin=REQUIRED, key=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Deletes entry for `key` (if it exists) for a given origin's shared storage."""
+        if args or unknown or ownerOrigin is REQUIRED or key is REQUIRED:
+            return self._invalid("deleteSharedStorageEntry", args, unknown, _timeout, {
+                "ownerOrigin": ownerOrigin, "key": key})
+        return self._tab.call_method("Storage.deleteSharedStorageEntry", _timeout=_timeout, ownerOrigin=ownerOrigin,
+                                     key=key)
+
+    def clearSharedStorageEntries(self, *args, ownerOrigin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Clears all entries for a given origin's shared storage."""
+        if args or unknown or ownerOrigin is REQUIRED:
+            return self._invalid("clearSharedStorageEntries", args, unknown, _timeout, {"ownerOrigin": ownerOrigin})
+        return self._tab.call_method("Storage.clearSharedStorageEntries", _timeout=_timeout, ownerOrigin=ownerOrigin)
+
+    def resetSharedStorageBudget(self, *args, ownerOrigin=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Resets the budget for `ownerOrigin` by clearing all budget withdrawals."""
+        if args or unknown or ownerOrigin is REQUIRED:
+            return self._invalid("resetSharedStorageBudget", args, unknown, _timeout, {"ownerOrigin": ownerOrigin})
+        return self._tab.call_method("Storage.resetSharedStorageBudget", _timeout=_timeout, ownerOrigin=ownerOrigin)
+
+    def setSharedStorageTracking(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables/disables issuing of sharedStorageAccessed events."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("setSharedStorageTracking", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("Storage.setSharedStorageTracking", _timeout=_timeout, enable=enable)
+
+    def setStorageBucketTracking(self, *args, storageKey=REQUIRED, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Set tracking for a storage key's buckets."""
+        if args or unknown or storageKey is REQUIRED or enable is REQUIRED:
+            return self._invalid("setStorageBucketTracking", args, unknown, _timeout, {
+                "storageKey": storageKey, "enable": enable})
+        return self._tab.call_method("Storage.setStorageBucketTracking", _timeout=_timeout, storageKey=storageKey,
+                                     enable=enable)
+
+    def deleteStorageBucket(self, *args, bucket=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Deletes the Storage Bucket with the given storage key and bucket name."""
+        if args or unknown or bucket is REQUIRED:
+            return self._invalid("deleteStorageBucket", args, unknown, _timeout, {"bucket": bucket})
+        return self._tab.call_method("Storage.deleteStorageBucket", _timeout=_timeout, bucket=bucket)
+
+    def runBounceTrackingMitigations(self, *args, _timeout=None, **unknown):
+        """(experimental) Deletes state for sites identified as potential bounce trackers, immediately."""
+        if args or unknown:
+            return self._invalid("runBounceTrackingMitigations", args, unknown, _timeout, {})
+        return self._tab.call_method("Storage.runBounceTrackingMitigations", _timeout=_timeout)
+
+    def setAttributionReportingLocalTestingMode(self, *args, enabled=REQUIRED, _timeout=None, **unknown):
+        """(experimental) https://wicg.github.io/attribution-reporting-api/"""
+        if args or unknown or enabled is REQUIRED:
+            return self._invalid("setAttributionReportingLocalTestingMode", args, unknown, _timeout, {
+                "enabled": enabled})
+        return self._tab.call_method("Storage.setAttributionReportingLocalTestingMode", _timeout=_timeout,
+                                     enabled=enabled)
+
+    def setAttributionReportingTracking(self, *args, enable=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables/disables issuing of Attribution Reporting events."""
+        if args or unknown or enable is REQUIRED:
+            return self._invalid("setAttributionReportingTracking", args, unknown, _timeout, {"enable": enable})
+        return self._tab.call_method("Storage.setAttributionReportingTracking", _timeout=_timeout, enable=enable)
+
+    def sendPendingAttributionReports(self, *args, _timeout=None, **unknown):
+        """(experimental) Sends all pending Attribution Reports immediately, regardless of their scheduled report time."""
+        if args or unknown:
+            return self._invalid("sendPendingAttributionReports", args, unknown, _timeout, {})
+        return self._tab.call_method("Storage.sendPendingAttributionReports", _timeout=_timeout)
+
+    def getRelatedWebsiteSets(self, *args, _timeout=None, **unknown):
+        """(experimental) Returns the effective Related Website Sets in use by this profile for the browser session."""
+        if args or unknown:
+            return self._invalid("getRelatedWebsiteSets", args, unknown, _timeout, {})
+        return self._tab.call_method("Storage.getRelatedWebsiteSets", _timeout=_timeout)
+
+    def getAffectedUrlsForThirdPartyCookieMetadata(self, *args, firstPartyUrl=REQUIRED, thirdPartyUrls=REQUIRED,
+                                                   _timeout=None, **unknown):
+        """(experimental) Returns the list of URLs from a page and its embedded resources that match existing grace period URL pattern rules."""
+        if args or unknown or firstPartyUrl is REQUIRED or thirdPartyUrls is REQUIRED:
+            return self._invalid("getAffectedUrlsForThirdPartyCookieMetadata", args, unknown, _timeout, {
+                "firstPartyUrl": firstPartyUrl, "thirdPartyUrls": thirdPartyUrls})
+        return self._tab.call_method("Storage.getAffectedUrlsForThirdPartyCookieMetadata", _timeout=_timeout,
+                                     firstPartyUrl=firstPartyUrl, thirdPartyUrls=thirdPartyUrls)
+
+    def setProtectedAudienceKAnonymity(self, *args, owner=REQUIRED, name=REQUIRED, hashes=REQUIRED, _timeout=None,
+                                       **unknown):
+        if args or unknown or owner is REQUIRED or name is REQUIRED or hashes is REQUIRED:
+            return self._invalid("setProtectedAudienceKAnonymity", args, unknown, _timeout, {
+                "owner": owner, "name": name, "hashes": hashes})
+        return self._tab.call_method("Storage.setProtectedAudienceKAnonymity", _timeout=_timeout, owner=owner,
+                                     name=name, hashes=hashes)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class SystemInfo(Domain):
+    """The SystemInfo domain defines methods and events for querying low-level system information."""
+
+    __slots__ = ()
+
+    _name = "SystemInfo"
+    _events = frozenset([])
+
+    def getInfo(self, *args, _timeout=None, **unknown):
+        """Returns information about the system."""
+        if args or unknown:
+            return self._invalid("getInfo", args, unknown, _timeout, {})
+        return self._tab.call_method("SystemInfo.getInfo", _timeout=_timeout)
+
+    def getFeatureState(self, *args, featureState=REQUIRED, _timeout=None, **unknown):
+        """Returns information about the feature state."""
+        if args or unknown or featureState is REQUIRED:
+            return self._invalid("getFeatureState", args, unknown, _timeout, {"featureState": featureState})
+        return self._tab.call_method("SystemInfo.getFeatureState", _timeout=_timeout, featureState=featureState)
+
+    def getProcessInfo(self, *args, _timeout=None, **unknown):
+        """Returns information about all running processes."""
+        if args or unknown:
+            return self._invalid("getProcessInfo", args, unknown, _timeout, {})
+        return self._tab.call_method("SystemInfo.getProcessInfo", _timeout=_timeout)
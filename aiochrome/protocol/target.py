@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Target(Domain):
+    """Supports additional targets discovery and allows to attach to them."""
+
+    __slots__ = ()
+
+    _name = "Target"
+    _events = frozenset([
+        "attachedToTarget", "detachedFromTarget", "receivedMessageFromTarget", "targetCrashed", "targetCreated",
+        "targetDestroyed", "targetInfoChanged"])
+
+    ATTACHED_TO_TARGET = "Target.attachedToTarget"
+    DETACHED_FROM_TARGET = "Target.detachedFromTarget"
+    RECEIVED_MESSAGE_FROM_TARGET = "Target.receivedMessageFromTarget"
+    TARGET_CRASHED = "Target.targetCrashed"
+    TARGET_CREATED = "Target.targetCreated"
+    TARGET_DESTROYED = "Target.targetDestroyed"
+    TARGET_INFO_CHANGED = "Target.targetInfoChanged"
+
+    def activateTarget(self, *args, targetId=REQUIRED, _timeout=None, **unknown):
+        """Activates (focuses) the target."""
+        if args or unknown or targetId is REQUIRED:
+            return self._invalid("activateTarget", args, unknown, _timeout, {"targetId": targetId})
+        return self._tab.call_method("Target.activateTarget", _timeout=_timeout, targetId=targetId)
+
+    def attachToTarget(self, *args, targetId=REQUIRED, flatten=None, _timeout=None, **unknown):
+        """Attaches to the target with given id."""
+        if args or unknown or targetId is REQUIRED:
+            return self._invalid("attachToTarget", args, unknown, _timeout, {"targetId": targetId, "flatten": flatten})
+        params = {"targetId": targetId}
+        if flatten is not None:
+            params["flatten"] = flatten
+        return self._tab.call_method("Target.attachToTarget", _timeout=_timeout, **params)
+
+    def attachToBrowserTarget(self, *args, _timeout=None, **unknown):
+        """(experimental) Attaches to the browser target, only uses flat sessionId mode."""
+        if args or unknown:
+            return self._invalid("attachToBrowserTarget", args, unknown, _timeout, {})
+        return self._tab.call_method("Target.attachToBrowserTarget", _timeout=_timeout)
+
+    def closeTarget(self, *args, targetId=REQUIRED, _timeout=None, **unknown):
+        """Closes the target."""
+        if args or unknown or targetId is REQUIRED:
+            return self._invalid("closeTarget", args, unknown, _timeout, {"targetId": targetId})
+        return self._tab.call_method("Target.closeTarget", _timeout=_timeout, targetId=targetId)
+
+    def exposeDevToolsProtocol(self, *args, targetId=REQUIRED, bindingName=None, inheritPermissions=None,
+                               _timeout=None, **unknown):
+        """(experimental) Inject object to the target's main frame that provides a communication channel with browser target."""
+        if args or unknown or targetId is REQUIRED:
+            return self._invalid("exposeDevToolsProtocol", args, unknown, _timeout, {
+                "targetId": targetId, "bindingName": bindingName, "inheritPermissions": inheritPermissions})
+        params = {"targetId": targetId}
+        if bindingName is not None:
+            params["bindingName"] = bindingName
+        if inheritPermissions is not None:
+            params["inheritPermissions"] = inheritPermissions
+        return self._tab.call_method("Target.exposeDevToolsProtocol", _timeout=_timeout, **params)
+
+    def createBrowserContext(self, *args, disposeOnDetach=None, proxyServer=None, proxyBypassList=None,
+                             originsWithUniversalNetworkAccess=None, _timeout=None, **unknown):
+        """Creates a new empty BrowserContext."""
+        if args or unknown:
+            return self._invalid("createBrowserContext", args, unknown, _timeout, {
+                "disposeOnDetach": disposeOnDetach, "proxyServer": proxyServer, "proxyBypassList": proxyBypassList,
+                "originsWithUniversalNetworkAccess": originsWithUniversalNetworkAccess})
+        params = {}
+        if disposeOnDetach is not None:
+            params["disposeOnDetach"] = disposeOnDetach
+        if proxyServer is not None:
+            params["proxyServer"] = proxyServer
+        if proxyBypassList is not None:
+            params["proxyBypassList"] = proxyBypassList
+        if originsWithUniversalNetworkAccess is not None:
+            params["originsWithUniversalNetworkAccess"] = originsWithUniversalNetworkAccess
+        return self._tab.call_method("Target.createBrowserContext", _timeout=_timeout, **params)
+
+    def getBrowserContexts(self, *args, _timeout=None, **unknown):
+        """Returns all browser contexts created with `Target.createBrowserContext` method."""
+        if args or unknown:
+            return self._invalid("getBrowserContexts", args, unknown, _timeout, {})
+        return self._tab.call_method("Target.getBrowserContexts", _timeout=_timeout)
+
+    def createTarget(self, *args, url=REQUIRED, left=None, top=None, width=None, height=None, windowState=None,
+                     browserContextId=None, enableBeginFrameControl=None, newWindow=None, background=None, forTab=None,
+                     hidden=None, _timeout=None, **unknown):
+        """Creates a new page."""
+        if args or unknown or url is REQUIRED:
+            return self._invalid("createTarget", args, unknown, _timeout, {
+                "url": url, "left": left, "top": top, "width": width, "height": height, "windowState": windowState,
+                "browserContextId": browserContextId, "enableBeginFrameControl": enableBeginFrameControl,
+                "newWindow": newWindow, "background": background, "forTab": forTab, "hidden": hidden})
+        params = {"url": url}
+        if left is not None:
+            params["left"] = left
+        if top is not None:
+            params["top"] = top
+        if width is not None:
+            params["width"] = width
+        if height is not None:
+            params["height"] = height
+        if windowState is not None:
+            params["windowState"] = windowState
+        if browserContextId is not None:
+            params["browserContextId"] = browserContextId
+        if enableBeginFrameControl is not None:
+            params["enableBeginFrameControl"] = enableBeginFrameControl
+        if newWindow is not None:
+            params["newWindow"] = newWindow
+        if background is not None:
+            params["background"] = background
+        if forTab is not None:
+            params["forTab"] = forTab
+        if hidden is not None:
+            params["hidden"] = hidden
+        return self._tab.call_method("Target.createTarget", _timeout=_timeout, **params)
+
+    def detachFromTarget(self, *args, sessionId=None, targetId=None, _timeout=None, **unknown):
+        """Detaches session with given id."""
+        if args or unknown:
+            return self._invalid("detachFromTarget", args, unknown, _timeout, {
+                "sessionId": sessionId, "targetId": targetId})
+        params = {}
+        if sessionId is not None:
+            params["sessionId"] = sessionId
+        if targetId is not None:
+            params["targetId"] = targetId
+        return self._tab.call_method("Target.detachFromTarget", _timeout=_timeout, **params)
+
+    def disposeBrowserContext(self, *args, browserContextId=REQUIRED, _timeout=None, **unknown):
+        """Deletes a BrowserContext."""
+        if args or unknown or browserContextId is REQUIRED:
+            return self._invalid("disposeBrowserContext", args, unknown, _timeout, {
+                "browserContextId": browserContextId})
+        return self._tab.call_method("Target.disposeBrowserContext", _timeout=_timeout,
+                                     browserContextId=browserContextId)
+
+    def getTargetInfo(self, *args, targetId=None, _timeout=None, **unknown):
+        """(experimental) Returns information about a target."""
+        if args or unknown:
+            return self._invalid("getTargetInfo", args, unknown, _timeout, {"targetId": targetId})
+        params = {}
+        if targetId is not None:
+            params["targetId"] = targetId
+        return self._tab.call_method("Target.getTargetInfo", _timeout=_timeout, **params)
+
+    def getTargets(self, *args, filter=None, _timeout=None, **unknown):
+        """Retrieves a list of available targets."""
+        if args or unknown:
+            return self._invalid("getTargets", args, unknown, _timeout, {"filter": filter})
+        params = {}
+        if filter is not None:
+            params["filter"] = filter
+        return self._tab.call_method("Target.getTargets", _timeout=_timeout, **params)
+
+    def sendMessageToTarget(self, *args, message=REQUIRED, sessionId=None, targetId=None, _timeout=None, **unknown):
+        """(deprecated) Sends protocol message over session with given id."""
+        if args or unknown or message is REQUIRED:
+            return self._invalid("sendMessageToTarget", args, unknown, _timeout, {
+                "message": message, "sessionId": sessionId, "targetId": targetId})
+        params = {"message": message}
+        if sessionId is not None:
+            params["sessionId"] = sessionId
+        if targetId is not None:
+            params["targetId"] = targetId
+        return self._tab.call_method("Target.sendMessageToTarget", _timeout=_timeout, **params)
+
+    def setAutoAttach(self, *args, autoAttach=REQUIRED, waitForDebuggerOnStart=REQUIRED, flatten=None, filter=None,
+                      _timeout=None, **unknown):
+        """Controls whether to automatically attach to new targets which are considered to be directly related to this one (for example, iframes or workers)."""
+        if args or unknown or autoAttach is REQUIRED or waitForDebuggerOnStart is REQUIRED:
+            return self._invalid("setAutoAttach", args, unknown, _timeout, {
+                "autoAttach": autoAttach, "waitForDebuggerOnStart": waitForDebuggerOnStart, "flatten": flatten,
+                "filter": filter})
+        params = {"autoAttach": autoAttach, "waitForDebuggerOnStart": waitForDebuggerOnStart}
+        if flatten is not None:
+            params["flatten"] = flatten
+        if filter is not None:
+            params["filter"] = filter
+        return self._tab.call_method("Target.setAutoAttach", _timeout=_timeout, **params)
+
+    def autoAttachRelated(self, *args, targetId=REQUIRED, waitForDebuggerOnStart=REQUIRED, filter=None, _timeout=None,
+                          **unknown):
+        """(experimental) Adds the specified target to the list of targets that will be monitored for any related target creation (such as child frames, child workers and new versions of service worker) and reported through `attachedToTarget`."""
+        if args or unknown or targetId is REQUIRED or waitForDebuggerOnStart is REQUIRED:
+            return self._invalid("autoAttachRelated", args, unknown, _timeout, {
+                "targetId": targetId, "waitForDebuggerOnStart": waitForDebuggerOnStart, "filter": filter})
+        params = {"targetId": targetId, "waitForDebuggerOnStart": waitForDebuggerOnStart}
+        if filter is not None:
+            params["filter"] = filter
+        return self._tab.call_method("Target.autoAttachRelated", _timeout=_timeout, **params)
+
+    def setDiscoverTargets(self, *args, discover=REQUIRED, filter=None, _timeout=None, **unknown):
+        """Controls whether to discover available targets and notify via `targetCreated/targetInfoChanged/targetDestroyed` events."""
+        if args or unknown or discover is REQUIRED:
+            return self._invalid("setDiscoverTargets", args, unknown, _timeout, {
+                "discover": discover, "filter": filter})
+        params = {"discover": discover}
+        if filter is not None:
+            params["filter"] = filter
+        return self._tab.call_method("Target.setDiscoverTargets", _timeout=_timeout, **params)
+
+    def setRemoteLocations(self, *args, locations=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Enables target discovery for the specified locations, when `setDiscoverTargets` was set to `true`."""
+        if args or unknown or locations is REQUIRED:
+            return self._invalid("setRemoteLocations", args, unknown, _timeout, {"locations": locations})
+        return self._tab.call_method("Target.setRemoteLocations", _timeout=_timeout, locations=locations)
+
+    def openDevTools(self, *args, targetId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Opens a DevTools window for the target."""
+        if args or unknown or targetId is REQUIRED:
+            return self._invalid("openDevTools", args, unknown, _timeout, {"targetId": targetId})
+        return self._tab.call_method("Target.openDevTools", _timeout=_timeout, targetId=targetId)
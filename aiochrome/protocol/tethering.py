@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Tethering(Domain):
+    """The Tethering domain defines methods and events for browser port binding."""
+
+    __slots__ = ()
+
+    _name = "Tethering"
+    _events = frozenset(["accepted"])
+
+    ACCEPTED = "Tethering.accepted"
+
+    def bind(self, *args, port=REQUIRED, _timeout=None, **unknown):
+        """Request browser port binding."""
+        if args or unknown or port is REQUIRED:
+            return self._invalid("bind", args, unknown, _timeout, {"port": port})
+        return self._tab.call_method("Tethering.bind", _timeout=_timeout, port=port)
+
+    def unbind(self, *args, port=REQUIRED, _timeout=None, **unknown):
+        """Request browser port unbinding."""
+        if args or unknown or port is REQUIRED:
+            return self._invalid("unbind", args, unknown, _timeout, {"port": port})
+        return self._tab.call_method("Tethering.unbind", _timeout=_timeout, port=port)
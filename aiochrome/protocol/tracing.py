@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class Tracing(Domain):
+    __slots__ = ()
+
+    _name = "Tracing"
+    _events = frozenset(["bufferUsage", "dataCollected", "tracingComplete"])
+
+    BUFFER_USAGE = "Tracing.bufferUsage"
+    DATA_COLLECTED = "Tracing.dataCollected"
+    TRACING_COMPLETE = "Tracing.tracingComplete"
+
+    def end(self, *args, _timeout=None, **unknown):
+        """Stop trace events collection."""
+        if args or unknown:
+            return self._invalid("end", args, unknown, _timeout, {})
+        return self._tab.call_method("Tracing.end", _timeout=_timeout)
+
+    def getCategories(self, *args, _timeout=None, **unknown):
+        """(experimental) Gets supported tracing categories."""
+        if args or unknown:
+            return self._invalid("getCategories", args, unknown, _timeout, {})
+        return self._tab.call_method("Tracing.getCategories", _timeout=_timeout)
+
+    def recordClockSyncMarker(self, *args, syncId=REQUIRED, _timeout=None, **unknown):
+        """(experimental) Record a clock sync marker in the trace."""
+        if args or unknown or syncId is REQUIRED:
+            return self._invalid("recordClockSyncMarker", args, unknown, _timeout, {"syncId": syncId})
+        return self._tab.call_method("Tracing.recordClockSyncMarker", _timeout=_timeout, syncId=syncId)
+
+    def requestMemoryDump(self, *args, deterministic=None, levelOfDetail=None, _timeout=None, **unknown):
+        """(experimental) Request a global memory dump."""
+        if args or unknown:
+            return self._invalid("requestMemoryDump", args, unknown, _timeout, {
+                "deterministic": deterministic, "levelOfDetail": levelOfDetail})
+        params = {}
+        if deterministic is not None:
+            params["deterministic"] = deterministic
+        if levelOfDetail is not None:
+            params["levelOfDetail"] = levelOfDetail
+        return self._tab.call_method("Tracing.requestMemoryDump", _timeout=_timeout, **params)
+
+    def start(self, *args, categories=None, options=None, bufferUsageReportingInterval=None, transferMode=None,
+              streamFormat=None, streamCompression=None, traceConfig=None, perfettoConfig=None, tracingBackend=None,
+              _timeout=None, **unknown):
+        """Start trace events collection."""
+        if args or unknown:
+            return self._invalid("start", args, unknown, _timeout, {
+                "categories": categories, "options": options,
+                "bufferUsageReportingInterval": bufferUsageReportingInterval, "transferMode": transferMode,
+                "streamFormat": streamFormat, "streamCompression": streamCompression, "traceConfig": traceConfig,
+                "perfettoConfig": perfettoConfig, "tracingBackend": tracingBackend})
+        params = {}
+        if categories is not None:
+            params["categories"] = categories
+        if options is not None:
+            params["options"] = options
+        if bufferUsageReportingInterval is not None:
+            params["bufferUsageReportingInterval"] = bufferUsageReportingInterval
+        if transferMode is not None:
+            params["transferMode"] = transferMode
+        if streamFormat is not None:
+            params["streamFormat"] = streamFormat
+        if streamCompression is not None:
+            params["streamCompression"] = streamCompression
+        if traceConfig is not None:
+            params["traceConfig"] = traceConfig
+        if perfettoConfig is not None:
+            params["perfettoConfig"] = perfettoConfig
+        if tracingBackend is not None:
+            params["tracingBackend"] = tracingBackend
+        return self._tab.call_method("Tracing.start", _timeout=_timeout, **params)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class WebAudio(Domain):
+    """This domain allows inspection of Web Audio API."""
+
+    __slots__ = ()
+
+    _name = "WebAudio"
+    _events = frozenset([
+        "audioListenerCreated", "audioListenerWillBeDestroyed", "audioNodeCreated", "audioNodeWillBeDestroyed",
+        "audioParamCreated", "audioParamWillBeDestroyed", "contextChanged", "contextCreated", "contextWillBeDestroyed",
+        "nodeParamConnected", "nodeParamDisconnected", "nodesConnected", "nodesDisconnected"])
+
+    AUDIO_LISTENER_CREATED = "WebAudio.audioListenerCreated"
+    AUDIO_LISTENER_WILL_BE_DESTROYED = "WebAudio.audioListenerWillBeDestroyed"
+    AUDIO_NODE_CREATED = "WebAudio.audioNodeCreated"
+    AUDIO_NODE_WILL_BE_DESTROYED = "WebAudio.audioNodeWillBeDestroyed"
+    AUDIO_PARAM_CREATED = "WebAudio.audioParamCreated"
+    AUDIO_PARAM_WILL_BE_DESTROYED = "WebAudio.audioParamWillBeDestroyed"
+    CONTEXT_CHANGED = "WebAudio.contextChanged"
+    CONTEXT_CREATED = "WebAudio.contextCreated"
+    CONTEXT_WILL_BE_DESTROYED = "WebAudio.contextWillBeDestroyed"
+    NODE_PARAM_CONNECTED = "WebAudio.nodeParamConnected"
+    NODE_PARAM_DISCONNECTED = "WebAudio.nodeParamDisconnected"
+    NODES_CONNECTED = "WebAudio.nodesConnected"
+    NODES_DISCONNECTED = "WebAudio.nodesDisconnected"
+
+    def enable(self, *args, _timeout=None, **unknown):
+        """Enables the WebAudio domain and starts sending context lifetime events."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {})
+        return self._tab.call_method("WebAudio.enable", _timeout=_timeout)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disables the WebAudio domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("WebAudio.disable", _timeout=_timeout)
+
+    def getRealtimeData(self, *args, contextId=REQUIRED, _timeout=None, **unknown):
+        """Fetch the realtime data from the registered contexts."""
+        if args or unknown or contextId is REQUIRED:
+            return self._invalid("getRealtimeData", args, unknown, _timeout, {"contextId": contextId})
+        return self._tab.call_method("WebAudio.getRealtimeData", _timeout=_timeout, contextId=contextId)
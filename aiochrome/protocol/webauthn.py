@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# generated by aiochrome/protocol/generate.py from devtools-protocol 0.0.1508733, do not edit
+
+from . import Domain, REQUIRED
+
+
+class WebAuthn(Domain):
+    """This domain allows configuring virtual authenticators to test the WebAuthn API."""
+
+    __slots__ = ()
+
+    _name = "WebAuthn"
+    _events = frozenset(["credentialAdded", "credentialAsserted", "credentialDeleted", "credentialUpdated"])
+
+    CREDENTIAL_ADDED = "WebAuthn.credentialAdded"
+    CREDENTIAL_ASSERTED = "WebAuthn.credentialAsserted"
+    CREDENTIAL_DELETED = "WebAuthn.credentialDeleted"
+    CREDENTIAL_UPDATED = "WebAuthn.credentialUpdated"
+
+    def enable(self, *args, enableUI=None, _timeout=None, **unknown):
+        """Enable the WebAuthn domain and start intercepting credential storage and retrieval with a virtual authenticator."""
+        if args or unknown:
+            return self._invalid("enable", args, unknown, _timeout, {"enableUI": enableUI})
+        params = {}
+        if enableUI is not None:
+            params["enableUI"] = enableUI
+        return self._tab.call_method("WebAuthn.enable", _timeout=_timeout, **params)
+
+    def disable(self, *args, _timeout=None, **unknown):
+        """Disable the WebAuthn domain."""
+        if args or unknown:
+            return self._invalid("disable", args, unknown, _timeout, {})
+        return self._tab.call_method("WebAuthn.disable", _timeout=_timeout)
+
+    def addVirtualAuthenticator(self, *args, options=REQUIRED, _timeout=None, **unknown):
+        """Creates and adds a virtual authenticator."""
+        if args or unknown or options is REQUIRED:
+            return self._invalid("addVirtualAuthenticator", args, unknown, _timeout, {"options": options})
+        return self._tab.call_method("WebAuthn.addVirtualAuthenticator", _timeout=_timeout, options=options)
+
+    def setResponseOverrideBits(self, *args, authenticatorId=REQUIRED, isBogusSignature=None, isBadUV=None,
+                                isBadUP=None, _timeout=None, **unknown):
+        """Resets parameters isBogusSignature, isBadUV, isBadUP to false if they are not present."""
+        if args or unknown or authenticatorId is REQUIRED:
+            return self._invalid("setResponseOverrideBits", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "isBogusSignature": isBogusSignature, "isBadUV": isBadUV,
+                "isBadUP": isBadUP})
+        params = {"authenticatorId": authenticatorId}
+        if isBogusSignature is not None:
+            params["isBogusSignature"] = isBogusSignature
+        if isBadUV is not None:
+            params["isBadUV"] = isBadUV
+        if isBadUP is not None:
+            params["isBadUP"] = isBadUP
+        return self._tab.call_method("WebAuthn.setResponseOverrideBits", _timeout=_timeout, **params)
+
+    def removeVirtualAuthenticator(self, *args, authenticatorId=REQUIRED, _timeout=None, **unknown):
+        """Removes the given authenticator."""
+        if args or unknown or authenticatorId is REQUIRED:
+            return self._invalid("removeVirtualAuthenticator", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId})
+        return self._tab.call_method("WebAuthn.removeVirtualAuthenticator", _timeout=_timeout,
+                                     authenticatorId=authenticatorId)
+
+    def addCredential(self, *args, authenticatorId=REQUIRED, credential=REQUIRED, _timeout=None, **unknown):
+        """Adds the credential to the specified authenticator."""
+        if args or unknown or authenticatorId is REQUIRED or credential is REQUIRED:
+            return self._invalid("addCredential", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "credential": credential})
+        return self._tab.call_method("WebAuthn.addCredential", _timeout=_timeout, authenticatorId=authenticatorId,
+                                     credential=credential)
+
+    def getCredential(self, *args, authenticatorId=REQUIRED, credentialId=REQUIRED, _timeout=None, **unknown):
+        """Returns a single credential stored in the given virtual authenticator that matches the credential ID."""
+        if args or unknown or authenticatorId is REQUIRED or credentialId is REQUIRED:
+            return self._invalid("getCredential", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "credentialId": credentialId})
+        return self._tab.call_method("WebAuthn.getCredential", _timeout=_timeout, authenticatorId=authenticatorId,
+                                     credentialId=credentialId)
+
+    def getCredentials(self, *args, authenticatorId=REQUIRED, _timeout=None, **unknown):
+        """Returns all the credentials stored in the given virtual authenticator."""
+        if args or unknown or authenticatorId is REQUIRED:
+            return self._invalid("getCredentials", args, unknown, _timeout, {"authenticatorId": authenticatorId})
+        return self._tab.call_method("WebAuthn.getCredentials", _timeout=_timeout, authenticatorId=authenticatorId)
+
+    def removeCredential(self, *args, authenticatorId=REQUIRED, credentialId=REQUIRED, _timeout=None, **unknown):
+        """Removes a credential from the authenticator."""
+        if args or unknown or authenticatorId is REQUIRED or credentialId is REQUIRED:
+            return self._invalid("removeCredential", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "credentialId": credentialId})
+        return self._tab.call_method("WebAuthn.removeCredential", _timeout=_timeout, authenticatorId=authenticatorId,
+                                     credentialId=credentialId)
+
+    def clearCredentials(self, *args, authenticatorId=REQUIRED, _timeout=None, **unknown):
+        """Clears all the credentials from the specified device."""
+        if args or unknown or authenticatorId is REQUIRED:
+            return self._invalid("clearCredentials", args, unknown, _timeout, {"authenticatorId": authenticatorId})
+        return self._tab.call_method("WebAuthn.clearCredentials", _timeout=_timeout, authenticatorId=authenticatorId)
+
+    def setUserVerified(self, *args, authenticatorId=REQUIRED, isUserVerified=REQUIRED, _timeout=None, **unknown):
+        """Sets whether User Verification succeeds or fails for an authenticator."""
+        if args or unknown or authenticatorId is REQUIRED or isUserVerified is REQUIRED:
+            return self._invalid("setUserVerified", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "isUserVerified": isUserVerified})
+        return self._tab.call_method("WebAuthn.setUserVerified", _timeout=_timeout, authenticatorId=authenticatorId,
+                                     isUserVerified=isUserVerified)
+
+    def setAutomaticPresenceSimulation(self, *args, authenticatorId=REQUIRED, enabled=REQUIRED, _timeout=None,
+                                       **unknown):
+        """Sets whether tests of user presence will succeed immediately (if true) or fail to resolve (if false) for an authenticator."""
+        if args or unknown or authenticatorId is REQUIRED or enabled is REQUIRED:
+            return self._invalid("setAutomaticPresenceSimulation", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "enabled": enabled})
+        return self._tab.call_method("WebAuthn.setAutomaticPresenceSimulation", _timeout=_timeout,
+                                     authenticatorId=authenticatorId, enabled=enabled)
+
+    def setCredentialProperties(self, *args, authenticatorId=REQUIRED, credentialId=REQUIRED, backupEligibility=None,
+                                backupState=None, _timeout=None, **unknown):
+        """Allows setting credential properties."""
+        if args or unknown or authenticatorId is REQUIRED or credentialId is REQUIRED:
+            return self._invalid("setCredentialProperties", args, unknown, _timeout, {
+                "authenticatorId": authenticatorId, "credentialId": credentialId,
+                "backupEligibility": backupEligibility, "backupState": backupState})
+        params = {"authenticatorId": authenticatorId, "credentialId": credentialId}
+        if backupEligibility is not None:
+            params["backupEligibility"] = backupEligibility
+        if backupState is not None:
+            params["backupState"] = backupState
+        return self._tab.call_method("WebAuthn.setCredentialProperties", _timeout=_timeout, **params)
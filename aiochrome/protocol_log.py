@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+import os
+import io
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import collections
+import concurrent.futures
+
+
+__all__ = ["ProtocolLog", "read_log"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProtocolLog:
+    """
+    the frames of any number of tabs, one NDJSON line per frame:
+
+        {"time": 1503817729.18, "tab": "...", "direction": "send", "id": 1001,
+         "method": "Page.navigate", "size": 58, "frame": "{...}"}
+
+    a frame longer than `max_frame` characters is cut (and marked `"truncated": true`),
+    0 logs no frame at all, None every frame in full. `sample` is the share of the
+    frames logged. a response gets the method of its call when the call was logged.
+
+    the tab only appends to a buffer (the frame already cut), formatting and writing
+    happen in a thread of their own every `flush_interval` seconds. frames beyond
+    `max_buffer` waiting to be written are dropped and counted, the tab never waits
+    for the log. tabs of several event loops may share a log.
+
+    `sink` is a path, rotated to `path.1` ... `path.<backups>` when it gets over
+    `max_bytes`, or a file-like object opened in text mode.
+    """
+
+    direction_send = 'send'
+    direction_recv = 'recv'
+
+    def __init__(self, sink, max_frame=1024, sample=1.0, max_bytes=10 * 1024 * 1024, backups=3,
+                 flush_interval=0.5, max_buffer=100000):
+        self.sink = sink
+        self.max_frame = max_frame
+        self.sample = sample
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+
+        self.logged = 0
+        self.dropped = 0
+
+        self._buffer = []
+        # event loop -> its flush timer, and its last write
+        self._handles = {}
+        self._last_writes = {}
+        self._executor = None
+
+        # only touched by the writer thread
+        self._fd = None
+        self._size = 0
+        self._methods = collections.OrderedDict()
+
+    def record(self, tab, direction, message, frame):
+        """called by the tab for every frame, keep it cheap"""
+        if self.sample < 1 and random.random() >= self.sample:
+            return
+
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped += 1
+            return
+
+        # a screenshot or a pdf must not wait in the buffer in full
+        size = len(frame)
+        truncated = self.max_frame is not None and size > self.max_frame
+        if truncated:
+            frame = frame[:self.max_frame] if self.max_frame else None
+
+        self._buffer.append((time.time(), tab.id, direction, message.get('id'), message.get('method'),
+                             frame, size, truncated))
+        if tab.loop not in self._handles:
+            self._handles[tab.loop] = tab.loop.call_later(self.flush_interval, self._write_buffer, tab.loop)
+
+    def _write_buffer(self, loop):
+        self._handles.pop(loop, None)
+        for closed in [other for other in self._handles if other.is_closed()]:
+            # its timer never fires, its frames go with this batch
+            del self._handles[closed]
+            self._last_writes.pop(closed, None)
+
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+
+        if self._executor is None:
+            # one writer thread keeps the batches in order
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        self._last_writes[loop] = loop.run_in_executor(self._executor, self._write, batch)
+
+    async def flush(self):
+        """write the buffered frames now"""
+        loop = asyncio.get_event_loop()
+        handle = self._handles.get(loop)
+        if handle is not None:
+            handle.cancel()
+        self._write_buffer(loop)
+
+        last_write = self._last_writes.get(loop)
+        if last_write is not None:
+            await last_write
+
+    async def close(self):
+        await self.flush()
+        if self._executor is not None:
+            await asyncio.get_event_loop().run_in_executor(self._executor, self._close)
+            self._executor.shutdown()
+            self._executor = None
+
+    def _entry(self, when, tab_id, direction, message_id, method, frame, size, truncated):
+        if message_id is not None:
+            key = (tab_id, message_id)
+            if direction == self.direction_send and method is not None:
+                self._methods[key] = method
+                if len(self._methods) > 10000:
+                    self._methods.popitem(last=False)  # calls which never got an answer
+            elif direction == self.direction_recv and method is None:
+                method = self._methods.pop(key, None)
+
+        if isinstance(frame, bytes):
+            frame = frame.decode('utf-8', 'replace')
+
+        entry = {"time": when, "tab": tab_id, "direction": direction, "size": size}
+        if message_id is not None:
+            entry['id'] = message_id
+        if method is not None:
+            entry['method'] = method
+
+        if frame is not None:
+            entry['frame'] = frame
+            if truncated:
+                entry['truncated'] = True
+
+        return entry
+
+    def _write(self, batch):
+        try:
+            lines = "".join(json.dumps(self._entry(*item)) + "\n" for item in batch)
+            if isinstance(self.sink, str):
+                self._write_file(lines)
+            else:
+                self.sink.write(lines)
+                self.sink.flush()
+
+            self.logged += len(batch)
+        except Exception:
+            logger.error("%s write failed" % self, exc_info=True)
+
+    def _write_file(self, lines):
+        if self._fd is None:
+            self._fd = open(self.sink, "a", encoding="utf-8")
+            self._size = self._fd.tell()
+
+        if self.max_bytes and self._size and self._size + len(lines) > self.max_bytes:
+            self._rotate()
+
+        self._fd.write(lines)
+        self._fd.flush()
+        self._size += len(lines)
+
+    def _rotate(self):
+        self._fd.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists("%s.%s" % (self.sink, i)):
+                os.replace("%s.%s" % (self.sink, i), "%s.%s" % (self.sink, i + 1))
+
+        if self.backups:
+            os.replace(self.sink, "%s.1" % self.sink)
+
+        self._fd = open(self.sink, "w", encoding="utf-8")
+        self._size = 0
+
+    def _close(self):
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+
+    def __str__(self):
+        return "<ProtocolLog %s>" % (self.sink if isinstance(self.sink, str) else type(self.sink).__name__)
+
+    __repr__ = __str__
+
+
+_stderr_log = None
+
+
+def stderr_log():
+    """the log of the tabs with `debug` on (or the DEBUG env variable), frames cut to 1KiB"""
+    global _stderr_log
+    if _stderr_log is None:
+        _stderr_log = ProtocolLog(sys.stderr, flush_interval=0.1)
+
+    return _stderr_log
+
+
+def read_log(path):
+    """the entries of a log, from the oldest rotated file to path itself"""
+    paths = [path]
+    i = 1
+    while os.path.exists("%s.%s" % (path, i)):
+        paths.insert(0, "%s.%s" % (path, i))
+        i += 1
+
+    for name in paths:
+        with io.open(name, encoding="utf-8") as fd:
+            for line in fd:
+                if line.strip():
+                    yield json.loads(line)
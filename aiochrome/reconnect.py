@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+
+__all__ = ["ReconnectPolicy"]
+
+
+class ReconnectPolicy:
+    """
+    how a Tab reconnects when its websocket is closed by the other side:
+    up to `max_retries` attempts, waiting `base_delay * factor ** attempt`
+    seconds (at most `max_delay`, with +/- `jitter` ratio) before each one.
+    """
+
+    def __init__(self, max_retries=5, base_delay=0.5, max_delay=10, factor=2, jitter=0.1):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+
+    def delays(self):
+        for attempt in range(self.max_retries):
+            delay = min(self.max_delay, self.base_delay * self.factor ** attempt)
+            if self.jitter:
+                delay *= 1 + random.uniform(-self.jitter, self.jitter)
+
+            yield delay
+
+    def __str__(self):
+        return "<ReconnectPolicy %s retries, %ss..%ss>" % (self.max_retries, self.base_delay, self.max_delay)
+
+    __repr__ = __str__
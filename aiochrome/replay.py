@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+"""
+record the frames of tabs and replay them without a browser, for load tests.
+
+    recorder = Recorder("session.ndjson")
+    browser = aiochrome.Browser(protocol_log=recorder)
+    ...
+    await recorder.close()
+
+    async with ReplayChrome("session.ndjson", speed=2) as replay:
+        browser = aiochrome.Browser(replay.url)
+        ...
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+import collections
+
+from .protocol_log import ProtocolLog, read_log
+from .fake_chrome import FakeChrome
+
+
+__all__ = ["Recorder", "ReplayChrome", "load_recording"]
+
+
+class Recorder(ProtocolLog):
+    """a ProtocolLog keeping every frame in full, in one file: the input of ReplayChrome"""
+
+    def __init__(self, sink, flush_interval=0.5, max_buffer=1000000):
+        super().__init__(sink, max_frame=None, sample=1.0, max_bytes=0, backups=0,
+                         flush_interval=flush_interval, max_buffer=max_buffer)
+
+
+class Step:
+    """a recorded call: its answer, how long it took and the events which followed it"""
+
+    __slots__ = ('method', 'params', 'sent', 'response', 'delay', 'events')
+
+    def __init__(self, method, params, sent):
+        self.method = method
+        self.params = params
+        self.sent = sent
+        self.response = None
+        self.delay = 0
+        # (seconds after the call, method, params)
+        self.events = []
+
+
+class Script:
+    """the recorded calls of one tab, in order"""
+
+    def __init__(self, tab_id):
+        self.tab_id = tab_id
+        self.steps = []
+        # events before the first call
+        self.events = []
+
+    def methods(self):
+        """method -> its answered steps, replayed in turn"""
+        methods = collections.defaultdict(collections.deque)
+        for step in self.steps:
+            if step.response is not None:
+                methods[step.method].append(step)
+
+        return methods
+
+    def __str__(self):
+        return "<Script [%s] %s calls>" % (self.tab_id, len(self.steps))
+
+    __repr__ = __str__
+
+
+def load_recording(entries, connection_id="browser"):
+    """
+    the Scripts of a recording (see read_log), one per recorded tab, in order of appearance.
+
+    the frames a multiplexed tab receives are logged by the browser connection
+    (`connection_id`), they go back to their tab by their sessionId.
+    """
+    scripts = collections.OrderedDict()
+    sessions = {}
+    pending = {}
+    last_step = {}
+
+    for entry in entries:
+        if 'frame' not in entry or entry.get('truncated'):
+            continue
+
+        message = json.loads(entry['frame'])
+        tab_id = entry['tab']
+        session_id = message.get('sessionId')
+        if session_id:
+            if tab_id != connection_id:
+                sessions[session_id] = tab_id
+            tab_id = sessions.get(session_id, tab_id)
+
+        if tab_id == connection_id:
+            continue  # browser level calls are answered by the fake itself
+
+        script = scripts.get(tab_id)
+        if script is None:
+            script = scripts[tab_id] = Script(tab_id)
+
+        if entry['direction'] == ProtocolLog.direction_send:
+            step = Step(message['method'], message.get('params', {}), entry['time'])
+            script.steps.append(step)
+            pending[(tab_id, message['id'])] = step
+            last_step[tab_id] = step
+        elif 'method' in message:
+            step = last_step.get(tab_id)
+            if step is None:
+                script.events.append((0, message['method'], message.get('params', {})))
+            else:
+                step.events.append((max(0, entry['time'] - step.sent), message['method'], message.get('params', {})))
+        else:
+            step = pending.pop((tab_id, message.get('id')), None)
+            if step is not None:
+                step.response = dict((key, value) for key, value in message.items() if key in ('result', 'error'))
+                step.delay = max(0, entry['time'] - step.sent)
+
+    return list(scripts.values())
+
+
+class ReplayChrome(FakeChrome):
+    """
+    a FakeChrome answering the calls of each tab like the recorded tabs were answered,
+    with the same delays and the events which followed, `speed` times faster (None for
+    no delay at all).
+
+    every new target plays the next recorded tab, round robin. a method is answered
+    with its recorded answers in turn (and again from the first one), a method which
+    was not recorded gets the fake's own answer.
+    """
+
+    def __init__(self, recording, speed=1.0, host="127.0.0.1", port=0):
+        super().__init__(host=host, port=port)
+        if isinstance(recording, str):
+            recording = read_log(recording)
+
+        self.scripts = [script for script in load_recording(recording) if script.steps]
+        self.speed = speed
+        self.record_calls = False
+
+        self.replayed = 0
+        self.unmatched = 0
+        self.events = 0
+
+        self._next_script = 0
+        # target id -> [script, method -> steps, initial events sent]
+        self._playing = {}
+
+    def new_target(self, url="about:blank", type="page"):
+        target = super().new_target(url, type)
+        if self.scripts and type == "page":
+            script = self.scripts[self._next_script % len(self.scripts)]
+            self._next_script += 1
+            self._playing[target.id] = [script, script.methods(), False]
+
+        return target
+
+    def script(self, target_id):
+        """the Script played by a target, or None"""
+        playing = self._playing.get(target_id)
+        return playing[0] if playing else None
+
+    async def close_target(self, target_id):
+        self._playing.pop(target_id, None)
+        return await super().close_target(target_id)
+
+    async def _emit(self, target, events):
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        for delay, method, params in events:
+            if self.speed:
+                wait = start + delay / self.speed - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            await target.emit(method, params)
+            self.events += 1
+
+    def _schedule(self, target, events):
+        if events:
+            self._spawn(self._emit(target, events))
+
+    async def _call(self, target, message):
+        playing = self._playing.get(target.id) if target is not None else None
+        steps = playing[1].get(message.get('method')) if playing else None
+        if not steps:
+            if playing:
+                self.unmatched += 1
+            return await super()._call(target, message)
+
+        if not playing[2]:
+            playing[2] = True
+            self._schedule(target, playing[0].events)
+
+        step = steps[0]
+        steps.rotate(-1)
+        self.replayed += 1
+
+        self._schedule(target, step.events)
+        if self.speed and step.delay:
+            await asyncio.sleep(step.delay / self.speed)
+
+        return dict(step.response, id=message['id'])
+
+    def stats(self):
+        return {
+            "scripts": len(self.scripts),
+            "replayed": self.replayed,
+            "unmatched": self.unmatched,
+            "events": self.events,
+        }
+
+    def __str__(self):
+        return "<ReplayChrome %s %s scripts>" % (self.url, len(self.scripts))
+
+    __repr__ = __str__
+
+
+def main(argv=None):
+    """
+    serve a recording like a chrome endpoint:
+
+        python -m aiochrome.replay session.ndjson --port 9222 --speed 2
+    """
+    parser = argparse.ArgumentParser(description="replay a recording of aiochrome tabs")
+    parser.add_argument("recording", help="a Recorder (or ProtocolLog with max_frame=None) file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9222)
+    parser.add_argument("--speed", type=float, default=1.0, help="N times faster than recorded, 0 for max speed")
+    options = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    loop = asyncio.get_event_loop()
+    replay = ReplayChrome(options.recording, speed=options.speed or None, host=options.host, port=options.port)
+    loop.run_until_complete(replay.start())
+    print("replaying %s tabs on %s" % (len(replay.scripts), replay.url))
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(replay.stop())
+        print(json.dumps(replay.stats()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import zlib
+import base64
+import asyncio
+
+from .exceptions import *
+
+
+__all__ = ["IOStream", "Trace", "write_base64", "open_sink"]
+
+
+# a multiple of 3 bytes, i.e. 4 base64 chars
+CHUNK_SIZE = 3 * 256 * 1024
+
+
+class open_sink:
+    """a path is opened (and closed) here, a file-like object is used as it is"""
+
+    def __init__(self, sink, mode="wb"):
+        self.sink = sink
+        self.mode = mode
+        self.fd = None
+
+    def __enter__(self):
+        if isinstance(self.sink, str):
+            self.fd = open(self.sink, self.mode)
+            return self.fd
+
+        if not callable(getattr(self.sink, 'write', None)):
+            raise RuntimeException("sink should be a path or a file-like object")
+
+        return self.sink
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.fd:
+            self.fd.close()
+
+
+def write_base64(data, sink, chunk_size=CHUNK_SIZE):
+    """
+    decode a base64 string into sink piece by piece, never holding the whole decoded artifact
+    """
+    # 4 base64 chars make 3 bytes
+    step = chunk_size // 3 * 4
+    written = 0
+    with open_sink(sink) as fd:
+        for i in range(0, len(data), step):
+            chunk = base64.b64decode(data[i:i + step])
+            fd.write(chunk)
+            written += len(chunk)
+
+    return written
+
+
+class IOStream:
+    """
+    read a protocol stream handle (transferMode: ReturnAsStream) with IO.read:
+
+        async for chunk in tab.read_stream(handle):
+            fd.write(chunk)
+
+    the handle is closed with IO.close once it is exhausted, or by close().
+    """
+
+    def __init__(self, tab, handle, chunk_size=CHUNK_SIZE, timeout=None):
+        self.tab = tab
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+        self.read_bytes = 0
+        self._eof = False
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._eof:
+            result = await self.tab.call_method("IO.read", handle=self.handle, size=self.chunk_size,
+                                                _timeout=self.timeout)
+            self._eof = result.get('eof', False)
+
+            data = result.get('data', '')
+            if result.get('base64Encoded'):
+                chunk = base64.b64decode(data)
+            else:
+                chunk = data.encode('utf-8')
+
+            if self._eof:
+                await self.close()
+
+            if chunk:
+                self.read_bytes += len(chunk)
+                return chunk
+
+        raise StopAsyncIteration
+
+    async def read(self):
+        """the rest of the stream at once, only for small streams"""
+        chunks = []
+        async for chunk in self:
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    async def save(self, sink):
+        """write the stream to a path or a file-like object, return the written size"""
+        written = 0
+        with open_sink(sink) as fd:
+            async for chunk in self:
+                fd.write(chunk)
+                written += len(chunk)
+
+        return written
+
+    async def close(self):
+        if self._closed:
+            return False
+
+        self._closed = True
+        self._eof = True
+        await self.tab.call_method("IO.close", handle=self.handle, _timeout=self.timeout)
+        return True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __str__(self):
+        return "<IOStream [%s]>" % self.handle
+
+    __repr__ = __str__
+
+
+class _CountingWriter:
+    def __init__(self, fd):
+        self.fd = fd
+        self.written = 0
+
+    def write(self, data):
+        self.fd.write(data)
+        self.written += len(data)
+        return len(data)
+
+    def flush(self):
+        if hasattr(self.fd, 'flush'):
+            self.fd.flush()
+
+
+class Trace:
+    """
+    Tracing.start with transferMode ReturnAsStream for the body of the `async with`,
+    the trace is then read with IO.read and written to sink chunk by chunk:
+
+        async with tab.trace("trace.json.gz", gzip=True) as trace:
+            await tab.goto("https://github.com/fate0/aiochrome")
+        print(trace.size)
+
+    `size` is the written size. with gzip chrome is asked to compress the stream, or it is compressed here if
+    chrome can't. without gzip a compressed stream is decompressed on the fly.
+    """
+
+    default_categories = ["-*", "devtools.timeline", "v8.execute", "disabled-by-default-devtools.timeline",
+                          "disabled-by-default-devtools.timeline.frame", "toplevel", "blink.console",
+                          "blink.user_timing", "latencyInfo", "disabled-by-default-v8.cpu_profiler"]
+
+    def __init__(self, tab, sink, categories=None, gzip=False, timeout=None, **params):
+        self.tab = tab
+        self.sink = sink
+        self.categories = categories or self.default_categories
+        self.gzip = gzip
+        self.timeout = timeout
+        self.params = params
+
+        self.size = 0
+        self.data_loss = False
+        self.compression = None
+        self._complete = None
+
+    def feed(self, method, params):
+        if method == "Tracing.tracingComplete" and not self._complete.done():
+            self._complete.set_result(params)
+
+    def fail(self, exc):
+        if self._complete.done():
+            return
+
+        self._complete.set_exception(exc)
+        # stop() may fail on Tracing.end first, nothing else would retrieve it
+        self._complete.exception()
+
+    async def start(self):
+        self._complete = self.tab.loop.create_future()
+        self.tab._watchers.append(self)
+
+        params = dict(self.params)
+        params.setdefault("traceConfig", {"includedCategories": [c for c in self.categories if c[0] != "-"],
+                                          "excludedCategories": [c[1:] for c in self.categories if c[0] == "-"]})
+        if self.gzip:
+            params["streamCompression"] = "gzip"
+
+        try:
+            await self.tab.call_method("Tracing.start", transferMode="ReturnAsStream", _timeout=self.timeout, **params)
+        except BaseException:
+            self.tab._watchers.remove(self)
+            raise
+
+    async def stop(self):
+        """end the trace and save it, return the written size"""
+        try:
+            # done already: failed with the tab, raised below
+            if not self._complete.done():
+                await self.tab.call_method("Tracing.end", _timeout=self.timeout)
+            try:
+                complete = await asyncio.wait_for(self._complete, self.timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutException("Tracing.tracingComplete timeout")
+        finally:
+            self.tab._watchers.remove(self)
+
+        self.data_loss = complete.get('dataLossOccurred', False)
+        self.compression = complete.get('streamCompression', 'none')
+        stream = self.tab.read_stream(complete['stream'], timeout=self.timeout)
+        async with stream:
+            self.size = await self._save(stream)
+
+        return self.size
+
+    async def _save(self, stream):
+        compressed = self.compression == "gzip"
+        with open_sink(self.sink) as fd:
+            out = _CountingWriter(fd)
+            if self.gzip and not compressed:
+                # chrome sent it as it is, compress it here
+                with gzip.GzipFile(fileobj=out, mode="wb") as gz:
+                    async for chunk in stream:
+                        gz.write(chunk)
+            else:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if compressed and not self.gzip else None
+                async for chunk in stream:
+                    out.write(decompressor.decompress(chunk) if decompressor else chunk)
+
+                if decompressor:
+                    out.write(decompressor.flush())
+
+        return out.written
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def __str__(self):
+        return "<Trace [%s]>" % self.tab.id
+
+    __repr__ = __str__
@@ -1,13 +1,24 @@
 # -*- coding: utf-8 -*-
 
 import os
-import json
+import math
+import time
+import base64
 import asyncio
 import logging
 import warnings
 import functools
 import websockets
 
+from .codec import get_codec
+from .stream import IOStream, Trace, CHUNK_SIZE, write_base64
+from .event_queue import EventQueue
+from .lifecycle import NavigationWatcher
+from .protocol_log import ProtocolLog, stderr_log
+from .intercept import Interceptor
+from .dispatcher import EventDispatcher
+from .listeners import Listeners
+from .protocol import load_domain
 from .exceptions import *
 
 
@@ -18,6 +29,8 @@ logger = logging.getLogger(__name__)
 
 
 class GenericAttr:
+    """a domain which is not in the protocol bindings, any method name goes"""
+
     def __init__(self, name, tab):
         self.__dict__['name'] = name
         self.__dict__['tab'] = tab
@@ -40,11 +53,27 @@ class Tab:
     status_started = 'started'
     status_stopped = 'stopped'
 
+    # a full `block` event queue holds back the websocket, see TabSession
+    _wait_event_queue = True
+
     def __init__(self, **kwargs):
         self.id = kwargs.get("id")
         self.type = kwargs.get("type")
-        self.debug = os.getenv("DEBUG", False)
         self.loop = kwargs.get('loop', None) or asyncio.get_event_loop()
+        self.codec = get_codec(kwargs.pop('codec', None))
+        self._event_queue_size = kwargs.pop('event_queue_size', 0)
+        self._event_overflow = kwargs.pop('event_overflow', EventQueue.policy_block)
+        self._event_concurrency = kwargs.pop('event_concurrency', 1)
+        self.reconnect = kwargs.pop('reconnect', None)
+        self.cache = kwargs.pop('cache', None)
+        # on, the protocol bindings reject unknown methods and params; off (default) sends them anyway
+        self.strict_protocol = kwargs.pop('strict_protocol', False)
+        # instrumentation, see Metrics; None keeps the hot paths at one attribute check
+        self.hooks = kwargs.pop('hooks', None)
+        # a ProtocolLog of the frames, switchable at runtime
+        self.protocol_log = kwargs.pop('protocol_log', None)
+        if self.protocol_log is None and os.getenv("DEBUG"):
+            self.protocol_log = stderr_log()
 
         self._websocket_url = kwargs.get("webSocketDebuggerUrl")
         self._kwargs = kwargs
@@ -53,6 +82,16 @@ class Tab:
 
         self._ws = None
 
+        # set while the websocket is usable, calls wait for it during a reconnect
+        self._connected = asyncio.Event()
+        self._enabled_domains = {}
+        self._focus_emulated = False
+        self._lifecycle_enabled = False
+        self._network_enabled = False
+        # params of the Emulation.setDeviceMetricsOverride in effect, restored by screenshot
+        self._device_metrics = None
+        self.reconnects = 0
+
         self._recv_task = None
         self._handle_event_task = None
 
@@ -60,83 +99,188 @@ class Tab:
         self._started = False
         self.status = self.status_initial
 
-        self.event_handlers = {}
+        self.listeners = Listeners()
         self.method_results = {}
-        self.event_queue = asyncio.Queue()
+        self.event_queue = EventQueue(self._event_queue_size, self._event_overflow)
+        self.unhandled_events = 0
+        # internal waiters (goto) fed with every event, listeners or not, failed with the tab
+        self._watchers = []
+        self.interceptor = None
+        self.dispatcher = EventDispatcher(self, self._event_concurrency)
+
+    @property
+    def debug(self):
+        return self.protocol_log is not None
+
+    @debug.setter
+    def debug(self, value):
+        # the frames of the tab on stderr, cut to 1KiB
+        self.protocol_log = stderr_log() if value else None
 
     async def _send(self, message, timeout=None):
         if 'id' not in message:
             self._cur_id += 1
             message['id'] = self._cur_id
 
-        message_json = json.dumps(message)
+        message_json = self.codec.dumps(message)
 
-        if self.debug:  # pragma: no cover
-            print("SEND ► %s" % message_json)
+        if self.protocol_log is not None:
+            self.protocol_log.record(self, ProtocolLog.direction_send, message, message_json)
 
-        if not isinstance(timeout, (int, float)) or timeout > 1:
-            q_timeout = 1
-        else:
-            q_timeout = timeout / 2.0
+        future = self.loop.create_future()
+        self.method_results[message['id']] = future
 
-        try:
-            queue = asyncio.Queue()
-            self.method_results[message['id']] = queue
+        hooks = self.hooks
+        if hooks is not None:
+            hooks.on_send(self, message['method'], len(message_json))
+            start = time.perf_counter()
+            error = True
 
-            # just raise the exception to user
+        try:
             await self._ws.send(message_json)
 
-            while not self._stopped.is_set():
-                try:
-                    if isinstance(timeout, (int, float)):
-                        if timeout < q_timeout:
-                            q_timeout = timeout
+            # one deadline for the whole call, the future is resolved by _recv_loop
+            result = await asyncio.wait_for(future, timeout)
+            if hooks is not None:
+                error = 'error' in result
+            return result
+        except asyncio.TimeoutError:
+            raise TimeoutException("Calling %s timeout" % message['method'])
+        except websockets.ConnectionClosed as e:
+            raise TabConnectionException("Tab %s connection closed when calling %s: %s" % (self.id, message['method'], e))
+        finally:
+            self.method_results.pop(message['id'], None)
+            if hooks is not None:
+                hooks.on_response(self, message['method'], time.perf_counter() - start, error)
+
+    def _fail_pending(self, exc):
+        method_results, self.method_results = self.method_results, {}
+        for future in method_results.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    def _fail_watchers(self, exc):
+        for watcher in list(self._watchers):
+            watcher.fail(exc)
+
+    def _lost(self, exc):
+        """the connection is gone for good"""
+        self.status = self.status_stopped
+        self._stopped.set()
+        self._connected.set()
+        self._fail_pending(exc)
+        self._fail_watchers(exc)
+        if self._handle_event_task:
+            self._handle_event_task.cancel()
+
+    async def _connect(self):
+        # screenshots, pdf and response bodies easily exceed the 1MiB default
+        self._ws = await websockets.connect(self._websocket_url, loop=self.loop, max_size=None)
+
+    async def _reconnect(self):
+        for delay in self.reconnect.delays():
+            await asyncio.sleep(delay)
+            if self._stopped.is_set():
+                return False
 
-                        timeout -= q_timeout
+            try:
+                await self._connect()
+            except (OSError, websockets.WebSocketException) as e:
+                logger.warning("%s reconnect failed: %s" % (self, e))
+                continue
 
-                    return await asyncio.wait_for(queue.get(), q_timeout)
-                except asyncio.TimeoutError:
-                    if isinstance(timeout, (int, float)) and timeout <= 0:
-                        raise TimeoutException("Calling %s timeout" % message['method'])
+            self.reconnects += 1
+            # answers are read by this very loop, replay from another task
+            asyncio.ensure_future(self._replay(), loop=self.loop)
+            return True
 
-                    continue
+        return False
 
-            raise UserAbortException("User abort, call stop() when calling %s" % message['method'])
+    async def _replay(self):
+        """enable the domains again, listeners are kept by the tab itself"""
+        # neither is a domain, they are set again on their next use
+        self._lifecycle_enabled = False
+        self._focus_emulated = False
+        # emulation ends with the old connection
+        self._device_metrics = None
+        try:
+            for method, params in list(self._enabled_domains.values()):
+                result = await self._send({"method": method, "params": params})
+                if 'error' in result:
+                    logger.warning("%s replay %s error: %s" % (self, method, result['error']['message']))
+        except AioChromeException:
+            logger.warning("%s replay failed" % self, exc_info=True)
         finally:
-            self.method_results.pop(message['id'])
+            self._connected.set()
+
+    async def _connection_lost(self, exc):
+        """return True when the loop can go on with a new connection"""
+        exc = TabConnectionException("Tab %s connection closed: %s" % (self.id, exc))
+        self._connected.clear()
+        self._fail_pending(exc)
+
+        if self.reconnect and not self._stopped.is_set() and await self._reconnect():
+            return True
+
+        if not self._stopped.is_set():
+            self._lost(exc)
+
+        return False
 
     async def _recv_loop(self):
         while not self._stopped.is_set():
             try:
                 message_json = await self._ws.recv()
-                message = json.loads(message_json)
-            except:
+            except (websockets.ConnectionClosed, OSError) as e:
+                # the old code spun here forever, once per closed recv()
+                if await self._connection_lost(e):
+                    continue
+
+                break
+
+            try:
+                message = self.codec.loads(message_json)
+            except ValueError:  # pragma: no cover
+                warnings.warn("invalid message: %s" % message_json)
                 continue
 
-            if self.debug:  # pragma: no cover
-                print('◀ RECV %s' % message_json)
+            if self.protocol_log is not None:
+                self.protocol_log.record(self, ProtocolLog.direction_recv, message, message_json)
 
-            if "method" in message:
-                await self.event_queue.put(message)
+            if self.hooks is not None:
+                self.hooks.on_receive(self, "event" if "method" in message else "response", len(message_json))
 
-            elif "id" in message:
-                if message["id"] in self.method_results:
-                    await self.method_results[message['id']].put(message)
-            else:  # pragma: no cover
-                warnings.warn("unknown message: %s" % message)
+            await self._on_message(message)
 
-    async def _handle_event_loop(self):
-        while True:
-            event = await self.event_queue.get()
+    async def _on_message(self, message):
+        if "method" in message:
+            if self._watchers:
+                for watcher in list(self._watchers):
+                    watcher.feed(message['method'], message.get('params', {}))
+
+            # nobody listens, don't let it take room in the queue
+            if message['method'] not in self.listeners:
+                self.unhandled_events += 1
+                return
 
-            if event['method'] in self.event_handlers:
-                try:
-                    await self.event_handlers[event['method']](**event['params'])
-                except Exception as e:
-                    logger.error("callback %s exception" % event['method'], exc_info=True)
+            await self.event_queue.put(message, self._wait_event_queue)
+            if self.hooks is not None:
+                self.hooks.on_event(self, message['method'], self.event_queue.qsize())
+
+        elif "id" in message:
+            future = self.method_results.get(message["id"])
+            if future and not future.done():
+                future.set_result(message)
+        else:  # pragma: no cover
+            warnings.warn("unknown message: %s" % message)
+
+    async def _handle_event_loop(self):
+        await self.dispatcher.run()
 
     def __getattr__(self, item):
-        attr = GenericAttr(item, self)
+        # tab.Page: the generated Page domain, loaded on first use and kept on the tab
+        domain = load_domain(item)
+        attr = domain(self) if domain is not None else GenericAttr(item, self)
         setattr(self, item, attr)
         return attr
 
@@ -147,32 +291,233 @@ class Tab:
         if args:
             raise CallMethodException("the params should be key=value format")
 
+        timeout = kwargs.pop("_timeout", None)
+        if not self._connected.is_set():
+            # the wait for a reconnect is part of the call's deadline
+            start = self.loop.time()
+            try:
+                await asyncio.wait_for(self._connected.wait(), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutException("Calling %s timeout while reconnecting" % _method)
+
+            if timeout is not None:
+                timeout = max(0, timeout - (self.loop.time() - start))
+
         if self._stopped.is_set():
             raise RuntimeException("Tab has been stopped")
 
-        timeout = kwargs.pop("_timeout", None)
         result = await self._send({"method": _method, "params": kwargs}, timeout=timeout)
         if 'result' not in result and 'error' in result:
             warnings.warn("%s error: %s" % (_method, result['error']['message']))
             raise CallMethodException("calling method: %s error: %s" % (_method, result['error']['message']))
 
+        if self.reconnect is not None:
+            self._track_domain(_method, kwargs)
+
+        if _method == "Emulation.setDeviceMetricsOverride":
+            self._device_metrics = kwargs
+        elif _method == "Emulation.clearDeviceMetricsOverride":
+            self._device_metrics = None
+
         return result['result']
 
+    def _track_domain(self, method, params):
+        domain, _, name = method.rpartition('.')
+        if name == 'enable':
+            self._enabled_domains[domain] = (method, params)
+        elif name == 'disable':
+            self._enabled_domains.pop(domain, None)
+
+    async def goto(self, url, wait_until=NavigationWatcher.wait_load, timeout=None, idle_time=0.5, **kwargs):
+        """
+        Page.navigate to url and wait for `load`, `domcontentloaded` or `networkidle`,
+        kwargs are Page.navigate params. `timeout` is one deadline for the whole navigation.
+
+        return the Page.navigate result with `timing` (seconds from the call to `navigate`,
+        `domcontentloaded`, `load`, `networkidle` and `total`, as observed) and `requests`.
+        """
+        deadline = None if timeout is None else self.loop.time() + timeout
+
+        def remaining():
+            return None if deadline is None else max(0, deadline - self.loop.time())
+
+        watcher = NavigationWatcher(self, wait_until, idle_time)
+        self._watchers.append(watcher)
+        try:
+            if not self._lifecycle_enabled:
+                await self.call_method("Page.enable", _timeout=remaining())
+                await self.call_method("Page.setLifecycleEventsEnabled", enabled=True, _timeout=remaining())
+                self._lifecycle_enabled = True
+
+            if wait_until == NavigationWatcher.wait_networkidle and not self._network_enabled:
+                await self.call_method("Network.enable", _timeout=remaining())
+                self._network_enabled = True
+
+            result = await self.call_method("Page.navigate", url=url, _timeout=remaining(), **kwargs)
+            if result.get('errorText'):
+                raise CallMethodException("navigate to %s error: %s" % (url, result['errorText']))
+
+            watcher.navigated(result)
+            await watcher.wait(remaining())
+        finally:
+            watcher.close()
+            self._watchers.remove(watcher)
+
+        return dict(result, timing=watcher.timing, requests=watcher.requests)
+
+    async def intercept(self, rules, cache=None):
+        """
+        handle the requests of the tab with the Fetch domain, see InterceptRule:
+
+            await tab.intercept([
+                {"action": "block", "types": ["Image", "Font", "Media"]},
+                {"action": "headers", "headers": {"Accept-Language": "en"}},
+                {"action": "cache", "types": ["Script", "Stylesheet"]},
+            ], cache=ResponseCache("/tmp/aiochrome-cache"))
+
+        `cache` defaults to the cache of the tab (see Browser). replaces the rules of
+        a previous call, `await tab.interceptor.stop()` stops it.
+        """
+        if self.interceptor is not None:
+            await self.interceptor.stop()
+
+        self.interceptor = Interceptor(self, rules, self.cache if cache is None else cache)
+        await self.interceptor.start()
+        return self.interceptor
+
+    async def batch(self, calls, window=None, timeout=None):
+        """
+        send many calls without waiting for each answer, the results come back in order.
+
+        calls: iterable of (method, params dict) or method names
+        window: max calls in flight, all of them by default
+        timeout: per call timeout
+
+        a failed call does not fail the batch, its exception takes its place in the results.
+        """
+        if not self._started:
+            raise RuntimeException("Cannot call method before it is started")
+
+        window = asyncio.Semaphore(window) if window else None
+
+        async def call(item):
+            method, params = (item, {}) if isinstance(item, str) else item
+            try:
+                if window is None:
+                    return await self.call_method(method, _timeout=timeout, **params)
+
+                async with window:
+                    return await self.call_method(method, _timeout=timeout, **params)
+            except AioChromeException as e:
+                return e
+
+        return await asyncio.gather(*[call(item) for item in calls])
+
+    def read_stream(self, handle, chunk_size=CHUNK_SIZE, timeout=None):
+        """an async iterator of the decoded chunks of a protocol stream handle"""
+        return IOStream(self, handle, chunk_size, timeout)
+
+    async def pdf_stream(self, _timeout=None, **kwargs):
+        """Page.printToPDF with transferMode ReturnAsStream, kwargs are printToPDF params"""
+        result = await self.call_method("Page.printToPDF", transferMode="ReturnAsStream", _timeout=_timeout, **kwargs)
+        return self.read_stream(result['stream'], timeout=_timeout)
+
+    async def save_pdf(self, sink, _timeout=None, **kwargs):
+        """print to a path or a file-like object chunk by chunk, return the written size"""
+        stream = await self.pdf_stream(_timeout=_timeout, **kwargs)
+        async with stream:
+            return await stream.save(sink)
+
+    def trace(self, sink, categories=None, gzip=False, _timeout=None, **kwargs):
+        """
+        an async context manager tracing its body into sink (a path or a file-like object),
+        streamed with IO.read and gzipped on the fly with gzip, kwargs are Tracing.start params
+        """
+        return Trace(self, sink, categories, gzip, _timeout, **kwargs)
+
+    async def screenshot(self, sink=None, full_page=False, _timeout=None, **kwargs):
+        """
+        Page.captureScreenshot without activate_tab, kwargs are captureScreenshot params
+        (format, quality, clip, ...). full_page sizes the viewport to the whole page first.
+
+        the image is decoded into sink (a path or a file-like object) and the written size
+        returned, or returned as bytes without sink.
+        """
+        if not self._focus_emulated:
+            # a background tab keeps rendering as if it had the focus, no need to bring it to front
+            try:
+                await self.call_method("Emulation.setFocusEmulationEnabled", enabled=True, _timeout=_timeout)
+            except CallMethodException:  # pragma: no cover
+                pass  # chrome < 63
+
+            self._focus_emulated = True
+
+        clip = kwargs.get('clip')
+        if clip is not None and 'scale' not in clip:
+            kwargs['clip'] = dict(clip, scale=1)
+
+        if not full_page:
+            result = await self.call_method("Page.captureScreenshot", _timeout=_timeout, **kwargs)
+        else:
+            previous = self._device_metrics
+            metrics = await self.call_method("Page.getLayoutMetrics", _timeout=_timeout)
+            size = metrics.get('cssContentSize') or metrics['contentSize']
+            width, height = int(math.ceil(size['width'])), int(math.ceil(size['height']))
+
+            await self.call_method("Emulation.setDeviceMetricsOverride", width=width, height=height,
+                                   deviceScaleFactor=1, mobile=False, _timeout=_timeout)
+            kwargs.setdefault('clip', {"x": 0, "y": 0, "width": width, "height": height, "scale": 1})
+            try:
+                result = await self.call_method("Page.captureScreenshot", _timeout=_timeout, **kwargs)
+            finally:
+                # an override set with call_method before is set again, not cleared
+                if previous is None:
+                    await self.call_method("Emulation.clearDeviceMetricsOverride", _timeout=_timeout)
+                else:
+                    await self.call_method("Emulation.setDeviceMetricsOverride", _timeout=_timeout, **previous)
+
+        if sink is None:
+            return base64.b64decode(result['data'])
+
+        return write_base64(result['data'], sink)
+
     def set_listener(self, event, callback):
+        """the one listener of event, replacing the others; a false callback removes them"""
         if not callback:
-            return self.event_handlers.pop(event, None)
+            removed = self.listeners.remove(event)
+            return removed[0] if removed else None
 
-        if not callable(callback):
-            raise RuntimeException("callback should be callable")
+        return self.listeners.set(event, callback)
 
-        self.event_handlers[event] = callback
-        return True
+    def add_listener(self, event, callback, once=False):
+        """
+        one more listener of event, `Domain.*` and `*` get every event of a domain
+        or of the tab as `callback(method, params)`, see Listeners
+        """
+        return self.listeners.add(event, callback, once)
+
+    def remove_listener(self, event, callback=None):
+        return self.listeners.remove(event, callback)
+
+    def set_event_policy(self, event, policy, key=None):
+        return self.event_queue.set_policy(event, policy, key)
+
+    def set_dispatch_key(self, event, key):
+        return self.dispatcher.set_key(event, key)
+
+    def handler_stats(self):
+        return self.dispatcher.stats()
+
+    def event_stats(self):
+        stats = self.event_queue.stats()
+        stats['unhandled'] = self.unhandled_events
+        return stats
 
     def get_listener(self, event):
-        return self.event_handlers.get(event, None)
+        return self.listeners.get(event)
 
     def del_all_listeners(self):
-        self.event_handlers = {}
+        self.listeners.clear()
         return True
 
     async def start(self):
@@ -185,7 +530,15 @@ class Tab:
         self._started = True
         self.status = self.status_started
         self._stopped.clear()
-        self._ws = await websockets.connect(self._websocket_url, loop=self.loop)
+        try:
+            await self._connect()
+        except BaseException:
+            # never connected, nothing to stop
+            self._started = False
+            self.status = self.status_initial
+            raise
+
+        self._connected.set()
 
         self._recv_task = asyncio.ensure_future(self._recv_loop(), loop=self.loop)
         self._handle_event_task = asyncio.ensure_future(self._handle_event_loop(), loop=self.loop)
@@ -201,9 +554,16 @@ class Tab:
 
         self.status = self.status_stopped
         self._stopped.set()
-        await self._ws.close()
-        self._recv_task.cancel()
-        self._handle_event_task.cancel()
+        self._connected.set()
+        exc = UserAbortException("User abort, call stop() when calling method")
+        self._fail_pending(exc)
+        self._fail_watchers(exc)
+        if self._ws is not None:
+            await self._ws.close()
+        if self._recv_task:
+            self._recv_task.cancel()
+        if self._handle_event_task:
+            self._handle_event_task.cancel()
         return True
 
     async def wait(self, timeout=None):
@@ -217,8 +577,7 @@ class Tab:
             except asyncio.TimeoutError:
                 return False
 
-        await self._recv_task
-        await self._handle_event_task
+        await self._stopped.wait()
 
     def __str__(self):
         return "<Tab [%s]>" % self.id
@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+encode/decode throughput and peak memory of every installed codec
+
+the traffic is read from a ProtocolLog written with `max_frame=None`
+(truncated frames are skipped), or generated to look like a crawl: small
+call/response frames, Network events and a few multi-megabyte screenshot
+payloads.
+
+usage: PYTHONPATH=. python benchmarks/bench_codec.py [traffic.ndjson] [rounds]
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import tracemalloc
+
+from aiochrome.codec import codecs
+from aiochrome.protocol_log import read_log
+
+
+def generate_traffic():
+    frames = []
+    for i in range(2000):
+        frames.append(json.dumps({"id": 1000 + i, "method": "Runtime.evaluate", "params": {"expression": "1"}}))
+        frames.append(json.dumps({"id": 1000 + i, "result": {"result": {"type": "number", "value": 1}}}))
+        frames.append(json.dumps({"method": "Network.requestWillBeSent", "params": {
+            "requestId": "1000.%d" % i, "loaderId": "1000.1", "documentURL": "http://www.fatezero.org/",
+            "request": {"url": "http://www.fatezero.org/static/%d.js" % i, "method": "GET",
+                        "headers": {"User-Agent": "Mozilla/5.0 HeadlessChrome/62.0.3197.0"}},
+            "timestamp": 87792.945539 + i, "wallTime": 1503817729.18642, "initiator": {"type": "other"},
+            "type": "Script", "frameId": "1000.1"}}))
+
+    for i in range(5):
+        data = base64.b64encode(os.urandom(4 * 1024 * 1024)).decode('ascii')
+        frames.append(json.dumps({"id": 9000 + i, "result": {"data": data}}))
+
+    return frames
+
+
+def bench(codec, frames, rounds):
+    raw = [frame.encode('utf-8') for frame in frames] if codec.accepts_bytes else frames
+    total = sum(len(frame) for frame in frames) * rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        messages = [codec.loads(frame) for frame in raw]
+    decode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            codec.dumps(message)
+    encode = time.perf_counter() - start
+
+    del messages
+    tracemalloc.start()
+    for frame in raw:
+        codec.loads(frame)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "decode_mb_per_sec": round(total / decode / 1024 / 1024, 1),
+        "encode_mb_per_sec": round(total / encode / 1024 / 1024, 1),
+        "decode_peak_mb": round(peak / 1024 / 1024, 1),
+        "input": "bytes" if codec.accepts_bytes else "str",
+    }
+
+
+def main():
+    if len(sys.argv) > 1:
+        frames = [entry['frame'] for entry in read_log(sys.argv[1])
+                  if 'frame' in entry and not entry.get('truncated')]
+    else:
+        frames = generate_traffic()
+
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    results = {}
+    for codec_class in codecs:
+        try:
+            codec = codec_class()
+        except ImportError:
+            continue
+
+        results[codec.name] = bench(codec, frames, rounds)
+
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+cold start of ChromeLauncher: spawn to /json/version, and spawn to the first
+tab which answers Runtime.evaluate, for a number of processes started at once
+
+usage: PYTHONPATH=. python benchmarks/bench_launch.py [count] [rounds] [--stub] [-- chrome args]
+
+--stub runs aiochrome.fake_chrome instead of chrome, to measure the launcher itself.
+"""
+
+import sys
+import asyncio
+import statistics
+
+from aiochrome.launcher import ChromeLauncher
+
+
+async def run(count, rounds, executable, args):
+    ready, first_tab = [], []
+    for _ in range(rounds):
+        async with ChromeLauncher(executable, count=count, args=args, warmup=True) as launcher:
+            for stats in launcher.stats():
+                ready.append(stats['ready_time'])
+                first_tab.append(stats['first_tab_time'])
+
+    for name, values in (("ready", ready), ("first tab", first_tab)):
+        values.sort()
+        print("%-10s min %.3fs  median %.3fs  max %.3fs" % (
+            name, values[0], statistics.median(values), values[-1]))
+
+
+def main():
+    argv = sys.argv[1:]
+    args = []
+    if "--" in argv:
+        args = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+
+    executable = None
+    if "--stub" in argv:
+        argv.remove("--stub")
+        executable = [sys.executable, "-m", "aiochrome.fake_chrome"]
+
+    count = int(argv[0]) if argv else 1
+    rounds = int(argv[1]) if len(argv) > 1 else 3
+
+    print("%s processes, %s rounds" % (count, rounds))
+    asyncio.get_event_loop().run_until_complete(run(count, rounds, executable, args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+client side throughput under a recorded traffic mix: a ReplayChrome serves the
+recording, N tabs each play the calls of a recorded tab (round robin) and listen
+to the events it got, for a number of rounds
+
+without a recording, one is made against the fake: navigations, evaluations and
+screenshots with network events in between.
+
+usage: PYTHONPATH=. python benchmarks/bench_replay.py [recording] [--speed N] [--tabs N] [--rounds N] [--multiplex]
+
+--speed 0 (default) replays with no delay, to measure the client alone.
+"""
+
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+
+import aiochrome
+from aiochrome.fake_chrome import FakeChrome
+from aiochrome.replay import Recorder, ReplayChrome
+
+
+async def make_recording(path):
+    recorder = Recorder(path)
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url, protocol_log=recorder) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            await tab.Network.enable()
+            for i in range(20):
+                await tab.goto("http://www.fatezero.org/%s" % i)
+                params = {"requestId": "1000.%s" % i, "timestamp": 0, "dataLength": 1024, "encodedDataLength": 1024}
+                await fake.targets[tab.id].flood("Network.dataReceived", params, count=20)
+                for _ in range(10):
+                    await tab.Runtime.evaluate(expression="document.title")
+                await tab.screenshot()
+
+    await recorder.close()
+
+
+async def play(tab, script, rounds, counters):
+    async def listener(**kwargs):
+        counters['events'] += 1
+
+    for method in set(method for step in script.steps for _, method, _ in step.events):
+        tab.set_listener(method, listener)
+
+    for _ in range(rounds):
+        for step in script.steps:
+            try:
+                await tab.call_method(step.method, **step.params)
+            except aiochrome.CallMethodException:
+                pass  # recorded errors are replayed too
+
+            counters['calls'] += 1
+
+
+async def run(options):
+    replay = ReplayChrome(options.recording, speed=options.speed or None)
+    await replay.start()
+    counters = {"calls": 0, "events": 0}
+    try:
+        async with aiochrome.Browser(replay.url, multiplex=options.multiplex) as browser:
+            tabs = []
+            for _ in range(options.tabs):
+                tab = await browser.new_tab()
+                await tab.start()
+                tabs.append(tab)
+
+            scripts = [replay.script(tab.id) for tab in tabs]
+            start = time.perf_counter()
+            await asyncio.gather(*[play(tab, script, options.rounds, counters) for tab, script in zip(tabs, scripts)])
+            # let the events of the last calls in
+            await asyncio.sleep(0.1)
+            elapsed = time.perf_counter() - start - 0.1
+    finally:
+        await replay.stop()
+        await aiochrome.close_default_session()
+
+    return {
+        "tabs": options.tabs,
+        "speed": options.speed or "max",
+        "multiplex": options.multiplex,
+        "calls": counters['calls'],
+        "calls_per_sec": round(counters['calls'] / elapsed, 1),
+        "events": counters['events'],
+        "events_per_sec": round(counters['events'] / elapsed, 1),
+        "replay": replay.stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="replay benchmark")
+    parser.add_argument("recording", nargs="?", help="a Recorder file, default: recorded against the fake")
+    parser.add_argument("--speed", type=float, default=0, help="N times the recorded speed, 0 for max")
+    parser.add_argument("--tabs", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--multiplex", action="store_true")
+    options = parser.parse_args(argv)
+
+    loop = asyncio.get_event_loop()
+    with tempfile.TemporaryDirectory() as path:
+        if not options.recording:
+            options.recording = path + "/session.ndjson"
+            loop.run_until_complete(make_recording(options.recording))
+
+        print(json.dumps(loop.run_until_complete(run(options)), indent=4))
+
+
+if __name__ == '__main__':
+    main()
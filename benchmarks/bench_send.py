@@ -0,0 +1,169 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+micro-benchmark for Tab._send response correlation
+
+compare the queue polling implementation (before) with the future based
+one (after), using an in-memory websocket that answers after a delay, so
+every call stays in flight for a while.
+
+usage: PYTHONPATH=. python benchmarks/bench_send.py [calls] [concurrency] [delay]
+
+with a delay above one second the polling version wakes up every
+second for every in-flight call, see `loop_iterations` and `timers` and
+their `difference`. the defaults (4000 calls, 2000 at a time, answered
+after 2.5 seconds) keep every call in flight long enough for that.
+"""
+
+import sys
+import json
+import time
+import asyncio
+import aiochrome
+
+from aiochrome.exceptions import TimeoutException, UserAbortException
+
+
+class FakeWebSocket:
+    def __init__(self, loop, delay):
+        self.loop = loop
+        self.delay = delay
+        self.messages = asyncio.Queue()
+
+    async def send(self, message_json):
+        message = json.loads(message_json)
+        response = json.dumps({"id": message['id'], "result": {}})
+        self.loop.call_later(self.delay, self.messages.put_nowait, response)
+
+    async def recv(self):
+        return await self.messages.get()
+
+    async def close(self):
+        pass
+
+
+class LegacyTab(aiochrome.Tab):
+    """the per-call Queue implementation, kept here for comparison"""
+
+    async def _send(self, message, timeout=None):
+        if 'id' not in message:
+            self._cur_id += 1
+            message['id'] = self._cur_id
+
+        message_json = json.dumps(message)
+
+        if not isinstance(timeout, (int, float)) or timeout > 1:
+            q_timeout = 1
+        else:
+            q_timeout = timeout / 2.0
+
+        try:
+            queue = asyncio.Queue()
+            self.method_results[message['id']] = queue
+            await self._ws.send(message_json)
+
+            while not self._stopped.is_set():
+                try:
+                    if isinstance(timeout, (int, float)):
+                        if timeout < q_timeout:
+                            q_timeout = timeout
+
+                        timeout -= q_timeout
+
+                    return await asyncio.wait_for(queue.get(), q_timeout)
+                except asyncio.TimeoutError:
+                    if isinstance(timeout, (int, float)) and timeout <= 0:
+                        raise TimeoutException("Calling %s timeout" % message['method'])
+
+                    continue
+
+            raise UserAbortException("User abort, call stop() when calling %s" % message['method'])
+        finally:
+            self.method_results.pop(message['id'])
+
+    async def _recv_loop(self):
+        while not self._stopped.is_set():
+            message = json.loads(await self._ws.recv())
+            if "id" in message and message["id"] in self.method_results:
+                await self.method_results[message['id']].put(message)
+
+
+class WakeupCounter:
+    def __init__(self, loop):
+        self.loop = loop
+        self.iterations = 0
+        self.timers = 0
+        self._run_once = loop._run_once
+        self._call_at = loop.call_at
+
+    def __enter__(self):
+        def run_once():
+            self.iterations += 1
+            self._run_once()
+
+        def call_at(*args, **kwargs):
+            self.timers += 1
+            return self._call_at(*args, **kwargs)
+
+        self.loop._run_once = run_once
+        self.loop.call_at = call_at
+        return self
+
+    def __exit__(self, *exc_info):
+        del self.loop._run_once
+        del self.loop.call_at
+
+
+async def run(tab_class, loop, calls, concurrency, delay):
+    tab = tab_class(id="bench", loop=loop)
+    tab._ws = FakeWebSocket(loop, delay)
+    tab._started = True
+    tab.status = tab.status_started
+    tab._connected.set()
+    tab._recv_task = asyncio.ensure_future(tab._recv_loop(), loop=loop)
+
+    async def caller(n):
+        for _ in range(n):
+            await tab.call_method("Runtime.evaluate", expression="1", _timeout=30)
+
+    with WakeupCounter(loop) as counter:
+        start = time.perf_counter()
+        await asyncio.gather(*[caller(calls // concurrency) for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+    tab._stopped.set()
+    tab._recv_task.cancel()
+
+    total = calls // concurrency * concurrency
+    return {
+        "calls": total,
+        "seconds": round(elapsed, 4),
+        "calls_per_sec": round(total / elapsed, 1),
+        "loop_iterations": counter.iterations,
+        "timers": counter.timers,
+    }
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 2.5
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        results = {
+            "before": loop.run_until_complete(run(LegacyTab, loop, calls, concurrency, delay)),
+            "after": loop.run_until_complete(run(aiochrome.Tab, loop, calls, concurrency, delay)),
+        }
+    finally:
+        loop.close()
+
+    results["difference"] = dict(
+        (name, results["before"][name] - results["after"][name]) for name in ("loop_iterations", "timers"))
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == '__main__':
+    main()
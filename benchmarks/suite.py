@@ -0,0 +1,279 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmark suite for the Tab and Browser hot paths
+
+* latency: round-trip call_method latency percentiles, one caller
+* throughput: calls per second with N concurrent callers on one tab
+* events: events per second through _recv_loop -> _handle_event_loop
+* scaling: memory, CPU and task count from 1 to 1000 tabs under one Browser
+* screenshots: Tab.screenshot to disk per second, spread over 1 to 16 tabs
+
+runs against an in-process FakeChrome by default, or any endpoint with --url.
+results are printed (or written with --output) as JSON, to track regressions.
+
+usage: PYTHONPATH=. python benchmarks/suite.py [--url URL] [--multiplex] [--metrics] [--output FILE] [bench ...]
+"""
+
+import os
+import json
+import time
+import asyncio
+import argparse
+import platform
+import tempfile
+import resource
+import tracemalloc
+
+import aiochrome
+from aiochrome.fake_chrome import FakeChrome
+
+
+def percentile(values, p):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))
+    return values[index]
+
+
+def max_rss():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def close_all_tabs(browser):
+    for tab in await browser.list_tab():
+        if tab.status == tab.status_started:
+            await tab.stop()
+        await browser.close_tab(tab)
+
+
+async def bench_latency(browser, options):
+    tab = await browser.new_tab()
+    await tab.start()
+
+    for _ in range(100):
+        await tab.Runtime.evaluate(expression="1")
+
+    latencies = []
+    for _ in range(options.calls):
+        start = time.perf_counter()
+        await tab.Runtime.evaluate(expression="1")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    await tab.stop()
+    await browser.close_tab(tab)
+
+    return {
+        "calls": options.calls,
+        "p50_ms": round(percentile(latencies, 50), 4),
+        "p90_ms": round(percentile(latencies, 90), 4),
+        "p99_ms": round(percentile(latencies, 99), 4),
+        "max_ms": round(max(latencies), 4),
+    }
+
+
+async def bench_throughput(browser, options):
+    tab = await browser.new_tab()
+    await tab.start()
+
+    results = {}
+    for concurrency in options.concurrency:
+        per_caller = max(1, options.calls // concurrency)
+
+        async def caller():
+            for _ in range(per_caller):
+                await tab.Runtime.evaluate(expression="1")
+
+        start = time.perf_counter()
+        await asyncio.gather(*[caller() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+        results[str(concurrency)] = {
+            "calls": per_caller * concurrency,
+            "calls_per_sec": round(per_caller * concurrency / elapsed, 1),
+        }
+
+    await tab.stop()
+    await browser.close_tab(tab)
+    return results
+
+
+async def bench_events(browser, options):
+    if not options.fake:
+        return {"skipped": "needs the fake endpoint to generate events"}
+
+    tab = await browser.new_tab()
+    received = [0]
+    done = asyncio.Event()
+
+    async def data_received(**kwargs):
+        received[0] += 1
+        if received[0] == options.events:
+            done.set()
+
+    tab.Network.dataReceived = data_received
+    await tab.start()
+
+    target = options.fake.targets[tab.id]
+    params = {"requestId": "1000.1", "timestamp": 0, "dataLength": 1024, "encodedDataLength": 1024}
+
+    start = time.perf_counter()
+    await target.flood("Network.dataReceived", params, count=options.events)
+    await asyncio.wait_for(done.wait(), 60)
+    elapsed = time.perf_counter() - start
+
+    await tab.stop()
+    await browser.close_tab(tab)
+
+    return {
+        "events": options.events,
+        "events_per_sec": round(options.events / elapsed, 1),
+    }
+
+
+async def bench_scaling(browser, options):
+    results = {}
+    for count in options.tabs:
+        await close_all_tabs(browser)
+
+        tracemalloc.start()
+        cpu = time.process_time()
+        start = time.perf_counter()
+
+        tabs = []
+        for _ in range(count):
+            tab = await browser.new_tab()
+            await tab.start()
+            tabs.append(tab)
+
+        await asyncio.gather(*[tab.Runtime.evaluate(expression="1") for tab in tabs])
+
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[str(count)] = {
+            "seconds": round(elapsed, 4),
+            "cpu_seconds": round(cpu, 4),
+            "traced_memory_kb": round(current / 1024.0, 1),
+            "peak_traced_memory_kb": round(peak / 1024.0, 1),
+            "max_rss_kb": max_rss(),
+            "tasks": len(asyncio.all_tasks()) if hasattr(asyncio, 'all_tasks') else len(asyncio.Task.all_tasks()),
+        }
+
+        for tab in tabs:
+            await tab.stop()
+
+    await close_all_tabs(browser)
+    return results
+
+
+async def bench_screenshots(browser, options):
+    results = {}
+    for count in options.shot_tabs:
+        await close_all_tabs(browser)
+        tabs = []
+        for _ in range(count):
+            tab = await browser.new_tab()
+            await tab.start()
+            tabs.append(tab)
+
+        await asyncio.gather(*[tab.screenshot() for tab in tabs])
+
+        per_tab = max(1, options.shots // count)
+        with tempfile.TemporaryDirectory() as path:
+            async def shooter(tab):
+                for i in range(per_tab):
+                    await tab.screenshot(os.path.join(path, "%s-%s.png" % (tab.id, i)))
+
+            start = time.perf_counter()
+            await asyncio.gather(*[shooter(tab) for tab in tabs])
+            elapsed = time.perf_counter() - start
+
+        results[str(count)] = {
+            "screenshots": per_tab * count,
+            "screenshots_per_sec": round(per_tab * count / elapsed, 1),
+        }
+
+        for tab in tabs:
+            await tab.stop()
+
+    await close_all_tabs(browser)
+    return results
+
+
+benches = {
+    "latency": bench_latency,
+    "throughput": bench_throughput,
+    "events": bench_events,
+    "scaling": bench_scaling,
+    "screenshots": bench_screenshots,
+}
+
+
+async def run(options):
+    options.fake = None
+    url = options.url
+    if not url:
+        options.fake = FakeChrome(latency=options.latency)
+        options.fake.record_calls = False
+        await options.fake.start()
+        url = options.fake.url
+
+    browser = aiochrome.Browser(url, multiplex=options.multiplex, hooks=aiochrome.Metrics() if options.metrics else None)
+    results = {
+        "aiochrome": aiochrome.__version__,
+        "python": platform.python_version(),
+        "endpoint": "fake" if options.fake else url,
+        "multiplex": options.multiplex,
+        "metrics": options.metrics,
+        "results": {},
+    }
+
+    try:
+        for name in options.benches or list(benches):
+            results["results"][name] = await benches[name](browser, options)
+    finally:
+        await browser.close()
+        await aiochrome.close_default_session()
+        if options.fake:
+            await options.fake.stop()
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="aiochrome benchmarks")
+    parser.add_argument("benches", nargs="*", help="any of %s, default: all" % ", ".join(benches))
+    parser.add_argument("--url", help="remote debugging endpoint, default: in-process fake")
+    parser.add_argument("--multiplex", action="store_true", help="share one browser websocket")
+    parser.add_argument("--metrics", action="store_true", help="record with aiochrome.Metrics, to measure its overhead")
+    parser.add_argument("--latency", type=float, default=0, help="fake endpoint latency in seconds")
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--tabs", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--shots", type=int, default=200, help="screenshots per tab count")
+    parser.add_argument("--shot-tabs", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--output", help="write the JSON results to this file")
+    options = parser.parse_args(argv)
+
+    for name in options.benches:
+        if name not in benches:
+            parser.error("unknown benchmark: %s" % name)
+
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(run(options))
+
+    output = json.dumps(results, indent=4)
+    if options.output:
+        with open(options.output, "w") as fd:
+            fd.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
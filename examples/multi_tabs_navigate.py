@@ -84,7 +84,7 @@ async def main():
         await tab.start()
         await tab.Page.stopLoading()
         await tab.Page.enable()
-        await tab.Network.setRequestInterceptionEnabled(enabled=True)
+        await tab.Network.setRequestInterception(patterns=[{"urlPattern": "*"}])
         await tab.Page.navigate(url="http://httpbin.org/post")
 
     for tab in tabs:
@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 
 import time
-import base64
 import asyncio
 import aiochrome
 
@@ -36,10 +35,8 @@ class EventHandler(object):
                 print(await self.browser.activate_tab(self.tab.id))
 
                 try:
-                    data = await self.tab.Page.printToPDF()
-
-                    with open("%s.pdf" % time.time(), "wb") as fd:
-                        fd.write(base64.b64decode(data['data']))
+                    # streamed with IO.read, never the whole pdf in memory
+                    await self.tab.save_pdf("%s.pdf" % time.time())
                 finally:
                     await self.tab.stop()
 
@@ -1,8 +1,6 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import time
-import base64
 import asyncio
 import aiochrome
 
@@ -16,8 +14,6 @@ urls = [
 
 
 class EventHandler(object):
-    screen_lock = asyncio.Lock()
-
     def __init__(self, browser, tab):
         self.browser = browser
         self.tab = tab
@@ -31,16 +27,11 @@ class EventHandler(object):
         if self.start_frame == frameId:
             await self.tab.Page.stopLoading()
 
-            async with self.screen_lock:
-                # must activate current tab
-                print(await self.browser.activate_tab(self.tab.id))
-
-                try:
-                    data = await self.tab.Page.captureScreenshot()
-                    with open("%s.png" % time.time(), "wb") as fd:
-                        fd.write(base64.b64decode(data['data']))
-                finally:
-                    await self.tab.stop()
+            # every tab at the same time, no activate_tab needed
+            try:
+                await self.tab.screenshot("%s.png" % self.tab.id, full_page=True)
+            finally:
+                await self.tab.stop()
 
 
 async def close_all_tabs(browser):
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+
+def event(method, **params):
+    return {"method": method, "params": params}
+
+
+async def dispatch(tab, events, timeout=0.1):
+    """feed events to the tab as its websocket would, and let its dispatcher run for timeout"""
+    task = asyncio.ensure_future(tab._handle_event_loop())
+    for e in events:
+        await tab._on_message(e)
+
+    try:
+        await asyncio.sleep(timeout)
+    finally:
+        task.cancel()
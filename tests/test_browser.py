@@ -109,3 +109,29 @@ async def test_browser_new_100_tabs():
 
     await asyncio.sleep(1)
     assert len(await browser.list_tab()) == 0
+
+
+@pytest.mark.asyncio
+async def test_browser_multiplex():
+    browser = aiochrome.Browser(multiplex=True)
+    await close_all_tabs(browser)
+
+    tabs = []
+    for i in range(10):
+        tabs.append(await browser.new_tab())
+
+    for tab in tabs:
+        assert isinstance(tab, aiochrome.TabSession)
+        await tab.start()
+
+    connection = await browser.connect()
+    assert len(connection.sessions) == 10
+
+    for tab in tabs:
+        result = await tab.Runtime.evaluate(expression="1 + 1")
+        assert result['result']['value'] == 2
+        await tab.stop()
+        await browser.close_tab(tab)
+
+    assert len(connection.sessions) == 0
+    assert await browser.disconnect()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import aiohttp
+import websockets
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome
+
+
+@pytest.mark.asyncio
+async def test_default_session_shared():
+    async with FakeChrome() as fake:
+        browser1 = aiochrome.Browser(fake.url)
+        browser2 = aiochrome.Browser(fake.url)
+        assert browser1.session is browser2.session is aiochrome.default_session()
+        assert browser1.session.connector.limit_per_host == 10
+
+        await browser1.version()
+        async with browser2:
+            await browser2.version()
+
+        # closing a browser leaves the shared session open
+        assert not browser1.session.closed
+        session = browser1.session
+        assert await aiochrome.close_default_session()
+        assert session.closed
+        assert not await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_injected_session_and_connector():
+    async with FakeChrome() as fake:
+        async with aiohttp.ClientSession() as session:
+            async with aiochrome.Browser(fake.url, session=session) as browser:
+                assert browser.session is session
+                await browser.list_tab()
+
+            assert not session.closed
+
+        connector = aiochrome.new_connector(limit_per_host=2)
+        browser = aiochrome.Browser(fake.url, connector=connector)
+        session = browser.session
+        assert session.connector is connector and session is not aiochrome.default_session()
+        await browser.version()
+        await browser.close()
+        assert session.closed and not connector.closed
+        await connector.close()
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_browser_context_stops_tabs():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            await tab.Page.navigate(url="http://www.fatezero.org")
+
+        assert tab.status == aiochrome.Tab.status_stopped
+        assert len(fake.targets) == 1
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_browser_context_connect_failed():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await fake.close_target(tab.id)
+
+            with pytest.raises(websockets.WebSocketException):
+                await tab.start()
+
+            # never started, the browser has nothing to stop
+            assert tab.status == aiochrome.Tab.status_initial
+
+        await aiochrome.close_default_session()
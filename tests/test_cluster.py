@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome
+
+
+@pytest.mark.asyncio
+async def test_cluster_spreads_jobs():
+    async with FakeChrome() as fake1, FakeChrome() as fake2:
+        async with aiochrome.BrowserCluster([fake1.url, fake2.url], max_concurrency=3) as cluster:
+            in_flight = [0, 0]
+
+            async def job(tab, n):
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+                await tab.Page.navigate(url="http://www.fatezero.org/%s" % n)
+                await asyncio.sleep(0.05)
+                in_flight[0] -= 1
+                return n
+
+            results = await asyncio.gather(*[cluster.run(job, i) for i in range(30)])
+            assert results == list(range(30))
+            assert in_flight[1] == 6
+
+            stats = cluster.stats()
+            assert stats[fake1.url]['jobs'] == 15
+            assert stats[fake2.url]['jobs'] == 15
+            assert len(fake1.targets) == len(fake2.targets) == 3
+
+        assert len(fake1.targets) == len(fake2.targets) == 0
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_cluster_removes_unhealthy_node():
+    async with FakeChrome() as fake1:
+        fake2 = FakeChrome()
+        await fake2.start()
+
+        cluster = aiochrome.BrowserCluster([fake1.url, fake2.url], max_concurrency=2,
+                                           health_interval=0.05, health_timeout=0.5, max_failures=2)
+        await cluster.start()
+        assert len(cluster.nodes) == 2
+
+        await fake2.stop()
+        await asyncio.sleep(0.5)
+        assert [node.url for node in cluster.nodes] == [fake1.url]
+
+        async with cluster.acquire() as tab:
+            assert tab.id in fake1.targets
+
+        await cluster.stop()
+        with pytest.raises(aiochrome.RuntimeException):
+            await cluster.acquire()
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_cluster_open_tabs_strategy():
+    async with FakeChrome() as fake1, FakeChrome() as fake2:
+        for i in range(5):
+            fake1.new_target()
+
+        cluster = aiochrome.BrowserCluster([fake1.url, fake2.url], strategy="open_tabs")
+        await cluster.start()
+
+        async with cluster.acquire() as tab:
+            assert tab.id in fake2.targets
+
+        await cluster.stop()
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_cluster_drain_and_timeout():
+    async with FakeChrome() as fake1, FakeChrome() as fake2:
+        cluster = aiochrome.BrowserCluster([fake1.url, fake2.url], max_concurrency=1)
+        await cluster.start()
+
+        tab = await cluster.acquire()
+        await cluster.drain(fake1.url if tab.id in fake1.targets else fake2.url)
+        assert len(cluster.nodes) == 2
+
+        other = await cluster.acquire()
+        with pytest.raises(aiochrome.TimeoutException):
+            await cluster.acquire(timeout=0.1)
+
+        await cluster.release(tab)
+        assert len(cluster.nodes) == 1
+
+        await cluster.release(other)
+        await cluster.stop()
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_cluster_acquire_deadline():
+    async with FakeChrome() as fake:
+        cluster = aiochrome.BrowserCluster([fake.url], max_concurrency=1)
+        await cluster.start()
+
+        node = cluster.nodes[0]
+        timeouts = []
+        acquire = node.pool.acquire
+
+        def pool_acquire(timeout=None):
+            timeouts.append(timeout)
+            return acquire(timeout)
+
+        node.pool.acquire = pool_acquire
+
+        tab = await cluster.acquire()
+        asyncio.get_event_loop().call_later(0.2, asyncio.ensure_future, cluster.release(tab))
+        tab = await cluster.acquire(timeout=0.5)
+
+        # the pool only gets what is left after waiting for the node
+        assert timeouts[0] is None
+        assert 0 < timeouts[1] <= 0.35
+
+        await cluster.release(tab)
+        await cluster.stop()
+
+    await aiochrome.close_default_session()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import aiochrome
+
+from aiochrome.codec import codecs, get_codec, JSONCodec
+
+
+def test_default_codec():
+    codec = get_codec()
+    assert codec.loads(codec.dumps({"id": 1001, "params": {"url": "about:blank"}})) == \
+        {"id": 1001, "params": {"url": "about:blank"}}
+
+
+def test_every_installed_codec():
+    message = {"method": "Page.navigate", "params": {"url": "http://www.fatezero.org/中文"}}
+    for codec_class in codecs:
+        try:
+            codec = codec_class()
+        except ImportError:
+            continue
+
+        message_json = codec.dumps(message)
+        assert isinstance(message_json, str)
+        assert codec.loads(message_json) == message
+        assert codec.loads(message_json.encode('utf-8')) == message
+
+
+def test_codec_by_name():
+    assert isinstance(get_codec('json'), JSONCodec)
+    with pytest.raises(aiochrome.RuntimeException):
+        get_codec('not-exist-codec')
+
+    with pytest.raises(aiochrome.RuntimeException):
+        get_codec(object())
+
+
+@pytest.mark.asyncio
+async def test_tab_codec():
+    tab = aiochrome.Tab(id="test", codec='json')
+    assert tab.codec.name == 'json'
+    assert 'codec' not in tab._kwargs
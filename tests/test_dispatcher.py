@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from .helpers import event, dispatch
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block_other_events():
+    tab = aiochrome.Tab(id="test", event_concurrency=4)
+    order = []
+
+    async def response_received(**kwargs):
+        await asyncio.sleep(0.3)
+        order.append("responseReceived")
+
+    async def load_event_fired(**kwargs):
+        order.append("loadEventFired")
+
+    tab.Network.responseReceived = response_received
+    tab.Page.loadEventFired = load_event_fired
+
+    await dispatch(tab, [event("Network.responseReceived"), event("Page.loadEventFired")], 0.5)
+    assert order == ["loadEventFired", "responseReceived"]
+
+    stats = tab.handler_stats()
+    assert stats["Network.responseReceived"]["count"] == 1
+    assert stats["Network.responseReceived"]["max"] >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_ordering_by_key():
+    tab = aiochrome.Tab(id="test", event_concurrency=10)
+    tab.set_dispatch_key("Network.requestWillBeSent", "requestId")
+    tab.set_dispatch_key("Network.responseReceived", "requestId")
+    order = []
+
+    async def request_will_be_sent(requestId, delay):
+        await asyncio.sleep(delay)
+        order.append(("request", requestId))
+
+    async def response_received(requestId, delay):
+        await asyncio.sleep(delay)
+        order.append(("response", requestId))
+
+    tab.Network.requestWillBeSent = request_will_be_sent
+    tab.Network.responseReceived = response_received
+
+    await dispatch(tab, [
+        event("Network.requestWillBeSent", requestId="1", delay=0.2),
+        event("Network.requestWillBeSent", requestId="2", delay=0.1),
+        event("Network.responseReceived", requestId="1", delay=0),
+        event("Network.responseReceived", requestId="2", delay=0),
+    ], 0.5)
+
+    assert order.index(("request", "1")) < order.index(("response", "1"))
+    assert order.index(("request", "2")) < order.index(("response", "2"))
+    assert order[0] == ("request", "2")
+
+
+@pytest.mark.asyncio
+async def test_handler_exception():
+    tab = aiochrome.Tab(id="test")
+
+    async def load_event_fired(**kwargs):
+        raise ValueError("test")
+
+    tab.Page.loadEventFired = load_event_fired
+    await dispatch(tab, [event("Page.loadEventFired")], 0.1)
+    assert tab.handler_stats()["Page.loadEventFired"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_handler():
+    tab = aiochrome.Tab(id="test")
+    started = asyncio.Event()
+
+    async def load_event_fired(**kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    tab.Page.loadEventFired = load_event_fired
+    await tab._on_message(event("Page.loadEventFired"))
+    task = asyncio.ensure_future(tab._handle_event_loop())
+    await asyncio.wait_for(started.wait(), 1)
+
+    # the handler loop ends, the cancellation is no handler error
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, 1)
+    assert tab.handler_stats() == {}
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.event_queue import EventQueue
+
+from .helpers import event
+
+
+@pytest.mark.asyncio
+async def test_drop_newest():
+    queue = EventQueue(2, EventQueue.policy_drop_newest)
+    for i in range(5):
+        await queue.put(event("Network.dataReceived", n=i))
+
+    assert [(await queue.get())['params']['n'] for i in range(2)] == [0, 1]
+    assert queue.stats() == {"size": 0, "queued": 2, "dropped": 3, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    queue = EventQueue(2, EventQueue.policy_drop_oldest)
+    for i in range(5):
+        await queue.put(event("Network.dataReceived", n=i))
+
+    assert [(await queue.get())['params']['n'] for i in range(2)] == [3, 4]
+    assert queue.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_by_key():
+    queue = EventQueue()
+    queue.set_policy("Network.dataReceived", EventQueue.policy_coalesce, "requestId")
+
+    await queue.put(event("Network.dataReceived", requestId="1", n=0))
+    await queue.put(event("Page.loadEventFired"))
+    await queue.put(event("Network.dataReceived", requestId="2", n=1))
+    await queue.put(event("Network.dataReceived", requestId="1", n=2))
+
+    assert queue.qsize() == 3
+    assert queue.coalesced == 1
+    assert (await queue.get())['params'] == {"requestId": "1", "n": 2}
+    assert (await queue.get())['method'] == "Page.loadEventFired"
+
+    # already taken out, nothing to coalesce with
+    await queue.put(event("Network.dataReceived", requestId="1", n=3))
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_block():
+    queue = EventQueue(1)
+    await queue.put(event("Page.loadEventFired"))
+
+    put = asyncio.ensure_future(queue.put(event("Page.frameStoppedLoading")))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    assert (await queue.get())['method'] == "Page.loadEventFired"
+    await asyncio.wait_for(put, 1)
+    assert (await queue.get())['method'] == "Page.frameStoppedLoading"
+
+    # without wait, like drop_newest
+    await queue.put(event("Page.loadEventFired"))
+    assert not await asyncio.wait_for(queue.put(event("Page.frameStoppedLoading"), wait=False), 1)
+    assert queue.dropped == 1 and queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_without_wait():
+    # no key to coalesce with falls back to the queue policy, which must not block either
+    queue = EventQueue(1, EventQueue.policy_coalesce)
+    assert await queue.put(event("Page.loadEventFired"), wait=False)
+    assert not await asyncio.wait_for(queue.put(event("Page.frameStoppedLoading"), wait=False), 1)
+    assert queue.dropped == 1 and queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_shrink_maxsize():
+    queue = EventQueue(3)
+    for i in range(3):
+        await queue.put(event("Network.dataReceived", n=i))
+
+    queue.maxsize = 1
+    put = asyncio.ensure_future(queue.put(event("Network.dataReceived", n=3)))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    await queue.get()
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    await queue.get()
+    await queue.get()
+    await asyncio.wait_for(put, 1)
+    assert (await queue.get())['params']['n'] == 3
+
+    # growing it again lets a blocked put through
+    await queue.put(event("Network.dataReceived", n=4))
+    put = asyncio.ensure_future(queue.put(event("Network.dataReceived", n=5)))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+    queue.maxsize = 0
+    await asyncio.wait_for(put, 1)
+    assert queue.qsize() == 2
+
+
+def test_unknown_policy():
+    with pytest.raises(aiochrome.RuntimeException):
+        EventQueue(policy="not-exist-policy")
+
+
+@pytest.mark.asyncio
+async def test_tab_skips_unhandled_events():
+    tab = aiochrome.Tab(id="test", event_queue_size=10, event_overflow=EventQueue.policy_drop_oldest)
+
+    async def load_event_fired(**kwargs):
+        pass
+
+    tab.Page.loadEventFired = load_event_fired
+    await tab._on_message(event("Network.dataReceived"))
+    await tab._on_message(event("Page.loadEventFired"))
+
+    stats = tab.event_stats()
+    assert stats['unhandled'] == 1
+    assert stats['queued'] == 1
+    assert tab.event_queue.maxsize == 10
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+import os
+import base64
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome, FakeMethodError
+
+
+@pytest.mark.asyncio
+async def test_fake_browser_endpoints():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+
+        assert 'webSocketDebuggerUrl' in await browser.version()
+        assert len(await browser.list_tab()) == 0
+
+        tab = await browser.new_tab("http://www.fatezero.org")
+        assert tab in await browser.list_tab()
+        assert await browser.activate_tab(tab) == "Target activated"
+        assert await browser.close_tab(tab) == "Target is closing"
+        assert len(await browser.list_tab()) == 0
+
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_call_method():
+    async with FakeChrome(strict=True) as fake:
+        def evaluate(target, expression):
+            if expression == "throw":
+                raise FakeMethodError("Uncaught")
+
+            return {"result": {"type": "string", "value": target.url}}
+
+        fake.set_method("Runtime.evaluate", evaluate)
+        fake.set_method("Page.enable", {})
+
+        browser = aiochrome.Browser(fake.url)
+        tab = await browser.new_tab()
+        await tab.start()
+
+        await tab.Page.enable()
+        await tab.Page.navigate(url="http://www.fatezero.org")
+        result = await tab.Runtime.evaluate(expression="document.URL")
+        assert result['result']['value'] == "http://www.fatezero.org"
+
+        with pytest.raises(aiochrome.CallMethodException):
+            await tab.Runtime.evaluate(expression="throw")
+
+        with pytest.raises(aiochrome.CallMethodException):
+            await tab.Page.NotExistMethod()
+
+        with pytest.raises(aiochrome.CallMethodException):
+            await tab.Runtime.evaluate(not_exist_param=1)
+
+        await tab.stop()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_stop_cancels_events():
+    fake = await FakeChrome().start()
+    fake.page_resources = [10]
+    browser = aiochrome.Browser(fake.url)
+    tab = await browser.new_tab()
+    await tab.start()
+
+    # the load events of the page are still being sent when the fake goes away
+    await tab.Page.navigate(url="http://www.fatezero.org")
+    tasks = list(fake._tasks)
+    assert tasks
+
+    await fake.stop()
+    assert fake._tasks == set()
+    assert all(task.done() for task in tasks)
+
+    await tab.stop()
+    await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_latency_and_timeout():
+    async with FakeChrome(latency=0.2) as fake:
+        fake.set_method("Page.enable", {}, latency=0)
+
+        browser = aiochrome.Browser(fake.url)
+        tab = await browser.new_tab()
+        await tab.start()
+
+        await tab.Page.enable(_timeout=0.1)
+        with pytest.raises(aiochrome.TimeoutException):
+            await tab.Network.enable(_timeout=0.1)
+
+        await tab.stop()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_event_flood():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        tab = await browser.new_tab()
+        received = []
+
+        async def data_received(**kwargs):
+            received.append(kwargs['n'])
+
+        tab.Network.dataReceived = data_received
+        await tab.start()
+
+        await fake.targets[tab.id].flood("Network.dataReceived", lambda i: {"n": i}, count=1000)
+        await fake.targets[tab.id].flood("Network.loadingFinished", count=1000)
+
+        # the loadingFinished flood may still be on its way after the last dataReceived
+        for i in range(100):
+            if len(received) == 1000 and tab.event_stats()['unhandled'] == 1000:
+                break
+            await asyncio.sleep(0.05)
+
+        assert received == list(range(1000))
+        assert tab.event_stats()['unhandled'] == 1000
+
+        await tab.stop()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_large_payload():
+    async with FakeChrome() as fake:
+        fake.payload = os.urandom(8 * 1024 * 1024)
+
+        browser = aiochrome.Browser(fake.url)
+        tab = await browser.new_tab()
+        await tab.start()
+
+        result = await tab.Page.captureScreenshot()
+        assert base64.b64decode(result['data']) == fake.payload
+
+        await tab.stop()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_multiplex():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url, multiplex=True)
+        tabs = [await browser.new_tab() for i in range(10)]
+
+        for tab in tabs:
+            await tab.start()
+
+        results = await asyncio.gather(*[tab.Page.navigate(url="about:blank") for tab in tabs])
+        assert [result['frameId'] for result in results] == [tab.id for tab in tabs]
+
+        await tabs[0].stop()
+        await browser.close_tab(tabs[1])
+        await asyncio.sleep(0.1)
+        assert tabs[1].status == aiochrome.Tab.status_stopped
+
+        connection = await browser.connect()
+        assert len(connection.sessions) == 8
+
+        await browser.disconnect()
+        assert all(tab.status == aiochrome.Tab.status_stopped for tab in tabs)
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_multiplex_attach_failed():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url, multiplex=True)
+        tab = await browser.new_tab()
+        await fake.close_target(tab.id)
+
+        with pytest.raises(aiochrome.CallMethodException):
+            await tab.start()
+
+        assert tab.status == tab.status_initial
+        with pytest.raises(aiochrome.RuntimeException):
+            await tab.stop()
+
+        await browser.close()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_multiplex_full_queue():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url, multiplex=True)
+        slow, other = await browser.new_tab(), await browser.new_tab()
+        released = asyncio.Event()
+
+        async def data_received(**kwargs):
+            await released.wait()
+
+        slow.event_queue.maxsize = 1
+        slow.Network.dataReceived = data_received
+        await slow.start()
+        await other.start()
+
+        # the full queue of one session does not hold back the shared websocket
+        await fake.targets[slow.id].flood("Network.dataReceived", count=10)
+        await asyncio.wait_for(other.Page.navigate(url="about:blank"), 1)
+        assert slow.event_queue.dropped >= 8
+
+        released.set()
+        await browser.disconnect()
+        await browser.session.close()
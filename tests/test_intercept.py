@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import pytest
+import asyncio
+import tempfile
+import threading
+import aiochrome
+
+from aiochrome.cache import ResponseCache
+from aiochrome.intercept import InterceptRule
+from aiochrome.fake_chrome import FakeChrome
+
+
+@pytest.mark.asyncio
+async def test_intercept_rules():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            target = fake.targets[tab.id]
+
+            await tab.intercept([
+                {"action": "block", "types": ["image", "Font"]},
+                {"action": "block", "url": "*.doubleclick.net/*"},
+                InterceptRule("headers", headers={"Accept-Language": "en", "user-agent": None}),
+            ])
+
+            result = await target.fetch("http://www.fatezero.org/logo.png", type="Image")
+            assert result == {"outcome": "failed", "errorReason": "BlockedByClient"}
+
+            result = await target.fetch("http://ad.doubleclick.net/ad.js", type="Script")
+            assert result['outcome'] == "failed"
+
+            result = await target.fetch("http://www.fatezero.org/", headers={"User-Agent": "HeadlessChrome"})
+            assert result['outcome'] == "continued"
+            assert result['request_headers'] == {"Accept-Language": "en"}
+
+            stats = tab.interceptor.stats()
+            assert stats['intercepted'] == 3 and stats['blocked'] == 2 and stats['continued'] == 1
+            assert 0 < stats['avg'] <= stats['max']
+
+            await tab.interceptor.stop()
+            assert target.fetch_patterns == []
+            assert tab._watchers == []
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_intercept_cache():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            target = fake.targets[tab.id]
+
+            with tempfile.TemporaryDirectory() as path:
+                cache = ResponseCache(path)
+                interceptor = await tab.intercept([{"action": "cache", "types": ["Script"]}], cache=cache)
+                assert interceptor.patterns()[1] == {"urlPattern": "*", "resourceType": "Script",
+                                                     "requestStage": "Response"}
+
+                body = os.urandom(10000)
+                url = "http://cdn.fatezero.org/app.js"
+                result = await target.fetch(url, type="Script", body=body)
+                assert result['outcome'] == "continued"
+                assert len(cache) == 1
+
+                # concurrently, every one from the cache
+                results = await asyncio.gather(*[target.fetch(url, type="Script") for _ in range(10)])
+                assert all(r['outcome'] == "fulfilled" and r['body'] == body for r in results)
+
+                # not cached: another type, another method
+                assert (await target.fetch(url, type="XHR"))['outcome'] == "continued"
+                assert (await target.fetch(url, type="Script", method="POST"))['outcome'] == "continued"
+
+                stats = interceptor.stats()
+                assert stats['fulfilled'] == 10 and stats['stored'] == 1
+                assert stats['bytes_saved'] == 10 * len(body)
+
+                # entries survive the process
+                assert ResponseCache(path).get(url)['body'] == body
+                cache.close()
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_intercept_cache_compressed():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            target = fake.targets[tab.id]
+
+            with tempfile.TemporaryDirectory() as path:
+                cache = ResponseCache(path)
+                await tab.intercept([{"action": "cache", "types": ["Script"]}], cache=cache)
+
+                # the body Fetch.getResponseBody gives back is already decoded
+                url = "http://cdn.fatezero.org/app.js"
+                await target.fetch(url, type="Script", body=b"decoded", response_headers=[
+                    {"name": "Content-Type", "value": "application/javascript"},
+                    {"name": "Content-Encoding", "value": "gzip"},
+                    {"name": "content-length", "value": "27"},
+                    {"name": "Transfer-Encoding", "value": "chunked"},
+                ])
+
+                result = await target.fetch(url, type="Script")
+                assert result['outcome'] == "fulfilled" and result['body'] == b"decoded"
+                assert result['headers'] == [{"name": "Content-Type", "value": "application/javascript"}]
+                cache.close()
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_intercept_error():
+    class Cache(ResponseCache):
+        def put(self, url, status, headers, body):
+            raise OSError(28, "No space left on device")
+
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            target = fake.targets[tab.id]
+
+            with tempfile.TemporaryDirectory() as path:
+                cache = Cache(path)
+                interceptor = await tab.intercept([{"action": "cache"}], cache=cache)
+
+                # the store failed, the response still goes to the page
+                result = await asyncio.wait_for(target.fetch("http://cdn.fatezero.org/app.js", type="Script"), 5)
+                assert result['outcome'] == "continued"
+                assert interceptor.stats()['errors'] == 1 and len(cache) == 0
+                cache.close()
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_off_loop():
+    threads = []
+
+    class Cache(ResponseCache):
+        def _load(self, key):
+            threads.append(threading.get_ident())
+            return super()._load(key)
+
+    with tempfile.TemporaryDirectory() as path:
+        cache = Cache(path)
+        assert await cache.lookup("http://www.fatezero.org/a.js") is None
+        assert threads and threading.get_ident() not in threads
+
+        stored = await asyncio.gather(*[cache.store("http://www.fatezero.org/%s.js" % i, 200, [], b"x" * i)
+                                        for i in range(1, 11)])
+        assert all(stored) and len(cache) == 10
+        assert (await cache.lookup("http://www.fatezero.org/3.js"))['body'] == b"xxx"
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_clear_while_storing():
+    with tempfile.TemporaryDirectory() as path:
+        cache = ResponseCache(path)
+        stores = asyncio.gather(*[cache.store("http://www.fatezero.org/%s.js" % i, 200, [], os.urandom(100))
+                                  for i in range(200)])
+        # on the loop thread, while the cache thread stores
+        for _ in range(20):
+            cache.clear()
+            assert cache.stats()['entries'] >= 0
+            await asyncio.sleep(0)
+
+        await stores
+        assert cache.size == sum(size for size, _ in cache.bodies.values())
+        assert cache.stats()['bodies'] == len(cache.bodies) == len(cache)
+        cache.clear()
+        assert cache.size == 0 and os.listdir(os.path.join(path, "bodies")) == []
+        cache.close()
+
+
+def test_response_cache_lru():
+    with tempfile.TemporaryDirectory() as path:
+        cache = ResponseCache(path, max_size=3000)
+        for i in range(3):
+            cache.put("http://www.fatezero.org/%s" % i, 200, [], str(i).encode() * 1000)
+
+        assert cache.get("http://www.fatezero.org/0")
+        cache.put("http://www.fatezero.org/3", 200, [], b"3" * 1000)
+        assert cache.get("http://www.fatezero.org/1") is None
+        assert cache.get("http://www.fatezero.org/0") and len(cache) == 3
+        assert cache.size == 3000
+        assert not cache.put("http://www.fatezero.org/big", 200, [], b"x" * 3001)
+        assert len(os.listdir(os.path.join(path, "entries"))) == 3
+
+
+def test_response_cache_content_addressed():
+    with tempfile.TemporaryDirectory() as path:
+        cache = ResponseCache(path, max_size=3000)
+        for i in range(5):
+            assert cache.put("http://cdn%s.fatezero.org/jquery.js" % i, 200, [], b"x" * 1000)
+
+        # one body for five urls
+        assert len(cache) == 5 and cache.size == 1000
+        assert len(os.listdir(os.path.join(path, "bodies"))) == 1
+
+        cache.put("http://cdn0.fatezero.org/jquery.js", 200, [], b"y" * 1000)
+        assert cache.size == 2000 and len(os.listdir(os.path.join(path, "bodies"))) == 2
+
+        for i in range(5):
+            cache.get("http://cdn%s.fatezero.org/jquery.js" % i)
+        cache.get("http://cdn5.fatezero.org/jquery.js")
+
+        stats = cache.stats()
+        assert stats['hits'] == 5 and stats['misses'] == 1
+        assert stats['hit_ratio'] == 5 / 6.0
+        assert stats['bytes_saved'] == 5000
+
+
+def test_response_cache_headers():
+    with tempfile.TemporaryDirectory() as path:
+        cache = ResponseCache(path, default_ttl=60)
+        url = "http://www.fatezero.org/"
+
+        assert not cache.put(url, 200, [{"name": "Cache-Control", "value": "private, no-store"}], b"x")
+        assert not cache.put(url, 200, [{"name": "Set-Cookie", "value": "a=b"}], b"x")
+        assert not cache.put(url, 200, [{"name": "Vary", "value": "*"}], b"x")
+        assert not cache.put(url, 200, [{"name": "Expires", "value": "0"}], b"x")
+
+        assert cache.put(url, 200, [{"name": "cache-control", "value": "public, max-age=0"}], b"x") is False
+        assert cache.put(url, 200, [{"name": "Expires", "value": "Thu, 01 Dec 1994 16:00:00 GMT"}], b"x") is False
+
+        assert cache.put(url, 200, [{"name": "Cache-Control", "value": "max-age=3600"}], b"x")
+        assert 3590 < cache.index[cache.key(url)]['expires'] - time.time() <= 3600
+
+        assert cache.put(url, 200, [], b"x")
+        assert cache.index[cache.key(url)]['expires'] - time.time() <= 60
+
+        cache.index[cache.key(url)]['expires'] = time.time() - 1
+        assert cache.get(url) is None and len(cache) == 0
+
+        assert cache.put(url, 200, [{"name": "Content-Type", "value": "text/html"},
+                                    {"name": "Content-Encoding", "value": "br"},
+                                    {"name": "Content-Length", "value": "1"},
+                                    {"name": "transfer-encoding", "value": "chunked"}], b"decoded")
+        assert cache.get(url)['headers'] == [{"name": "Content-Type", "value": "text/html"}]
+
+
+def test_response_cache_shared():
+    with tempfile.TemporaryDirectory() as path:
+        cache1 = ResponseCache(path)
+        cache2 = ResponseCache(path)
+
+        # written by another process
+        cache1.put("http://www.fatezero.org/1", 200, [], b"1")
+        assert cache2.get("http://www.fatezero.org/1")['body'] == b"1"
+
+        cache1.put("http://www.fatezero.org/1", 200, [], b"2")
+        cache1.clear()
+        assert cache2.get("http://www.fatezero.org/1") is None
+        assert len(cache2) == 0
+
+        cache2.put("http://www.fatezero.org/2", 200, [], b"2")
+        assert len(ResponseCache(path)) == 1
+        assert [name for name in os.listdir(os.path.join(path, "bodies")) if name.endswith(".tmp")] == []
+
+
+@pytest.mark.asyncio
+async def test_browser_cache():
+    async with FakeChrome() as fake:
+        with tempfile.TemporaryDirectory() as path:
+            cache = ResponseCache(path)
+            async with aiochrome.Browser(fake.url, cache=cache) as browser:
+                tabs = [await browser.new_tab() for _ in range(3)]
+                for tab in tabs:
+                    await tab.start()
+                    await tab.intercept([{"action": "cache"}])
+                    assert tab.interceptor.cache is cache
+
+                await fake.targets[tabs[0].id].fetch("http://cdn.fatezero.org/a.js", type="Script", body=b"a")
+                for tab in tabs:
+                    assert (await fake.targets[tab.id].fetch("http://cdn.fatezero.org/a.js"))['body'] == b"a"
+
+                assert cache.stats()['hits'] == 3
+
+        await aiochrome.close_default_session()
+
+
+def test_intercept_rule_errors():
+    with pytest.raises(aiochrome.RuntimeException):
+        InterceptRule("drop")
+
+    with pytest.raises(aiochrome.RuntimeException):
+        InterceptRule("block", types=["Picture"])
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import signal
+import asyncio
+import pytest
+import aiochrome
+
+from aiochrome.launcher import ChromeLauncher, _running
+
+
+# a fake chrome binary, see aiochrome.fake_chrome.main
+stub = [sys.executable, "-m", "aiochrome.fake_chrome"]
+
+
+def alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+
+    return True
+
+
+@pytest.mark.asyncio
+async def test_launcher_starts_browsers():
+    launcher = ChromeLauncher(stub, count=2, warmup=True)
+    browsers = await launcher.start()
+    assert len(browsers) == 2
+    assert len(set(browser.dev_url for browser in browsers)) == 2
+
+    stats = launcher.stats()
+    assert all(s['running'] and s['ready_time'] > 0 for s in stats)
+    assert all(s['first_tab_time'] >= s['ready_time'] for s in stats)
+
+    tab = await browsers[0].new_tab()
+    await tab.start()
+    assert (await tab.Runtime.evaluate(expression="1 + 1"))["result"]
+    await tab.stop()
+
+    user_data_dir = launcher.processes[0].user_data_dir
+    await launcher.stop()
+    assert not any(alive(s['pid']) for s in stats)
+    assert not os.path.exists(os.path.dirname(user_data_dir))
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_launcher_restarts_crashed():
+    async with ChromeLauncher(stub, count=1) as launcher:
+        process = launcher.processes[0]
+        pid = process.process.pid
+        os.kill(pid, signal.SIGKILL)
+
+        for _ in range(100):
+            await asyncio.sleep(0.1)
+            if process.restarts and process.ready:
+                break
+
+        assert process.restarts == 1
+        assert process.process.pid != pid
+        assert (await launcher.browsers[0].version())['Browser']
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_launcher_not_restarted():
+    async with ChromeLauncher(stub, count=1, restart=False) as launcher:
+        process = launcher.processes[0]
+        pid = process.process.pid
+        assert pid in _running
+        os.kill(pid, signal.SIGKILL)
+
+        for _ in range(100):
+            await asyncio.sleep(0.1)
+            if pid not in _running:
+                break
+
+        assert pid not in _running and process.restarts == 0
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_launcher_startup_failure():
+    launcher = ChromeLauncher([sys.executable, "-c", "pass"], count=1, startup_timeout=5)
+    with pytest.raises(aiochrome.RuntimeException):
+        await launcher.start()
+
+    assert launcher._temp_dir is None
+    await aiochrome.close_default_session()
+
+    # not fewer browsers than asked for
+    with pytest.raises(aiochrome.RuntimeException):
+        ChromeLauncher(stub, count=2, ports=[9222])
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.listeners import Listeners
+
+from .helpers import event, dispatch
+
+
+def test_resolve_cache():
+    listeners = Listeners()
+
+    async def callback(**kwargs):
+        pass
+
+    assert "Network.dataReceived" not in listeners
+    listeners.add("Network.*", callback)
+    assert "Network.dataReceived" in listeners
+    assert "Page.loadEventFired" not in listeners
+
+    resolved = listeners._resolved["Network.dataReceived"]
+    assert "Network.dataReceived" in listeners
+    assert listeners._resolved["Network.dataReceived"] is resolved
+
+    # a change invalidates what was resolved
+    listeners.add("*", callback)
+    assert listeners._resolved == {}
+    assert "Page.loadEventFired" in listeners
+
+    assert listeners.remove("*") == [callback]
+    assert listeners.remove("Network.*", callback) == [callback]
+    assert "Network.dataReceived" not in listeners and len(listeners) == 0
+
+    with pytest.raises(aiochrome.RuntimeException):
+        listeners.add("Page.loadEventFired", "not callable")
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+@pytest.mark.asyncio
+async def test_many_listeners(concurrency):
+    tab = aiochrome.Tab(id="test", event_concurrency=concurrency)
+    calls = []
+
+    async def business(requestId):
+        calls.append(("business", requestId))
+
+    async def metrics(requestId):
+        calls.append(("metrics", requestId))
+
+    async def domain(method, params):
+        calls.append((method, params['requestId']))
+
+    async def once(**kwargs):
+        calls.append(("once", kwargs['requestId']))
+
+    tab.add_listener("Network.responseReceived", business)
+    tab.add_listener("Network.responseReceived", metrics)
+    tab.add_listener("Network.*", domain)
+    tab.add_listener("Network.responseReceived", once, once=True)
+    assert tab.get_listener("Network.responseReceived") is business
+
+    await dispatch(tab, [event("Network.responseReceived", requestId="1"),
+                         event("Network.responseReceived", requestId="2"),
+                         event("Network.dataReceived", requestId="1"),
+                         event("Page.loadEventFired", timestamp=1)])
+
+    assert calls == [
+        ("business", "1"), ("metrics", "1"), ("Network.responseReceived", "1"), ("once", "1"),
+        ("business", "2"), ("metrics", "2"), ("Network.responseReceived", "2"),
+        ("Network.dataReceived", "1"),
+    ]
+    assert tab.event_stats()['unhandled'] == 1
+    assert tab.handler_stats()["Network.responseReceived"]["count"] == 7
+
+    # set_listener keeps its meaning: the one listener of the event
+    assert tab.remove_listener("Network.responseReceived", metrics) == [metrics]
+    tab.Network.responseReceived = metrics
+    assert tab.Network.responseReceived is metrics
+    assert tab.set_listener("Network.responseReceived", None) is metrics
+    assert tab.get_listener("Network.responseReceived") is None
+    assert "Network.responseReceived" in tab.listeners
+
+    assert tab.del_all_listeners()
+    assert "Network.responseReceived" not in tab.listeners
+
+
+@pytest.mark.asyncio
+async def test_wildcard_params():
+    tab = aiochrome.Tab(id="test")
+    calls = []
+
+    async def everything(method, params):
+        calls.append((method, params))
+
+    tab.add_listener("*", everything)
+
+    # params named like the arguments of the listener are passed as they are
+    params = {"name": "f", "payload": "", "method": "m", "callback": "c"}
+    await dispatch(tab, [{"method": "Runtime.bindingCalled", "params": params}])
+    assert calls == [("Runtime.bindingCalled", params)] and calls[0][1] is params
+    assert tab.handler_stats()["Runtime.bindingCalled"]["errors"] == 0
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome, FakeMethodError
+
+
+def test_histogram():
+    histogram = aiochrome.metrics.Histogram((1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 4 and snapshot['sum'] == 56.5
+    assert list(snapshot['buckets'].items()) == [("1", 2), ("10", 3), ("+Inf", 4)]
+
+
+@pytest.mark.asyncio
+async def test_metrics_hooks(tmpdir):
+    memory = aiochrome.MemorySink(size=2)
+    prometheus = aiochrome.PrometheusTextSink(str(tmpdir.join("aiochrome.prom")))
+    metrics = aiochrome.Metrics(sinks=[memory, prometheus])
+
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url, hooks=metrics) as browser:
+            tab = await browser.new_tab()
+            assert tab.hooks is metrics
+            await tab.start()
+
+            def fail(target, **kwargs):
+                raise FakeMethodError("boom")
+
+            fake.set_method("DOM.getDocument", fail)
+            await tab.Runtime.evaluate(expression="1")
+            with pytest.raises(aiochrome.CallMethodException):
+                await tab.DOM.getDocument()
+
+            done = asyncio.Event()
+
+            async def data_received(**kwargs):
+                if kwargs['dataLength'] == 2:
+                    done.set()
+                    raise ValueError("handler error")
+
+            tab.Network.dataReceived = data_received
+            for length in (1, 2):
+                await fake.targets[tab.id].emit("Network.dataReceived", {"requestId": "1", "dataLength": length})
+            await asyncio.wait_for(done.wait(), 5)
+            await asyncio.sleep(0.01)
+
+            # switched off at runtime
+            tab.hooks = None
+            await tab.Runtime.evaluate(expression="2")
+
+            await browser.close_tab(tab)
+
+        metrics.export()
+
+    await aiochrome.close_default_session()
+    snapshot = memory.last
+    assert snapshot['aiochrome_call_duration_seconds']['Runtime.evaluate']['count'] == 1
+    assert snapshot['aiochrome_call_errors_total'] == {"DOM.getDocument": 1}
+    assert snapshot['aiochrome_calls_in_flight'] == {None: 0}
+    assert snapshot['aiochrome_sent_bytes']['Runtime.evaluate']['sum'] > 0
+    assert snapshot['aiochrome_received_bytes']['response']['count'] == 2
+    assert snapshot['aiochrome_received_bytes']['event']['count'] == 2
+    assert snapshot['aiochrome_events_total'] == {"Network.dataReceived": 2}
+    assert snapshot['aiochrome_event_queue_depth'][None]['count'] == 2
+    assert snapshot['aiochrome_handler_duration_seconds']['Network.dataReceived']['count'] == 2
+    assert snapshot['aiochrome_handler_errors_total'] == {"Network.dataReceived": 1}
+    assert snapshot['aiochrome_http_duration_seconds']['new']['count'] == 1
+    assert snapshot['aiochrome_http_duration_seconds']['close']['count'] == 1
+    assert snapshot['aiochrome_http_errors_total'] == {}
+
+    with open(prometheus.path) as fd:
+        text = fd.read()
+
+    assert text == metrics.prometheus()
+    assert "# TYPE aiochrome_call_duration_seconds histogram" in text
+    assert 'aiochrome_call_duration_seconds_bucket{method="Runtime.evaluate",le="+Inf"} 1' in text
+    assert 'aiochrome_call_errors_total{method="DOM.getDocument"} 1' in text
+    assert "aiochrome_calls_in_flight 0" in text
+    assert os.listdir(str(tmpdir)) == ["aiochrome.prom"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_http_errors():
+    metrics = aiochrome.Metrics()
+    async with FakeChrome() as fake:
+        url = fake.url
+
+    browser = aiochrome.Browser(url, hooks=metrics)
+    with pytest.raises(OSError):
+        await browser.version(timeout=1)
+
+    await browser.close()
+    await aiochrome.close_default_session()
+    assert metrics.snapshot()['aiochrome_http_errors_total'] == {"version": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_export_task():
+    sink = aiochrome.MemorySink(size=10)
+    metrics = aiochrome.Metrics(sinks=[sink])
+    task = metrics.start(interval=0.01)
+    assert metrics.start() is task
+
+    await asyncio.sleep(0.05)
+    metrics.stop()
+    count = len(sink.snapshots)
+    assert count >= 2
+
+    await asyncio.sleep(0.03)
+    assert len(sink.snapshots) == count
@@ -42,10 +42,9 @@ async def test_normal_callmethod():
 
     for tab in tabs:
         await tab.start()
-        result = await tab.Page.navigate(url="http://www.fatezero.org")
-        assert result['frameId']
 
-    await asyncio.sleep(3)
+    for result in await asyncio.gather(*[tab.goto("http://www.fatezero.org", timeout=30) for tab in tabs]):
+        assert result['frameId']
 
     for tab in tabs:
         result = await tab.Runtime.evaluate(expression="document.domain")
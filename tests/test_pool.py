@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome
+
+
+@pytest.mark.asyncio
+async def test_pool_reuse():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+
+        async with browser.tab_pool(min_size=2, max_size=2) as pool:
+            assert len(fake.targets) == 2
+
+            for i in range(10):
+                async with pool.acquire() as tab:
+                    await tab.Runtime.evaluate(expression="1 + 1")
+
+            stats = pool.stats()
+            assert stats['misses'] == 0
+            assert stats['hits'] == 10
+            assert len(fake.targets) == 2
+
+        assert len(fake.targets) == 0
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_max_size():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(max_size=3)
+
+        async def job():
+            async with pool.acquire() as tab:
+                await tab.Page.navigate(url="about:blank")
+                await asyncio.sleep(0.1)
+
+        await asyncio.gather(*[job() for _ in range(9)])
+        assert pool.stats()['misses'] == 3
+        assert pool.stats()['hit_rate'] == 6 / 9
+        assert len(fake.targets) == 3
+
+        results = await asyncio.gather(*[pool.acquire(timeout=0.1) for _ in range(4)], return_exceptions=True)
+        timeouts = [r for r in results if isinstance(r, aiochrome.TimeoutException)]
+        assert len(timeouts) == 1
+
+        # tabs in use are closed when released
+        await pool.close()
+        for tab in results:
+            if tab not in timeouts:
+                await pool.release(tab)
+
+        assert len(fake.targets) == 0
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_recycle():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(max_size=1, max_uses=2)
+
+        ids = []
+        for i in range(4):
+            async with pool.acquire() as tab:
+                ids.append(tab.id)
+
+        assert ids[0] == ids[1]
+        assert ids[1] != ids[2]
+        assert pool.stats()['recycled'] == 2
+
+        await pool.close()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_refill():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(min_size=2, max_size=2, max_uses=1)
+        await pool.start()
+
+        async with pool.acquire() as tab:
+            first = tab
+
+        # recycled, another tab takes its place
+        assert first.id not in fake.targets
+        assert pool.stats()['idle'] == 2 and len(fake.targets) == 2
+
+        async with pool.acquire() as tab:
+            await fake.close_target(tab.id)
+            await asyncio.sleep(0.1)
+
+        assert pool.stats()['idle'] == 2 and len(fake.targets) == 2
+
+        await pool.close()
+        assert len(fake.targets) == 0
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_unhealthy_tab():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(max_size=1)
+
+        async with pool.acquire() as tab:
+            first = tab
+
+        await fake.close_target(first.id)
+        await asyncio.sleep(0.1)
+
+        async with pool.acquire() as tab:
+            assert tab is not first
+
+        assert pool.stats()['unhealthy'] == 1
+        await pool.close()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_connection_closed():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(max_size=1)
+
+        # the websocket closes under the job, release() discards the tab
+        async with pool.acquire() as tab:
+            first = tab
+            await fake.drop_connections(tab.id)
+            await asyncio.sleep(0.1)
+
+        async with pool.acquire() as tab:
+            assert tab is not first and tab.status == tab.status_started
+
+        assert pool.stats()['unhealthy'] == 1
+        await pool.close()
+
+        # close_tab stops a started tab before closing it
+        tab = await browser.new_tab()
+        await tab.start()
+        await browser.close_tab(tab)
+        assert tab.status == tab.status_stopped
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_release_clears_listeners():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url)
+        pool = browser.tab_pool(max_size=1)
+
+        async def load_event_fired(**kwargs):
+            pass
+
+        async with pool.acquire() as tab:
+            tab.Page.loadEventFired = load_event_fired
+
+        async with pool.acquire() as tab:
+            assert tab.get_listener("Page.loadEventFired") is None
+
+        await pool.close()
+        await browser.session.close()
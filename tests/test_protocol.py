@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import json
+import pytest
+import aiochrome
+
+from aiochrome import protocol
+from aiochrome.protocol import generate
+from aiochrome.fake_chrome import FakeChrome
+
+
+class FakeTab:
+    id = "fake"
+    strict_protocol = True
+
+    def __init__(self):
+        self.calls = []
+        self.listeners = {}
+
+    def call_method(self, _method, _timeout=None, **params):
+        self.calls.append((_method, _timeout, params))
+
+    def get_listener(self, event):
+        return self.listeners.get(event)
+
+    def set_listener(self, event, callback):
+        self.listeners[event] = callback
+
+
+def test_domain_methods():
+    tab = FakeTab()
+    page = protocol.load_domain("Page")(tab)
+    assert protocol.load_domain("Page") is type(page)
+    assert protocol.load_domain("NotADomain") is None
+
+    page.navigate(url="http://www.fatezero.org", _timeout=5)
+    page.enable()
+    page.captureScreenshot(format="png", quality=None)
+    assert tab.calls == [
+        ("Page.navigate", 5, {"url": "http://www.fatezero.org"}),
+        ("Page.enable", None, {}),
+        ("Page.captureScreenshot", None, {"format": "png"}),
+    ]
+
+    with pytest.raises(aiochrome.InvalidParamsException) as e:
+        page.navigate(url="http://www.fatezero.org", not_a_param=1)
+    assert "not_a_param" in str(e.value)
+
+    with pytest.raises(aiochrome.InvalidParamsException) as e:
+        page.navigate()
+    assert "missing params: url" in str(e.value)
+
+    with pytest.raises(TypeError):
+        page.navigate("http://www.fatezero.org")
+
+    with pytest.raises(aiochrome.UnknownMethodException):
+        page.navigat(url="http://www.fatezero.org")
+    assert not hasattr(page, "navigat")
+    assert len(tab.calls) == 3
+
+    with pytest.raises(AttributeError):
+        page.whatever = 1
+
+
+def test_domain_events():
+    tab = FakeTab()
+    page = protocol.load_domain("Page")(tab)
+
+    def loaded(**kwargs):
+        pass
+
+    # no listener: a call, like GenericAttr always did
+    unset = page.loadEventFired
+    assert unset.func == tab.call_method and unset.args == ("Page.loadEventFired",)
+
+    page.loadEventFired = loaded
+    assert page.loadEventFired is loaded
+    assert tab.listeners == {"Page.loadEventFired": loaded}
+    assert page.LOAD_EVENT_FIRED == "Page.loadEventFired"
+    assert protocol.load_domain("DOM").DOCUMENT_UPDATED == "DOM.documentUpdated"
+
+    with pytest.raises(AttributeError):
+        page.__dict__
+
+
+def test_domain_not_strict():
+    # off by default, unknown params go to chrome as before the bindings
+    assert aiochrome.Tab().strict_protocol is False
+    assert aiochrome.Browser().strict_protocol is False
+
+    tab = FakeTab()
+    tab.strict_protocol = False
+    page = protocol.load_domain("Page")(tab)
+
+    # what a newer or older chrome may know goes through unchecked
+    page.navigate(url="http://www.fatezero.org", newParam=1, frameId=None)
+    page.navigate(referrer="http://www.fatezero.org")
+    page.newMethod(x=1)
+    assert tab.calls == [
+        ("Page.navigate", None, {"url": "http://www.fatezero.org", "newParam": 1}),
+        ("Page.navigate", None, {"referrer": "http://www.fatezero.org"}),
+        ("Page.newMethod", None, {"x": 1}),
+    ]
+
+    async def new_event(**kwargs):
+        pass
+
+    page.newEvent = new_event
+    assert tab.listeners == {"Page.newEvent": new_event}
+    assert page.newEvent is new_event
+
+
+@pytest.mark.asyncio
+async def test_tab_domains():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url, strict_protocol=True) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+
+            assert isinstance(tab.Page, protocol.Domain) and tab.Page is tab.Page
+            await tab.Runtime.evaluate(expression="document.URL", returnByValue=True)
+            assert fake.calls[-1][1:] == ("Runtime.evaluate", {"expression": "document.URL", "returnByValue": True})
+
+            # a domain which is not in the bindings still goes through
+            assert isinstance(tab.NotADomain, aiochrome.tab.GenericAttr)
+            assert await tab.NotADomain.anything() == {}
+            assert fake.calls[-1][1:] == ("NotADomain.anything", {})
+
+            with pytest.raises(aiochrome.UnknownMethodException):
+                await tab.Page.notInTheProtocol()
+
+            tab.strict_protocol = False
+            assert await tab.Page.notInTheProtocol(x=1) == {}
+            assert fake.calls[-1][1:] == ("Page.notInTheProtocol", {"x": 1})
+
+    await aiochrome.close_default_session()
+
+
+def test_generate(tmpdir):
+    spec = {"version": {"major": "1", "minor": "3"}, "domains": [{
+        "domain": "Demo",
+        "description": "A demo domain. With more text.",
+        "commands": [
+            {"name": "run", "parameters": [
+                {"name": "first", "type": "string"},
+                {"name": "second", "type": "integer", "optional": True}]},
+            {"name": "stop", "experimental": True},
+            # long enough to wrap the signature, the checks and the call
+            {"name": "configure", "parameters": [
+                {"name": "someRatherLongParameterName%s" % i, "type": "integer"} for i in range(6)]},
+        ],
+        "events": [{"name": "somethingHappened"}],
+    }]}
+    path = tmpdir.join("protocol.json")
+    path.write(json.dumps(spec))
+
+    output = tmpdir.mkdir("bindings")
+    output.join("__init__.py").write("from aiochrome.protocol import Domain, REQUIRED\n")
+    assert generate.generate([str(path)], str(output), "test") == {"Demo": "demo"}
+    assert sorted(p.basename for p in output.listdir()) == ["__init__.py", "_index.py", "demo.py"]
+
+    sys.path.insert(0, str(tmpdir))
+    try:
+        from bindings.demo import Demo
+        from bindings._index import DOMAINS, PROTOCOL_VERSION
+    finally:
+        sys.path.remove(str(tmpdir))
+
+    assert DOMAINS == {"Demo": "demo"} and PROTOCOL_VERSION == "test"
+    assert Demo.__doc__ == "A demo domain."
+    assert Demo.SOMETHING_HAPPENED == "Demo.somethingHappened"
+
+    tab = FakeTab()
+    demo = Demo(tab)
+    demo.run(first="a", second=2)
+    demo.run(first="b")
+    demo.stop()
+    assert tab.calls == [("Demo.run", None, {"first": "a", "second": 2}), ("Demo.run", None, {"first": "b"}),
+                         ("Demo.stop", None, {})]
+    with pytest.raises(aiochrome.InvalidParamsException):
+        demo.run(second=1)
+
+    params = dict(("someRatherLongParameterName%s" % i, i) for i in range(6))
+    demo.configure(**params)
+    assert tab.calls[-1] == ("Demo.configure", None, params)
+    del params["someRatherLongParameterName5"]
+    with pytest.raises(aiochrome.InvalidParamsException) as e:
+        demo.configure(**params)
+    assert "missing params: someRatherLongParameterName5" in str(e.value)
+    assert "invalid = " in output.join("demo.py").read()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import json
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome, FakeMethodError, large_payload
+
+
+@pytest.mark.asyncio
+async def test_protocol_log(tmpdir):
+    path = str(tmpdir.join("frames.ndjson"))
+    log = aiochrome.ProtocolLog(path, max_frame=100, flush_interval=0.01)
+
+    async with FakeChrome() as fake:
+        fake.set_method("Page.captureScreenshot", {"data": large_payload(1024)})
+        async with aiochrome.Browser(fake.url, protocol_log=log) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            assert tab.debug
+
+            await tab.Runtime.evaluate(expression="1")
+            await tab.Page.captureScreenshot()
+
+            # switched off at runtime
+            tab.protocol_log = None
+            await tab.Runtime.evaluate(expression="2")
+
+    await log.close()
+    await aiochrome.close_default_session()
+    entries = list(aiochrome.read_log(path))
+    assert [(e['direction'], e['method']) for e in entries] == [
+        ("send", "Runtime.evaluate"), ("recv", "Runtime.evaluate"),
+        ("send", "Page.captureScreenshot"), ("recv", "Page.captureScreenshot"),
+    ]
+    assert entries[0]['id'] == entries[1]['id'] and entries[0]['tab'] == tab.id
+    assert not entries[1].get('truncated') and '"id"' in entries[1]['frame']
+
+    screenshot = entries[3]
+    assert screenshot['truncated'] and len(screenshot['frame']) == 100 and screenshot['size'] > 1024
+    assert log.logged == 4 and log.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_protocol_log_rotate_and_sample(tmpdir):
+    path = str(tmpdir.join("frames.ndjson"))
+    log = aiochrome.ProtocolLog(path, max_frame=0, max_bytes=2000, backups=2, flush_interval=0.01)
+
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url, protocol_log=log) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            for i in range(30):
+                await tab.Runtime.evaluate(expression=str(i))
+                await log.flush()
+
+            log.sample = 0
+            await tab.Runtime.evaluate(expression="sampled out")
+
+    await log.close()
+    await aiochrome.close_default_session()
+    assert sorted(os.listdir(str(tmpdir))) == ["frames.ndjson", "frames.ndjson.1", "frames.ndjson.2"]
+    assert all(os.path.getsize(str(tmpdir.join(name))) <= 2000 for name in os.listdir(str(tmpdir)))
+
+    entries = list(aiochrome.read_log(path))
+    assert 0 < len(entries) < 60 and log.logged == 60
+    assert all('frame' not in entry for entry in entries)
+    # the newest frames are kept, in order
+    assert entries[-1]['direction'] == "recv" and entries[-1]['id'] == 1030
+    assert [e['time'] for e in entries] == sorted(e['time'] for e in entries)
+
+
+@pytest.mark.asyncio
+async def test_protocol_log_buffer_full():
+    sink = io.StringIO()
+    log = aiochrome.ProtocolLog(sink, max_buffer=2, flush_interval=0.01)
+
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            tab.protocol_log = log
+            await tab.start()
+            await asyncio.gather(*[tab.Runtime.evaluate(expression="1") for _ in range(5)])
+
+    await log.close()
+    await aiochrome.close_default_session()
+    assert log.logged + log.dropped == 10 and log.dropped >= 3
+    assert len(sink.getvalue().splitlines()) == log.logged
+
+
+def test_protocol_log_loops():
+    class FakeTab:
+        def __init__(self, id, loop):
+            self.id = id
+            self.loop = loop
+
+    sink = io.StringIO()
+    log = aiochrome.ProtocolLog(sink, max_frame=10, flush_interval=60)
+
+    # a frame waits in the buffer already cut
+    first = asyncio.new_event_loop()
+    log.record(FakeTab("first", first), log.direction_recv, {"id": 1}, "x" * 10000)
+    assert len(log._buffer[0][5]) == 10
+    first.close()
+
+    # the timer of the first loop is gone with it, the second one writes on
+    second = asyncio.new_event_loop()
+    log.record(FakeTab("second", second), log.direction_recv, {"id": 2}, "y")
+    second.run_until_complete(log.close())
+    second.close()
+
+    entries = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [(e['tab'], e['size'], e['frame'], e.get('truncated', False)) for e in entries] == [
+        ("first", 10000, "x" * 10, True), ("second", 1, "y", False)]
+
+
+@pytest.mark.asyncio
+async def test_fake_replay_log(tmpdir):
+    path = str(tmpdir.join("frames.ndjson"))
+    log = aiochrome.ProtocolLog(path, max_frame=None, flush_interval=0.01)
+
+    async with FakeChrome() as fake:
+        def evaluate(target, expression, **kwargs):
+            if expression == "throw":
+                raise FakeMethodError("Uncaught", code=-32015)
+            return {"result": {"type": "number", "value": int(expression)}}
+
+        fake.set_method("Runtime.evaluate", evaluate)
+        async with aiochrome.Browser(fake.url, protocol_log=log) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            await tab.Runtime.evaluate(expression="1")
+            await tab.Runtime.evaluate(expression="2")
+            with pytest.raises(aiochrome.CallMethodException):
+                await tab.Runtime.evaluate(expression="throw")
+
+    await log.close()
+
+    async with FakeChrome(strict=True) as fake:
+        assert fake.replay_log(aiochrome.read_log(path)) == ["Runtime.evaluate"]
+        async with aiochrome.Browser(fake.url) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            assert (await tab.Runtime.evaluate(expression="x"))['result']['value'] == 1
+            assert (await tab.Runtime.evaluate(expression="x"))['result']['value'] == 2
+            with pytest.raises(aiochrome.CallMethodException):
+                await tab.Runtime.evaluate(expression="x")
+            assert (await tab.Runtime.evaluate(expression="x"))['result']['value'] == 1
+
+    await aiochrome.close_default_session()
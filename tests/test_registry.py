@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_registry_follows_targets():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            existing = fake.new_target("http://www.fatezero.org/1")
+            assert await browser.watch()
+            tabs = await browser.list_tab()
+            assert [tab.id for tab in tabs] == [existing.id]
+
+            # created behind the back of the browser
+            target = fake.new_target("http://www.fatezero.org/2")
+            fake.new_target(type="service_worker")
+            await settle()
+            tabs = await browser.list_tab()
+            assert set(tab.id for tab in tabs) == {existing.id, target.id}
+            assert tabs == await browser.list_tab()
+
+            tab = [tab for tab in tabs if tab.id == target.id][0]
+            await tab.start()
+            await tab.Page.navigate(url="http://www.fatezero.org/3")
+            await settle()
+            assert browser.targets[target.id]['url'] == "http://www.fatezero.org/3"
+            assert tab._kwargs['url'] == "http://www.fatezero.org/3"
+
+            await fake.close_target(target.id)
+            await settle()
+            assert [tab.id for tab in await browser.list_tab()] == [existing.id]
+            assert target.id not in browser.targets
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_registry_per_browser():
+    async with FakeChrome() as fake:
+        browser1 = aiochrome.Browser(fake.url)
+        browser2 = aiochrome.Browser(fake.url)
+        await browser1.watch()
+
+        tab = await browser1.new_tab()
+        await browser2.watch()
+        assert await browser1.list_tab() == [tab]
+        assert tab not in await browser2.list_tab()
+        assert len(await browser2.list_tab()) == 1
+
+        await browser1.close_tab(tab)
+        assert await browser1.list_tab() == []
+        await settle()
+        assert await browser2.list_tab() == []
+
+        assert not hasattr(aiochrome.Browser, '_all_tabs')
+        await browser1.close()
+        await browser2.close()
+
+        # a new connection starts from a fresh snapshot
+        fake.new_target()
+        await browser1.watch()
+        assert len(await browser1.list_tab()) == 1
+        await browser1.close()
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_registry_reconnect():
+    async with FakeChrome() as fake:
+        reconnect = aiochrome.ReconnectPolicy(base_delay=0.01)
+        async with aiochrome.Browser(fake.url, reconnect=reconnect) as browser:
+            assert await browser.watch()
+            assert await browser.list_tab() == []
+
+            created = fake.new_target("http://www.fatezero.org/1")
+            gone = fake.new_target("http://www.fatezero.org/2")
+            await fake.close_target(gone.id)
+            await settle()
+            assert set(browser.targets) == {created.id}
+
+            # the listeners are awaited by the dispatcher, none of them failed
+            stats = browser._connection.handler_stats()
+            assert stats["Target.targetCreated"] == dict(stats["Target.targetCreated"], count=2, errors=0)
+            assert stats["Target.targetDestroyed"]["errors"] == 0
+
+            # the new websocket discovers the targets again
+            connection = browser._connection
+            await fake.drop_connections()
+            await settle()
+            assert connection.reconnects == 1 and browser._watching is connection
+
+            later = fake.new_target("http://www.fatezero.org/3")
+            await fake.close_target(created.id)
+            await settle()
+            assert set(browser.targets) == {later.id}
+            assert [tab.id for tab in await browser.list_tab()] == [later.id]
+
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_list_tab_json():
+    async with FakeChrome() as fake:
+        async with aiochrome.Browser(fake.url) as browser:
+            target = fake.new_target("http://www.fatezero.org/1")
+            tabs = await browser.list_tab()
+
+            # neither multiplexed nor watched: /json as it is, no browser connection
+            assert [tab._kwargs for tab in tabs] == [target.to_json()]
+            assert browser._connection is None
+            assert await browser.list_tab() == tabs
+
+            await fake.close_target(target.id)
+            assert await browser.list_tab() == []
+
+        async with aiochrome.Browser(fake.url, multiplex=True) as browser:
+            target = fake.new_target("http://www.fatezero.org/2")
+            assert [tab.id for tab in await browser.list_tab()] == [target.id]
+            assert browser._watching is browser._connection
+
+        await aiochrome.close_default_session()
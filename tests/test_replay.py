@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import time
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.fake_chrome import FakeChrome
+from aiochrome.replay import Recorder, ReplayChrome, load_recording
+
+
+async def record(path, multiplex=False):
+    recorder = Recorder(path, flush_interval=0.01)
+    async with FakeChrome() as fake:
+        def evaluate(target, expression, **kwargs):
+            return {"result": {"type": "string", "value": expression * 2}}
+
+        fake.set_method("Runtime.evaluate", evaluate, latency=0.1)
+        async with aiochrome.Browser(fake.url, multiplex=multiplex, protocol_log=recorder) as browser:
+            tab = await browser.new_tab()
+            await tab.start()
+            await tab.Page.enable()
+            await tab.goto("http://www.fatezero.org", wait_until="load")
+            await tab.Runtime.evaluate(expression="a")
+            await tab.Runtime.evaluate(expression="b")
+
+    await recorder.close()
+    return list(aiochrome.read_log(path))
+
+
+@pytest.mark.asyncio
+async def test_load_recording(tmpdir):
+    entries = await record(str(tmpdir.join("session.ndjson")))
+    scripts = load_recording(entries)
+    assert len(scripts) == 1
+
+    steps = scripts[0].steps
+    assert [step.method for step in steps] == [
+        "Page.enable", "Page.enable", "Page.setLifecycleEventsEnabled", "Page.navigate",
+        "Runtime.evaluate", "Runtime.evaluate"]
+    assert steps[3].params == {"url": "http://www.fatezero.org"}
+    assert "Page.loadEventFired" in [method for delay, method, params in steps[3].events]
+    assert steps[4].response == {"result": {"result": {"type": "string", "value": "aa"}}}
+    assert steps[4].delay >= 0.1
+
+    methods = scripts[0].methods()
+    assert len(methods["Runtime.evaluate"]) == 2
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("multiplex", [False, True])
+async def test_replay(tmpdir, multiplex):
+    path = str(tmpdir.join("session.ndjson"))
+    await record(path, multiplex=multiplex)
+
+    for speed in (1, None):
+        async with ReplayChrome(path, speed=speed) as replay:
+            assert len(replay.scripts) == 1
+            async with aiochrome.Browser(replay.url, multiplex=multiplex) as browser:
+                tab = await browser.new_tab()
+                await tab.start()
+
+                result = await tab.goto("http://www.fatezero.org", timeout=5)
+                assert 'load' in result['timing']
+
+                start = time.perf_counter()
+                first = await tab.Runtime.evaluate(expression="x")
+                second = await tab.Runtime.evaluate(expression="x")
+                third = await tab.Runtime.evaluate(expression="x")
+                elapsed = time.perf_counter() - start
+
+                # answered in turn, and again from the first one
+                assert [r['result']['value'] for r in (first, second, third)] == ["aa", "bb", "aa"]
+                if speed:
+                    assert elapsed >= 0.3
+                else:
+                    assert elapsed < 0.3
+
+                # not recorded, answered by the fake
+                assert await tab.DOM.enable() == {}
+
+            stats = replay.stats()
+            assert stats['replayed'] >= 6 and stats['unmatched'] == 1 and stats['events'] > 0
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_replay_round_robin(tmpdir):
+    path = str(tmpdir.join("session.ndjson"))
+    await record(path)
+
+    async with ReplayChrome(path, speed=None) as replay:
+        async with aiochrome.Browser(replay.url) as browser:
+            tabs = [await browser.new_tab() for _ in range(3)]
+            for tab in tabs:
+                await tab.start()
+
+            results = await asyncio.gather(*[tab.Runtime.evaluate(expression="x") for tab in tabs])
+            assert [r['result']['value'] for r in results] == ["aa"] * 3
+
+    await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_replay_stop(tmpdir):
+    path = str(tmpdir.join("session.ndjson"))
+    await record(path)
+
+    # so slow that the recorded events are still being sent when the replay stops
+    replay = await ReplayChrome(path, speed=0.01).start()
+    browser = aiochrome.Browser(replay.url)
+    tab = await browser.new_tab()
+    await tab.start()
+    await tab.Page.navigate(url="http://www.fatezero.org", _timeout=5)
+    tasks = list(replay._tasks)
+    assert tasks
+
+    await replay.stop()
+    assert replay._tasks == set()
+    assert all(task.done() for task in tasks)
+
+    await tab.stop()
+    await aiochrome.close_default_session()
@@ -28,10 +28,9 @@ async def test_normal_callmethod():
     tab = await browser.new_tab()
 
     await tab.start()
-    result = await tab.Page.navigate(url="http://www.fatezero.org")
+    result = await tab.goto("http://www.fatezero.org", timeout=30)
     assert result['frameId']
 
-    await asyncio.sleep(1)
     result = await tab.Runtime.evaluate(expression="document.domain")
 
     assert result['result']['type'] == 'string'
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import gzip
+import base64
+import pytest
+import asyncio
+import aiochrome
+
+from aiochrome.stream import write_base64
+from aiochrome.fake_chrome import FakeChrome, FakeMethodError
+
+
+class started_tab:
+    """a started tab of a fresh FakeChrome: `async with started_tab() as (fake, tab)`"""
+
+    def __init__(self, **kwargs):
+        self.fake = FakeChrome(**kwargs)
+        self.browser = None
+        self.tab = None
+
+    async def __aenter__(self):
+        await self.fake.start()
+        self.browser = aiochrome.Browser(self.fake.url)
+        self.tab = await self.browser.new_tab()
+        await self.tab.start()
+        return self.fake, self.tab
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.tab.status == self.tab.status_started:
+            await self.tab.stop()
+
+        await self.browser.session.close()
+        await self.fake.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch():
+    async with started_tab() as (fake, tab):
+        def get_attributes(target, nodeId):
+            if nodeId == 3:
+                raise FakeMethodError("Could not find node with given id")
+
+            return {"attributes": ["id", str(nodeId)]}
+
+        fake.set_method("DOM.getAttributes", get_attributes)
+
+        results = await tab.batch([("DOM.getAttributes", {"nodeId": i}) for i in range(10)] + ["DOM.enable"])
+
+        assert len(results) == 11
+        assert isinstance(results[3], aiochrome.CallMethodException)
+        assert [result['attributes'][1] for i, result in enumerate(results[:10]) if i != 3] == \
+            [str(i) for i in range(10) if i != 3]
+        assert results[10] == {}
+
+
+@pytest.mark.asyncio
+async def test_batch_window():
+    async with started_tab() as (fake, tab):
+        in_flight = [0, 0]
+
+        async def get_properties(target, objectId):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return {"result": [objectId]}
+
+        fake.set_method("Runtime.getProperties", get_properties)
+
+        calls = [("Runtime.getProperties", {"objectId": str(i)}) for i in range(50)]
+        results = await tab.batch(calls, window=5)
+
+        assert [result['result'][0] for result in results] == [str(i) for i in range(50)]
+        assert in_flight[1] == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout():
+    async with started_tab() as (fake, tab):
+        fake.set_method("Runtime.getProperties", {}, latency=0.5)
+
+        results = await tab.batch([("Runtime.getProperties", {"objectId": "1"}), "DOM.enable"], timeout=0.1)
+        assert isinstance(results[0], aiochrome.TimeoutException)
+        assert results[1] == {}
+
+
+@pytest.mark.asyncio
+async def test_pdf_stream():
+    async with started_tab() as (fake, tab):
+        fake.payload = os.urandom(3 * 1024 * 1024 + 1)
+
+        chunks = []
+        stream = await tab.pdf_stream(landscape=True)
+        async for chunk in stream:
+            chunks.append(chunk)
+
+        assert len(chunks) > 1
+        assert b"".join(chunks) == fake.payload
+        assert len(fake.streams) == 0
+        assert ("Page.printToPDF", {"landscape": True, "transferMode": "ReturnAsStream"}) in \
+            [(method, params) for _, method, params in fake.calls]
+
+
+@pytest.mark.asyncio
+async def test_save_pdf():
+    async with started_tab() as (fake, tab):
+        fake.payload = os.urandom(1024 * 1024)
+
+        fd = io.BytesIO()
+        assert await tab.save_pdf(fd) == len(fake.payload)
+        assert fd.getvalue() == fake.payload
+        assert len(fake.streams) == 0
+
+
+@pytest.mark.asyncio
+async def test_screenshot():
+    async with started_tab() as (fake, tab):
+        assert await tab.screenshot() == fake.payload
+
+        fd = io.BytesIO()
+        assert await tab.screenshot(fd, format="jpeg", quality=80, clip={"x": 0, "y": 0, "width": 10, "height": 10}) \
+            == len(fake.payload)
+        assert fd.getvalue() == fake.payload
+
+        del fake.calls[:]
+        await tab.screenshot(io.BytesIO(), full_page=True)
+        assert [(method, params) for _, method, params in fake.calls] == [
+            ("Page.getLayoutMetrics", {}),
+            ("Emulation.setDeviceMetricsOverride", {"width": 1280, "height": 3000, "deviceScaleFactor": 1,
+                                                    "mobile": False}),
+            ("Page.captureScreenshot", {"clip": {"x": 0, "y": 0, "width": 1280, "height": 3000, "scale": 1}}),
+            ("Emulation.clearDeviceMetricsOverride", {}),
+        ]
+
+        methods = [method for _, method, _ in fake.calls]
+        assert "Emulation.setFocusEmulationEnabled" not in methods
+
+        # the override of the user is set again, not cleared
+        mobile = {"width": 375, "height": 667, "deviceScaleFactor": 2, "mobile": True}
+        await tab.Emulation.setDeviceMetricsOverride(**mobile)
+        del fake.calls[:]
+        await tab.screenshot(io.BytesIO(), full_page=True)
+        assert fake.calls[-1][1:] == ("Emulation.setDeviceMetricsOverride", mobile)
+
+        await tab.Emulation.clearDeviceMetricsOverride()
+        await tab.screenshot(io.BytesIO(), full_page=True)
+        assert fake.calls[-1][1] == "Emulation.clearDeviceMetricsOverride"
+
+
+@pytest.mark.asyncio
+async def test_screenshot_parallel():
+    async with FakeChrome() as fake:
+        fake.set_method("Page.captureScreenshot", {"data": base64.b64encode(b"png").decode()}, latency=0.2)
+        browser = aiochrome.Browser(fake.url)
+        tabs = [await browser.new_tab() for _ in range(8)]
+        await asyncio.gather(*[tab.start() for tab in tabs])
+
+        start = asyncio.get_event_loop().time()
+        assert await asyncio.gather(*[tab.screenshot() for tab in tabs]) == [b"png"] * 8
+        assert asyncio.get_event_loop().time() - start < 0.2 * 3
+
+        await browser.close()
+        await aiochrome.close_default_session()
+
+
+@pytest.mark.asyncio
+async def test_goto():
+    async with started_tab() as (fake, tab):
+        result = await tab.goto("http://www.fatezero.org", timeout=5)
+        assert result['frameId'] == tab.id
+        assert set(result["timing"]) >= {"navigate", "domcontentloaded", "load", "total"}
+        assert result['timing']['load'] <= result['timing']['total']
+
+        result = await tab.goto("http://www.fatezero.org", wait_until="domcontentloaded")
+        assert "domcontentloaded" in result['timing']
+        assert [method for _, method, _ in fake.calls].count("Page.setLifecycleEventsEnabled") == 1
+
+        fake.page_resources = [0.2, 0.3]
+        result = await tab.goto("http://www.fatezero.org", wait_until="networkidle", idle_time=0.1)
+        assert result['timing']['load'] < 0.2 <= 0.3 <= result['timing']['networkidle']
+        assert result['requests'] == 3
+
+        # one deadline for the whole navigation
+        with pytest.raises(aiochrome.TimeoutException):
+            await tab.goto("http://www.fatezero.org", wait_until="networkidle", timeout=0.2)
+
+        fake.set_method("Page.navigate", {"frameId": tab.id, "errorText": "net::ERR_NAME_NOT_RESOLVED"})
+        with pytest.raises(aiochrome.CallMethodException):
+            await tab.goto("http://not.found")
+
+        assert tab._watchers == []
+
+
+@pytest.mark.asyncio
+async def test_trace():
+    async with started_tab() as (fake, tab):
+        fd = io.BytesIO()
+        async with tab.trace(fd) as trace:
+            await tab.goto("http://www.fatezero.org")
+
+        assert fd.getvalue() == fake.trace_data
+        assert trace.size == len(fake.trace_data) and trace.compression == "none"
+        assert len(fake.streams) == 0 and tab._watchers == []
+        assert tab.event_stats()['queued'] == 0
+
+        # compressed by chrome
+        fd = io.BytesIO()
+        async with tab.trace(fd, gzip=True, _timeout=5) as trace:
+            pass
+
+        assert trace.compression == "gzip" and trace.size < len(fake.trace_data)
+        assert gzip.decompress(fd.getvalue()) == fake.trace_data
+
+        # an older chrome without streamCompression, compressed here
+        fake.set_method("Tracing.start", lambda target, transferMode, **kwargs: setattr(
+            target, "tracing", (transferMode, "none")))
+        fd = io.BytesIO()
+        async with tab.trace(fd, gzip=True):
+            pass
+
+        assert gzip.decompress(fd.getvalue()) == fake.trace_data
+        assert ("Tracing.start", "gzip") in [(method, params.get("streamCompression"))
+                                             for _, method, params in fake.calls]
+
+
+def test_write_base64():
+    data = os.urandom(1024 * 1024 + 2)
+    fd = io.BytesIO()
+    assert write_base64(base64.b64encode(data).decode('ascii'), fd, chunk_size=3000) == len(data)
+    assert fd.getvalue() == data
+
+
+@pytest.mark.asyncio
+async def test_connection_lost():
+    async with started_tab(latency=1) as (fake, tab):
+        call = asyncio.ensure_future(tab.Page.navigate(url="about:blank"))
+        await asyncio.sleep(0.1)
+
+        await fake.drop_connections(tab.id)
+        with pytest.raises(aiochrome.TabConnectionException):
+            await asyncio.wait_for(call, 0.5)
+
+        assert await tab.wait(timeout=1)
+        await asyncio.wait_for(tab.wait(), 1)
+        assert tab.status == tab.status_stopped
+        assert tab._recv_task.done()
+
+        with pytest.raises(aiochrome.RuntimeException):
+            await tab.Page.navigate(url="about:blank")
+
+
+@pytest.mark.asyncio
+async def test_goto_connection_lost():
+    async with started_tab() as (fake, tab):
+        # networkidle is never reached, the tab going away ends the wait
+        fake.page_resources = [10]
+        goto = asyncio.ensure_future(tab.goto("http://www.fatezero.org", wait_until="networkidle"))
+        await asyncio.sleep(0.2)
+
+        await fake.drop_connections(tab.id)
+        with pytest.raises(aiochrome.TabConnectionException):
+            await asyncio.wait_for(goto, 1)
+
+        assert tab._watchers == []
+
+    async with started_tab() as (fake, tab):
+        fake.page_resources = [10]
+        goto = asyncio.ensure_future(tab.goto("http://www.fatezero.org", wait_until="networkidle"))
+        await asyncio.sleep(0.2)
+
+        await tab.stop()
+        with pytest.raises(aiochrome.UserAbortException):
+            await asyncio.wait_for(goto, 1)
+
+    async with started_tab() as (fake, tab):
+        with pytest.raises(aiochrome.TabConnectionException):
+            async with tab.trace(io.BytesIO()):
+                await fake.drop_connections(tab.id)
+                await tab.wait(timeout=1)
+
+        assert tab._watchers == []
+
+
+@pytest.mark.asyncio
+async def test_reconnect():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url, reconnect=aiochrome.ReconnectPolicy(base_delay=0.01))
+        tab = await browser.new_tab()
+
+        async def data_received(**kwargs):
+            pass
+
+        tab.Network.dataReceived = data_received
+        await tab.start()
+        await tab.Network.enable(maxTotalBufferSize=1024)
+        await tab.Page.enable()
+        await tab.Page.disable()
+
+        fake.calls = []
+        await fake.drop_connections(tab.id)
+        await asyncio.sleep(0.2)
+
+        assert tab.reconnects == 1
+        assert tab.status == tab.status_started
+        assert [(method, params) for _, method, params in fake.calls] == [("Network.enable", {"maxTotalBufferSize": 1024})]
+        assert tab.get_listener("Network.dataReceived") is data_received
+        assert await tab.Runtime.evaluate(expression="1") == {"result": {"type": "undefined"}}
+
+        # the target is gone, every retry fails
+        await fake.close_target(tab.id)
+        assert await tab.wait(timeout=2)
+        assert tab.status == tab.status_stopped
+
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_call_while_reconnecting():
+    async with FakeChrome() as fake:
+        policy = aiochrome.ReconnectPolicy(base_delay=0.5, jitter=0)
+        browser = aiochrome.Browser(fake.url, reconnect=policy)
+        tab = await browser.new_tab()
+        await tab.start()
+        await tab.screenshot()
+
+        await fake.drop_connections(tab.id)
+        await asyncio.sleep(0.05)
+
+        # the wait for the reconnect is bounded by the call's timeout
+        start = asyncio.get_event_loop().time()
+        with pytest.raises(aiochrome.TimeoutException):
+            await tab.Runtime.evaluate(expression="1", _timeout=0.1)
+        assert asyncio.get_event_loop().time() - start < 0.3
+
+        await asyncio.sleep(0.8)
+        assert tab.reconnects == 1
+
+        fake.calls = []
+        await tab.screenshot()
+        assert [method for _, method, _ in fake.calls] == ["Emulation.setFocusEmulationEnabled", "Page.captureScreenshot"]
+
+        await tab.stop()
+        await browser.session.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_multiplex():
+    async with FakeChrome() as fake:
+        browser = aiochrome.Browser(fake.url, multiplex=True, reconnect=aiochrome.ReconnectPolicy(base_delay=0.01))
+        tabs = [await browser.new_tab() for i in range(3)]
+        for tab in tabs:
+            await tab.start()
+            await tab.Page.enable()
+
+        session_ids = [tab.session_id for tab in tabs]
+        fake.calls = []
+        await fake.drop_connections()
+        await asyncio.sleep(0.2)
+
+        assert all(tab.status == tab.status_started for tab in tabs)
+        assert all(tab.session_id not in session_ids for tab in tabs)
+        assert [method for _, method, _ in fake.calls].count("Page.enable") == 3
+
+        results = await asyncio.gather(*[tab.Page.navigate(url="about:blank") for tab in tabs])
+        assert [result['frameId'] for result in results] == [tab.id for tab in tabs]
+
+        await browser.disconnect()
+        await browser.session.close()